@@ -1,12 +1,11 @@
 from django.contrib.contenttypes.models import ContentType
-from django.db import transaction
 from django.db.models import Q
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
 from nautobot.dcim.models import CablePath
-from nautobot.dcim.signals import create_cablepath
+from nautobot.dcim.tracing import CablePathTracer
 
 from .choices import CircuitTerminationSideChoices
 from .models import CircuitTermination
@@ -27,11 +26,7 @@ def rebuild_paths_circuits(obj):
     )
     # pylint: enable=unsupported-binary-operation
 
-    with transaction.atomic():
-        for cp in cable_paths:
-            cp.delete()
-            # Prevent looping back to rebuild_paths during the atomic transaction.
-            create_cablepath(cp.origin, rebuild=False)
+    CablePathTracer().save(cable_paths.values_list("origin_type_id", "origin_id"))
 
 
 @receiver(post_save, sender=CircuitTermination)
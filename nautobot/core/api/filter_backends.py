@@ -19,6 +19,8 @@ class NautobotFilterBackend(DjangoFilterBackend):
 
         for non_filter_param in (
             "api_version",  # used to select the Nautobot API version
+            "count",  # pagination
+            "cursor",  # pagination
             "depth",  # nested levels of the serializers default to depth=0
             "format",  # "json" or "api", used in the interactive HTML REST API views
             "include",  # used to include computed fields, relationships, config-contexts, etc. (excluded by default)
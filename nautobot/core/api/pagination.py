@@ -1,5 +1,8 @@
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
+from nautobot.core.models.querysets import estimate_count, KeysetPaginator
 from nautobot.core.utils.config import get_settings_or_config
 
 
@@ -8,29 +11,96 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
     Override the stock paginator to allow setting limit=0 to disable pagination for a request. This returns all objects
     matching a query, but retains the same format as a paginated request. The limit can only be disabled if
     MAX_PAGE_SIZE has been set to 0 or None.
+
+    Two further options are supported, neither of which changes the format of the response:
+
+    - `cursor` switches to keyset pagination (see `KeysetPaginator`): an empty `cursor` requests the first page, and the
+      `next` link of each page carries the cursor of the page after it. Unlike `offset`, fetching a page by its cursor
+      costs the same no matter how deep into the results it is. There is no `previous` link in this mode.
+    - `count=estimate` replaces the exact `count` of objects with an estimate (see `estimate_count`), and `count=none`
+      omits it (returning `null`), to avoid the cost of counting a large number of objects.
     """
 
+    cursor_query_param = "cursor"
+    cursor_query_description = (
+        "Use keyset pagination rather than limit/offset pagination, starting after the given opaque cursor as returned "
+        "in the `next` link of the previous page. Leave the cursor empty to get the first page."
+    )
+    count_query_param = "count"
+    count_query_description = "How to count the total number of results: `exact` (default), `estimate` or `none`."
+    count_choices = ("exact", "estimate", "none")
+    invalid_cursor_message = "Invalid cursor"
+
     def paginate_queryset(self, queryset, request, view=None):
         # No pagination when rendering to CSV
         if "text/csv" in request.accepted_media_type:
             return None
 
+        self.count_mode = self.get_count_mode(request)
+        self.cursor = request.query_params.get(self.cursor_query_param)
+        self.next_cursor = None
         self.count = self.get_count(queryset)
         self.limit = self.get_limit(request)
-        self.offset = self.get_offset(request)
+        self.offset = self.get_offset(request) if self.cursor is None else 0
         self.request = request
 
-        if self.limit and self.count > self.limit and self.template is not None:
+        if self.cursor is not None:
+            return self.paginate_queryset_by_cursor(queryset)
+
+        if self.limit and self.count_mode == "exact" and self.count > self.limit and self.template is not None:
             self.display_page_controls = True
 
-        if self.count == 0 or self.offset > self.count:
-            return []
+        if self.count_mode == "exact":
+            self.has_next = bool(self.limit) and self.offset + self.limit < self.count
+            if self.count == 0 or self.offset > self.count:
+                return []
 
-        if self.limit:
-            return list(queryset[self.offset : self.offset + self.limit])
-        else:
+        if not self.limit:
+            self.has_next = False
             return list(queryset[self.offset :])
 
+        if self.count_mode == "exact":
+            return list(queryset[self.offset : self.offset + self.limit])
+
+        # Without an exact count, fetch one extra object to find out whether there's a next page
+        results = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(results) > self.limit
+        return results[: self.limit]
+
+    def paginate_queryset_by_cursor(self, queryset):
+        """Return the page of objects after `self.cursor`, recording the cursor of the next page if there is one."""
+        paginator = KeysetPaginator(queryset)
+        try:
+            queryset = paginator.get_queryset(self.cursor)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+
+        if not self.limit:
+            self.has_next = False
+            return list(queryset)
+
+        results = list(queryset[: self.limit + 1])
+        self.has_next = len(results) > self.limit
+        results = results[: self.limit]
+        if self.has_next:
+            self.next_cursor = paginator.get_cursor(results[-1])
+        return results
+
+    def get_count_mode(self, request):
+        count_mode = request.query_params.get(self.count_query_param, "exact").lower()
+        if count_mode not in self.count_choices:
+            raise ValidationError(
+                {self.count_query_param: f"Must be one of {', '.join(self.count_choices)}, not {count_mode!r}"}
+            )
+        return count_mode
+
+    def get_count(self, queryset):
+        if self.count_mode == "none":
+            return None
+        if self.count_mode == "estimate":
+            return estimate_count(queryset)
+        return super().get_count(queryset)
+
     def get_limit(self, request):
         if self.limit_query_param:
             try:
@@ -52,14 +122,44 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
 
     def get_next_link(self):
         # Pagination has been disabled
-        if not self.limit:
+        if not self.limit or not self.has_next:
             return None
 
-        return super().get_next_link()
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        if self.cursor is not None:
+            url = remove_query_param(url, self.offset_query_param)
+            return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+        return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
 
     def get_previous_link(self):
-        # Pagination has been disabled
-        if not self.limit:
+        # Pagination has been disabled, or keyset pagination (which only goes forward) is in use
+        if not self.limit or self.cursor is not None:
             return None
 
         return super().get_previous_link()
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count"]["nullable"] = True
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.cursor_query_description,
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.count_query_description,
+                "schema": {"type": "string", "enum": list(self.count_choices)},
+            },
+        ]
@@ -20,7 +20,7 @@ from drf_spectacular.utils import extend_schema
 from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
 from graphene_django.settings import graphene_settings
 from graphene_django.views import GraphQLView, HttpError, instantiate_middleware
-from graphql import get_default_backend
+from graphql import GraphQLError
 from graphql.execution import ExecutionResult
 from graphql.execution.middleware import MiddlewareManager
 from graphql.type.schema import GraphQLSchema
@@ -38,12 +38,16 @@ from nautobot.core.api.exceptions import SerializerNotFound
 from nautobot.core.api.utils import get_serializer_for_model
 from nautobot.core.celery import app as celery_app
 from nautobot.core.exceptions import FilterSetFieldNotFound
+from nautobot.core.graphql.backend import get_graphql_backend
+from nautobot.core.graphql.cost import get_result_cost, QueryCostEstimator
+from nautobot.core.graphql.utils import get_next_cursors
 from nautobot.core.utils.data import is_uuid
 from nautobot.core.utils.filtering import get_all_lookup_expr_for_field, get_filterset_parameter_form_field
 from nautobot.core.utils.lookup import get_form_for_model, get_route_for_model
 from nautobot.core.utils.permissions import get_permission_for_model
 from nautobot.core.utils.requests import ensure_content_type_and_field_name_in_query_params
 from nautobot.core.views.utils import get_csv_form_fields_from_serializer_class
+from nautobot.extras.models import GraphQLQuery
 from nautobot.extras.registry import registry
 
 from . import serializers
@@ -116,12 +120,23 @@ class BulkUpdateModelMixin:
     def perform_bulk_update(self, objects, update_data, partial):
         with transaction.atomic():
             data_list = []
-            for obj in objects:
-                data = update_data.get(str(obj.id))
-                serializer = self.get_serializer(obj, data=data, partial=partial)
-                serializer.is_valid(raise_exception=True)
-                self.perform_update(serializer)
-                data_list.append(serializer.data)
+            # Defer the enforcement of object-level permissions on each updated object by _validate_objects(),
+            # so that they can instead be checked for all of the updated objects at once
+            self._deferred_validation_objects = []
+            try:
+                for obj in objects:
+                    data = update_data.get(str(obj.id))
+                    serializer = self.get_serializer(obj, data=data, partial=partial)
+                    serializer.is_valid(raise_exception=True)
+                    self.perform_update(serializer)
+                    data_list.append(serializer.data)
+                updated_objects = self._deferred_validation_objects
+            finally:
+                self._deferred_validation_objects = None
+
+            updated_pks = {obj.pk for obj in updated_objects}
+            if len(self.queryset.restrict_pks(self.request.user, "change", updated_pks)) != len(updated_pks):
+                raise PermissionDenied()
 
             return data_list
 
@@ -296,6 +311,10 @@ class ModelViewSet(
         Check that the provided instance or list of instances are matched by the current queryset. This confirms that
         any newly created or modified objects abide by the attributes granted by any applicable ObjectPermissions.
         """
+        if getattr(self, "_deferred_validation_objects", None) is not None:
+            # Part of a bulk update, the objects will be checked all at once by perform_bulk_update()
+            self._deferred_validation_objects.extend(instance if isinstance(instance, list) else [instance])
+            return
         if isinstance(instance, list):
             # Check that all instances are still included in the view's queryset
             conforming_count = self.queryset.filter(pk__in=[obj.pk for obj in instance]).count()
@@ -605,7 +624,7 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
             self.schema = graphene_settings.SCHEMA
 
         if self.backend is None:
-            self.backend = get_default_backend()
+            self.backend = get_graphql_backend()
 
         self.graphql_schema = self.graphql_schema or self.schema
 
@@ -631,7 +650,9 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
         Returns:
             response (dict), status_code (int): Payload of the response to send and the status code.
         """
-        query, variables, operation_name, _id = GraphQLView.get_graphql_params(request, data)
+        query, variables, operation_name, query_id = GraphQLView.get_graphql_params(request, data)
+        if not query and query_id:
+            query = self.get_saved_query(request, query_id)
 
         execution_result = self.execute_graphql_request(request, data, query, variables, operation_name)
 
@@ -647,12 +668,69 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
             else:
                 response["data"] = execution_result.data
 
+            if execution_result.extensions:
+                response["extensions"] = execution_result.extensions
+
             result = response
         else:
             result = None
 
         return result, status_code
 
+    def get_saved_query(self, request, query_id):
+        """Get the query string of the saved GraphQLQuery with the given ID or name, to execute it as a persisted query.
+
+        Args:
+            request (HttpRequest): Request object from Django
+            query_id (str): ID or name of the GraphQLQuery
+
+        Returns:
+            (str): GraphQL query
+        """
+        queryset = GraphQLQuery.objects.restrict(request.user, "view")
+        try:
+            if is_uuid(query_id):
+                return queryset.get(pk=query_id).query
+            return queryset.get(name=query_id).query
+        except GraphQLQuery.DoesNotExist:
+            raise HttpError(HttpResponseBadRequest(f"Saved query {query_id} not found."))
+
+    def check_query_cost(self, document, variables, operation_name):
+        """Estimate the cost of a GraphQL query and check it against the configured limits before it's executed.
+
+        Args:
+            document (GraphQLDocument): Parsed GraphQL query
+            variables (dict): Optional variables for the GraphQL query
+            operation_name (str): GraphQL operation name
+
+        Returns:
+            (QueryCost, list): The estimated cost of the query, and a list of errors if it exceeds any of the limits
+        """
+        estimator = QueryCostEstimator(
+            self.graphql_schema,
+            document.document_ast,
+            variables=variables,
+            list_size=settings.GRAPHQL_ESTIMATED_LIST_SIZE,
+            # Estimating the number of objects in each list takes database queries, so only do so to enforce a limit
+            estimate_counts=bool(settings.GRAPHQL_MAX_QUERY_COST),
+        )
+        estimate = estimator.estimate(operation_name)
+        errors = []
+        if settings.GRAPHQL_MAX_QUERY_DEPTH and estimate.depth > settings.GRAPHQL_MAX_QUERY_DEPTH:
+            errors.append(
+                GraphQLError(
+                    f"Query depth of {estimate.depth} exceeds the maximum depth of {settings.GRAPHQL_MAX_QUERY_DEPTH}."
+                )
+            )
+        if settings.GRAPHQL_MAX_QUERY_COST and estimate.cost > settings.GRAPHQL_MAX_QUERY_COST:
+            errors.append(
+                GraphQLError(
+                    f"Estimated query cost of {estimate.cost} exceeds the maximum cost of "
+                    f"{settings.GRAPHQL_MAX_QUERY_COST}. Use the `limit` argument to request fewer objects."
+                )
+            )
+        return estimate, errors
+
     def parse_body(self, request):
         """Analyze the request and based on the content type,
         extract the query from the body as a string or as a JSON payload.
@@ -706,6 +784,11 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
                 HttpResponseBadRequest(f"'{operation_type}' is not a supported operation, Only query are supported.")
             )
 
+        estimate, errors = self.check_query_cost(document, variables, operation_name)
+        extensions = {"cost": {"estimated": estimate.cost, "depth": estimate.depth}}
+        if errors:
+            return ExecutionResult(errors=errors, invalid=True, extensions=extensions)
+
         try:
             extra_options = {}
             if self.executor:
@@ -722,11 +805,18 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
             }
             options.update(extra_options)
 
-            operation_type = document.get_operation_type(operation_name)
-            return document.execute(**options)
+            execution_result = document.execute(**options)
         except Exception as e:
             return ExecutionResult(errors=[e], invalid=True)
 
+        if not execution_result.invalid:
+            extensions["cost"]["actual"] = get_result_cost(execution_result.data)
+            cursors = get_next_cursors(options["context_value"])
+            if cursors:
+                extensions["cursors"] = cursors
+            execution_result.extensions = {**(execution_result.extensions or {}), **extensions}
+        return execution_result
+
 
 #
 # UI Views
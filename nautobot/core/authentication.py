@@ -7,9 +7,11 @@ from django.contrib.auth.backends import (
     RemoteUserBackend as _RemoteUserBackend,
 )
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.db.models import Q
 
 from nautobot.core.utils.permissions import (
+    compile_constraints,
     permission_is_exempt,
     qs_filter_from_constraints,
     resolve_permission,
@@ -25,12 +27,20 @@ class ObjectPermissionBackend(ModelBackend):
         if not user_obj.is_active or user_obj.is_anonymous:
             return {}
         if not hasattr(user_obj, "_object_perm_cache"):
-            user_obj._object_perm_cache = self.get_object_permissions(user_obj)
+            cache_key = f"{self.get_object_permissions.cache_key_prefix}.{user_obj.pk}"
+            perms = cache.get(cache_key)
+            if perms is None:
+                perms = self.get_object_permissions(user_obj)
+                cache.set(cache_key, perms)
+            user_obj._object_perm_cache = perms
         return user_obj._object_perm_cache
 
     def get_object_permissions(self, user_obj):
         """
         Return all permissions granted to the user by an ObjectPermission.
+
+        The result is cached per user by `get_all_permissions()`; the cache is cleared whenever an ObjectPermission,
+        its assignments or the user's group memberships change.
         """
         # Retrieve all assigned and enabled ObjectPermissions
         object_permissions = ObjectPermission.objects.filter(
@@ -47,6 +57,24 @@ class ObjectPermissionBackend(ModelBackend):
 
         return perms
 
+    get_object_permissions.cache_key_prefix = "nautobot.core.authentication.get_object_permissions"
+
+    def get_constraints_predicate(self, user_obj, perm, model):
+        """
+        Return the compiled predicate for the user's constraints on the given permission, or None if they are too
+        complex to be evaluated other than by the database.
+        """
+        if not hasattr(user_obj, "_object_perm_predicates"):
+            user_obj._object_perm_predicates = {}
+        if perm not in user_obj._object_perm_predicates:
+            tokens = {
+                "$user": user_obj,
+            }
+            user_obj._object_perm_predicates[perm] = compile_constraints(
+                model, self.get_all_permissions(user_obj)[perm], tokens
+            )
+        return user_obj._object_perm_predicates[perm]
+
     def has_perm(self, user_obj, perm, obj=None):
         if perm == "is_staff":
             return user_obj.is_active and (user_obj.is_staff or user_obj.is_superuser)
@@ -82,6 +110,17 @@ class ObjectPermissionBackend(ModelBackend):
         if model._meta.label_lower != ".".join((app_label, model_name)):
             raise ValueError(f"Invalid permission {perm} for model {model}")
 
+        # If the constraints are simple enough, evaluate them against the instance itself, without a query, provided
+        # that the attributes they depend on are unchanged since it was loaded, so that the result is the same as that
+        # of the database query below
+        predicate = self.get_constraints_predicate(user_obj, perm, model)
+        if (
+            predicate is not None
+            and hasattr(obj, "loaded_values_unchanged")
+            and obj.loaded_values_unchanged(predicate.attnames)
+        ):
+            return predicate(obj)
+
         # Compile a QuerySet filter that matches all instances of the specified model
         tokens = {
             "$user": user_obj,
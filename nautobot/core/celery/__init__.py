@@ -16,7 +16,8 @@ from prometheus_client import CollectorRegistry, multiprocess, start_http_server
 
 from nautobot.core.celery.control import discard_git_repository, refresh_git_repository  # noqa: F401  # unused-import
 from nautobot.core.celery.encoders import NautobotKombuJSONEncoder
-from nautobot.core.celery.log import NautobotDatabaseHandler
+from nautobot.core.celery.log import flush_database_handlers, NautobotDatabaseHandler
+from nautobot.core.utils.cache import expire_generational_caches
 from nautobot.core.utils.module_loading import import_modules_privately
 from nautobot.extras.registry import registry
 
@@ -142,6 +143,18 @@ def setup_nautobot_job_logging(sender, instance, conf, **kwargs):
         add_nautobot_log_handler(redirect_logger)
 
 
+@signals.task_prerun.connect
+def expire_nautobot_generational_caches(**kwargs):
+    """Check whether the values held by process-local caches are still valid once for each task."""
+    expire_generational_caches()
+
+
+@signals.task_postrun.connect
+def flush_nautobot_job_logging(**kwargs):
+    """Record any job log entries still buffered by the nautobot database logging handlers at the end of each task."""
+    flush_database_handlers()
+
+
 @signals.worker_ready.connect
 def setup_prometheus(**kwargs):
     """This sets up an HTTP server to serve prometheus metrics from the celery workers."""
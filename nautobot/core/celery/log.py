@@ -1,38 +1,111 @@
 import logging
+import time
+import weakref
 
 from celery import current_task
 from django.core.exceptions import ValidationError
 
+logger = logging.getLogger(__name__)
+
+# All NautobotDatabaseHandler instances, so that their buffers can be flushed at the end of each task
+_database_handlers = weakref.WeakSet()
+
 
 class NautobotDatabaseHandler(logging.Handler):
-    """Custom logging handler to log messages to JobLogEntry database entries."""
+    """
+    Custom logging handler to log messages to JobLogEntry database entries.
+
+    Rather than creating each entry as soon as it's logged, entries are buffered and created in bulk, in the order in
+    which they were logged. The buffer is flushed whenever it holds `capacity` entries, whenever an entry is logged
+    more than `flush_interval` seconds after the previous flush, and at the end of each task (see
+    `flush_database_handlers()`).
+    """
+
+    def __init__(self, level=logging.NOTSET, capacity=100, flush_interval=1.0):
+        super().__init__(level)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.last_flush = time.monotonic()
+        # The task ID and JobResult of the most recently logged entry, to avoid looking it up again for every entry
+        self._job_result = (None, None)
+        _database_handlers.add(self)
+
+    def get_job_result(self, task_id):
+        """Get the JobResult of the task with the given ID, or None if there isn't one."""
+        from nautobot.extras.models.jobs import JobResult
+
+        cached_task_id, job_result = self._job_result
+        if task_id == cached_task_id:
+            return job_result
+
+        try:
+            job_result = JobResult.objects.get(id=task_id)
+        except (ValidationError, JobResult.DoesNotExist):
+            # Both of these cases are very rare
+            # ValidationError - because the task_id might not a valid UUID
+            # JobResult.DoesNotExist - because we might not have a JobResult with that ID
+            return None
+        self._job_result = (task_id, job_result)
+        return job_result
 
     def emit(self, record):
         if current_task is None:
             return
 
-        from nautobot.extras.models.jobs import JobResult
-
         try:
             self.format(record)
 
-            try:
-                job_result = JobResult.objects.get(id=record.task_id)
-            except (ValidationError, JobResult.DoesNotExist):
-                # Both of these cases are very rare
-                # ValidationError - because the task_id might not a valid UUID
-                # JobResult.DoesNotExist - because we might not have a JobResult with that ID
-                return
-
             # Skip recording the log entry if it has been marked as such
             if getattr(record, "skip_db_logging", False):
                 return
 
-            job_result.log(
+            job_result = self.get_job_result(record.task_id)
+            if job_result is None:
+                return
+
+            log_entry = job_result.build_log_entry(
                 message=record.message,
                 level_choice=record.levelname.lower(),
                 obj=getattr(record, "object", None),
                 grouping=getattr(record, "grouping", record.funcName),
             )
+            self.buffer.append((job_result.log_entries_database, log_entry))
+            if len(self.buffer) >= self.capacity or time.monotonic() - self.last_flush >= self.flush_interval:
+                self.flush()
         except Exception:
             self.handleError(record)
+
+    def flush(self):
+        """Create all buffered JobLogEntry records in bulk."""
+        from nautobot.extras.models.jobs import JobLogEntry
+
+        self.acquire()
+        try:
+            buffer, self.buffer = self.buffer, []
+            self.last_flush = time.monotonic()
+            if not buffer:
+                return
+
+            # Group the entries by database, preserving their order within each one
+            log_entries = {}
+            for database, log_entry in buffer:
+                log_entries.setdefault(database, []).append(log_entry)
+            for database, entries in log_entries.items():
+                try:
+                    JobLogEntry.objects.using(database).bulk_create(entries)
+                except Exception:
+                    logger.exception("Unable to record %d job log entries", len(entries))
+        finally:
+            self.release()
+
+    def close(self):
+        self.flush()
+        _database_handlers.discard(self)
+        super().close()
+
+
+def flush_database_handlers():
+    """Flush the buffered log entries of all NautobotDatabaseHandlers, as needed at the end of a task."""
+    for handler in list(_database_handlers):
+        handler.flush()
@@ -133,6 +133,7 @@ GLOBAL_SEARCH_EXCLUDE_LIST = [
     "devicebay",
     "devicebaytemplate",
     "devicetypetosoftwareimagefile",
+    "dynamicgroupcachedmember",
     "dynamicgroupmembership",
     "exporttemplate",
     "fileattachment",
@@ -0,0 +1,68 @@
+"""GraphQL backend that caches parsed and validated query documents."""
+
+from collections import OrderedDict
+from functools import partial
+import hashlib
+import threading
+
+from django.conf import settings
+from graphql import GraphQLCoreBackend
+from graphql.execution import execute, ExecutionResult
+from graphql.validation import validate
+
+
+class CachedDocumentBackend(GraphQLCoreBackend):
+    """
+    GraphQL backend that keeps the parsed and validated documents of the most recently executed queries.
+
+    The default `GraphQLCoreBackend` parses each query string anew, and validates the parsed document against the schema
+    every time it's executed. This backend instead validates each document once when it's parsed and keeps up to
+    `cache_size` valid documents, keyed by the SHA-256 hash of their query string, in a least-recently-used cache.
+    """
+
+    def __init__(self, cache_size=1000, executor=None):
+        super().__init__(executor=executor)
+        self.cache_size = cache_size
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+
+    def document_from_string(self, schema, document_string):
+        if not self.cache_size or not isinstance(document_string, str):
+            return super().document_from_string(schema, document_string)
+
+        key = (schema, hashlib.sha256(document_string.encode()).hexdigest())
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+                return document
+
+        document = super().document_from_string(schema, document_string)
+        errors = validate(schema, document.document_ast)
+        if errors:
+            # Invalid documents aren't cached, so that they don't push valid ones out of the cache
+            document.execute = lambda *args, **kwargs: ExecutionResult(errors=errors, invalid=True)
+            return document
+        document.execute = partial(execute, schema, document.document_ast, **self.execute_params)
+
+        with self._lock:
+            self._documents[key] = document
+            while len(self._documents) > self.cache_size:
+                self._documents.popitem(last=False)
+        return document
+
+    def clear(self):
+        """Discard all cached documents."""
+        with self._lock:
+            self._documents.clear()
+
+
+_backend = None
+
+
+def get_graphql_backend():
+    """Return the GraphQL backend shared by all GraphQL queries, sized by `settings.GRAPHQL_DOCUMENT_CACHE_SIZE`."""
+    global _backend
+    if _backend is None:
+        _backend = CachedDocumentBackend(cache_size=settings.GRAPHQL_DOCUMENT_CACHE_SIZE)
+    return _backend
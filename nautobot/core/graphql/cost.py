@@ -0,0 +1,200 @@
+"""Static cost analysis of GraphQL queries."""
+
+from collections import namedtuple
+import math
+
+from graphql import value_from_ast
+from graphql.language import ast
+from graphql.type import GraphQLList, GraphQLNonNull
+from graphql.type.definition import get_named_type
+
+from nautobot.core.models.querysets import estimate_count
+
+#: Estimated cost of a GraphQL query, and the maximum depth of nested fields in it.
+QueryCost = namedtuple("QueryCost", ["cost", "depth"])
+
+
+class QueryCostEstimator:
+    """
+    Estimate the cost of executing a GraphQL query, without executing it.
+
+    The cost of a query is the number of field values in its response, with each field of each object in a list counted
+    separately. As the number of objects in each list isn't known before the query is executed, each list is assumed to
+    hold the number of objects given by its `limit` argument, or `list_size` objects if it has none. Introspection
+    fields (such as `__schema` and `__typename`) aren't counted.
+
+    If `estimate_counts` is True, lists of model instances are instead assumed to hold the number of objects estimated
+    by the database (see `estimate_count()`), up to their `limit`: at the top level of the query, the number of
+    objects that match the list's filters, and nested within other objects, the average number of objects of the
+    list's model per object of its parent's model.
+
+    Example:
+        >>> estimator = QueryCostEstimator(schema, document_ast, list_size=100)
+        >>> estimator.estimate()
+        QueryCost(cost=10101, depth=3)
+    """
+
+    def __init__(self, schema, document_ast, variables=None, list_size=100, estimate_counts=False):
+        self.schema = schema
+        self.document_ast = document_ast
+        self.variables = variables or {}
+        self.list_size = list_size
+        self.estimate_counts = estimate_counts
+        self._model_counts = {}
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document_ast.definitions
+            if isinstance(definition, ast.FragmentDefinition)
+        }
+
+    def get_operation(self, operation_name=None):
+        """Return the operation definition that would be executed for the given operation name, if any."""
+        operations = [
+            definition
+            for definition in self.document_ast.definitions
+            if isinstance(definition, ast.OperationDefinition)
+        ]
+        if operation_name is None:
+            return operations[0] if len(operations) == 1 else None
+        for operation in operations:
+            if operation.name and operation.name.value == operation_name:
+                return operation
+        return None
+
+    def estimate(self, operation_name=None):
+        """Return the estimated QueryCost of executing the given operation of the document."""
+        operation = self.get_operation(operation_name)
+        if operation is None:
+            return QueryCost(0, 0)
+        root_type = {
+            "query": self.schema.get_query_type(),
+            "mutation": self.schema.get_mutation_type(),
+            "subscription": self.schema.get_subscription_type(),
+        }.get(operation.operation)
+        if root_type is None:
+            return QueryCost(0, 0)
+        return self._estimate_selection_set(operation.selection_set, root_type, depth=1, fragment_names=())
+
+    def get_list_size(self, field_ast, field_def=None, parent_type=None):
+        """Return the assumed number of objects in the list returned by the given field."""
+        limit = None
+        for argument in field_ast.arguments or []:
+            if argument.name.value != "limit":
+                continue
+            value = argument.value
+            if isinstance(value, ast.Variable):
+                value = self.variables.get(value.name.value)
+            elif isinstance(value, ast.IntValue):
+                value = int(value.value)
+            if isinstance(value, int) and value > 0:
+                limit = value
+
+        count = None
+        if self.estimate_counts and field_def is not None:
+            count = self.get_object_count(field_ast, field_def, parent_type)
+        if count is None:
+            return limit or self.list_size
+        return min(limit, count) if limit else count
+
+    def get_object_count(self, field_ast, field_def, parent_type):
+        """
+        Return the estimated number of objects in the list of model instances returned by the given field, or None if
+        it doesn't return model instances.
+        """
+        model = _get_model(get_named_type(field_def.type))
+        if model is None:
+            return None
+
+        if parent_type is self.schema.get_query_type():
+            filterset_class = getattr(get_named_type(field_def.type).graphene_type._meta, "filterset_class", None)
+            if filterset_class is None:
+                return self.get_model_count(model)
+            # Apply the same filters as the list resolver, but without restricting the objects to those that the user
+            # is permitted to view, which can only make the list shorter
+            filter_params = {
+                argument.name.value: value_from_ast(
+                    argument.value, field_def.args[argument.name.value].type, self.variables
+                )
+                for argument in field_ast.arguments or []
+                if argument.name.value in field_def.args and argument.name.value not in ("limit", "offset", "cursor")
+            }
+            if not filter_params:
+                return self.get_model_count(model)
+            filterset = filterset_class(filter_params, model.objects.all())
+            if not filterset.is_valid():
+                # The query will fail with the filterset's errors when executed
+                return 0
+            return estimate_count(filterset.qs)
+
+        parent_model = _get_model(parent_type)
+        if parent_model is None:
+            return None
+        return math.ceil(self.get_model_count(model) / max(self.get_model_count(parent_model), 1))
+
+    def get_model_count(self, model):
+        """Return the estimated number of objects of the given model, estimating it only once per model."""
+        if model not in self._model_counts:
+            self._model_counts[model] = estimate_count(model.objects.all())
+        return self._model_counts[model]
+
+    def _estimate_selection_set(self, selection_set, parent_type, depth, fragment_names):
+        cost = 0
+        max_depth = depth - 1
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                field_cost, field_depth = self._estimate_field(selection, parent_type, depth, fragment_names)
+            elif isinstance(selection, ast.InlineFragment):
+                fragment_type = parent_type
+                if selection.type_condition:
+                    fragment_type = self.schema.get_type(selection.type_condition.name.value)
+                field_cost, field_depth = self._estimate_selection_set(
+                    selection.selection_set, fragment_type, depth, fragment_names
+                )
+            else:
+                # A fragment spread; cyclic spreads are rejected by validation, but guard against them regardless
+                fragment = self.fragments.get(selection.name.value)
+                if fragment is None or fragment.name.value in fragment_names:
+                    continue
+                field_cost, field_depth = self._estimate_selection_set(
+                    fragment.selection_set,
+                    self.schema.get_type(fragment.type_condition.name.value),
+                    depth,
+                    (*fragment_names, fragment.name.value),
+                )
+            cost += field_cost
+            max_depth = max(max_depth, field_depth)
+        return QueryCost(cost, max_depth)
+
+    def _estimate_field(self, field_ast, parent_type, depth, fragment_names):
+        name = field_ast.name.value
+        fields = getattr(parent_type, "fields", None) or {}
+        if name.startswith("__") or name not in fields:
+            return QueryCost(0, depth - 1)
+
+        field_type = fields[name].type
+        if isinstance(field_type, GraphQLNonNull):
+            field_type = field_type.of_type
+
+        if not field_ast.selection_set:
+            return QueryCost(1, depth)
+        child_cost, child_depth = self._estimate_selection_set(
+            field_ast.selection_set, get_named_type(field_type), depth + 1, fragment_names
+        )
+        if isinstance(field_type, GraphQLList):
+            child_cost *= self.get_list_size(field_ast, fields[name], parent_type)
+        return QueryCost(1 + child_cost, max(depth, child_depth))
+
+
+def _get_model(graphql_type):
+    """Return the Django model of the given GraphQL object type, if it has one."""
+    graphene_meta = getattr(getattr(graphql_type, "graphene_type", None), "_meta", None)
+    return getattr(graphene_meta, "model", None)
+
+
+def get_result_cost(data):
+    """Return the actual cost of a GraphQL query from its response data, counted as by `QueryCostEstimator`."""
+    if isinstance(data, dict):
+        return sum(1 + get_result_cost(value) for key, value in data.items() if not key.startswith("__"))
+    if isinstance(data, list):
+        return sum(get_result_cost(item) for item in data)
+    return 0
@@ -0,0 +1,170 @@
+"""DataLoaders for batching the database queries of GraphQL resolvers across all of the objects in a query."""
+
+from collections import defaultdict
+import logging
+
+from django.db.models import Q
+import graphene_django_optimizer as gql_optimizer
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from nautobot.core.utils.config import get_settings_or_config
+from nautobot.extras.choices import RelationshipSideChoices
+
+logger = logging.getLogger(__name__)
+
+
+def get_dataloader(info, key, loader_factory):
+    """
+    Get the DataLoader identified by `key` for the GraphQL query currently being executed, creating it if needed.
+
+    DataLoaders cache the values they load, so each one must only be used for a single execution of a query, even if the
+    same request (`info.context`) is used to execute several queries, as happens in tests and in `execute_query()`.
+    The `variable_values` dict is created afresh for each execution, so it's used to tell executions apart.
+
+    Args:
+        info (ResolveInfo): GraphQL resolver info
+        key (tuple): unique identifier of the DataLoader within the execution
+        loader_factory (callable): called with no arguments to create the DataLoader
+    """
+    execution, loaders = getattr(info.context, "_nautobot_dataloaders", (None, None))
+    if execution is not info.variable_values:
+        loaders = {}
+        info.context._nautobot_dataloaders = (info.variable_values, loaders)
+    if key not in loaders:
+        loaders[key] = loader_factory()
+    return loaders[key]
+
+
+def optimized_list(queryset, info):
+    """Evaluate the queryset, optimized for the fields selected by `info` where possible."""
+    # graphene_django_optimizer fails for some queries that only select the `id` of the objects, in which case we
+    # just fall back to the unoptimized query; see https://github.com/nautobot/nautobot/issues/1228
+    try:
+        return list(gql_optimizer.query(queryset, info))
+    except (AttributeError, TypeError):
+        logger.debug("Caught exception in graphene_django_optimizer, falling back to un-optimized query")
+        return list(queryset)
+
+
+class ObjectLoader(DataLoader):
+    """Load instances of `model` by their primary key, returning None for any that don't exist."""
+
+    def __init__(self, model, **kwargs):
+        super().__init__(**kwargs)
+        self.model = model
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        objects = self.model.objects.in_bulk(keys)
+        return Promise.resolve([objects.get(key) for key in keys])
+
+
+def load_object(info, model, pk):
+    """Load the `model` instance with the given primary key, batched with all other such loads in the query."""
+    if pk is None:
+        return None
+    return get_dataloader(info, ("object", model), lambda: ObjectLoader(model)).load(pk)
+
+
+class RelationshipPeersLoader(DataLoader):
+    """
+    Load the peers of objects on the given side of a Relationship, as a list of peers for each object's primary key.
+
+    The peers of all of the objects are loaded with one query for their RelationshipAssociations and one query for the
+    peer objects themselves, which is optimized for the fields selected by `info`.
+    """
+
+    def __init__(self, relationship, side, peer_model, info, **kwargs):
+        super().__init__(**kwargs)
+        self.relationship = relationship
+        self.side = side
+        self.peer_model = peer_model
+        self.info = info
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        peer_ids = defaultdict(set)
+        associations = self.relationship.relationship_associations.all()
+        if not self.relationship.symmetric:
+            peer_side = RelationshipSideChoices.OPPOSITE[self.side]
+            associations = associations.filter(**{f"{self.side}_id__in": keys})
+            for object_id, peer_id in associations.values_list(f"{self.side}_id", f"{peer_side}_id"):
+                peer_ids[peer_id].add(object_id)
+        else:
+            # Get objects that are peers for this relationship, regardless of side
+            keys_set = set(keys)
+            associations = associations.filter(Q(source_id__in=keys) | Q(destination_id__in=keys))
+            for source_id, destination_id in associations.values_list("source_id", "destination_id"):
+                if source_id in keys_set:
+                    peer_ids[destination_id].add(source_id)
+                if destination_id in keys_set:
+                    peer_ids[source_id].add(destination_id)
+
+        peers = defaultdict(list)
+        if peer_ids:
+            for peer in optimized_list(self.peer_model.objects.filter(id__in=peer_ids.keys()), self.info):
+                for object_id in peer_ids[peer.pk]:
+                    peers[object_id].append(peer)
+        return Promise.resolve([peers[key] for key in keys])
+
+
+def load_relationship_peers(info, obj, relationship, side, peer_model):
+    """Load the list of peers of the given object on the given side of a Relationship."""
+    # The peers are optimized for the fields selected by `info`, so each field selecting them needs its own DataLoader
+    key = ("relationship", relationship.pk, side, tuple(id(field_ast) for field_ast in info.field_asts))
+    return get_dataloader(info, key, lambda: RelationshipPeersLoader(relationship, side, peer_model, info)).load(obj.pk)
+
+
+class ComputedFieldLoader(DataLoader):
+    """Render the ComputedField with the given key for many instances of `model`, looking it up only once."""
+
+    def __init__(self, model, computed_field_key, **kwargs):
+        super().__init__(**kwargs)
+        self.model = model
+        self.computed_field_key = computed_field_key
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        from nautobot.extras.models import ComputedField
+
+        computed_fields = ComputedField.objects.get_snapshot_for_model(self.model)
+        computed_field = next((cf for cf in computed_fields if cf.key == self.computed_field_key), None)
+        if computed_field is None:
+            logger.warning(
+                "Computed Field with key %s does not exist for model %s",
+                self.computed_field_key,
+                self.model._meta.verbose_name,
+            )
+            return Promise.resolve([None] * len(keys))
+        return Promise.resolve([computed_field.render(context={"obj": obj}) for obj in keys])
+
+
+def load_computed_field(info, obj, computed_field_key):
+    """Render the computed field with the given key for the given object."""
+    model = type(obj)
+    key = ("computed_field", model, computed_field_key)
+    return get_dataloader(info, key, lambda: ComputedFieldLoader(model, computed_field_key)).load(obj)
+
+
+class ConfigContextLoader(DataLoader):
+    """Render the config contexts of many Devices or VirtualMachines at once."""
+
+    def __init__(self, model, **kwargs):
+        super().__init__(**kwargs)
+        self.model = model
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        from nautobot.extras.config_contexts import ConfigContextRenderer, get_cached_config_contexts
+
+        if get_settings_or_config("CONFIG_CONTEXT_CACHE_TIMEOUT") != 0:
+            rendered = get_cached_config_contexts(keys)
+        else:
+            rendered = ConfigContextRenderer(self.model).render_many(keys)
+        return Promise.resolve([rendered[obj.pk] for obj in keys])
+
+
+def load_config_context(info, obj):
+    """Render the config context of the given Device or VirtualMachine."""
+    if hasattr(obj, "_cached_config_context") or hasattr(obj, "config_context_data"):
+        # Already available without any further queries
+        return obj.get_config_context()
+    model = type(obj)
+    return get_dataloader(info, ("config_context", model), lambda: ConfigContextLoader(model)).load(obj)
@@ -6,11 +6,12 @@ import graphene
 import graphene_django_optimizer as gql_optimizer
 from graphql import GraphQLError
 
+from nautobot.core.graphql.dataloaders import load_computed_field, load_relationship_peers, optimized_list
 from nautobot.core.graphql.types import OptimizedNautobotObjectType
-from nautobot.core.graphql.utils import get_filtering_args_from_filterset, str_to_var_name
+from nautobot.core.graphql.utils import get_filtering_args_from_filterset, record_next_cursor, str_to_var_name
+from nautobot.core.models.querysets import KeysetPaginator
 from nautobot.core.utils.lookup import get_filterset_for_model
 from nautobot.extras.choices import RelationshipSideChoices
-from nautobot.extras.models import RelationshipAssociation
 
 logger = logging.getLogger(__name__)
 RESOLVER_PREFIX = "resolve_"
@@ -116,7 +117,7 @@ def generate_computed_field_resolver(name, resolver_name):
     """
 
     def resolve_computed_field(self, info, **kwargs):
-        return self.get_computed_field(key=name)
+        return load_computed_field(info, self, name)
 
     resolve_computed_field.__name__ = resolver_name
     return resolve_computed_field
@@ -134,72 +135,13 @@ def generate_relationship_resolver(name, resolver_name, relationship, side, peer
     """
 
     def resolve_relationship(self, info, **kwargs):
-        """Return a queryset or an object depending on the type of the relationship."""
+        """Return a list or an object depending on the type of the relationship."""
         peer_side = RelationshipSideChoices.OPPOSITE[side]
-        query_params = {"relationship": relationship}
-        # https://github.com/nautobot/nautobot/issues/1228
-        # If querying for **only** the ID of the related object, for example:
-        # { device(id:"...") { ... rel_my_relationship { id } } }
-        # we will get this exception:
-        # TypeError: Cannot call select_related() after .values() or .values_list()
-        # This appears to be a bug in graphene_django_optimizer but I haven't found a known issue on GitHub.
-        # For now we just work around it by catching the exception and retrying without optimization, below...
-        if not relationship.symmetric:
-            # Get the objects on the other side of this relationship
-            query_params[f"{side}_id"] = self.pk
-
-            try:
-                queryset_ids = gql_optimizer.query(
-                    RelationshipAssociation.objects.filter(**query_params).values_list(f"{peer_side}_id", flat=True),
-                    info,
-                )
-            except TypeError:
-                logger.debug("Caught TypeError in graphene_django_optimizer, falling back to un-optimized query")
-                queryset_ids = RelationshipAssociation.objects.filter(**query_params).values_list(
-                    f"{peer_side}_id", flat=True
-                )
-        else:
-            # Get objects that are peers for this relationship, regardless of side
-            try:
-                queryset_ids = list(
-                    gql_optimizer.query(
-                        RelationshipAssociation.objects.filter(source_id=self.pk, **query_params).values_list(
-                            "destination_id", flat=True
-                        ),
-                        info,
-                    )
-                )
-                queryset_ids += list(
-                    gql_optimizer.query(
-                        RelationshipAssociation.objects.filter(destination_id=self.pk, **query_params).values_list(
-                            "source_id", flat=True
-                        ),
-                        info,
-                    )
-                )
-            except TypeError:
-                logger.debug("Caught TypeError in graphene_django_optimizer, falling back to un-optimized query")
-                queryset_ids = list(
-                    RelationshipAssociation.objects.filter(source_id=self.pk, **query_params).values_list(
-                        "destination_id", flat=True
-                    ),
-                )
-                queryset_ids += list(
-                    RelationshipAssociation.objects.filter(destination_id=self.pk, **query_params).values_list(
-                        "source_id", flat=True
-                    ),
-                )
-
+        # The peers of all of the objects in the query are loaded together, see RelationshipPeersLoader
+        peers = load_relationship_peers(info, self, relationship, side, peer_model)
         if relationship.has_many(peer_side):
-            return gql_optimizer.query(peer_model.objects.filter(id__in=queryset_ids), info)
-
-        # Also apparently a graphene_django_optimizer bug - in the same query case as described above, here we may see:
-        # AttributeError: object has no attribute "only"
-        try:
-            return gql_optimizer.query(peer_model.objects.filter(id__in=queryset_ids).first(), info)
-        except AttributeError:
-            logger.debug("Caught AttributeError in graphene_django_optimizer, falling back to un-optimized query")
-            return peer_model.objects.filter(id__in=queryset_ids).first()
+            return peers
+        return peers.then(lambda peers: peers[0] if peers else None)
 
     resolve_relationship.__name__ = resolver_name
     return resolve_relationship
@@ -251,6 +193,7 @@ def generate_list_search_parameters(schema_type):
     search_params = {
         "limit": graphene.Int(),
         "offset": graphene.Int(),
+        "cursor": graphene.String(),
     }
     if schema_type._meta.filterset_class is not None:
         search_params.update(
@@ -294,6 +237,9 @@ def generate_list_resolver(schema_type, resolver_name):
     the resolver will pass all arguments received to the FilterSet
     If not, it will return a restricted queryset for all objects
 
+    If a `cursor` is given, the objects are paginated by keyset (see `KeysetPaginator`) rather than by offset, and the
+    cursor of the next page is returned in the response extensions (see `record_next_cursor()`).
+
     Args:
         schema_type (DjangoObjectType): DjangoObjectType for a given model
         resolver_name (str): name of the resolver
@@ -303,7 +249,7 @@ def generate_list_resolver(schema_type, resolver_name):
     """
     model = schema_type._meta.model
 
-    def list_resolver(self, info, limit=None, offset=None, **kwargs):
+    def list_resolver(self, info, limit=None, offset=None, cursor=None, **kwargs):
         filterset_class = schema_type._meta.filterset_class
         if filterset_class is not None:
             resolved_obj = filterset_class(kwargs, model.objects.restrict(info.context.user, "view").all())
@@ -324,6 +270,20 @@ def generate_list_resolver(schema_type, resolver_name):
         else:
             qs = model.objects.restrict(info.context.user, "view").all()
 
+        if cursor is not None:
+            paginator = KeysetPaginator(qs)
+            try:
+                qs = paginator.get_queryset(cursor)
+            except ValueError as exc:
+                raise GraphQLError(str(exc))
+            if not limit:
+                record_next_cursor(info, None)
+                return optimized_list(qs, info)
+            # Fetch one extra object to find out whether there's a next page
+            objects = optimized_list(qs[: limit + 1], info)
+            record_next_cursor(info, paginator.get_cursor(objects[limit - 1]) if len(objects) > limit else None)
+            return objects[:limit]
+
         if offset:
             qs = qs[offset:]
 
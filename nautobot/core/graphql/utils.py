@@ -1,5 +1,6 @@
 import logging
 
+from django.contrib.contenttypes.models import ContentType
 from django_filters.filters import BooleanFilter, MultipleChoiceFilter, NumberFilter
 import graphene
 
@@ -10,6 +11,7 @@ from nautobot.core.filters import (
     MultiValueNumberFilter,
 )
 from nautobot.core.graphql import BigInteger
+from nautobot.core.graphql.dataloaders import load_object
 from nautobot.core.models.fields import slugify_dashes_to_underscores
 
 logger = logging.getLogger(__name__)
@@ -100,24 +102,57 @@ def construct_resolver(model_name, resolver_type):
         model_name (str): Name of the model to construct a resolver function for (e.g. CircuitTermination).
         resolver_type (str): One of ['connected_endpoint', 'cable_peer']
     """
-    if resolver_type == "cable_peer":
+    from nautobot.dcim.models import CablePath
 
-        def resolve_cable_peer(self, args):
-            peer = self.get_cable_peer()
-            if type(peer).__name__ == model_name:
-                return peer
+    def load_if_model_matches(info, content_type_id, object_id):
+        # Skip loading any objects of other models than the one this resolver is for
+        model = ContentType.objects.get_for_id(content_type_id).model_class() if content_type_id else None
+        if model is None or model.__name__ != model_name:
             return None
+        return load_object(info, model, object_id)
+
+    # The peers and endpoints of all of the objects in the query are loaded together, see load_object()
+    if resolver_type == "cable_peer":
+
+        def resolve_cable_peer(self, info):
+            return load_if_model_matches(info, self._cable_peer_type_id, self._cable_peer_id)
 
         return resolve_cable_peer
 
     if resolver_type == "connected_endpoint":
 
-        def resolve_connected_endpoint(self, args):
-            peer = self.connected_endpoint
-            if type(peer).__name__ == model_name:
-                return peer
-            return None
+        def resolve_connected_endpoint(self, info):
+            if hasattr(self, "_connected_endpoint"):
+                peer = self._connected_endpoint
+                return peer if type(peer).__name__ == model_name else None
+            if self._path_id is None:
+                return None
+            return load_object(info, CablePath, self._path_id).then(
+                lambda path: (
+                    load_if_model_matches(info, path.destination_type_id, path.destination_id) if path else None
+                )
+            )
 
         return resolve_connected_endpoint
 
     raise ValueError(f"resolver_type must be 'cable_peer' or 'connected_endpoint', not '{resolver_type}'")
+
+
+def record_next_cursor(info, cursor):
+    """
+    Record the cursor of the next page of the list field being resolved, or None if there is no next page.
+
+    List fields can't carry the cursor themselves, so the cursors of all of the list fields in a query are returned in
+    the `cursors` extension of the response, keyed by the path of each field (see `get_next_cursors()`).
+    """
+    # As with DataLoaders, keep the cursors of each execution of a query apart, even if they share the same context
+    execution, cursors = getattr(info.context, "_nautobot_next_cursors", (None, None))
+    if execution is not info.variable_values:
+        cursors = {}
+        info.context._nautobot_next_cursors = (info.variable_values, cursors)
+    cursors[".".join(str(key) for key in info.path)] = cursor
+
+
+def get_next_cursors(context):
+    """Return the next-page cursors recorded by `record_next_cursor()` in the most recent query executed in `context`."""
+    return getattr(context, "_nautobot_next_cursors", (None, {}))[1]
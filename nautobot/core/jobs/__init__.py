@@ -14,6 +14,7 @@ from nautobot.core.api.renderers import NautobotCSVRenderer
 from nautobot.core.api.utils import get_serializer_for_model
 from nautobot.core.celery import app, register_jobs
 from nautobot.core.exceptions import AbortTransaction
+from nautobot.core.jobs.cleanup import LogsCleanup
 from nautobot.core.utils.lookup import get_filterset_for_model
 from nautobot.core.utils.requests import get_filterable_params_from_filter_params
 from nautobot.extras.datasources import ensure_git_repository, git_repository_dry_run, refresh_datasource_content
@@ -243,6 +244,8 @@ class ImportObjects(Job):
                     self.logger.info('Row %d: Created record "%s"', row, new_obj, extra={"object": new_obj})
                     new_objs.append(new_obj)
                 except AbortTransaction:
+                    if hasattr(queryset, "discard_from_hierarchy_index"):
+                        queryset.discard_from_hierarchy_index(new_obj)
                     self.logger.error(
                         'Row %d: User "%s" does not have permission to create an object with these attributes',
                         row,
@@ -293,10 +296,15 @@ class ImportObjects(Job):
                 parser_context={"request": None, "serializer_class": serializer_class},
             )
             self.logger.info("Processing %d rows of data", len(data))
-            if roll_back_if_error:
-                new_objs, validation_failed = self._perform_atomic_operation(data, serializer_class, queryset)
-            else:
-                new_objs, validation_failed = self._perform_operation(data, serializer_class, queryset)
+            # For IPAM objects, resolve the Prefix hierarchy of all rows in memory rather than row by row
+            batch_context = contextlib.nullcontext()
+            if hasattr(queryset, "hierarchy_index"):
+                batch_context = queryset.hierarchy_index(data=data)
+            with batch_context:
+                if roll_back_if_error:
+                    new_objs, validation_failed = self._perform_atomic_operation(data, serializer_class, queryset)
+                else:
+                    new_objs, validation_failed = self._perform_operation(data, serializer_class, queryset)
         except drf_exceptions.ParseError as exc:
             validation_failed = True
             self.logger.error("`%s`", exc)
@@ -314,5 +322,5 @@ class ImportObjects(Job):
             raise RunJobTaskFailed("CSV import not fully successful, see logs")
 
 
-jobs = [ExportObjectList, GitRepositorySync, GitRepositoryDryRun, ImportObjects]
+jobs = [ExportObjectList, GitRepositorySync, GitRepositoryDryRun, ImportObjects, LogsCleanup]
 register_jobs(*jobs)
@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+from django.core.exceptions import PermissionDenied
+from django.utils import timezone
+
+from nautobot.core.utils.config import get_settings_or_config
+from nautobot.extras.jobs import IntegerVar, Job, MultiChoiceVar
+from nautobot.extras.models import JobLogEntry, ObjectChange
+
+name = "System Jobs"
+
+
+class CleanupTypes:
+    OBJECT_CHANGE = "extras.ObjectChange"
+    JOB_LOG_ENTRY = "extras.JobLogEntry"
+
+    CHOICES = (
+        (OBJECT_CHANGE, "Change log entries (ObjectChange)"),
+        (JOB_LOG_ENTRY, "Job log entries (JobLogEntry)"),
+    )
+
+
+class LogsCleanup(Job):
+    """
+    System job to delete change log and job log entries older than a given age, in bounded chunks.
+
+    This is intended to be scheduled (for example, daily) so that retention never has to be enforced as part of
+    handling a user request.
+    """
+
+    cleanup_types = MultiChoiceVar(
+        choices=CleanupTypes.CHOICES,
+        default=[CleanupTypes.OBJECT_CHANGE],
+        description="Types of records to clean up",
+        label="Cleanup Types",
+    )
+    max_age = IntegerVar(
+        required=False,
+        min_value=1,
+        description="Delete records older than this many days (defaults to the CHANGELOG_RETENTION setting)",
+        label="Max Age",
+    )
+    chunk_size = IntegerVar(
+        default=1000,
+        min_value=1,
+        description="Number of records to delete per database query",
+        label="Chunk Size",
+    )
+
+    class Meta:
+        name = "Logs Cleanup"
+        description = "Delete ObjectChange and/or JobLogEntry records older than a given age"
+        has_sensitive_variables = False
+        # Deleting a large backlog of records may take substantial processing time
+        soft_time_limit = 3600
+        time_limit = 3700
+
+    def cleanup_queryset(self, queryset, date_field, cutoff, chunk_size):
+        """
+        Delete all records in `queryset` whose `date_field` is older than `cutoff`, `chunk_size` records at a time.
+
+        Each chunk is selected by primary key in ascending `date_field` order, so that it is served from that field's
+        index, and deleted in its own query and transaction, so that no single query locks or scans the whole table.
+        """
+        model = queryset.model
+        queryset = queryset.filter(**{f"{date_field}__lt": cutoff})
+        total = queryset.count()
+        if not total:
+            self.logger.info("No %s older than %s to delete", model._meta.verbose_name_plural, cutoff)
+            return 0
+
+        self.logger.info("Deleting %d %s older than %s", total, model._meta.verbose_name_plural, cutoff)
+        deleted = 0
+        reported_percent = 0
+        while True:
+            pks = list(queryset.order_by(date_field).values_list("pk", flat=True)[:chunk_size])
+            if not pks:
+                break
+            # These models have no dependent objects, so skip the Collector, which would otherwise load every record
+            # and send its delete signals
+            chunk = model.objects.filter(pk__in=pks)
+            deleted += chunk._raw_delete(chunk.db)  # pylint: disable=protected-access
+            # Report progress in 10% steps rather than per chunk, to avoid flooding the job log
+            percent = min(deleted * 100 // total, 100)
+            if percent // 10 > reported_percent // 10:
+                self.logger.info("Deleted %d of %d %s (%d%%)", deleted, total, model._meta.verbose_name_plural, percent)
+                reported_percent = percent
+        self.logger.info("Deleted %d %s", deleted, model._meta.verbose_name_plural)
+        return deleted
+
+    def run(self, *, cleanup_types, max_age=None, chunk_size=1000):
+        if max_age is None:
+            max_age = get_settings_or_config("CHANGELOG_RETENTION")
+            if not max_age:
+                self.logger.warning("CHANGELOG_RETENTION is set to 0 (retain indefinitely) and no max age was given")
+                return {}
+        cutoff = timezone.now() - timedelta(days=max_age)
+
+        results = {}
+        for cleanup_type, model, date_field in (
+            (CleanupTypes.OBJECT_CHANGE, ObjectChange, "time"),
+            (CleanupTypes.JOB_LOG_ENTRY, JobLogEntry, "created"),
+        ):
+            if cleanup_type not in cleanup_types:
+                continue
+            if not self.user.has_perm(f"{model._meta.app_label}.delete_{model._meta.model_name}"):
+                self.logger.error(
+                    'User "%s" does not have permission to delete %s objects', self.user, model._meta.model_name
+                )
+                raise PermissionDenied(f"User does not have delete permissions on {model._meta.verbose_name_plural}")
+            results[cleanup_type] = self.cleanup_queryset(model.objects.all(), date_field, cutoff, chunk_size)
+        return results
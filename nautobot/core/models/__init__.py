@@ -83,6 +83,33 @@ class BaseModel(models.Model):
 
         raise AttributeError(f"Cannot find a URL for {self} ({self._meta.app_label}.{self._meta.model_name})")
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the field values as loaded, without copying them, so that `loaded_values_unchanged()` can tell
+        # whether the instance has been modified since
+        instance._loaded_values = (field_names, values)
+        return instance
+
+    def loaded_values_unchanged(self, attnames):
+        """
+        True if the given (concrete field) attributes still have the values loaded from the database, False otherwise.
+
+        Always False for an instance that wasn't loaded from the database, or if any of the attributes were deferred.
+        """
+        loaded_values = getattr(self, "_loaded_values", None)
+        if loaded_values is None:
+            return False
+        field_names, values = loaded_values
+        for attname in attnames:
+            try:
+                value = values[field_names.index(attname)]
+            except ValueError:
+                return False
+            if value is models.DEFERRED or getattr(self, attname) != value:
+                return False
+        return True
+
     @property
     def present_in_database(self):
         """
@@ -1,3 +1,5 @@
+import json
+
 from django.db import NotSupportedError
 from django.db.models import Aggregate, Func, JSONField
 
@@ -68,3 +70,105 @@ class EmptyGroupByJSONBAgg(JSONBAgg):
     """
 
     contains_aggregate = False
+
+
+def _mysql_json_path(key):
+    """Return the MySQL JSON path of the given top-level key of a JSON object."""
+    return f"$.{json.dumps(key)}"
+
+
+class JSONSet(Func):
+    """
+    Set the given top-level key of a JSON object to the given (JSON-serializable) value, adding the key if not present.
+
+    Supports both Postgres (JSONB_SET) and MySQL (JSON_SET).
+    """
+
+    output_field = JSONField()
+
+    def __init__(self, expression, key, value, **extra):
+        self.key = key
+        self.value = value
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        value = json.dumps(self.value)
+        vendor = connection.vendor
+        if vendor == "postgresql":
+            return f"JSONB_SET({sql}, %s::text[], %s::jsonb)", [*params, [self.key], value]
+        if vendor == "mysql":
+            return f"JSON_SET({sql}, %s, CAST(%s AS JSON))", [*params, _mysql_json_path(self.key), value]
+        raise NotSupportedError(f"JSONSet is not supported for database {vendor}")
+
+
+class JSONRemove(Func):
+    """
+    Remove the given top-level key from a JSON object.
+
+    Supports both Postgres (the `-` operator) and MySQL (JSON_REMOVE).
+    """
+
+    output_field = JSONField()
+
+    def __init__(self, expression, key, **extra):
+        self.key = key
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        vendor = connection.vendor
+        if vendor == "postgresql":
+            return f"({sql} - %s)", [*params, self.key]
+        if vendor == "mysql":
+            return f"JSON_REMOVE({sql}, %s)", [*params, _mysql_json_path(self.key)]
+        raise NotSupportedError(f"JSONRemove is not supported for database {vendor}")
+
+
+class JSONArrayReplace(Func):
+    """
+    Replace every occurrence of `old_value` with `new_value` in the array under the given top-level key of a JSON object.
+
+    Supports both Postgres (JSONB_AGG over JSONB_ARRAY_ELEMENTS) and MySQL (JSON_ARRAYAGG over JSON_TABLE). As with
+    `JSONBAgg`, MySQL does not guarantee that JSON_ARRAYAGG preserves the order of the array, though in practice it
+    aggregates the rows of JSON_TABLE in the order in which they are produced.
+    """
+
+    output_field = JSONField()
+    # Mapping of vendor => template, in which the JSON object expression appears twice
+    templates = {
+        "postgresql": (
+            "JSONB_SET(%(expression)s, %%s::text[], COALESCE(("
+            "SELECT JSONB_AGG(CASE WHEN elem = %%s::jsonb THEN %%s::jsonb ELSE elem END ORDER BY idx) "
+            "FROM JSONB_ARRAY_ELEMENTS(%(expression)s -> %%s) WITH ORDINALITY AS t(elem, idx)"
+            "), '[]'::jsonb))"
+        ),
+        "mysql": (
+            "JSON_SET(%(expression)s, %%s, COALESCE(("
+            "SELECT JSON_ARRAYAGG(CASE WHEN t.elem = CAST(%%s AS JSON) THEN CAST(%%s AS JSON) ELSE t.elem END) "
+            "FROM JSON_TABLE(%(expression)s, %%s COLUMNS (elem JSON PATH '$')) AS t"
+            "), JSON_ARRAY()))"
+        ),
+    }
+
+    def __init__(self, expression, key, old_value, new_value, **extra):
+        self.key = key
+        self.old_value = old_value
+        self.new_value = new_value
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        vendor = connection.vendor
+        if vendor not in self.templates:
+            raise NotSupportedError(f"JSONArrayReplace is not supported for database {vendor}")
+
+        sql, params = compiler.compile(self.source_expressions[0])
+        old_value = json.dumps(self.old_value)
+        new_value = json.dumps(self.new_value)
+        if vendor == "postgresql":
+            path, array_path = [self.key], self.key
+        else:
+            path = _mysql_json_path(self.key)
+            array_path = f"{path}[*]"
+        params = [*params, path, old_value, new_value, *params, array_path]
+        return self.templates[vendor] % {"expression": sql}, params
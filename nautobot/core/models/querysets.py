@@ -1,4 +1,10 @@
-from django.db.models import Count, OuterRef, Q, QuerySet, Subquery
+import base64
+import binascii
+import json
+
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.db import connections
+from django.db.models import Count, JSONField, OuterRef, Q, QuerySet, Subquery
 from django.db.models.functions import Coalesce
 
 from nautobot.core.models.utils import deconstruct_composite_key
@@ -32,6 +38,141 @@ def count_related(model, field, *, filter_dict=None, distinct=False):
     return Coalesce(subquery, 0)
 
 
+def estimate_count(queryset, exact_below=1000):
+    """
+    Return an estimate of the number of objects in the given queryset, without counting them.
+
+    On PostgreSQL the estimate is the number of rows that the query planner expects the query to return, which is far
+    cheaper to get than a `COUNT(*)` of a large table, but may be well off the mark for heavily filtered querysets or
+    tables whose statistics are out of date. Other databases don't offer a usable estimate, so the objects are counted.
+
+    Args:
+        queryset (QuerySet): The queryset to estimate the size of
+        exact_below (int): Estimates below this number are replaced by an exact count, as they're cheap to count and
+            the planner is least accurate for small results
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    estimate = plan[0]["Plan"]["Plan Rows"]
+    if estimate < exact_below:
+        return queryset.count()
+    return estimate
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset by keyset, as an alternative to LIMIT/OFFSET slicing.
+
+    The objects are ordered by the queryset's ordering (or the model's default ordering) followed by the primary key, so
+    that each object has a unique position. Each page starts after the object at the end of the previous page,
+    identified by an opaque cursor that encodes the ordering values of that object, so fetching a page costs the same
+    no matter how far into the queryset it is. If the ordering isn't made up of plain, non-null fields of the model
+    (for example if it orders by a related model or an annotation), the objects are ordered by primary key alone.
+
+    Example:
+        >>> paginator = KeysetPaginator(IPAddress.objects.all())
+        >>> page = list(paginator.get_queryset()[:100])
+        >>> cursor = paginator.get_cursor(page[-1])
+        >>> next_page = list(paginator.get_queryset(cursor)[:100])
+    """
+
+    def __init__(self, queryset):
+        self.queryset = queryset
+        self.ordering = self.get_ordering(queryset)
+
+    @staticmethod
+    def get_ordering(queryset):
+        """Return the ordering of the given queryset as a list of `(field, descending)` tuples, ending with the pk."""
+        model = queryset.model
+        pk = model._meta.pk
+        if queryset.query.order_by:
+            order_by = queryset.query.order_by
+        elif queryset.query.default_ordering:
+            order_by = model._meta.ordering
+        else:
+            order_by = ()
+
+        ordering = []
+        for item in order_by:
+            if not isinstance(item, str) or item == "?":
+                return [(pk, False)]
+            descending = item.startswith("-")
+            name = item.lstrip("-+")
+            if name == "pk":
+                name = pk.name
+            try:
+                field = model._meta.get_field(name)
+            except Exception:
+                return [(pk, False)]
+            if (
+                not getattr(field, "concrete", False)
+                or field.is_relation
+                or field.null
+                or isinstance(field, JSONField)
+                or field.model is not model
+            ):
+                return [(pk, False)]
+            if field == pk:
+                ordering.append((pk, descending))
+                return ordering
+            ordering.append((field, descending))
+
+        ordering.append((pk, False))
+        return ordering
+
+    def get_cursor(self, obj):
+        """Return the opaque cursor identifying the position of the given object."""
+        values = [field.value_to_string(obj) for field, _ in self.ordering]
+        return base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":")).encode()).decode()
+
+    def decode_cursor(self, cursor):
+        """Return the ordering values encoded in the given cursor, or raise a ValueError if it's invalid."""
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, UnicodeError, ValueError) as exc:
+            raise ValueError(f"Invalid cursor {cursor!r}") from exc
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise ValueError(f"Invalid cursor {cursor!r}")
+        try:
+            return [field.to_python(value) for (field, _), value in zip(self.ordering, values)]
+        except (ValidationError, TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid cursor {cursor!r}") from exc
+
+    def get_queryset(self, cursor=None):
+        """Return the ordered queryset of the objects after the given cursor, or of all objects if there's no cursor."""
+        queryset = self.queryset.order_by(
+            *[f"-{field.name}" if descending else field.name for field, descending in self.ordering]
+        )
+        if not cursor:
+            return queryset
+
+        values = self.decode_cursor(cursor)
+        # (f1 > v1) OR (f1 = v1 AND f2 > v2) OR ..., with "<" in place of ">" for descending fields
+        after = Q()
+        for i, (field, descending) in enumerate(self.ordering):
+            condition = Q(**{f"{field.name}__{'lt' if descending else 'gt'}": values[i]})
+            for j, (previous_field, _) in enumerate(self.ordering[:i]):
+                condition &= Q(**{previous_field.name: values[j]})
+            after |= condition
+        if len(self.ordering) > 1:
+            # Redundant with the above, but lets the database use an index on the first field to find the page
+            first_field, descending = self.ordering[0]
+            after &= Q(**{f"{first_field.name}__{'lte' if descending else 'gte'}": values[0]})
+        return queryset.filter(after)
+
+
 class CompositeKeyQuerySetMixin:
     """
     Mixin to extend a base queryset class with support for filtering by `composite_key=...` as a virtual parameter.
@@ -139,6 +280,24 @@ class RestrictedQuerySet(CompositeKeyQuerySetMixin, QuerySet):
 
         return qs
 
+    def restrict_pks(self, user, action, pks):
+        """
+        Return the subset of the given primary keys identifying objects that the specified user has been granted the
+        specified permission on, using a single query.
+
+        Args:
+          user (User): User instance
+          action (str): The action which must be permitted (e.g. "view" for "dcim.view_location")
+          pks (list): Primary keys of the objects to check
+
+        Returns:
+            (set): The primary keys of the permitted objects, as returned by the database
+        """
+        pks = list(pks)
+        if not pks:
+            return set()
+        return set(self.restrict(user, action).filter(pk__in=pks).values_list("pk", flat=True))
+
     def check_perms(self, user, *, instance=None, pk=None, action="view"):
         """
         Check whether the given user can perform the given action with regard to the given instance of this model.
@@ -160,6 +319,16 @@ class RestrictedQuerySet(CompositeKeyQuerySetMixin, QuerySet):
             raise ValueError("Either instance or pk must be specified!")
         if instance is not None and not isinstance(instance, self.model):
             raise TypeError(f"{instance} is not a {self.model}")
+        if (
+            instance is not None
+            and not instance._state.adding
+            and user.is_active
+            and not user.is_superuser
+            and not self.query.has_filters()
+        ):
+            # Simple constraints can be evaluated against the instance itself without a database query, provided that
+            # this queryset isn't filtered, as user.has_perm() only takes the user's permissions into account
+            return user.has_perm(f"{self.model._meta.app_label}.{action}_{self.model._meta.model_name}", instance)
         if pk is None:
             pk = instance.pk
 
@@ -81,10 +81,19 @@ if "NAUTOBOT_BANNER_TOP" in os.environ and os.environ["NAUTOBOT_BANNER_TOP"] !=
 if "NAUTOBOT_CHANGELOG_RETENTION" in os.environ and os.environ["NAUTOBOT_CHANGELOG_RETENTION"] != "":
     CHANGELOG_RETENTION = int(os.environ["NAUTOBOT_CHANGELOG_RETENTION"])
 
+# Buffer object changes made in each request, job, etc. and create them in bulk once its database transaction commits,
+# rather than serializing and saving each object change as the object is saved.
+CHANGELOG_DEFERRED = is_truthy(os.getenv("NAUTOBOT_CHANGELOG_DEFERRED", "False"))
+
 # Disable linking of Config Context objects via Dynamic Groups by default. This could cause performance impacts
 # when a large number of dynamic groups are present
 CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED = is_truthy(os.getenv("NAUTOBOT_CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED", "False"))
 
+# The number of seconds to cache the rendered config context of each device and virtual machine. Set this to `0` to
+# disable caching.
+if "NAUTOBOT_CONFIG_CONTEXT_CACHE_TIMEOUT" in os.environ and os.environ["NAUTOBOT_CONFIG_CONTEXT_CACHE_TIMEOUT"] != "":
+    CONFIG_CONTEXT_CACHE_TIMEOUT = int(os.environ["NAUTOBOT_CONFIG_CONTEXT_CACHE_TIMEOUT"])
+
 # UUID uniquely but anonymously identifying this Nautobot deployment.
 if "NAUTOBOT_DEPLOYMENT_ID" in os.environ and os.environ["NAUTOBOT_DEPLOYMENT_ID"] != "":
     DEPLOYMENT_ID = os.environ["NAUTOBOT_DEPLOYMENT_ID"]
@@ -229,6 +238,9 @@ SANITIZER_PATTERNS = [
     ),
 ]
 
+# The backend to use for the global search
+SEARCH_BACKEND = os.getenv("NAUTOBOT_SEARCH_BACKEND", "nautobot.extras.search.FilterSetSearchBackend")
+
 # Storage
 STORAGE_BACKEND = None
 STORAGE_CONFIG = {}
@@ -714,6 +726,13 @@ CONSTANCE_CONFIG = {
         "Used for sending anonymous installation metrics, when settings.INSTALLATION_METRICS_ENABLED is set to True.",
         field_type=str,
     ),
+    "CONFIG_CONTEXT_CACHE_TIMEOUT": ConstanceConfigItem(
+        default=0,
+        help_text="Rendered config context cache timeout in seconds. This is the amount of time that the rendered config "
+        "context of a device or virtual machine will be cached in Django cache backend. Cached config contexts are "
+        "invalidated when the object or any config context that may apply to it changes. Set to 0 to disable caching.",
+        field_type=int,
+    ),
     "DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT": ConstanceConfigItem(
         default=0,
         help_text="Dynamic Group member cache timeout in seconds. This is the amount of time that a Dynamic Group's member list "
@@ -815,7 +834,7 @@ CONSTANCE_CONFIG_FIELDSETS = {
     "Installation Metrics": ["DEPLOYMENT_ID"],
     "Natural Keys": ["DEVICE_NAME_AS_NATURAL_KEY", "LOCATION_NAME_AS_NATURAL_KEY"],
     "Pagination": ["PAGINATE_COUNT", "MAX_PAGE_SIZE", "PER_PAGE_DEFAULTS"],
-    "Performance": ["DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT", "JOB_CREATE_FILE_MAX_SIZE"],
+    "Performance": ["CONFIG_CONTEXT_CACHE_TIMEOUT", "DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT", "JOB_CREATE_FILE_MAX_SIZE"],
     "Rack Elevation Rendering": [
         "RACK_ELEVATION_DEFAULT_UNIT_HEIGHT",
         "RACK_ELEVATION_DEFAULT_UNIT_WIDTH",
@@ -854,6 +873,10 @@ GRAPHENE = {
 GRAPHQL_CUSTOM_FIELD_PREFIX = "cf"
 GRAPHQL_RELATIONSHIP_PREFIX = "rel"
 GRAPHQL_COMPUTED_FIELD_PREFIX = "cpf"
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.getenv("NAUTOBOT_GRAPHQL_DOCUMENT_CACHE_SIZE", "1000"))
+GRAPHQL_ESTIMATED_LIST_SIZE = int(os.getenv("NAUTOBOT_GRAPHQL_ESTIMATED_LIST_SIZE", "100"))
+GRAPHQL_MAX_QUERY_COST = int(os.getenv("NAUTOBOT_GRAPHQL_MAX_QUERY_COST", "0"))
+GRAPHQL_MAX_QUERY_DEPTH = int(os.getenv("NAUTOBOT_GRAPHQL_MAX_QUERY_DEPTH", "0"))
 
 
 #
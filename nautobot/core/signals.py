@@ -7,10 +7,14 @@ import logging
 
 from django.contrib.auth.signals import user_logged_in, user_logged_out
 from django.core.cache import cache
-from django.db.models.signals import post_delete, post_save
+from django.core.signals import request_started
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver, Signal
 import redis.exceptions
 
+from nautobot.core.utils.cache import expire_generational_caches
+
 nautobot_database_ready = Signal()
 """
 Signal sent to all installed apps and plugins after the database is ready.
@@ -41,6 +45,12 @@ def user_logged_out_signal(sender, request, user, **kwargs):
     logger.info(f"User {user} has logged out")
 
 
+@receiver(request_started)
+def expire_generational_caches_on_request(sender, **kwargs):
+    """Check whether the values held by process-local caches are still valid once for each request."""
+    expire_generational_caches()
+
+
 def disable_for_loaddata(signal_handler):
     """
     Return early from the given signal handler if triggered during a `nautobot-server loaddata` call.
@@ -73,3 +83,35 @@ def invalidate_max_depth_cache(sender, **kwargs):
 
     with contextlib.suppress(redis.exceptions.ConnectionError):
         cache.delete(sender.objects.max_depth_cache_key)
+
+
+@receiver(post_save)
+@receiver(m2m_changed)
+@receiver(post_delete)
+def invalidate_object_permissions_cache(sender, **kwargs):
+    """Clear the cached ObjectPermissions of all users when permissions, their assignments or group memberships change."""
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import Group
+
+    from nautobot.core.authentication import ObjectPermissionBackend
+    from nautobot.users.models import ObjectPermission
+
+    if sender not in (
+        ObjectPermission,
+        ObjectPermission.users.through,
+        ObjectPermission.groups.through,
+        ObjectPermission.object_types.through,
+        Group,
+        get_user_model().groups.through,
+    ):
+        return
+
+    def delete_cached_object_permissions():
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            cache.delete_pattern(f"{ObjectPermissionBackend.get_object_permissions.cache_key_prefix}.*")
+
+    delete_cached_object_permissions()
+    # Other requests may cache the permissions again before the current transaction is committed, from the data as it
+    # was before it, so clear them again once it has been
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(delete_cached_object_permissions)
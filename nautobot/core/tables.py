@@ -38,14 +38,15 @@ class BaseTable(django_tables2.Table):
         # Add custom field columns
         model = self._meta.model
 
-        for cf in models.CustomField.objects.get_for_model(model):
+        for cf in models.CustomField.objects.get_snapshot_for_model(model):
             name = cf.add_prefix_to_cf_key()
             self.base_columns[name] = CustomFieldColumn(cf)
 
-        for cpf in models.ComputedField.objects.get_for_model(model):
+        for cpf in models.ComputedField.objects.get_snapshot_for_model(model):
             self.base_columns[f"cpf_{cpf.key}"] = ComputedFieldColumn(cpf)
 
-        for relationship in models.Relationship.objects.get_for_model_source(model):
+        source_relationships, destination_relationships = models.Relationship.objects.get_snapshot_for_model(model)
+        for relationship in source_relationships:
             if not relationship.symmetric:
                 self.base_columns[f"cr_{relationship.key}_src"] = RelationshipColumn(
                     relationship, side=choices.RelationshipSideChoices.SIDE_SOURCE
@@ -55,7 +56,7 @@ class BaseTable(django_tables2.Table):
                     relationship, side=choices.RelationshipSideChoices.SIDE_PEER
                 )
 
-        for relationship in models.Relationship.objects.get_for_model_destination(model):
+        for relationship in destination_relationships:
             if not relationship.symmetric:
                 self.base_columns[f"cr_{relationship.key}_dst"] = RelationshipColumn(
                     relationship, side=choices.RelationshipSideChoices.SIDE_DESTINATION
@@ -296,12 +297,12 @@ class ButtonsColumn(django_tables2.TemplateColumn):
             <i class="mdi mdi-history"></i>
         </a>
     {{% endif %}}
-    {{% if "edit" in buttons and perms.{app_label}.change_{model_name} %}}
+    {{% if "edit" in buttons and change_permitted %}}
         <a href="{{% url '{edit_route}' {pk_field}=record.{pk_field} %}}?return_url={{{{ request.path }}}}{{{{ return_url_extra }}}}" class="btn btn-xs btn-warning" title="Edit">
             <i class="mdi mdi-pencil"></i>
         </a>
     {{% endif %}}
-    {{% if "delete" in buttons and perms.{app_label}.delete_{model_name} %}}
+    {{% if "delete" in buttons and delete_permitted %}}
         <a href="{{% url '{delete_route}' {pk_field}=record.{pk_field} %}}?return_url={{{{ request.path }}}}{{{{ return_url_extra }}}}" class="btn btn-xs btn-danger" title="Delete">
             <i class="mdi mdi-trash-can-outline"></i>
         </a>
@@ -340,6 +341,7 @@ class ButtonsColumn(django_tables2.TemplateColumn):
 
         super().__init__(template_code=template_code, *args, **kwargs)
 
+        self.model = model
         self.extra_context.update(
             {
                 "buttons": buttons or self.buttons,
@@ -347,6 +349,33 @@ class ButtonsColumn(django_tables2.TemplateColumn):
             }
         )
 
+    def get_permitted_pks(self, table, user, action):
+        """
+        Return the PKs of the objects on the table's current page that the user is permitted to perform the given action
+        on, using (at most) a single query for the whole page.
+        """
+        permitted_pks = table.__dict__.setdefault("_permitted_pks", {})
+        if action not in permitted_pks:
+            rows = table.page.object_list if getattr(table, "page", None) is not None else table.rows
+            pks = [row.record.pk for row in rows]
+            if not user.has_perm(f"{self.model._meta.app_label}.{action}_{self.model._meta.model_name}"):
+                permitted_pks[action] = set()
+            elif user.is_superuser or not hasattr(self.model.objects, "restrict_pks"):
+                permitted_pks[action] = set(pks)
+            else:
+                permitted_pks[action] = self.model.objects.restrict_pks(user, action, pks)
+        return permitted_pks[action]
+
+    def render(self, record, table, value, bound_column, **kwargs):  # pylint: disable=arguments-differ
+        context = getattr(table, "context", None)
+        request = context.get("request") if context is not None else None
+        if request is not None:
+            self.extra_context["change_permitted"] = record.pk in self.get_permitted_pks(table, request.user, "change")
+            self.extra_context["delete_permitted"] = record.pk in self.get_permitted_pks(table, request.user, "delete")
+        else:
+            self.extra_context["change_permitted"] = self.extra_context["delete_permitted"] = False
+        return super().render(record, table, value, bound_column, **kwargs)
+
     def header(self):  # pylint: disable=invalid-overridden-method
         return ""
 
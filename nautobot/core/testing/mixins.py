@@ -14,6 +14,7 @@ from rest_framework.test import APIClient, APIRequestFactory
 from nautobot.core.models import fields as core_fields
 from nautobot.core.testing import utils
 from nautobot.core.utils import permissions
+from nautobot.core.utils.cache import clear_generational_caches
 from nautobot.extras import management, models as extras_models
 from nautobot.users import models as users_models
 
@@ -73,9 +74,13 @@ class NautobotTestCaseMixin:
         that would otherwise refresh the cache appropriately.
 
         See also: https://code.djangoproject.com/ticket/11505
+
+        Process-local caches are cleared as well, as the rollback of each test's database changes doesn't trigger those
+        signals either.
         """
         super().tearDown()
         cache.clear()
+        clear_generational_caches()
 
     def prepare_instance(self, instance):
         """
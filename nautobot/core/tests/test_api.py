@@ -103,6 +103,8 @@ class APIPaginationTestCase(testing.APITestCase):
     @classmethod
     def setUpTestData(cls):
         cls.url = reverse("circuits-api:provider-list")
+        for i in range(1, 8):
+            Provider.objects.create(name=f"Pagination Provider {i}")
 
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=5, MAX_PAGE_SIZE=10)
     def test_pagination_defaults_to_paginate_count(self):
@@ -185,6 +187,57 @@ class APIPaginationTestCase(testing.APITestCase):
         self.assertHttpStatus(response, 200)
         self.assertEqual(len(response.data["results"]), config.MAX_PAGE_SIZE)
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=3, MAX_PAGE_SIZE=10)
+    def test_cursor_pagination(self):
+        """Page through all records by cursor, in the same order as the unpaginated list."""
+        names = list(Provider.objects.values_list("name", flat=True))
+        results = []
+        url = f"{self.url}?cursor="
+        while url:
+            response = self.client.get(url, **self.header)
+            self.assertHttpStatus(response, 200)
+            self.assertEqual(response.data["count"], len(names))
+            self.assertIsNone(response.data["previous"])
+            self.assertLessEqual(len(response.data["results"]), settings.PAGINATE_COUNT)
+            results.extend(result["name"] for result in response.data["results"])
+            url = response.data["next"]
+            if url:
+                self.assertIn("cursor=", url)
+                self.assertNotIn("offset=", url)
+        self.assertEqual(results, names)
+
+        # Filters and sorting are applied to the cursor pages as well
+        response = self.client.get(f"{self.url}?cursor=&sort=-name&limit=2", **self.header)
+        self.assertEqual([result["name"] for result in response.data["results"]], names[::-1][:2])
+        response = self.client.get(response.data["next"], **self.header)
+        self.assertEqual([result["name"] for result in response.data["results"]], names[::-1][2:4])
+
+        response = self.client.get(f"{self.url}?cursor=not-a-cursor", **self.header)
+        self.assertHttpStatus(response, 404)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=3, MAX_PAGE_SIZE=10)
+    def test_pagination_count(self):
+        """The total count can be estimated or omitted, without affecting the next and previous links."""
+        count = Provider.objects.count()
+        response = self.client.get(f"{self.url}?count=estimate", **self.header)
+        self.assertHttpStatus(response, 200)
+        # Small tables are always counted exactly
+        self.assertEqual(response.data["count"], count)
+
+        response = self.client.get(f"{self.url}?count=none&offset=1", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertIsNone(response.data["count"])
+        self.assertEqual(len(response.data["results"]), settings.PAGINATE_COUNT)
+        self.assertIn("offset=4", response.data["next"])
+        self.assertIsNotNone(response.data["previous"])
+
+        response = self.client.get(f"{self.url}?count=none&offset={count - 1}", **self.header)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNone(response.data["next"])
+
+        response = self.client.get(f"{self.url}?count=bogus", **self.header)
+        self.assertHttpStatus(response, 400)
+
 
 class APIVersioningTestCase(testing.APITestCase):
     """
@@ -4,13 +4,16 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.test.utils import override_settings
 from django.urls import reverse
 from netaddr import IPNetwork
 
+from nautobot.core.authentication import ObjectPermissionBackend
 from nautobot.core.settings_funcs import sso_auth_enabled
 from nautobot.core.testing import NautobotTestClient, TestCase
 from nautobot.core.utils import lookup
+from nautobot.core.utils.permissions import compile_constraints, qs_filter_from_constraints
 from nautobot.dcim.models import Location, LocationType
 from nautobot.extras.models import ObjectChange, Status
 from nautobot.ipam.models import Namespace, Prefix
@@ -580,3 +583,157 @@ class ObjectPermissionAPIViewTestCase(TestCase):
         self.assertEqual(response_user2.status_code, 200)
         self.assertEqual(response_user2.data["count"], 1)
         self.assertEqual(response_user2.data["results"][0]["user"]["id"], obj_user2.pk)
+
+
+class ObjectPermissionBackendTestCase(TestCase):
+    """Tests for the caching and constraint evaluation of the ObjectPermissionBackend."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.location = Location.objects.first()
+        cls.backend = ObjectPermissionBackend()
+
+    def setUp(self):
+        super().setUp()
+        self.obj_perm = ObjectPermission.objects.create(
+            name="Test permission",
+            constraints={"location_type": str(self.location.location_type.pk)},
+            actions=["change"],
+        )
+        self.obj_perm.object_types.add(ContentType.objects.get_for_model(Location))
+        self.obj_perm.users.add(self.user)
+
+    def get_user(self):
+        """Retrieve a fresh copy of the test user, as on each new request."""
+        return User.objects.get(pk=self.user.pk)
+
+    def test_permissions_cached(self):
+        self.assertIn("dcim.change_location", self.backend.get_all_permissions(self.get_user()))
+        user = self.get_user()
+        with self.assertNumQueries(0):
+            self.assertIn("dcim.change_location", self.backend.get_all_permissions(user))
+
+    def test_permissions_cache_invalidated(self):
+        self.assertIn("dcim.change_location", self.backend.get_all_permissions(self.get_user()))
+
+        with self.subTest("permission updated"):
+            self.obj_perm.actions = ["delete"]
+            self.obj_perm.save()
+            perms = self.backend.get_all_permissions(self.get_user())
+            self.assertNotIn("dcim.change_location", perms)
+            self.assertIn("dcim.delete_location", perms)
+
+        with self.subTest("user unassigned"):
+            self.obj_perm.users.remove(self.user)
+            self.assertNotIn("dcim.delete_location", self.backend.get_all_permissions(self.get_user()))
+
+        group = Group.objects.create(name="Test group")
+        self.obj_perm.groups.add(group)
+        with self.subTest("user added to group"):
+            self.user.groups.add(group)
+            self.assertIn("dcim.delete_location", self.backend.get_all_permissions(self.get_user()))
+
+        with self.subTest("group deleted"):
+            group.delete()
+            self.assertNotIn("dcim.delete_location", self.backend.get_all_permissions(self.get_user()))
+
+    def test_permissions_cache_invalidated_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.obj_perm.actions = ["delete"]
+            self.obj_perm.save()
+            # A concurrent request caches the permissions as they were before the transaction
+            self.assertIn("dcim.change_location", self.backend.get_object_permissions(self.get_user()))
+            cache.set(
+                f"{ObjectPermissionBackend.get_object_permissions.cache_key_prefix}.{self.user.pk}",
+                {"dcim.change_location": [None]},
+            )
+        for callback in callbacks:
+            callback()
+        self.assertNotIn("dcim.change_location", self.backend.get_all_permissions(self.get_user()))
+
+    def test_has_perm_simple_constraints(self):
+        user = self.get_user()
+        self.backend.get_all_permissions(user)
+        permitted = Location.objects.filter(location_type=self.location.location_type).first()
+        not_permitted = Location.objects.exclude(location_type=self.location.location_type).first()
+        with self.assertNumQueries(0):
+            self.assertTrue(self.backend.has_perm(user, "dcim.change_location", permitted))
+            self.assertFalse(self.backend.has_perm(user, "dcim.change_location", not_permitted))
+
+    def test_has_perm_modified_instance(self):
+        user = self.get_user()
+        self.backend.get_all_permissions(user)
+        permitted = Location.objects.filter(location_type=self.location.location_type).first()
+        not_permitted = Location.objects.exclude(location_type=self.location.location_type).first()
+        # Modified instances are checked against their database records, not their modified attributes
+        permitted.location_type_id, not_permitted.location_type_id = (
+            not_permitted.location_type_id,
+            permitted.location_type_id,
+        )
+        with self.assertNumQueries(2):
+            self.assertTrue(self.backend.has_perm(user, "dcim.change_location", permitted))
+            self.assertFalse(self.backend.has_perm(user, "dcim.change_location", not_permitted))
+
+    def test_check_perms_filtered_queryset(self):
+        user = self.get_user()
+        user.get_all_permissions()
+        permitted = Location.objects.filter(location_type=self.location.location_type).first()
+        self.assertTrue(Location.objects.check_perms(user, instance=permitted, action="change"))
+        self.assertFalse(
+            Location.objects.exclude(pk=permitted.pk).check_perms(user, instance=permitted, action="change")
+        )
+
+    def test_has_perm_complex_constraints(self):
+        self.obj_perm.constraints = {"location_type__name": self.location.location_type.name}
+        self.obj_perm.save()
+        user = self.get_user()
+        self.backend.get_all_permissions(user)
+        permitted = Location.objects.filter(location_type=self.location.location_type).first()
+        not_permitted = Location.objects.exclude(location_type=self.location.location_type).first()
+        with self.assertNumQueries(2):
+            self.assertTrue(self.backend.has_perm(user, "dcim.change_location", permitted))
+            self.assertFalse(self.backend.has_perm(user, "dcim.change_location", not_permitted))
+
+    def test_compile_constraints(self):
+        location = self.location
+        for constraints, expected in (
+            ([None], True),
+            ([{"pk": str(location.pk)}], True),
+            ([{"id__in": [str(location.pk), str(uuid.uuid4())]}], True),
+            ([{"status": str(location.status.pk)}], True),
+            ([{"status_id": str(uuid.uuid4())}], False),
+            ([{"status__id__in": [str(uuid.uuid4())]}, {"location_type": location.location_type}], True),
+            ([{"status__id": str(location.status.pk), "location_type": str(uuid.uuid4())}], False),
+        ):
+            with self.subTest(constraints=constraints):
+                predicate = compile_constraints(Location, constraints)
+                self.assertIsNotNone(predicate)
+                self.assertEqual(predicate(location), expected)
+                self.assertEqual(
+                    predicate(location),
+                    Location.objects.filter(qs_filter_from_constraints(constraints), pk=location.pk).exists(),
+                )
+
+        for constraints in (
+            [{"status__name": location.status.name}],
+            [{"tags__isnull": True}],
+            [{"parent__parent": None}],
+            [{"pk__in": "not-a-list"}],
+        ):
+            with self.subTest(constraints=constraints):
+                self.assertIsNone(compile_constraints(Location, constraints))
+
+    def test_restrict_pks(self):
+        location_type = self.location.location_type
+        permitted = list(Location.objects.filter(location_type=location_type).values_list("pk", flat=True))
+        not_permitted = list(Location.objects.exclude(location_type=location_type).values_list("pk", flat=True))
+        user = self.get_user()
+        user.get_all_permissions()
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                Location.objects.restrict_pks(user, "change", permitted + not_permitted + [uuid.uuid4()]),
+                set(permitted),
+            )
+        with self.assertNumQueries(0):
+            self.assertEqual(Location.objects.restrict_pks(user, "change", []), set())
+        self.assertEqual(Location.objects.restrict_pks(user, "delete", permitted), set())
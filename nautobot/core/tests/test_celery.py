@@ -1,8 +1,80 @@
+import logging
 from unittest import TestCase
 
+from django.test import tag
+
 from nautobot.core import celery
+from nautobot.core.celery.log import flush_database_handlers, NautobotDatabaseHandler
+from nautobot.core.testing import TransactionTestCase
+from nautobot.extras.choices import LogLevelChoices
+from nautobot.extras.models import JobLogEntry, JobResult
 
 
 class CeleryTest(TestCase):
     def test__dumps(self):
         self.assertEqual('"I am UTF-8! 😀"', celery._dumps("I am UTF-8! 😀"))
+
+
+class NautobotDatabaseHandlerTest(TransactionTestCase):
+    """Tests for the buffering of job log entries by NautobotDatabaseHandler."""
+
+    databases = ("default", "job_logs")
+
+    def setUp(self):
+        super().setUp()
+        self.job_result = JobResult.objects.create(name="ExampleJob", user=None)
+
+    def _emit(self, handler, message, level=logging.INFO, **extra):
+        record = logging.LogRecord("nautobot.test", level, __file__, 0, message, None, None, func="run")
+        record.task_id = str(self.job_result.pk)
+        record.__dict__.update(extra)
+        handler.handle(record)
+
+    def test_buffered_until_flush(self):
+        handler = NautobotDatabaseHandler(capacity=100, flush_interval=60)
+        for i in range(10):
+            self._emit(handler, f"Message {i}", level=logging.WARNING if i % 2 else logging.INFO)
+        self._emit(handler, "Not to be recorded", skip_db_logging=True)
+        self.assertFalse(self.job_result.job_log_entries.exists())
+
+        flush_database_handlers()
+        entries = list(self.job_result.job_log_entries.order_by("created"))
+        self.assertEqual([entry.message for entry in entries], [f"Message {i}" for i in range(10)])
+        self.assertEqual(entries[1].log_level, LogLevelChoices.LOG_WARNING)
+        self.assertEqual(entries[0].grouping, "run")
+        self.assertEqual(handler.buffer, [])
+
+    def test_flush_at_capacity(self):
+        handler = NautobotDatabaseHandler(capacity=5, flush_interval=60)
+        for i in range(7):
+            self._emit(handler, f"Message {i}")
+        self.assertEqual(self.job_result.job_log_entries.count(), 5)
+        handler.close()
+        self.assertEqual(self.job_result.job_log_entries.count(), 7)
+
+    def test_flush_after_interval(self):
+        handler = NautobotDatabaseHandler(capacity=100, flush_interval=0)
+        self._emit(handler, "Message")
+        self.assertEqual(self.job_result.job_log_entries.count(), 1)
+
+    def test_unknown_task_id(self):
+        handler = NautobotDatabaseHandler()
+        record = logging.LogRecord("nautobot.test", logging.INFO, __file__, 0, "Message", None, None)
+        record.task_id = "not-a-uuid"
+        handler.handle(record)
+        self.assertEqual(handler.buffer, [])
+
+    def _log_entries(self, capacity, count=500):
+        handler = NautobotDatabaseHandler(capacity=capacity, flush_interval=60)
+        for i in range(count):
+            self._emit(handler, f"Message {i}")
+        handler.close()
+        self.assertEqual(JobLogEntry.objects.using("job_logs").filter(job_result=self.job_result).count(), count)
+
+    @tag("performance")
+    def test_log_entries_unbuffered(self):
+        self._log_entries(capacity=1)
+
+    @tag("performance")
+    def test_log_entries_buffered(self):
+        self._log_entries(capacity=100)
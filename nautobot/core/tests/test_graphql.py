@@ -1,4 +1,5 @@
 import datetime
+import math
 import random
 import types
 from unittest import skip, TestCase as UnitTestTestCase
@@ -8,19 +9,23 @@ from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.db.models import Q
 from django.test import override_settings, TestCase
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 import graphene.types
 from graphene_django.registry import get_global_registry
 from graphene_django.settings import graphene_settings
-from graphql import get_default_backend, GraphQLError
+from graphql import get_default_backend, GraphQLError, parse
 from graphql.error.located_error import GraphQLLocatedError
 from rest_framework import status
 
 from nautobot.circuits.models import CircuitTermination, Provider
 from nautobot.core.graphql import execute_query, execute_saved_query
+from nautobot.core.graphql.backend import CachedDocumentBackend
+from nautobot.core.graphql.cost import get_result_cost, QueryCost, QueryCostEstimator
 from nautobot.core.graphql.generators import (
     generate_list_search_parameters,
     generate_schema_type,
@@ -35,6 +40,7 @@ from nautobot.core.graphql.schema import (
 )
 from nautobot.core.graphql.types import DateType, OptimizedNautobotObjectType
 from nautobot.core.graphql.utils import str_to_var_name
+from nautobot.core.models.querysets import estimate_count
 from nautobot.core.testing import create_test_user, NautobotTestClient
 from nautobot.dcim.choices import ConsolePortTypeChoices, InterfaceModeChoices, InterfaceTypeChoices, PortTypeChoices
 from nautobot.dcim.filters import DeviceFilterSet, LocationFilterSet
@@ -222,6 +228,65 @@ class GraphQLUtilsTestCase(GraphQLTestCaseBase):
         self.assertEqual(str_to_var_name("My-VAR"), "my_var")
 
 
+class GraphQLBackendTestCase(GraphQLTestCaseBase):
+    def test_document_cache(self):
+        backend = CachedDocumentBackend(cache_size=2)
+        document = backend.document_from_string(self.SCHEMA, "{ locations { name } }")
+        self.assertIs(backend.document_from_string(self.SCHEMA, "{ locations { name } }"), document)
+        self.assertIsNot(backend.document_from_string(self.SCHEMA, "{ locations { id } }"), document)
+        backend.document_from_string(self.SCHEMA, "{ racks { id } }")
+        # The least recently used document has been evicted
+        self.assertIsNot(backend.document_from_string(self.SCHEMA, "{ locations { name } }"), document)
+
+    def test_document_cache_invalid_query(self):
+        backend = CachedDocumentBackend(cache_size=2)
+        document = backend.document_from_string(self.SCHEMA, "{ locations { no_such_field } }")
+        result = document.execute(context_value=None)
+        self.assertTrue(result.invalid)
+        self.assertIsNot(backend.document_from_string(self.SCHEMA, "{ locations { no_such_field } }"), document)
+        with self.assertRaises(GraphQLError):
+            backend.document_from_string(self.SCHEMA, "{ locations { name }")
+
+    def test_query_cost_estimator(self):
+        query = """
+            query ($limit: Int) {
+                devices(limit: $limit) { name ...Interfaces }
+                location(id: "1") { name __typename }
+            }
+            fragment Interfaces on DeviceType { interfaces { name } }
+        """
+        document_ast = parse(query)
+        self.assertEqual(
+            QueryCostEstimator(self.SCHEMA, document_ast, variables={"limit": 10}, list_size=20).estimate(),
+            QueryCost(cost=1 + 10 * (1 + 1 + 20) + 1 + 1, depth=3),
+        )
+        self.assertEqual(
+            QueryCostEstimator(self.SCHEMA, document_ast, list_size=20).estimate(),
+            QueryCost(cost=1 + 20 * (1 + 1 + 20) + 1 + 1, depth=3),
+        )
+        self.assertEqual(get_result_cost({"location": {"name": "Location 1", "__typename": "LocationType"}}), 2)
+
+    def test_query_cost_estimator_estimate_counts(self):
+        """Lists of model instances are costed from the number of objects estimated by the database."""
+        query = "{ devices { name interfaces { name } } }"
+        devices = estimate_count(Device.objects.all())
+        interfaces = math.ceil(estimate_count(Interface.objects.all()) / max(devices, 1))
+        self.assertEqual(
+            QueryCostEstimator(self.SCHEMA, parse(query), list_size=20, estimate_counts=True).estimate(),
+            QueryCost(cost=1 + devices * (1 + 1 + interfaces), depth=3),
+        )
+        query = '{ devices(name: "No such device") { name interfaces { name } } }'
+        self.assertEqual(
+            QueryCostEstimator(self.SCHEMA, parse(query), list_size=20, estimate_counts=True).estimate(),
+            QueryCost(cost=1, depth=3),
+        )
+        query = "{ devices(limit: 1) { name } }"
+        self.assertEqual(
+            QueryCostEstimator(self.SCHEMA, parse(query), list_size=20, estimate_counts=True).estimate(),
+            QueryCost(cost=1 + min(devices, 1), depth=2),
+        )
+
+
 class GraphQLGenerateSchemaTypeTestCase(GraphQLTestCaseBase):
     def test_model_w_filterset(self):
         schema = generate_schema_type(app_name="dcim", model=Device)
@@ -630,6 +695,90 @@ class GraphQLAPIPermissionTest(GraphQLTestCaseBase):
         names = [item["name"] for item in response.data["data"]["racks"]]
         self.assertEqual(names, ["Rack 1-1", "Rack 1-2", "Rack 2-1", "Rack 2-2"])
 
+    def get_racks_per_location(self):
+        """Return the average number of racks per location, as estimated for the cost of a GraphQL query."""
+        return math.ceil(estimate_count(Rack.objects.all()) / max(estimate_count(Location.objects.all()), 1))
+
+    def get_locations_racks_query_cost(self):
+        """Return the estimated cost of `get_locations_racks_query`: locations * (name + racks * name)."""
+        return 1 + estimate_count(Location.objects.all()) * (1 + 1 + self.get_racks_per_location())
+
+    def test_graphql_api_query_cost(self):
+        """Validate that the estimated and actual costs of a query are reported."""
+        response = self.clients[2].post(self.api_url, {"query": self.get_locations_racks_query}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        locations = response.data["data"]["locations"]
+        cost = response.data["extensions"]["cost"]
+        # Without a cost limit, lists are assumed to hold GRAPHQL_ESTIMATED_LIST_SIZE objects rather than counted:
+        # locations + 100 * (name + racks + 100 * name)
+        self.assertEqual(cost["estimated"], 1 + 100 * (1 + 1 + 100))
+        self.assertEqual(cost["depth"], 3)
+        self.assertEqual(cost["actual"], 1 + sum(1 + 1 + len(location["racks"]) for location in locations))
+
+    def test_graphql_api_query_cost_limit(self):
+        """Validate that queries whose estimated cost exceeds the limit are rejected."""
+        max_cost = self.get_locations_racks_query_cost() - 1
+        with override_settings(GRAPHQL_MAX_QUERY_COST=max_cost):
+            response = self.clients[2].post(self.api_url, {"query": self.get_locations_racks_query}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(f"exceeds the maximum cost of {max_cost}", response.data["errors"][0]["message"])
+            self.assertNotIn("data", response.data)
+
+            query = "query { locations(limit: 1) { name racks { name } } }"
+            response = self.clients[2].post(self.api_url, {"query": query}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(
+                response.data["extensions"]["cost"]["estimated"], 1 + 1 * (1 + 1 + self.get_racks_per_location())
+            )
+
+    @override_settings(GRAPHQL_MAX_QUERY_DEPTH=2)
+    def test_graphql_api_query_depth_limit(self):
+        """Validate that queries whose fields are nested too deeply are rejected."""
+        response = self.clients[2].post(self.api_url, {"query": self.get_locations_racks_query}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("exceeds the maximum depth of 2", response.data["errors"][0]["message"])
+
+        response = self.clients[2].post(self.api_url, {"query": self.get_racks_query}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_graphql_api_saved_query(self):
+        """Validate that saved queries can be executed by their ID or name."""
+        saved_query = GraphQLQuery.objects.create(name="Racks", query=self.get_racks_var_query)
+        for query_id in (str(saved_query.pk), saved_query.name):
+            response = self.clients[2].post(
+                self.api_url, {"id": query_id, "variables": {"location": ["Location 1"]}}, format="json"
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            names = [item["name"] for item in response.data["data"]["racks"]]
+            self.assertEqual(names, ["Rack 1-1", "Rack 1-2"])
+
+        response = self.clients[2].post(self.api_url, {"id": "No such query"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # Saved queries are only available to users permitted to view them
+        response = self.clients[3].post(self.api_url, {"id": str(saved_query.pk)}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_graphql_api_cursor_pagination(self):
+        """Validate that list fields can be paged through by cursor, with the next cursor in the extensions."""
+        query = "query ($cursor: String) { racks(limit: 3, cursor: $cursor) { name } }"
+        names = []
+        cursor = ""
+        while cursor is not None:
+            response = self.clients[2].post(
+                self.api_url, {"query": query, "variables": {"cursor": cursor}}, format="json"
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["data"]["racks"]), 3)
+            names.extend(item["name"] for item in response.data["data"]["racks"])
+            cursor = response.data["extensions"]["cursors"]["racks"]
+        self.assertEqual(sorted(names), ["Rack 1-1", "Rack 1-2", "Rack 2-1", "Rack 2-2"])
+
+        response = self.clients[2].post(
+            self.api_url, {"query": query, "variables": {"cursor": "not-a-cursor"}}, format="json"
+        )
+        self.assertIn("Invalid cursor", response.data["errors"][0]["message"])
+
     def test_graphql_api_no_token(self):
         """Validate unauthenticated users are not able to query anything."""
         response = self.client.post(self.api_url, {"query": self.get_racks_query}, format="json")
@@ -1468,6 +1617,37 @@ query {
         self.assertIn(str(self.device2.id), set(item["id"] for item in result.data["device"]["rel_device_group"]))
         self.assertIn(str(self.device3.id), set(item["id"] for item in result.data["device"]["rel_device_group"]))
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_relationship_associations_batched(self):
+        """Test that the relationship peers of all objects in a query are loaded together."""
+        query = """
+            query {
+                devices {
+                    id
+                    rel_device_to_vm {
+                        id
+                    }
+                    rel_device_group {
+                        id
+                    }
+                }
+            }
+        """
+        with CaptureQueriesContext(connection) as queries:
+            result = self.execute_query(query)
+        self.assertIsNone(result.errors)
+        self.assertGreater(len(result.data["devices"]), 3)
+        association_queries = [q for q in queries if '"extras_relationshipassociation"' in q["sql"]]
+        self.assertEqual(len(association_queries), 2)
+
+        devices = {device["id"]: device for device in result.data["devices"]}
+        self.assertEqual(devices[str(self.device1.id)]["rel_device_to_vm"], {"id": str(self.virtualmachine.id)})
+        self.assertIsNone(devices[str(self.device2.id)]["rel_device_to_vm"])
+        self.assertEqual(
+            {item["id"] for item in devices[str(self.device2.id)]["rel_device_group"]},
+            {str(self.device1.id), str(self.device3.id)},
+        )
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_query_device_role_filter(self):
         query = (
@@ -1,12 +1,35 @@
+from datetime import timedelta
 from pathlib import Path
+import uuid
 
+from django.apps import apps as django_apps
+from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
 import yaml
 
+from nautobot.core.jobs.cleanup import LogsCleanup
 from nautobot.core.testing import create_job_result_and_run_job, TransactionTestCase
 from nautobot.dcim.models import DeviceType, Location, LocationType, Manufacturer
-from nautobot.extras.choices import JobResultStatusChoices, LogLevelChoices
-from nautobot.extras.models import Contact, ContactAssociation, ExportTemplate, JobLogEntry, Role, Status
+from nautobot.extras.choices import (
+    JobExecutionType,
+    JobResultStatusChoices,
+    LogLevelChoices,
+    ObjectChangeActionChoices,
+)
+from nautobot.extras.models import (
+    Contact,
+    ContactAssociation,
+    ExportTemplate,
+    JobLogEntry,
+    JobResult,
+    ObjectChange,
+    Role,
+    ScheduledJob,
+    Status,
+)
+from nautobot.extras.signals import ensure_logs_cleanup_schedule
+from nautobot.ipam.models import Namespace, Prefix
 from nautobot.users.models import ObjectPermission
 
 
@@ -257,6 +280,39 @@ class ImportObjectsTestCase(TransactionTestCase):
             self.assertTrue(Status.objects.filter(name="test_status4").exists())
             self.assertEqual(log_successes[4].message, "Created 4 status object(s) from 5 row(s) of data")
 
+    def test_csv_import_prefixes_with_constrained_permission(self):
+        """A prefix whose row is rolled back must not become the parent of prefixes imported after it."""
+        namespace = Namespace.objects.create(name="Import Objects Test")
+        obj_perm = ObjectPermission(name="Test permission", constraints={"prefix_length__gte": 24}, actions=["add"])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Prefix))
+        status = Status.objects.get_for_model(Prefix).first()
+        csv_data = "\n".join(
+            [
+                "prefix,namespace__name,status__name",
+                f"10.99.0.0/16,{namespace.name},{status.name}",
+                f"10.99.1.0/24,{namespace.name},{status.name}",
+            ]
+        )
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            username=self.user.username,  # otherwise run_job_for_testing defaults to a superuser account
+            content_type=ContentType.objects.get_for_model(Prefix).pk,
+            csv_data=csv_data,
+            roll_back_if_error=False,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+        log_errors = JobLogEntry.objects.filter(job_result=job_result, log_level=LogLevelChoices.LOG_ERROR)
+        self.assertEqual(
+            log_errors[0].message,
+            f'Row 1: User "{self.user}" does not have permission to create an object with these attributes',
+        )
+        self.assertFalse(Prefix.objects.filter(namespace=namespace, prefix_length=16).exists())
+        prefix = Prefix.objects.get(namespace=namespace, network="10.99.1.0", prefix_length=24)
+        self.assertIsNone(prefix.parent)
+
     def test_csv_import_contact_assignment(self):
         location_types_csv = "\n".join(["name", "ContactAssignmentImportTestLocationType"])
         locations_csv = "\n".join(
@@ -333,3 +389,97 @@ class ImportObjectsTestCase(TransactionTestCase):
         )
 
         self.assertEqual(associations_job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+
+
+class LogsCleanupTestCase(TransactionTestCase):
+    """
+    Test the LogsCleanup system job.
+    """
+
+    databases = ("default", "job_logs")
+
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        self.cutoff = now - timedelta(days=60)
+        for i, status in enumerate(Status.objects.all()[:10]):
+            objectchange = status.to_objectchange(ObjectChangeActionChoices.ACTION_UPDATE)
+            objectchange.request_id = uuid.uuid4()
+            objectchange.user_name = self.user.username
+            objectchange.save()
+            # Half of the changes are older than the cutoff
+            ObjectChange.objects.filter(pk=objectchange.pk).update(time=now - timedelta(days=15 + 10 * i))
+
+        job_result = JobResult.objects.create(name="test")
+        for i in range(10):
+            JobLogEntry.objects.create(
+                job_result=job_result, message=f"Log {i}", created=now - timedelta(days=15 + 10 * i)
+            )
+
+    def test_cleanup_without_permission(self):
+        """Job should enforce user permissions on the records being deleted."""
+        objectchange_count = ObjectChange.objects.count()
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs.cleanup",
+            "LogsCleanup",
+            username=self.user.username,  # otherwise run_job_for_testing defaults to a superuser account
+            cleanup_types=["extras.ObjectChange"],
+            max_age=60,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+        log_error = JobLogEntry.objects.get(job_result=job_result, log_level=LogLevelChoices.LOG_ERROR)
+        self.assertEqual(
+            log_error.message, f'User "{self.user}" does not have permission to delete objectchange objects'
+        )
+        self.assertEqual(ObjectChange.objects.count(), objectchange_count)
+
+    def test_cleanup_object_changes(self):
+        """Job should delete only the ObjectChanges older than the given age, in chunks."""
+        older_objectchange_count = ObjectChange.objects.filter(time__lt=self.cutoff).count()
+        newer_objectchanges = set(ObjectChange.objects.filter(time__gte=self.cutoff).values_list("pk", flat=True))
+        joblogentry_count = JobLogEntry.objects.filter(created__lt=self.cutoff).count()
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs.cleanup",
+            "LogsCleanup",
+            cleanup_types=["extras.ObjectChange"],
+            max_age=60,
+            chunk_size=2,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        self.assertEqual(job_result.result, {"extras.ObjectChange": older_objectchange_count})
+        self.assertEqual(set(ObjectChange.objects.values_list("pk", flat=True)), newer_objectchanges)
+        self.assertEqual(JobLogEntry.objects.filter(created__lt=self.cutoff).count(), joblogentry_count)
+
+    def test_cleanup_job_log_entries(self):
+        """Job should delete JobLogEntries older than the given age, but not those of the job itself."""
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs.cleanup",
+            "LogsCleanup",
+            cleanup_types=["extras.JobLogEntry"],
+            max_age=60,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        self.assertEqual(job_result.result, {"extras.JobLogEntry": 5})
+        self.assertFalse(JobLogEntry.objects.filter(created__lt=self.cutoff).exists())
+        self.assertTrue(JobLogEntry.objects.filter(job_result=job_result).exists())
+
+    def test_ensure_logs_cleanup_schedule(self):
+        """The job is scheduled to run daily as a superuser, once one exists, unless it's already scheduled."""
+        get_user_model().objects.filter(is_superuser=True).update(is_active=False)
+        ensure_logs_cleanup_schedule(sender=None, apps=django_apps)
+        self.assertFalse(ScheduledJob.objects.filter(task=LogsCleanup.class_path).exists())
+
+        superuser = get_user_model().objects.create(username="cleanup_admin", is_active=True, is_superuser=True)
+        ensure_logs_cleanup_schedule(sender=None, apps=django_apps)
+        scheduled_job = ScheduledJob.objects.get(task=LogsCleanup.class_path)
+        self.assertEqual(scheduled_job.interval, JobExecutionType.TYPE_DAILY)
+        self.assertEqual(scheduled_job.user, superuser)
+        self.assertEqual(scheduled_job.kwargs, {"cleanup_types": ["extras.ObjectChange"]})
+        self.assertTrue(scheduled_job.enabled)
+
+        # A disabled schedule is left alone rather than recreated
+        scheduled_job.enabled = False
+        scheduled_job.save()
+        ensure_logs_cleanup_schedule(sender=None, apps=django_apps)
+        self.assertEqual(ScheduledJob.objects.filter(task=LogsCleanup.class_path).count(), 1)
+        self.assertFalse(ScheduledJob.objects.get(task=LogsCleanup.class_path).enabled)
@@ -1,9 +1,16 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.template import Context
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
 
 from nautobot.core.models.querysets import count_related
 from nautobot.dcim.models import Device, InventoryItem, Location, LocationType, Rack, RackGroup
 from nautobot.dcim.tables import InventoryItemTable, LocationTable, LocationTypeTable, RackGroupTable
 from nautobot.tenancy.tables import TenantGroupTable
+from nautobot.users.models import ObjectPermission
+
+User = get_user_model()
 
 
 class TableTestCase(TestCase):
@@ -61,3 +68,32 @@ class TableTestCase(TestCase):
         queryset = RackGroupTable.Meta.model.objects.annotate(rack_count=count_related(Rack, "rack_group")).all()
         self._validate_sorted_tree_queryset_same_with_table_queryset(queryset, RackGroupTable, "rack_count")
         self._validate_sorted_tree_queryset_same_with_table_queryset(queryset, RackGroupTable, "-rack_count")
+
+    def test_buttons_column_permissions(self):
+        """Assert that ButtonsColumn only renders the buttons for actions permitted on each row's object."""
+        location_type = LocationType.objects.get(name="Campus")
+        user = User.objects.create_user(username="tableuser")
+        obj_perm = ObjectPermission.objects.create(
+            name="Test permission", constraints={"location_type": str(location_type.pk)}, actions=["change"]
+        )
+        obj_perm.users.add(user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Location))
+        request = RequestFactory().get("/")
+        request.user = user
+
+        table = LocationTable(Location.objects.all())
+        table.context = Context({"request": request})
+        permitted_pks = set(Location.objects.filter(location_type=location_type).values_list("pk", flat=True))
+        self.assertTrue(permitted_pks)
+        for row in table.rows:
+            with self.subTest(location=row.record.name):
+                html = row.get_cell("actions")
+                edit_url = reverse("dcim:location_edit", kwargs={"pk": row.record.pk})
+                if row.record.pk in permitted_pks:
+                    self.assertIn(edit_url, html)
+                else:
+                    self.assertNotIn(edit_url, html)
+                self.assertNotIn(reverse("dcim:location_delete", kwargs={"pk": row.record.pk}), html)
+        # The permitted PKs were looked up once for the whole table, not per row
+        self.assertEqual(set(table._permitted_pks["change"]), permitted_pks)
+        self.assertEqual(table._permitted_pks["delete"], set())
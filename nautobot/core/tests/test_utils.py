@@ -13,7 +13,7 @@ from nautobot.circuits import models as circuits_models
 from nautobot.core import exceptions, forms, settings_funcs
 from nautobot.core.api import utils as api_utils
 from nautobot.core.models import fields as core_fields, utils as models_utils, validators
-from nautobot.core.utils import data as data_utils, filtering, lookup, requests
+from nautobot.core.utils import cache as cache_utils, data as data_utils, filtering, lookup, requests
 from nautobot.core.utils.migrations import update_object_change_ct_for_replaced_models
 from nautobot.dcim import filters as dcim_filters, forms as dcim_forms, models as dcim_models, tables
 from nautobot.extras import models as extras_models, utils as extras_utils
@@ -158,6 +158,38 @@ class FlattenIterableTest(TestCase):
         self.assertEqual(list(data_utils.flatten_iterable(items)), expected)
 
 
+class GenerationalCacheTest(TestCase):
+    """Tests for the `GenerationalCache` class."""
+
+    def setUp(self):
+        # Two caches with the same name stand in for the caches of two separate processes
+        self.caches = (
+            cache_utils.GenerationalCache("nautobot.core.tests.test_utils"),
+            cache_utils.GenerationalCache("nautobot.core.tests.test_utils"),
+        )
+
+    def test_get_or_set(self):
+        self.assertEqual(self.caches[0].get_or_set("key", lambda: 1), 1)
+        self.assertEqual(self.caches[0].get_or_set("key", lambda: 2), 1)
+        self.assertEqual(self.caches[1].get_or_set("key", lambda: 3), 3)
+
+    def test_invalidate(self):
+        for generational_cache in self.caches:
+            generational_cache.get_or_set("key", lambda: 1)
+
+        self.caches[0].invalidate()
+        self.assertEqual(self.caches[0].get_or_set("key", lambda: 2), 2)
+        # Other processes keep their values until they next check the generation, at the start of the next request
+        self.assertEqual(self.caches[1].get_or_set("key", lambda: 2), 1)
+        cache_utils.expire_generational_caches()
+        self.assertEqual(self.caches[1].get_or_set("key", lambda: 2), 2)
+
+    def test_clear(self):
+        self.caches[0].get_or_set("key", lambda: 1)
+        cache_utils.clear_generational_caches()
+        self.assertEqual(self.caches[0].get_or_set("key", lambda: 2), 2)
+
+
 class GetFooForModelTest(TestCase):
     """Tests for the various `get_foo_for_model()` functions."""
 
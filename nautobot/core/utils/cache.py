@@ -0,0 +1,107 @@
+"""Process-local caching of rarely-changing data, invalidated across all processes through the shared cache."""
+
+import contextlib
+import threading
+import time
+import weakref
+
+from django.core.cache import cache
+from django.db import transaction
+import redis.exceptions
+
+# All GenerationalCache instances, so that they can be expired at the start of each request and task
+_generational_caches = weakref.WeakSet()
+
+
+class GenerationalCache:
+    """
+    A cache, held in the memory of each process, of values that are costly to compute but rarely change.
+
+    Getting a cached value costs no more than a dict lookup. To tell whether the values cached by one process have been
+    invalidated by another, the cache of each process records the generation counter, stored in the shared cache under
+    `generation_key`, that its values belong to. The counter is checked, at the cost of a single cache GET, at most once
+    per request or Celery task (see `expire_generational_caches()`), and otherwise at least every `max_age` seconds.
+
+    Cached values are shared between all callers (and threads) of a process, so they must not be modified.
+
+    Example:
+        >>> relationships_cache = GenerationalCache("nautobot.extras.relationships")
+        >>> relationships_cache.get_or_set(("dcim.device",), lambda: tuple(Relationship.objects.filter(...)))
+        >>> relationships_cache.invalidate()  # whenever a Relationship is changed
+    """
+
+    def __init__(self, name, max_age=60):
+        self.generation_key = f"{name}.generation"
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._values = {}
+        self._generation = None
+        self._checked_at = None
+        _generational_caches.add(self)
+
+    def get_or_set(self, key, default):
+        """Return the value cached under `key`, calling `default()` to compute and cache it if there isn't one."""
+        self.refresh()
+        values = self._values
+        if key in values:
+            return values[key]
+
+        value = default()
+        with self._lock:
+            # Don't keep a value that was computed while the cache was being cleared, as it may already be out of date
+            if self._values is values:
+                values[key] = value
+        return value
+
+    def refresh(self):
+        """Discard the cached values if another process has invalidated them since they were last checked."""
+        checked_at = self._checked_at
+        if checked_at is not None and time.monotonic() - checked_at < self.max_age:
+            return
+
+        generation = cache.get(self.generation_key)
+        with self._lock:
+            if generation != self._generation:
+                self._values = {}
+                self._generation = generation
+            self._checked_at = time.monotonic()
+
+    def expire(self):
+        """Check whether the cached values are still valid when the cache is next used."""
+        self._checked_at = None
+
+    def clear(self):
+        """Discard the values cached by this process."""
+        with self._lock:
+            self._values = {}
+            self._checked_at = None
+
+    def invalidate(self):
+        """Discard the values cached by this and all other processes."""
+        self._invalidate()
+        # Other processes may recompute their values before the current transaction is committed, from the data as it
+        # was before it, so invalidate them again once it has been
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(self._invalidate)
+
+    def _invalidate(self):
+        self.clear()
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            try:
+                cache.incr(self.generation_key)
+            except ValueError:
+                # Start from the current time rather than from zero, so that a generation from before the shared cache
+                # was last cleared can't be mistaken for the new one
+                cache.set(self.generation_key, time.time_ns(), timeout=None)
+
+
+def expire_generational_caches():
+    """Make all GenerationalCaches check whether their values are still valid on next use."""
+    for generational_cache in list(_generational_caches):
+        generational_cache.expire()
+
+
+def clear_generational_caches():
+    """Discard the values cached by all GenerationalCaches of this process."""
+    for generational_cache in list(_generational_caches):
+        generational_cache.clear()
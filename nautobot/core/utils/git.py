@@ -14,6 +14,9 @@ logger = logging.getLogger(__name__)
 # namedtuple takes a git log diff status and its accompanying text.
 GitDiffLog = namedtuple("GitDiffLog", ["status", "text"])
 
+# namedtuple takes the set of paths of files added or modified, and the set of paths of files deleted, between two commits
+GitChangedPaths = namedtuple("GitChangedPaths", ["updated", "deleted"])
+
 # 'A' and 'D' status are swapped because of the way the repo.git.diff was implemented
 # e.g. 'A' actually stands for Addition but in this case is Deletion
 GIT_STATUS_MAP = {
@@ -63,11 +66,11 @@ class GitRepo:
 
         Args:
             path (str): path to git repo
-            url (str): git repo url
+            url (str): git repo url, or None to use an existing local clone as-is
             clone_initially (bool): True if the repo needs to be cloned
         """
         self.url = url
-        self.sanitized_url = sanitize(url)
+        self.sanitized_url = sanitize(url) if url is not None else None
         if os.path.isdir(path) and os.path.isdir(os.path.join(path, ".git")):
             self.repo = Repo(path=path)
         elif clone_initially:
@@ -78,7 +81,7 @@ class GitRepo:
             self.repo = Repo.init(path)
             self.repo.create_remote("origin", url=url)
 
-        if url not in self.repo.remotes.origin.urls:
+        if url is not None and url not in self.repo.remotes.origin.urls:
             self.repo.remotes.origin.set_url(url)
 
     @property
@@ -232,3 +235,32 @@ class GitRepo:
             return convert_git_diff_log_to_list(diff)
         logger.debug("No Difference")
         return []
+
+    def diff_commits(self, from_commit, to_commit, path=None):
+        """
+        Get the paths of the files that were added or modified, and of those that were deleted, between two commits.
+
+        Args:
+            from_commit (str): The earlier commit.
+            to_commit (str): The later commit.
+            path (str): Optional subdirectory of the repository to limit the diff to.
+
+        Returns:
+            (GitChangedPaths): The `updated` and `deleted` file paths, relative to the root of the repository.
+                A renamed file is reported as deleted from its old path and added at its new path.
+        """
+        args = ["--name-status", "--no-renames", "-z", from_commit, to_commit]
+        if path:
+            args += ["--", path]
+        fields = self.repo.git.diff(*args).split("\0")
+        changed_paths = GitChangedPaths(updated=set(), deleted=set())
+        for status, file_path in zip(fields[::2], fields[1::2]):
+            if status == "D":
+                changed_paths.deleted.add(file_path)
+            else:
+                changed_paths.updated.add(file_path)
+        return changed_paths
+
+    def read_file(self, path, commit):
+        """Return the content of the file at the given path, relative to the root of the repository, at a commit."""
+        return self.repo.git.show(f"{commit}:{path}")
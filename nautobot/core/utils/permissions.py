@@ -1,5 +1,9 @@
+import uuid
+
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connection, models
 from django.db.models import Q
 
 
@@ -97,3 +101,125 @@ def qs_filter_from_constraints(constraints, tokens=None):
             return Q()
 
     return params
+
+
+# Field types whose Python values compare the same way as their database values
+_COMPILABLE_FIELD_TYPES = (
+    models.AutoField,
+    models.BigAutoField,
+    models.BooleanField,
+    models.IntegerField,
+    models.UUIDField,
+)
+
+# Field types whose comparison may depend on the database collation, so are only compiled for PostgreSQL
+_COLLATION_DEPENDENT_FIELD_TYPES = (
+    models.CharField,
+    models.TextField,
+)
+
+
+def _compile_lookup(model, lookup, value, tokens):
+    """
+    Compile a single constraint lookup into an `(attname, values)` pair, or return None if it can't be compiled.
+    """
+    parts = lookup.split("__")
+    operator = "exact"
+    if len(parts) > 1 and parts[-1] in ("exact", "in"):
+        operator = parts.pop()
+
+    try:
+        field = model._meta.pk if parts[0] == "pk" else model._meta.get_field(parts[0])
+    except FieldDoesNotExist:
+        return None
+    if not field.concrete or field.many_to_many:
+        return None
+
+    if field.is_relation:
+        # Only lookups on the related object's primary key (e.g. `location`, `location_id` or `location__id`)
+        target_field = field.target_field
+        if len(parts) == 2 and parts[1] not in ("pk", target_field.name):
+            return None
+    else:
+        target_field = field
+        if len(parts) > 1:
+            return None
+    if len(parts) > 2:
+        return None
+
+    if not isinstance(target_field, _COMPILABLE_FIELD_TYPES):
+        if not isinstance(target_field, _COLLATION_DEPENDENT_FIELD_TYPES) or connection.vendor != "postgresql":
+            return None
+
+    if operator == "in":
+        if not isinstance(value, (list, tuple)):
+            return None
+        values = value
+    else:
+        values = [value]
+
+    compiled_values = set()
+    for item in values:
+        if isinstance(item, str):
+            item = tokens.get(item, item)
+        if isinstance(item, models.Model):
+            item = item.pk
+        if item is not None and not isinstance(item, (str, int, uuid.UUID)):
+            return None
+        if item is None:
+            if operator == "in":
+                # SQL `IN` never matches NULL
+                continue
+        else:
+            try:
+                item = target_field.to_python(item)
+            except ValidationError:
+                return None
+        compiled_values.add(item)
+
+    return field.attname, compiled_values
+
+
+def compile_constraints(model, constraints, tokens=None):
+    """
+    Compile a user's permission constraints into a predicate that can be evaluated against already-loaded instances.
+
+    Only simple lookups are supported: equality or `__in` lookups on a concrete field of the model itself, or on the
+    primary key of a related object (e.g. `location`, `location_id` or `location__id`).
+
+    Args:
+        model (Model): The model that the constraints apply to.
+        constraints (list): List of constraint sets, as used by `qs_filter_from_constraints()`.
+        tokens (dict, optional): user tokens. Defaults to a None.
+
+    Returns:
+        (callable): Function taking a model instance and returning whether it matches any of the constraint sets,
+            with an `attnames` attribute listing the instance attributes it reads, or None if any constraint is too
+            complex to compile and must therefore be evaluated by the database.
+    """
+    if tokens is None:
+        tokens = {}
+
+    compiled = []
+    for constraint in constraints:
+        if not constraint:
+            # permit model level access, constraints are null
+            compiled = []
+            break
+        compiled_set = []
+        for lookup, value in constraint.items():
+            compiled_lookup = _compile_lookup(model, lookup, value, tokens)
+            if compiled_lookup is None:
+                return None
+            compiled_set.append(compiled_lookup)
+        compiled.append(compiled_set)
+
+    def predicate(obj):
+        if not compiled:
+            return True
+        return any(
+            all(getattr(obj, attname) in values for attname, values in compiled_set) for compiled_set in compiled
+        )
+
+    predicate.attnames = frozenset(attname for compiled_set in compiled for attname, _ in compiled_set)
+    return predicate
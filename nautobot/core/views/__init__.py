@@ -5,7 +5,6 @@ import sys
 import time
 
 from db_file_storage.views import get_file
-from django.apps import apps
 from django.conf import settings
 from django.contrib.auth.decorators import permission_required
 from django.contrib.auth.mixins import AccessMixin, LoginRequiredMixin
@@ -14,7 +13,7 @@ from django.http import HttpResponseForbidden, HttpResponseServerError, JsonResp
 from django.shortcuts import get_object_or_404, render
 from django.template import loader, RequestContext, Template
 from django.template.exceptions import TemplateDoesNotExist
-from django.urls import resolve, reverse
+from django.urls import reverse
 from django.utils.encoding import smart_str
 from django.views.csrf import csrf_failure as _csrf_failure
 from django.views.decorators.csrf import requires_csrf_token
@@ -39,12 +38,13 @@ from rest_framework.views import APIView
 
 from nautobot.core.constants import SEARCH_MAX_RESULTS
 from nautobot.core.forms import SearchForm
+from nautobot.core.graphql.backend import get_graphql_backend
 from nautobot.core.releases import get_latest_release
-from nautobot.core.utils.lookup import get_route_for_model
 from nautobot.core.utils.permissions import get_permission_for_model
 from nautobot.extras.forms import GraphQLQueryForm
 from nautobot.extras.models import FileProxy, GraphQLQuery, Status
 from nautobot.extras.registry import registry
+from nautobot.extras.search import get_search_backend, get_search_view_attributes, get_searchable_models
 
 
 class HomeView(AccessMixin, TemplateView):
@@ -156,46 +156,29 @@ class SearchView(AccessMixin, View):
         results = []
 
         if form.is_valid():
-            # Build the list of (app_label, modelname) tuples, representing all models included in the global search,
-            # based on the `app_config.searchable_models` list (if any) defined by each app
-            searchable_models = []
-            for app_config in apps.get_app_configs():
-                if hasattr(app_config, "searchable_models"):
-                    searchable_models += [(app_config.label, modelname) for modelname in app_config.searchable_models]
-
+            # All models included in the global search, based on the `app_config.searchable_models` list (if any)
+            # defined by each app
+            models = get_searchable_models()
             if form.cleaned_data["obj_type"]:
                 # Searching for a single type of object
-                obj_types = [form.cleaned_data["obj_type"]]
-            else:
-                # Searching all object types
-                obj_types = [model_info[1] for model_info in searchable_models]
-
-            for label, modelname in searchable_models:
-                if modelname not in obj_types:
-                    continue
-                # Based on the label and modelname, reverse-lookup the list URL, then the view or UIViewSet
-                # corresponding to that URL, and finally the queryset, filterset, and table classes needed
-                # to find and display the model search results.
-                url = get_route_for_model(f"{label}.{modelname}", "list")
-                view_func = resolve(reverse(url)).func
-                # For a UIViewSet, view_func.cls gets what we need; for an ObjectListView, view_func.view_class is it.
-                view_or_viewset = getattr(view_func, "cls", getattr(view_func, "view_class", None))
-                queryset = view_or_viewset.queryset.restrict(request.user, "view")
-                # For a UIViewSet, .filterset_class, for an ObjectListView, .filterset.
-                filterset = getattr(view_or_viewset, "filterset_class", getattr(view_or_viewset, "filterset", None))
-                # For a UIViewSet, .table_class, for an ObjectListView, .table.
-                table = getattr(view_or_viewset, "table_class", getattr(view_or_viewset, "table", None))
+                models = [model for model in models if model._meta.model_name == form.cleaned_data["obj_type"]]
+
+            for result in get_search_backend().search(request.user, form.cleaned_data["q"], models):
+                model = result["model"]
+                _, _, table, url = get_search_view_attributes(model)
 
                 # Construct the results table for this object type
-                filtered_queryset = filterset({"q": form.cleaned_data["q"]}, queryset=queryset).qs
-                table = table(filtered_queryset, orderable=False)
+                table = table(result["queryset"], orderable=False)
                 table.paginate(per_page=SEARCH_MAX_RESULTS)
 
                 if table.page:
+                    count = result["count"] if result["count"] is not None else table.page.paginator.count
                     results.append(
                         {
-                            "name": queryset.model._meta.verbose_name_plural,
+                            "name": model._meta.verbose_name_plural,
                             "table": table,
+                            "count": count,
+                            "has_more": count > len(table.page),
                             "url": f"{reverse(url)}?q={form.cleaned_data.get('q')}",
                         }
                     )
@@ -266,6 +249,9 @@ def csrf_failure(request, reason="", template_name="403_csrf_failure.html"):
 
 
 class CustomGraphQLView(LoginRequiredMixin, GraphQLView):
+    def get_backend(self, request):
+        return get_graphql_backend()
+
     def render_graphiql(self, request, **data):
         query_name = request.GET.get("name")
         if query_name:
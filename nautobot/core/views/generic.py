@@ -973,6 +973,9 @@ class BulkEditView(GetReturnURLMixin, ObjectPermissionRequiredMixin, View):
         else:
             pk_list = request.POST.getlist("pk")
 
+        # Limit the selection to the objects that the user is permitted to change
+        pk_list = list(self.queryset.restrict_pks(request.user, "change", pk_list))
+
         if "_apply" in request.POST:
             form = self.form(model, request.POST)
             restrict_form_fields(form, request.user)
@@ -1045,9 +1048,8 @@ class BulkEditView(GetReturnURLMixin, ObjectPermissionRequiredMixin, View):
                             self.extra_post_save_action(obj, form)
 
                         # Enforce object-level permissions
-                        if self.queryset.filter(pk__in=[obj.pk for obj in updated_objects]).count() != len(
-                            updated_objects
-                        ):
+                        updated_pks = [obj.pk for obj in updated_objects]
+                        if len(self.queryset.restrict_pks(request.user, "change", updated_pks)) != len(updated_pks):
                             raise ObjectDoesNotExist
 
                     if updated_objects:
@@ -1241,6 +1243,9 @@ class BulkDeleteView(GetReturnURLMixin, ObjectPermissionRequiredMixin, View):
         else:
             pk_list = request.POST.getlist("pk")
 
+        # Limit the selection to the objects that the user is permitted to delete
+        pk_list = list(self.queryset.restrict_pks(request.user, "delete", pk_list))
+
         form_cls = self.get_form()
 
         if "_confirm" in request.POST:
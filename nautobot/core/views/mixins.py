@@ -889,6 +889,8 @@ class ObjectBulkDestroyViewMixin(NautobotViewSetMixin, BulkDestroyModelMixin):
                 )
         else:
             self.pk_list = list(request.POST.getlist("pk"))
+        # Limit the selection to the objects that the user is permitted to delete
+        self.pk_list = list(queryset.restrict_pks(request.user, "delete", self.pk_list))
         form_class = self.get_form_class(**kwargs)
         data = {}
         if "_confirm" in request.POST:
@@ -1032,7 +1034,8 @@ class ObjectBulkUpdateViewMixin(NautobotViewSetMixin, BulkUpdateModelMixin):
                     form.save_note(instance=obj, user=request.user)
 
             # Enforce object-level permissions
-            if queryset.filter(pk__in=[obj.pk for obj in updated_objects]).count() != len(updated_objects):
+            updated_pks = [obj.pk for obj in updated_objects]
+            if len(queryset.restrict_pks(request.user, "change", updated_pks)) != len(updated_pks):
                 raise ObjectDoesNotExist
         if updated_objects:
             msg = f"Updated {len(updated_objects)} {model._meta.verbose_name_plural}"
@@ -1070,6 +1073,8 @@ class ObjectBulkUpdateViewMixin(NautobotViewSetMixin, BulkUpdateModelMixin):
                 )
         else:
             self.pk_list = list(request.POST.getlist("pk"))
+        # Limit the selection to the objects that the user is permitted to change
+        self.pk_list = list(queryset.restrict_pks(request.user, "change", self.pk_list))
         data = {}
         form_class = self.get_form_class()
         if "_apply" in request.POST:
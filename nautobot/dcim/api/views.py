@@ -121,7 +121,8 @@ class PassThroughPortMixin:
         Return all CablePaths which traverse a given pass-through port.
         """
         obj = get_object_or_404(self.queryset, pk=pk)
-        cablepaths = CablePath.objects.filter(path__contains=obj).prefetch_related("origin", "destination")
+        cablepaths = list(CablePath.objects.filter(path__contains=obj).prefetch_related("origin", "destination"))
+        CablePath.get_paths(cablepaths)
         serializer = serializers.CablePathSerializer(cablepaths, context={"request": request}, many=True)
 
         return Response(serializer.data)
@@ -1,18 +1,32 @@
-from django.core.management.base import BaseCommand
-from django.core.management.color import no_style
-from django.db import connection
+import bisect
+from concurrent.futures import as_completed, ProcessPoolExecutor
+import json
+import multiprocessing
+import os
+import uuid
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Q
+from django.utils import dateparse, timezone
 
 from nautobot.circuits.models import CircuitTermination
 from nautobot.dcim.models import (
+    Cable,
     CablePath,
     ConsolePort,
     ConsoleServerPort,
     Interface,
+    PathEndpoint,
     PowerFeed,
     PowerOutlet,
     PowerPort,
 )
-from nautobot.dcim.signals import create_cablepath
+from nautobot.dcim.tracing import CablePathTracer
+from nautobot.extras.models import ObjectChange
+
+BATCH_SIZE = 1000
 
 ENDPOINT_MODELS = (
     CircuitTermination,
@@ -24,6 +38,31 @@ ENDPOINT_MODELS = (
     PowerPort,
 )
 
+# Populated in the parent process before the worker processes are forked, so that they share the loaded topology
+_worker_tracer = None
+
+
+def _save_batch(index, origins):
+    """Trace and save the paths for one batch of origins in a worker process."""
+    return index, _worker_tracer.save(origins, batch_size=BATCH_SIZE)
+
+
+def _origin_key(origin):
+    """Sort key for `(content type ID, object ID)` nodes, which is also the form they are recorded in checkpoints."""
+    return origin[0], str(origin[1])
+
+
+def _parse_datetime(value):
+    parsed = dateparse.parse_datetime(value)
+    if parsed is None:
+        date = dateparse.parse_date(value)
+        if date is None:
+            raise CommandError(f"Invalid --changed-since value {value!r}; expected an ISO 8601 date or datetime")
+        parsed = timezone.datetime.combine(date, timezone.datetime.min.time())
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
 
 class Command(BaseCommand):
     help = "Generate any missing cable paths among all cable termination objects in Nautobot"
@@ -35,6 +74,24 @@ class Command(BaseCommand):
             dest="force",
             help="Force recalculation of all existing cable paths",
         )
+        parser.add_argument(
+            "--changed-since",
+            dest="changed_since",
+            help="Only retrace paths affected by Cables created, updated or deleted since this ISO 8601 date/time, "
+            "according to the change log",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes to trace paths in parallel (default: 1)",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            dest="checkpoint",
+            help="Record progress in this file, and resume from it if it already exists. "
+            "The file is removed once all paths have been traced",
+        )
         parser.add_argument(
             "--no-input",
             action="store_true",
@@ -49,51 +106,174 @@ class Command(BaseCommand):
         bar_size = int(percentage / 5)
         self.stdout.write(f"\r  [{'#' * bar_size}{' ' * (20-bar_size)}] {int(percentage)}%", ending="")
 
+    def get_changed_origins(self, since):
+        """
+        Return the `(content type ID, object ID)` nodes of all path origins affected by Cable changes since `since`.
+
+        This includes the endpoints at either end of each changed Cable, and the origins of all existing paths that
+        pass through either the Cable or its terminations.
+        """
+        cable_type = ContentType.objects.get_for_model(Cable)
+        changes = ObjectChange.objects.filter(changed_object_type=cable_type, time__gte=since).values_list(
+            "changed_object_id", "object_data"
+        )
+        origins = set()
+        through = set()
+        for cable_id, object_data in changes.iterator():
+            through.add(Cable(pk=cable_id))
+            for side in ("a", "b"):
+                termination_type_id = object_data.get(f"termination_{side}_type")
+                termination_id = object_data.get(f"termination_{side}_id")
+                if termination_type_id is None or termination_id is None:
+                    continue
+                model = ContentType.objects.get_for_id(termination_type_id).model_class()
+                if model is None:
+                    continue
+                termination = model(pk=uuid.UUID(str(termination_id)))
+                through.add(termination)
+                if issubclass(model, PathEndpoint):
+                    origins.add((termination_type_id, termination.pk))
+
+        through = list(through)
+        for offset in range(0, len(through), BATCH_SIZE):
+            query = Q()
+            for obj in through[offset : offset + BATCH_SIZE]:
+                query |= Q(path__contains=obj)
+            origins.update(CablePath.objects.filter(query).values_list("origin_type_id", "origin_id"))
+        return origins
+
+    def get_origins(self, options):
+        """Return the sorted `(content type ID, object ID)` nodes of all path origins to be traced."""
+        if options["changed_since"]:
+            return sorted(self.get_changed_origins(_parse_datetime(options["changed_since"])), key=_origin_key)
+
+        origins = []
+        for model in ENDPOINT_MODELS:
+            queryset = model.objects.filter(cable__isnull=False)
+            if not options["force"]:
+                queryset = queryset.filter(_path__isnull=True)
+            origin_type_id = ContentType.objects.get_for_model(model).pk
+            count = len(origins)
+            pks = queryset.values_list("pk", flat=True).iterator()
+            origins.extend((origin_type_id, pk) for pk in pks)
+            if len(origins) == count:
+                self.stdout.write(f"Found no missing {model._meta.verbose_name} paths; skipping")
+            else:
+                self.stdout.write(f"Found {len(origins) - count} cabled {model._meta.verbose_name_plural} to retrace")
+        return sorted(origins, key=_origin_key)
+
+    def load_checkpoint(self, path, options):
+        """Load the set of completed batches from the checkpoint file at `path`, if any."""
+        arguments = {key: options[key] for key in ("force", "changed_since")}
+        if path is None or not os.path.exists(path):
+            return {"arguments": arguments, "completed": []}
+        with open(path) as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        if checkpoint.get("arguments") != arguments:
+            raise CommandError(
+                f"Checkpoint file {path} was created with different arguments ({checkpoint.get('arguments')}); "
+                "remove it or rerun with the same arguments"
+            )
+        self.stdout.write(f"Resuming from checkpoint file {path}")
+        return checkpoint
+
+    @staticmethod
+    def save_checkpoint(path, checkpoint):
+        # Write to a temporary file first so that an interruption can't leave a truncated checkpoint behind
+        with open(f"{path}.tmp", "w") as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+        os.replace(f"{path}.tmp", path)
+
     def handle(self, *model_names, **options):
-        # If --force was passed, first delete all existing CablePaths
-        if options["force"]:
-            cable_paths = CablePath.objects.all()
-            paths_count = cable_paths.count()
+        global _worker_tracer  # pylint: disable=global-statement
 
-            # Prompt the user to confirm recalculation of all paths
-            if paths_count and not options["no_input"]:
+        if options["workers"] < 1:
+            raise CommandError("--workers must be at least 1")
+
+        # If --force was passed, confirm before retracing all existing CablePaths
+        if options["force"] and not options["changed_since"] and not options["no_input"]:
+            paths_count = CablePath.objects.count()
+            if paths_count:
                 self.stdout.write(self.style.ERROR("WARNING: Forcing recalculation of all cable paths."))
-                self.stdout.write(
-                    f"This will delete and recalculate all {paths_count} existing cable paths. Are you sure?"
-                )
+                self.stdout.write(f"This will recalculate all {paths_count} existing cable paths. Are you sure?")
                 confirmation = input("Type yes to confirm: ")
                 if confirmation != "yes":
                     self.stdout.write(self.style.SUCCESS("Aborting"))
                     return
 
-            # Delete all existing CablePath instances
-            self.stdout.write(f"Deleting {paths_count} existing cable paths...")
-            deleted_count, _ = CablePath.objects.all().delete()
-            self.stdout.write((self.style.SUCCESS(f"  Deleted {deleted_count} paths")))
+        checkpoint_path = options["checkpoint"]
+        checkpoint = self.load_checkpoint(checkpoint_path, options)
 
-            # Reinitialize the model's PK sequence
-            self.stdout.write("Resetting database sequence for CablePath model")
-            sequence_sql = connection.ops.sequence_reset_sql(no_style(), [CablePath])
-            with connection.cursor() as cursor:
-                for sql in sequence_sql:
-                    cursor.execute(sql)
+        # Split the origins into batches, each identified by its first and last origin, skipping completed batches
+        completed = sorted((tuple(first), tuple(last)) for first, last in checkpoint["completed"])
+        completed_firsts = [first for first, _ in completed]
 
-        # Retrace paths
-        for model in ENDPOINT_MODELS:
-            origins = model.objects.filter(cable__isnull=False)
-            if not options["force"]:
-                origins = origins.filter(_path__isnull=True)
-            origins_count = origins.count()
-            if not origins_count:
-                self.stdout.write(f"Found no missing {model._meta.verbose_name} paths; skipping")
-                continue
-            self.stdout.write(f"Retracing {origins_count} cabled {model._meta.verbose_name_plural}...")
-            i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepath(obj)
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
-            self.draw_progress_bar(100)
-            self.stdout.write(self.style.SUCCESS(f"\n  Retraced {i} {model._meta.verbose_name_plural}"))
+        def is_completed(origin):
+            key = _origin_key(origin)
+            index = bisect.bisect_right(completed_firsts, key) - 1
+            return index >= 0 and key <= completed[index][1]
+
+        origins = [origin for origin in self.get_origins(options) if not is_completed(origin)]
+        batches = [origins[i : i + BATCH_SIZE] for i in range(0, len(origins), BATCH_SIZE)]
+        if not batches:
+            self.stdout.write(self.style.SUCCESS("Found no cable paths to retrace."))
+        else:
+            self.stdout.write("Loading cable topology...")
+            tracer = CablePathTracer()
+            tracer.load_all()
+
+            self.stdout.write(
+                f"Retracing {len(origins)} cable paths in {len(batches)} batches using {options['workers']} workers..."
+            )
+            self.draw_progress_bar(0)
+            retraced = done = 0
+
+            def batch_completed(index, count):
+                nonlocal retraced, done
+                retraced += count
+                done += 1
+                if checkpoint_path is not None:
+                    batch = batches[index]
+                    checkpoint["completed"].append([_origin_key(batch[0]), _origin_key(batch[-1])])
+                    self.save_checkpoint(checkpoint_path, checkpoint)
+                self.draw_progress_bar(done * 100 / len(batches))
+
+            _worker_tracer = tracer
+            try:
+                if options["workers"] == 1:
+                    for index, batch in enumerate(batches):
+                        batch_completed(*_save_batch(index, batch))
+                else:
+                    # Each forked worker must open its own database connection rather than sharing the parent's
+                    connections.close_all()
+                    with ProcessPoolExecutor(
+                        max_workers=options["workers"], mp_context=multiprocessing.get_context("fork")
+                    ) as executor:
+                        futures = [executor.submit(_save_batch, index, batch) for index, batch in enumerate(batches)]
+                        try:
+                            for future in as_completed(futures):
+                                batch_completed(*future.result())
+                        except BaseException:
+                            # Don't start any further batches; the checkpoint records those already completed
+                            for future in futures:
+                                future.cancel()
+                            raise
+            finally:
+                _worker_tracer = None
+
+            self.stdout.write(self.style.SUCCESS(f"\n  Created or updated {retraced} cable paths"))
+
+        # A forced retrace of all paths also removes any paths whose origin is no longer cabled
+        if options["force"] and not options["changed_since"]:
+            for model in ENDPOINT_MODELS:
+                deleted_count, _ = (
+                    CablePath.objects.filter(origin_type=ContentType.objects.get_for_model(model))
+                    .exclude(origin_id__in=model.objects.filter(cable__isnull=False).values("pk"))
+                    .delete()
+                )
+                if deleted_count:
+                    self.stdout.write(f"Deleted {deleted_count} stale {model._meta.verbose_name} paths")
 
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
         self.stdout.write(self.style.SUCCESS("Finished."))
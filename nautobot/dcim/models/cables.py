@@ -426,28 +426,53 @@ class CablePath(BaseModel):
         """
         Return the path as a list of prefetched objects.
         """
-        # Compile a list of IDs to prefetch for each type of model in the path
-        to_prefetch = defaultdict(list)
-        for node in self.path:
-            ct_id, object_id = decompile_path_node(node)
-            to_prefetch[ct_id].append(object_id)
+        if not hasattr(self, "_path_objects"):
+            self.get_paths([self])
+        return self._path_objects
 
-        # Prefetch path objects using one query per model type. Prefetch related devices where appropriate.
+    @classmethod
+    def get_paths(cls, cable_paths):
+        """
+        Resolve the paths of the given CablePaths at once, using a single query per model type across all of them.
+
+        The resolved path is cached on each CablePath, so that subsequent calls to its `get_path()` (for example from
+        `PathEndpoint.trace()`) don't query the database again.
+
+        Args:
+            cable_paths (list): CablePath instances.
+
+        Returns:
+            (list): The path of each CablePath, as a list of objects, in the same order as `cable_paths`.
+        """
+        # Compile a list of IDs to prefetch for each type of model in the paths
+        to_prefetch = defaultdict(set)
+        for cable_path in cable_paths:
+            for node in cable_path.path:
+                ct_id, object_id = decompile_path_node(node)
+                to_prefetch[ct_id].add(object_id)
+
+        # Prefetch path objects using one query per model type. Prefetch related devices and circuits as appropriate.
         prefetched = {}
         for ct_id, object_ids in to_prefetch.items():
             model_class = ContentType.objects.get_for_id(ct_id).model_class()
             queryset = model_class.objects.filter(pk__in=object_ids)
             if hasattr(model_class, "device"):
                 queryset = queryset.prefetch_related("device")
+            if hasattr(model_class, "circuit"):
+                queryset = queryset.select_related("circuit__provider")
             prefetched[ct_id] = {obj.id: obj for obj in queryset}
 
-        # Replicate the path using the prefetched objects.
-        path = []
-        for node in self.path:
-            ct_id, object_id = decompile_path_node(node)
-            path.append(prefetched[ct_id][object_id])
-
-        return path
+        # Replicate each path using the prefetched objects.
+        paths = []
+        for cable_path in cable_paths:
+            path = []
+            for node in cable_path.path:
+                ct_id, object_id = decompile_path_node(node)
+                path.append(prefetched[ct_id][object_id])
+            cable_path._path_objects = path
+            paths.append(path)
+
+        return paths
 
     def get_total_length(self):
         """
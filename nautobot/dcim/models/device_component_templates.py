@@ -1,4 +1,3 @@
-from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
@@ -87,8 +86,7 @@ class ComponentTemplateModel(BaseModel, ChangeLoggedModel, CustomFieldModel, Rel
         Helper method to self.instantiate().
         """
         custom_field_data = {}
-        content_type = ContentType.objects.get_for_model(model)
-        fields = CustomField.objects.filter(content_types=content_type)
+        fields = CustomField.objects.get_snapshot_for_model(model)
         for field in fields:
             custom_field_data[field.key] = field.default
 
@@ -21,6 +21,7 @@ from .models import (
     RackGroup,
     VirtualChassis,
 )
+from .tracing import retrace_paths
 from .utils import validate_interface_tagged_vlans
 
 
@@ -30,28 +31,14 @@ def create_cablepath(node, rebuild=True):
 
     rebuild (bool) - Used to refresh paths where this node is not an endpoint.
     """
-    cp = CablePath.from_origin(node)
-    if cp:
-        try:
-            cp.save()
-        except Exception as e:
-            print(node, node.pk)
-            raise e
-    if rebuild:
-        rebuild_paths(node)
+    retrace_paths(origins=[node], through=[node] if rebuild else [])
 
 
 def rebuild_paths(obj):
     """
     Rebuild all CablePaths which traverse the specified node
     """
-    cable_paths = CablePath.objects.filter(path__contains=obj)
-
-    with transaction.atomic():
-        for cp in cable_paths:
-            cp.delete()
-            # Prevent looping back to rebuild_paths during the atomic transaction.
-            create_cablepath(cp.origin, rebuild=False)
+    retrace_paths(through=[obj])
 
 
 #
@@ -226,11 +213,11 @@ def update_connected_endpoints(instance, created, raw=False, **kwargs):
 
     # Create/update cable paths
     if created:
-        for termination in (instance.termination_a, instance.termination_b):
-            if isinstance(termination, PathEndpoint):
-                create_cablepath(termination)
-            else:
-                rebuild_paths(termination)
+        terminations = (instance.termination_a, instance.termination_b)
+        retrace_paths(
+            origins=[termination for termination in terminations if isinstance(termination, PathEndpoint)],
+            through=terminations,
+        )
     elif instance.status != instance._orig_status:
         # We currently don't support modifying either termination of an existing Cable. (This
         # may change in the future.) However, we do need to capture status changes and update
@@ -260,19 +247,8 @@ def nullify_connected_endpoints(instance, **kwargs):
         instance.termination_b._cable_peer = None
         instance.termination_b.save()
 
-    # Delete and retrace any dependent cable paths
-    for cablepath in CablePath.objects.filter(path__contains=instance):
-        cp = CablePath.from_origin(cablepath.origin)
-        if cp:
-            CablePath.objects.filter(pk=cablepath.pk).update(
-                path=cp.path,
-                destination_type=ContentType.objects.get_for_model(cp.destination) if cp.destination else None,
-                destination_id=cp.destination.pk if cp.destination else None,
-                is_active=cp.is_active,
-                is_split=cp.is_split,
-            )
-        else:
-            cablepath.delete()
+    # Retrace any dependent cable paths, deleting those that no longer have a cable at their origin
+    retrace_paths(through=[instance])
 
 
 #
@@ -1,3 +1,4 @@
+from django.db.models import prefetch_related_objects
 import django_tables2 as tables
 from django_tables2.utils import Accessor
 
@@ -11,6 +12,7 @@ from nautobot.core.tables import (
     ToggleColumn,
 )
 from nautobot.dcim.models import (
+    CablePath,
     ConsolePort,
     ConsoleServerPort,
     Controller,
@@ -267,6 +269,15 @@ class PathEndpointTable(CableTerminationTable):
         orderable=False,
     )
 
+    def before_render(self, request):
+        super().before_render(request)
+        if not self.columns["connection"].visible:
+            return
+        # Resolve the traced paths of all displayed rows together, rather than once per row
+        records = [row.record for row in self.paginated_rows]
+        prefetch_related_objects(records, "_path__destination")
+        CablePath.get_paths([record._path for record in records if record._path is not None])
+
 
 class ConsolePortTable(DeviceComponentTable, PathEndpointTable):
     tags = TagColumn(url_name="dcim:consoleport_list")
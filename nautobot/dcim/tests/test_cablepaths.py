@@ -1,5 +1,13 @@
+from datetime import timedelta
+from io import StringIO
+import json
+import os
+import tempfile
+import uuid
+
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.test import TestCase
 
 from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider
@@ -21,7 +29,9 @@ from nautobot.dcim.models import (
     PowerPort,
     RearPort,
 )
+from nautobot.dcim.tracing import CablePathTracer
 from nautobot.dcim.utils import object_to_path_node
+from nautobot.extras.choices import ObjectChangeActionChoices
 from nautobot.extras.models import Role, Status
 
 
@@ -1494,3 +1504,192 @@ class CablePathTestCase(TestCase):
                 rearport1: 2,
             }
         )
+
+    def test_303_tracer_matches_from_origin(self):
+        """
+        [IF1] --C1-- [FP1:1] [RP1] --C3-- [RP2] [FP2:1] --C4-- [IF3]
+        [IF2] --C2-- [FP1:2]                    [FP2:2] --C5-- [CT1A]
+        [IF4] --C6-- [RP3]
+        """
+        interface1 = Interface.objects.create(device=self.device, name="Interface 1", status=self.interface_status)
+        interface2 = Interface.objects.create(device=self.device, name="Interface 2", status=self.interface_status)
+        interface3 = Interface.objects.create(device=self.device, name="Interface 3", status=self.interface_status)
+        interface4 = Interface.objects.create(device=self.device, name="Interface 4", status=self.interface_status)
+        rearport1 = RearPort.objects.create(device=self.device, name="Rear Port 1", positions=4)
+        rearport2 = RearPort.objects.create(device=self.device, name="Rear Port 2", positions=4)
+        rearport3 = RearPort.objects.create(device=self.device, name="Rear Port 3", positions=4)
+        frontports = {}
+        for rearport, position in [(rearport1, 1), (rearport1, 2), (rearport2, 1), (rearport2, 2), (rearport3, 1)]:
+            frontports[(rearport, position)] = FrontPort.objects.create(
+                device=self.device,
+                name=f"{rearport.name} Front Port {position}",
+                rear_port=rearport,
+                rear_port_position=position,
+            )
+        circuittermination1 = CircuitTermination.objects.create(
+            circuit=self.circuit, location=self.location, term_side="A"
+        )
+        for termination_a, termination_b, status in [
+            (interface1, frontports[(rearport1, 1)], self.status),
+            (interface2, frontports[(rearport1, 2)], self.status),
+            (rearport1, rearport2, self.status),
+            (frontports[(rearport2, 1)], interface3, self.status_planned),
+            (frontports[(rearport2, 2)], circuittermination1, self.status),
+            (interface4, rearport3, self.status),
+        ]:
+            Cable.objects.create(termination_a=termination_a, termination_b=termination_b, status=status)
+
+        origins = [interface1, interface2, interface3, interface4, circuittermination1]
+        lazy_tracer = CablePathTracer()
+        full_tracer = CablePathTracer()
+        full_tracer.load_all()
+        with self.assertNumQueries(0):
+            full_results = full_tracer.trace(origins)
+        lazy_results = lazy_tracer.trace(origins)
+
+        for origin in origins:
+            expected = CablePath.from_origin(origin)
+            node = CablePathTracer.to_node(origin)
+            for tracer, results in (("lazy", lazy_results), ("full", full_results)):
+                with self.subTest(origin=origin, tracer=tracer):
+                    result = results[node]
+                    self.assertEqual(result.path, expected.path)
+                    self.assertEqual(result.is_active, expected.is_active)
+                    self.assertEqual(result.is_split, expected.is_split)
+                    self.assertEqual(
+                        result.destination,
+                        CablePathTracer.to_node(expected.destination) if expected.destination else None,
+                    )
+
+        # Paths written in bulk should match those created by the signal handlers
+        expected_paths = {
+            (cp.origin_type_id, cp.origin_id): (cp.path, cp.destination_id, cp.is_active, cp.is_split)
+            for cp in CablePath.objects.all()
+        }
+        CablePath.objects.all().delete()
+        self.assertEqual(CablePathTracer().save(origins), len(origins))
+        self.assertEqual(
+            {
+                (cp.origin_type_id, cp.origin_id): (cp.path, cp.destination_id, cp.is_active, cp.is_split)
+                for cp in CablePath.objects.all()
+            },
+            expected_paths,
+        )
+        for origin in origins:
+            origin.refresh_from_db()
+            self.assertPathIsSet(origin, CablePath.objects.get(origin_id=origin.pk))
+
+        # Re-saving unchanged paths is a no-op
+        self.assertEqual(full_tracer.save(origins), 0)
+
+    def test_304_loop_detection(self):
+        """
+        [IF1] --C1-- [FP1:1] [RP1] --C2-- [FP2] [RP2] --C3-- [FP1:2] [RP1] ...
+        """
+        interface1 = Interface.objects.create(device=self.device, name="Interface 1", status=self.interface_status)
+        rearport1 = RearPort.objects.create(device=self.device, name="Rear Port 1", positions=2)
+        rearport2 = RearPort.objects.create(device=self.device, name="Rear Port 2", positions=1)
+        frontport1_1 = FrontPort.objects.create(
+            device=self.device, name="Front Port 1:1", rear_port=rearport1, rear_port_position=1
+        )
+        frontport1_2 = FrontPort.objects.create(
+            device=self.device, name="Front Port 1:2", rear_port=rearport1, rear_port_position=2
+        )
+        frontport2 = FrontPort.objects.create(
+            device=self.device, name="Front Port 2", rear_port=rearport2, rear_port_position=1
+        )
+        Cable.objects.create(termination_a=interface1, termination_b=frontport1_1, status=self.status)
+        Cable.objects.create(termination_a=rearport1, termination_b=frontport2, status=self.status)
+
+        with self.assertRaises(ValidationError):
+            Cable.objects.create(termination_a=rearport2, termination_b=frontport1_2, status=self.status)
+
+    def test_305_trace_paths_command(self):
+        """
+        [IF1] --C1-- [IF2]
+        [IF3] --C2-- [IF4]
+        """
+        interfaces = [
+            Interface.objects.create(device=self.device, name=f"Interface {i}", status=self.interface_status)
+            for i in range(1, 5)
+        ]
+        Cable.objects.create(termination_a=interfaces[0], termination_b=interfaces[1], status=self.status)
+        self.assertEqual(CablePath.objects.count(), 2)
+
+        # Missing paths are retraced
+        CablePath.objects.all().delete()
+        call_command("trace_paths", stdout=StringIO())
+        self.assertPathExists(origin=interfaces[0], destination=interfaces[1], is_active=True)
+        self.assertPathExists(origin=interfaces[1], destination=interfaces[0], is_active=True)
+
+        # A checkpoint records batches that were already completed and is removed afterward
+        CablePath.objects.all().delete()
+        interface_type = ContentType.objects.get_for_model(Interface)
+        with tempfile.TemporaryDirectory() as tempdir:
+            checkpoint = os.path.join(tempdir, "checkpoint.json")
+            with open(checkpoint, "w") as checkpoint_file:
+                node = [interface_type.pk, str(interfaces[0].pk)]
+                json.dump(
+                    {"arguments": {"force": False, "changed_since": None}, "completed": [[node, node]]},
+                    checkpoint_file,
+                )
+            call_command("trace_paths", checkpoint=checkpoint, stdout=StringIO())
+            self.assertFalse(os.path.exists(checkpoint))
+        self.assertEqual(CablePath.objects.count(), 1)
+        self.assertPathExists(origin=interfaces[1], destination=interfaces[0], is_active=True)
+
+        # Only paths affected by Cables changed since the given time are retraced
+        cable2 = Cable.objects.create(termination_a=interfaces[2], termination_b=interfaces[3], status=self.status)
+        objectchange = cable2.to_objectchange(ObjectChangeActionChoices.ACTION_CREATE)
+        objectchange.request_id = uuid.uuid4()
+        objectchange.save()
+        since = (objectchange.time - timedelta(minutes=1)).isoformat()
+        CablePath.objects.all().delete()
+        call_command("trace_paths", changed_since=since, stdout=StringIO())
+        self.assertEqual(CablePath.objects.count(), 2)
+        self.assertPathExists(origin=interfaces[2], destination=interfaces[3], is_active=True)
+        self.assertPathExists(origin=interfaces[3], destination=interfaces[2], is_active=True)
+
+        # Forcing a full retrace recalculates all paths
+        call_command("trace_paths", force=True, no_input=True, stdout=StringIO())
+        self.assertEqual(CablePath.objects.count(), 4)
+
+    def test_306_get_paths(self):
+        """
+        [IF1] --C1-- [FP1:1] [RP1] --C3-- [RP2] [FP2:1] --C4-- [IF3]
+        [IF2] --C2-- [FP1:2]                    [FP2:2] --C5-- [IF4]
+        """
+        interfaces = [
+            Interface.objects.create(device=self.device, name=f"Interface {i}", status=self.interface_status)
+            for i in range(1, 5)
+        ]
+        rearport1 = RearPort.objects.create(device=self.device, name="Rear Port 1", positions=2)
+        rearport2 = RearPort.objects.create(device=self.device, name="Rear Port 2", positions=2)
+        frontports = [
+            FrontPort.objects.create(
+                device=self.device, name=f"Front Port {i}:{position}", rear_port=rearport, rear_port_position=position
+            )
+            for i, rearport in ((1, rearport1), (2, rearport2))
+            for position in (1, 2)
+        ]
+        for termination_a, termination_b in [
+            (interfaces[0], frontports[0]),
+            (interfaces[1], frontports[1]),
+            (rearport1, rearport2),
+            (frontports[2], interfaces[2]),
+            (frontports[3], interfaces[3]),
+        ]:
+            Cable.objects.create(termination_a=termination_a, termination_b=termination_b, status=self.status)
+
+        expected = {cp.pk: cp.get_path() for cp in CablePath.objects.all()}
+        self.assertEqual(len(expected), 4)
+
+        cable_paths = list(CablePath.objects.all())
+        # One query each for Cables, FrontPorts and RearPorts, plus one each for the FrontPort and RearPort Devices
+        with self.assertNumQueries(5):
+            paths = CablePath.get_paths(cable_paths)
+        for cable_path, path in zip(cable_paths, paths):
+            self.assertEqual(path, expected[cable_path.pk])
+        with self.assertNumQueries(0):
+            for cable_path in cable_paths:
+                self.assertEqual(cable_path.get_path(), expected[cable_path.pk])
@@ -0,0 +1,363 @@
+"""Batch tracing of CablePaths against an in-memory graph of the cabling topology."""
+
+from collections import defaultdict, namedtuple
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery
+
+from nautobot.dcim.constants import CABLE_TERMINATION_MODELS
+from nautobot.dcim.models import Cable, CablePath, FrontPort, RearPort
+from nautobot.dcim.utils import compile_path_node, decompile_path_node
+
+TraceResult = namedtuple("TraceResult", ["path", "destination", "is_active", "is_split"])
+
+_NO_FRONT_PORTS = {}
+
+
+class _NotLoaded(Exception):
+    """Raised while tracing when the graph does not yet contain the data needed to follow the next hop."""
+
+    def __init__(self, kind, key):
+        super().__init__(kind, key)
+        self.kind = kind
+        self.key = key
+
+
+class CablePathTracer:
+    """
+    Trace CablePaths using an in-memory graph of cables, pass-through ports and circuit terminations.
+
+    Tracing follows exactly the same rules as `CablePath.from_origin()`, but the topology is read from the database in
+    bulk rather than one hop and one object at a time. Path nodes are represented as `(content type ID, object ID)`
+    tuples throughout.
+
+    The graph can be populated in two ways:
+
+    - `load_all()` reads the entire cabling topology up front, in a handful of queries. This is appropriate when
+      tracing a large number of paths, such as in the `trace_paths` management command.
+    - Otherwise, the graph is populated on demand: all requested origins are traced side-by-side, and whenever some of
+      them need data that hasn't been loaded yet, that data is fetched for all of them at once. Tracing any number of
+      paths then takes a number of queries proportional to the length of the longest path. This is appropriate when
+      re-tracing only the paths affected by a change to a single cable.
+
+    Note that the graph is a snapshot; a tracer should not be reused after the cabling has changed.
+    """
+
+    def __init__(self, chunk_size=1000):
+        self.chunk_size = chunk_size
+        self.complete = False
+        # (ct_id, pk) of a cable termination -> (cable pk, cable is connected, (ct_id, pk) of cable peer) or None
+        self.terminations = {}
+        # FrontPort pk -> (RearPort pk, rear port position)
+        self.front_ports = {}
+        # RearPort pk -> number of positions
+        self.rear_ports = {}
+        # RearPort pk -> {position: FrontPort pk}
+        self.rear_port_front_ports = {}
+        # CircuitTermination pk -> pk of the CircuitTermination on the other side of the Circuit, or None
+        self.circuit_peers = {}
+
+        # Import added here to avoid circular imports with CircuitTermination.
+        from nautobot.circuits.models import CircuitTermination
+
+        get_for_model = ContentType.objects.get_for_model
+        self.cable_type = get_for_model(Cable).pk
+        self.front_port_type = get_for_model(FrontPort).pk
+        self.rear_port_type = get_for_model(RearPort).pk
+        self.circuit_termination_type = get_for_model(CircuitTermination).pk
+        self._connected_status = Cable.STATUS_CONNECTED
+
+    def _chunks(self, values):
+        values = list(values)
+        for offset in range(0, len(values), self.chunk_size):
+            yield values[offset : offset + self.chunk_size]
+
+    @staticmethod
+    def to_node(obj):
+        """Return the `(content type ID, object ID)` node for a model instance, path node string or node tuple."""
+        if isinstance(obj, tuple):
+            return obj
+        if isinstance(obj, str):
+            return decompile_path_node(obj)
+        return ContentType.objects.get_for_model(obj).pk, obj.pk
+
+    #
+    # Graph population
+    #
+
+    def _add_terminations(self, ct_id, rows):
+        connected_status_id = self._connected_status.pk if self._connected_status is not None else None
+        for pk, cable_id, status_id, peer_type_id, peer_id in rows:
+            if cable_id is None:
+                self.terminations[(ct_id, pk)] = None
+                continue
+            peer = (peer_type_id, peer_id) if peer_type_id is not None and peer_id is not None else None
+            self.terminations[(ct_id, pk)] = (cable_id, status_id == connected_status_id, peer)
+
+    def _add_front_ports(self, rows):
+        for pk, rear_port_id, rear_port_position in rows:
+            self.front_ports[pk] = (rear_port_id, rear_port_position)
+            self.rear_port_front_ports.setdefault(rear_port_id, {})[rear_port_position] = pk
+
+    def _add_circuit_terminations(self, rows):
+        by_circuit = defaultdict(dict)
+        for pk, circuit_id, term_side in rows:
+            by_circuit[circuit_id][term_side] = pk
+        for sides in by_circuit.values():
+            for term_side, pk in sides.items():
+                self.circuit_peers[pk] = sides.get("Z" if term_side == "A" else "A")
+
+    @staticmethod
+    def _termination_fields():
+        return ("pk", "cable_id", "cable__status_id", "_cable_peer_type_id", "_cable_peer_id")
+
+    def load_all(self):
+        """Load the entire cabling topology into memory."""
+        from nautobot.circuits.models import CircuitTermination
+
+        for content_type in ContentType.objects.filter(CABLE_TERMINATION_MODELS):
+            rows = (
+                content_type.model_class()
+                .objects.filter(cable__isnull=False)
+                .values_list(*self._termination_fields())
+                .iterator()
+            )
+            self._add_terminations(content_type.pk, rows)
+        self._add_front_ports(FrontPort.objects.values_list("pk", "rear_port_id", "rear_port_position").iterator())
+        self.rear_ports.update(RearPort.objects.values_list("pk", "positions").iterator())
+        self._add_circuit_terminations(
+            CircuitTermination.objects.values_list("pk", "circuit_id", "term_side").iterator()
+        )
+        self.complete = True
+
+    def _load(self, missing):
+        """Bulk-load the data for the given `{kind: {keys}}` that was found to be missing while tracing."""
+        from nautobot.circuits.models import CircuitTermination
+
+        by_type = defaultdict(list)
+        for ct_id, pk in missing.get("terminations", ()):
+            self.terminations[(ct_id, pk)] = None
+            by_type[ct_id].append(pk)
+        for ct_id, pks in by_type.items():
+            model = ContentType.objects.get_for_id(ct_id).model_class()
+            for chunk in self._chunks(pks):
+                self._add_terminations(
+                    ct_id, model.objects.filter(pk__in=chunk).values_list(*self._termination_fields())
+                )
+
+        rear_port_ids = set(missing.get("rear_ports", ())) | set(missing.get("rear_port_front_ports", ()))
+        for chunk in self._chunks(missing.get("front_ports", ())):
+            rows = list(FrontPort.objects.filter(pk__in=chunk).values_list("pk", "rear_port_id", "rear_port_position"))
+            self._add_front_ports(rows)
+            rear_port_ids.update(rear_port_id for _, rear_port_id, _ in rows)
+        for chunk in self._chunks(rear_port_ids):
+            self.rear_ports.update(RearPort.objects.filter(pk__in=chunk).values_list("pk", "positions"))
+            self._add_front_ports(
+                FrontPort.objects.filter(rear_port__in=chunk).values_list("pk", "rear_port_id", "rear_port_position")
+            )
+            for rear_port_id in chunk:
+                self.rear_port_front_ports.setdefault(rear_port_id, {})
+
+        for chunk in self._chunks(missing.get("circuit_peers", ())):
+            for pk in chunk:
+                self.circuit_peers[pk] = None
+            self._add_circuit_terminations(
+                CircuitTermination.objects.filter(circuit__circuit_terminations__in=chunk).values_list(
+                    "pk", "circuit_id", "term_side"
+                )
+            )
+
+    def _get(self, kind, key, default=None):
+        try:
+            return getattr(self, kind)[key]
+        except KeyError:
+            if self.complete:
+                return default
+            raise _NotLoaded(kind, key)
+
+    #
+    # Tracing
+    #
+
+    def _trace(self, origin):
+        """Trace the path from the `origin` node, mirroring `CablePath.from_origin()`."""
+        termination = self._get("terminations", origin)
+        if termination is None:
+            return None
+
+        destination = None
+        path = []
+        position_stack = []
+        is_active = True
+        is_split = False
+
+        node = origin
+        visited_nodes = set()
+        while termination is not None:
+            if node[1] in visited_nodes:
+                raise ValidationError("a loop is detected in the path")
+            visited_nodes.add(node[1])
+            cable_id, is_connected, peer = termination
+            if not is_connected:
+                is_active = False
+
+            # Follow the cable to its far-end termination
+            path.append(compile_path_node(self.cable_type, cable_id))
+
+            # Follow a FrontPort to its corresponding RearPort
+            if peer is not None and peer[0] == self.front_port_type:
+                path.append(compile_path_node(*peer))
+                rear_port_id, rear_port_position = self._get("front_ports", peer[1])
+                node = (self.rear_port_type, rear_port_id)
+                if self._get("rear_ports", rear_port_id) > 1:
+                    position_stack.append(rear_port_position)
+                path.append(compile_path_node(*node))
+
+            # Follow a RearPort to its corresponding FrontPort (if any)
+            elif peer is not None and peer[0] == self.rear_port_type:
+                path.append(compile_path_node(*peer))
+
+                # Determine the peer FrontPort's position
+                if self._get("rear_ports", peer[1]) == 1:
+                    position = 1
+                elif position_stack:
+                    position = position_stack.pop()
+                else:
+                    # No position indicated: path has split, so we stop at the RearPort
+                    is_split = True
+                    break
+
+                front_port_id = self._get("rear_port_front_ports", peer[1], _NO_FRONT_PORTS).get(position)
+                if front_port_id is None:
+                    # No corresponding FrontPort found for the RearPort
+                    break
+                node = (self.front_port_type, front_port_id)
+                path.append(compile_path_node(*node))
+
+            # Follow a Circuit Termination if there is a corresponding Circuit Termination
+            # Side A and Side Z exist
+            elif peer is not None and peer[0] == self.circuit_termination_type:
+                peer_termination_id = self._get("circuit_peers", peer[1])
+                # A Circuit Termination does not require a peer.
+                if peer_termination_id is None:
+                    destination = peer
+                    break
+                node = (self.circuit_termination_type, peer_termination_id)
+                path.append(compile_path_node(*peer))
+                path.append(compile_path_node(*node))
+
+            # Anything else marks the end of the path
+            else:
+                destination = peer
+                break
+
+            termination = self._get("terminations", node)
+
+        if destination is None:
+            is_active = False
+
+        return TraceResult(path=path, destination=destination, is_active=is_active, is_split=is_split)
+
+    def trace(self, origins):
+        """
+        Trace the paths originating from each of the given `origins`.
+
+        Args:
+            origins (iterable): Path origins, as model instances or `(content type ID, object ID)` nodes.
+
+        Returns:
+            (dict): `{origin node: TraceResult}`, with a value of None for origins that have no cable attached.
+
+        Raises:
+            ValidationError: if a loop is detected in any path.
+        """
+        pending = {self.to_node(origin) for origin in origins}
+        results = {}
+        while pending:
+            missing = defaultdict(set)
+            for origin in pending:
+                try:
+                    results[origin] = self._trace(origin)
+                except _NotLoaded as e:
+                    missing[e.kind].add(e.key)
+            pending.difference_update(results)
+            self._load(missing)
+        return results
+
+    def save(self, origins, batch_size=1000):
+        """
+        Trace the paths originating from each of the given `origins` and write them to the database in bulk.
+
+        Existing CablePaths for these origins are updated in place, or deleted if the origin no longer has a cable.
+
+        Args:
+            origins (iterable): Path origins, as model instances or `(content type ID, object ID)` nodes.
+            batch_size (int, optional): Maximum number of CablePaths to create or update in a single query.
+
+        Returns:
+            (int): The number of CablePaths created or updated.
+        """
+        results = self.trace(origins)
+        origin_ids = defaultdict(list)
+        for ct_id, pk in results:
+            origin_ids[ct_id].append(pk)
+
+        existing = {}
+        for ct_id, pks in origin_ids.items():
+            for chunk in self._chunks(pks):
+                for cable_path in CablePath.objects.filter(origin_type_id=ct_id, origin_id__in=chunk):
+                    existing[(ct_id, cable_path.origin_id)] = cable_path
+
+        fields = ["path", "destination_type_id", "destination_id", "is_active", "is_split"]
+        to_create = []
+        to_update = []
+        to_delete = []
+        for origin, result in results.items():
+            cable_path = existing.get(origin)
+            if result is None:
+                if cable_path is not None:
+                    to_delete.append(cable_path.pk)
+                continue
+            destination_type_id, destination_id = result.destination or (None, None)
+            values = [result.path, destination_type_id, destination_id, result.is_active, result.is_split]
+            if cable_path is None:
+                cable_path = CablePath(origin_type_id=origin[0], origin_id=origin[1])
+                to_create.append(cable_path)
+            elif [getattr(cable_path, field) for field in fields] != values:
+                to_update.append(cable_path)
+            for field, value in zip(fields, values):
+                setattr(cable_path, field, value)
+
+        with transaction.atomic():
+            for chunk in self._chunks(to_delete):
+                CablePath.objects.filter(pk__in=chunk).delete()
+            CablePath.objects.bulk_create(to_create, batch_size=batch_size)
+            CablePath.objects.bulk_update(
+                to_update, ["path", "destination_type", "destination_id", "is_active", "is_split"], batch_size
+            )
+
+            # Record a direct reference to each CablePath on its originating object
+            for ct_id, pks in origin_ids.items():
+                model = ContentType.objects.get_for_id(ct_id).model_class()
+                cable_path = CablePath.objects.filter(origin_type_id=ct_id, origin_id=OuterRef("pk")).values("pk")
+                for chunk in self._chunks(pks):
+                    model.objects.filter(pk__in=chunk).update(_path=Subquery(cable_path[:1]))
+
+        return len(to_create) + len(to_update)
+
+
+def retrace_paths(origins=(), through=()):
+    """
+    Trace and save the CablePaths from the given `origins`, and re-trace all existing CablePaths that pass `through`
+    any of the given objects, using a single on-demand `CablePathTracer`.
+    """
+    origins = list(origins)
+    query = Q()
+    for obj in through:
+        query |= Q(path__contains=obj)
+    if query:
+        origins.extend(CablePath.objects.filter(query).values_list("origin_type_id", "origin_id"))
+    if origins:
+        CablePathTracer().save(origins)
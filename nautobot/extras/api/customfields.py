@@ -1,4 +1,3 @@
-from django.contrib.contenttypes.models import ContentType
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
 from rest_framework.fields import Field
@@ -21,8 +20,7 @@ class CustomFieldDefaultValues:
         self.model = serializer_field.parent.Meta.model
 
         # Retrieve the CustomFields for the parent model
-        content_type = ContentType.objects.get_for_model(self.model)
-        fields = CustomField.objects.filter(content_types=content_type)
+        fields = CustomField.objects.get_snapshot_for_model(self.model)
 
         # Populate the default value for each CustomField
         value = {}
@@ -44,10 +42,9 @@ class CustomFieldsDataField(Field):
         Cache CustomField keys assigned to this model to avoid redundant database queries
         """
         if not hasattr(self, "_custom_field_keys"):
-            content_type = ContentType.objects.get_for_model(self.parent.Meta.model)
-            self._custom_field_keys = CustomField.objects.filter(content_types=content_type).values_list(
-                "key", flat=True
-            )
+            self._custom_field_keys = [
+                cf.key for cf in CustomField.objects.get_snapshot_for_model(self.parent.Meta.model)
+            ]
         return self._custom_field_keys
 
     def to_representation(self, obj):
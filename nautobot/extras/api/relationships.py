@@ -1,7 +1,6 @@
 import logging
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q
 from drf_spectacular.utils import extend_schema_field
 from rest_framework.fields import JSONField
 from rest_framework.reverse import reverse
@@ -193,7 +192,12 @@ class RelationshipsDataField(WritableSerializerMixin, JSONField):
         # Set up the skeleton of the output data for all relevant relationships
         output_data = {}
         ct = ContentType.objects.get_for_model(self.parent.Meta.model)
-        relationships = Relationship.objects.filter(Q(source_type=ct) | Q(destination_type=ct))
+        source_relationships, destination_relationships = Relationship.objects.get_snapshot_for_model(
+            self.parent.Meta.model
+        )
+        relationships = sorted(
+            {*source_relationships, *destination_relationships}, key=lambda relationship: relationship.label
+        )
         for relationship in relationships:
             output_data[relationship] = {}
             if relationship.source_type == ct and not relationship.symmetric:
@@ -148,6 +148,12 @@ class ConfigContextSerializer(ValidatedModelSerializer, TaggedModelSerializerMix
         return return_nested_serializer_data_based_on_depth(self, depth, obj, obj.owner, "owner")
 
 
+class RenderedConfigContextSerializer(serializers.Serializer):
+    id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    config_context = serializers.DictField(read_only=True)
+
+
 #
 # Config context Schemas
 #
@@ -30,8 +30,10 @@ from nautobot.core.api.views import (
 from nautobot.core.exceptions import CeleryWorkerNotRunningException
 from nautobot.core.graphql import execute_saved_query
 from nautobot.core.models.querysets import count_related
+from nautobot.core.utils.config import get_settings_or_config
 from nautobot.extras import filters
 from nautobot.extras.choices import JobExecutionType
+from nautobot.extras.config_contexts import ConfigContextRenderer, get_cached_config_contexts
 from nautobot.extras.filters import RoleFilterSet
 from nautobot.extras.jobs import get_job
 from nautobot.extras.models import (
@@ -159,16 +161,52 @@ class ConfigContextQuerySetMixin:
         """
         Build the proper queryset based on the request context
 
-        If the `include` query param includes `config_context`, return the queryset annotated with config context.
+        If the `include` query param includes `config_context`, return the queryset annotated with config context,
+        unless rendered config contexts are cached, in which case they're looked up for each page of objects instead.
 
         Else, return the base queryset.
         """
         queryset = super().get_queryset()
-        request = self.get_serializer_context()["request"]
-        if request is not None and "config_context" in request.query_params.get("include", []):
+        if self._include_config_context() and get_settings_or_config("CONFIG_CONTEXT_CACHE_TIMEOUT") == 0:
             return queryset.annotate_config_context_data()
         return queryset
 
+    def _include_config_context(self):
+        request = self.get_serializer_context()["request"]
+        return request is not None and "config_context" in request.query_params.get("include", [])
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if (
+            page is not None
+            and self._include_config_context()
+            and get_settings_or_config("CONFIG_CONTEXT_CACHE_TIMEOUT") != 0
+        ):
+            # Look up the cached config contexts of the whole page at once, rather than separately for each object
+            rendered = get_cached_config_contexts(page)
+            for obj in page:
+                obj._cached_config_context = rendered[obj.pk]  # pylint: disable=protected-access
+        return page
+
+    @extend_schema(responses={200: serializers.RenderedConfigContextSerializer(many=True)})
+    @action(detail=False, url_path="config-contexts", methods=["get"])
+    def config_contexts(self, request):
+        """
+        Return the rendered config context of each object matching the given filters.
+
+        The config contexts are computed in bulk for each page of objects, rather than separately for each object.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        renderer = ConfigContextRenderer(queryset.model)
+        queryset = renderer.select_related(queryset)
+        page = self.paginate_queryset(queryset)
+        objects = page if page is not None else list(queryset)
+        rendered = renderer.render_many(objects)
+        data = [{"id": obj.pk, "name": obj.name, "config_context": rendered[obj.pk]} for obj in objects]
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
 
 class ConfigContextViewSet(NotesViewSetMixin, ModelViewSet):
     queryset = ConfigContext.objects.prefetch_related(
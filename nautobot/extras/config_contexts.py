@@ -0,0 +1,395 @@
+"""Bulk rendering and caching of config contexts for Devices and VirtualMachines."""
+
+from collections import defaultdict
+import hashlib
+import time
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+from prometheus_client import Counter
+
+from nautobot.core.utils.config import get_settings_or_config
+from nautobot.core.utils.data import deepmerge
+from nautobot.extras.models import ConfigContext, DynamicGroup, DynamicGroupCachedMember, TaggedItem
+
+
+class ConfigContextRenderer:
+    """
+    Compute the rendered config contexts of many Devices or VirtualMachines at once.
+
+    `ConfigContextModel.get_config_context()` queries for and merges the applicable config contexts of each object
+    separately. Instead, this loads all active `ConfigContext` objects once, indexed by each of the dimensions that they
+    can be assigned by, and then matches each object against them in memory. The data of each distinct combination of
+    matching config contexts is only merged once, so the data returned for different objects may be shared, and must
+    not be modified in place.
+
+    Example:
+        >>> renderer = ConfigContextRenderer(Device)
+        >>> for device, config_context in renderer.iterator(Device.objects.filter(location=location)):
+        ...     print(device.name, config_context)
+    """
+
+    DIMENSIONS = (
+        "locations",
+        "roles",
+        "device_types",
+        "device_redundancy_groups",
+        "platforms",
+        "cluster_groups",
+        "clusters",
+        "tenant_groups",
+        "tenants",
+        "tags",
+        "dynamic_groups",
+    )
+
+    def __init__(self, model, queryset=None):
+        """
+        Load the active config contexts in `queryset` (by default, all of them) for rendering instances of `model`.
+        """
+        from nautobot.dcim.models import Location
+        from nautobot.tenancy.models import TenantGroup
+
+        self.model = model
+        self.content_type = ContentType.objects.get_for_model(model)
+        if queryset is None:
+            queryset = ConfigContext.objects.all()
+        queryset = queryset.filter(is_active=True).order_by("weight", "name")
+        self.contexts = {pk: data for pk, data in queryset.values_list("pk", "data")}
+        self.context_order = list(self.contexts)
+
+        dimensions = list(self.DIMENSIONS)
+        if not settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+            dimensions.remove("dynamic_groups")
+
+        # For each dimension, the set of values each config context is assigned to. Config contexts that aren't
+        # assigned to any value of a dimension apply regardless of that dimension, so aren't included in its mapping.
+        self.assignments = {}
+        for dimension in dimensions:
+            field = ConfigContext._meta.get_field(dimension)
+            source = f"{field.m2m_field_name()}_id"
+            target = f"{field.m2m_reverse_field_name()}_id"
+            assignments = defaultdict(set)
+            through_objects = field.remote_field.through.objects.filter(**{f"{source}__in": self.contexts})
+            for context_pk, value in through_objects.values_list(source, target).iterator():
+                assignments[context_pk].add(value)
+            if assignments:
+                self.assignments[dimension] = assignments
+
+        # Tree models are matched by their ancestors too, so load the whole trees up front
+        self.location_parents = {}
+        if "locations" in self.assignments:
+            self.location_parents = dict(Location.objects.values_list("pk", "parent_id"))
+        self.tenant_group_parents = {}
+        if "tenant_groups" in self.assignments:
+            self.tenant_group_parents = dict(TenantGroup.objects.values_list("pk", "parent_id"))
+
+        self.dynamic_groups = []
+        if "dynamic_groups" in self.assignments:
+            dynamic_group_pks = set().union(*self.assignments["dynamic_groups"].values())
+            self.dynamic_groups = list(
+                DynamicGroup.objects.filter(pk__in=dynamic_group_pks, content_type=self.content_type).select_related(
+                    "content_type"
+                )
+            )
+
+        # Merged data, by the tuple of config contexts that were merged to produce it
+        self._merged = {}
+
+    @staticmethod
+    def _with_ancestors(pk, parents):
+        values = set()
+        while pk is not None and pk not in values:
+            values.add(pk)
+            pk = parents.get(pk)
+        return values
+
+    def _get_dynamic_group_members(self, pks):
+        """Return a mapping of the given object PKs to the PKs of the relevant dynamic groups they belong to."""
+        members = defaultdict(set)
+        if not self.dynamic_groups:
+            return members
+
+        if get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT") != 0:
+            DynamicGroup.objects._refresh_stale_cached_members(self.dynamic_groups)
+            cached_members = DynamicGroupCachedMember.objects.filter(
+                dynamic_group__in=self.dynamic_groups, associated_object_id__in=pks
+            )
+            for dynamic_group_pk, pk in cached_members.values_list("dynamic_group_id", "associated_object_id"):
+                members[pk].add(dynamic_group_pk)
+        else:
+            for dynamic_group in self.dynamic_groups:
+                for pk in dynamic_group.members.filter(pk__in=pks).values_list("pk", flat=True):
+                    members[pk].add(dynamic_group.pk)
+        return members
+
+    def _get_dimension_values(self, obj, tags, dynamic_groups):
+        """Return a mapping of each dimension to the set of values that the given object has for it."""
+        location = getattr(obj, "location", None)
+        cluster = getattr(obj, "cluster", None)
+        tenant = obj.tenant
+        return {
+            "locations": self._with_ancestors(location.pk if location else None, self.location_parents),
+            "roles": {obj.role_id},
+            "device_types": {getattr(obj, "device_type_id", None)},
+            "device_redundancy_groups": {getattr(obj, "device_redundancy_group_id", None)},
+            "platforms": {obj.platform_id},
+            "cluster_groups": {cluster.cluster_group_id if cluster else None},
+            "clusters": {cluster.pk if cluster else None},
+            "tenant_groups": self._with_ancestors(
+                tenant.tenant_group_id if tenant else None, self.tenant_group_parents
+            ),
+            "tenants": {obj.tenant_id},
+            "tags": tags,
+            "dynamic_groups": dynamic_groups,
+        }
+
+    def select_related(self, queryset):
+        """Return the given queryset with the related objects needed to render each object's config context."""
+        if any(field.name == "location" for field in self.model._meta.concrete_fields):
+            return queryset.select_related("location", "cluster", "tenant")
+        # VirtualMachine.location is derived from its cluster
+        return queryset.select_related("cluster__location", "tenant")
+
+    def render_many(self, objects):
+        """
+        Return a mapping of the PK of each of the given objects to its rendered config context.
+
+        The objects should have their location, cluster and tenant already loaded, for example from a queryset
+        returned by `select_related()`, to avoid several queries per object.
+        """
+        objects = list(objects)
+        pks = [obj.pk for obj in objects]
+
+        tags = defaultdict(set)
+        if "tags" in self.assignments:
+            tagged_items = TaggedItem.objects.filter(content_type=self.content_type, object_id__in=pks)
+            for object_id, tag_id in tagged_items.values_list("object_id", "tag_id"):
+                tags[object_id].add(tag_id)
+        dynamic_groups = self._get_dynamic_group_members(pks)
+
+        rendered = {}
+        for obj in objects:
+            values = self._get_dimension_values(obj, tags[obj.pk], dynamic_groups[obj.pk])
+            matches = tuple(
+                pk
+                for pk in self.context_order
+                if all(
+                    assignments[pk] & values[dimension]
+                    for dimension, assignments in self.assignments.items()
+                    if pk in assignments
+                )
+            )
+            if matches not in self._merged:
+                data = {}
+                for pk in matches:
+                    data = deepmerge(data, self.contexts[pk])
+                self._merged[matches] = data
+            data = self._merged[matches]
+
+            # If the object has local config context data defined, merge it last
+            if obj.local_config_context_data:
+                data = deepmerge(data, obj.local_config_context_data)
+            rendered[obj.pk] = data
+        return rendered
+
+    def iterator(self, queryset, chunk_size=1000):
+        """
+        Yield `(object, rendered config context)` for each object in the given queryset, loading `chunk_size` objects
+        at a time.
+        """
+        queryset = self.select_related(queryset)
+        chunk = []
+        for obj in queryset.iterator(chunk_size=chunk_size):
+            chunk.append(obj)
+            if len(chunk) >= chunk_size:
+                rendered = self.render_many(chunk)
+                for chunk_obj in chunk:
+                    yield chunk_obj, rendered[chunk_obj.pk]
+                chunk = []
+        if chunk:
+            rendered = self.render_many(chunk)
+            for chunk_obj in chunk:
+                yield chunk_obj, rendered[chunk_obj.pk]
+
+
+#
+# Caching of rendered config contexts
+#
+
+CONFIG_CONTEXT_CACHE_METRIC = Counter(
+    "nautobot_config_context_cache_requests", "Lookups of rendered config contexts in the cache.", ["result"]
+)
+
+GENERATION_CACHE_KEY_PREFIX = "nautobot.extras.configcontext.generation"
+RENDERED_CACHE_KEY_PREFIX = "nautobot.extras.configcontext.rendered"
+
+# The name used in generation cache keys for the values of each config context assignment dimension
+DIMENSION_GENERATION_NAMES = {
+    "locations": "location",
+    "roles": "role",
+    "device_types": "devicetype",
+    "device_redundancy_groups": "deviceredundancygroup",
+    "platforms": "platform",
+    "cluster_groups": "clustergroup",
+    "clusters": "cluster",
+    "tenant_groups": "tenantgroup",
+    "tenants": "tenant",
+    "tags": "tag",
+}
+
+
+def get_generation_key(name, pk=None):
+    """
+    Return the cache key of the generation of the given dimension value, or of all config contexts if `pk` is None.
+    """
+    if pk is None:
+        return f"{GENERATION_CACHE_KEY_PREFIX}.{name}"
+    return f"{GENERATION_CACHE_KEY_PREFIX}.{name}.{pk}"
+
+
+def bump_generations(keys):
+    """
+    Invalidate all cached config contexts whose version includes any of the given generation cache keys.
+
+    Generations are set to the current time rather than incremented, so that a generation that is evicted from the
+    cache and later recreated can never repeat a value that an existing cached config context was rendered with.
+    """
+    if keys:
+        now = time.time_ns()
+        cache.set_many({key: now for key in keys}, timeout=None)
+
+
+def _get_generations(keys):
+    generations = cache.get_many(keys)
+    for key in set(keys) - set(generations):
+        cache.add(key, time.time_ns(), timeout=None)
+        generations[key] = cache.get(key)
+    return generations
+
+
+def _with_descendants(pks, model):
+    children = defaultdict(list)
+    for pk, parent_id in model.objects.values_list("pk", "parent_id"):
+        children[parent_id].append(pk)
+    descendants = set()
+    pending = list(pks)
+    while pending:
+        pk = pending.pop()
+        if pk not in descendants:
+            descendants.add(pk)
+            pending.extend(children[pk])
+    return descendants
+
+
+def get_config_context_generation_keys(config_contexts):
+    """
+    Return the generation cache keys that must be bumped to invalidate the cached config contexts of every object that
+    any of the given config contexts could apply to.
+
+    A config context only applies to objects that match at least one of its assigned values in every dimension it is
+    assigned by, so it is sufficient to invalidate the objects matching any one of those dimensions. Config contexts
+    that aren't assigned by any dimension, or only by dynamic groups, may apply to any object.
+    """
+    from nautobot.dcim.models import Location
+    from nautobot.tenancy.models import TenantGroup
+
+    keys = set()
+    values = defaultdict(set)
+    for config_context in config_contexts:
+        for dimension, name in DIMENSION_GENERATION_NAMES.items():
+            pks = set(getattr(config_context, dimension).values_list("pk", flat=True))
+            if pks:
+                values[name] |= pks
+                break
+        else:
+            keys.add(get_generation_key("all"))
+
+    # Objects are versioned by the generations of their own location and tenant group, not of their ancestors
+    if values["location"]:
+        values["location"] = _with_descendants(values["location"], Location)
+    if values["tenantgroup"]:
+        values["tenantgroup"] = _with_descendants(values["tenantgroup"], TenantGroup)
+    for name, pks in values.items():
+        keys.update(get_generation_key(name, pk) for pk in pks)
+    return keys
+
+
+def invalidate_config_contexts_on_commit(keys):
+    """
+    Bump the given generations once the current transaction commits.
+
+    Bumping any earlier could let a concurrent request render and cache a config context from the old data under the
+    new generations.
+    """
+    if keys:
+        transaction.on_commit(lambda: bump_generations(keys))
+
+
+def _get_cache_version(obj, tags):
+    """Return the generation cache keys that version the cached config context of the given object."""
+    cluster = getattr(obj, "cluster", None)
+    tenant = obj.tenant
+    values = {
+        "location": [obj.location_id],
+        "role": [obj.role_id],
+        "devicetype": [getattr(obj, "device_type_id", None)],
+        "deviceredundancygroup": [getattr(obj, "device_redundancy_group_id", None)],
+        "platform": [obj.platform_id],
+        "clustergroup": [cluster.cluster_group_id if cluster else None],
+        "cluster": [cluster.pk if cluster else None],
+        "tenantgroup": [tenant.tenant_group_id if tenant else None],
+        "tenant": [obj.tenant_id],
+        "tag": sorted(tags),
+    }
+    keys = [get_generation_key("all")]
+    for name, pks in values.items():
+        keys.extend(get_generation_key(name, pk) for pk in pks if pk is not None)
+    return keys
+
+
+def get_cached_config_contexts(objects):
+    """
+    Return a mapping of the PK of each of the given objects to its rendered config context, using the cache.
+
+    Each object's cached config context is keyed by its `last_updated` time and the current generations of each of the
+    values (location, tenant, tags, etc.) by which config contexts may be assigned to it, so it is invalidated by any
+    change to the object itself or to any config context that could apply to it. Any changes to dynamic group
+    membership that don't involve saving the object itself are only reflected once the cached config context expires.
+    """
+    objects = list(objects)
+    if not objects:
+        return {}
+    model = type(objects[0])
+    content_type = ContentType.objects.get_for_model(model)
+    tags = defaultdict(set)
+    for object_id, tag_id in TaggedItem.objects.filter(
+        content_type=content_type, object_id__in=[obj.pk for obj in objects]
+    ).values_list("object_id", "tag_id"):
+        tags[object_id].add(tag_id)
+
+    versions = {obj.pk: _get_cache_version(obj, tags[obj.pk]) for obj in objects}
+    generations = _get_generations(list(set().union(*versions.values())))
+    cache_keys = {}
+    for obj in objects:
+        version = repr((obj.last_updated, [(key, generations[key]) for key in versions[obj.pk]]))
+        digest = hashlib.sha256(version.encode()).hexdigest()
+        cache_keys[obj.pk] = f"{RENDERED_CACHE_KEY_PREFIX}.{content_type.model}.{obj.pk}.{digest}"
+
+    cached = cache.get_many(list(cache_keys.values()))
+    rendered = {pk: cached[key] for pk, key in cache_keys.items() if key in cached}
+    misses = [obj for obj in objects if obj.pk not in rendered]
+    CONFIG_CONTEXT_CACHE_METRIC.labels(result="hit").inc(len(rendered))
+    CONFIG_CONTEXT_CACHE_METRIC.labels(result="miss").inc(len(misses))
+    if len(misses) == 1:
+        rendered[misses[0].pk] = misses[0].get_config_context(use_cache=False)
+    elif misses:
+        rendered.update(ConfigContextRenderer(model).render_many(misses))
+    if misses:
+        cache.set_many(
+            {cache_keys[obj.pk]: rendered[obj.pk] for obj in misses},
+            timeout=get_settings_or_config("CONFIG_CONTEXT_CACHE_TIMEOUT"),
+        )
+    return rendered
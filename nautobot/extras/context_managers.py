@@ -1,6 +1,7 @@
 from contextlib import contextmanager
 import uuid
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from django.db import transaction
@@ -9,8 +10,9 @@ from django.test.client import RequestFactory
 from nautobot.extras.choices import ObjectChangeEventContextChoices
 from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
 from nautobot.extras.models import ObjectChange
+from nautobot.extras.search import get_search_backend
 from nautobot.extras.signals import change_context_state, get_user_if_authenticated
-from nautobot.extras.webhooks import enqueue_webhooks
+from nautobot.extras.webhooks import batch_webhooks, enqueue_webhooks
 
 
 class ChangeContext:
@@ -25,6 +27,10 @@ class ChangeContext:
     :param context: Context of the transaction, must match a choice in nautobot.extras.choices.ObjectChangeEventContextChoices
     :param context_detail: Optional extra details about the transaction (ex: the plugin name that initiated the change)
     :param change_id: Optional uuid object to uniquely identify the transaction. One will be generated if not supplied
+
+    If `settings.CHANGELOG_DEFERRED` is True, object changes are not recorded as each object is saved or deleted;
+    instead they are buffered and created in bulk when the change context exits and the surrounding transaction (if
+    any) commits. Created and updated objects are serialized only at that point, reflecting their final state.
     """
 
     defer_object_changes = False  # advanced usage, for creating object changes in bulk
@@ -32,6 +38,7 @@ class ChangeContext:
     def __init__(self, user=None, request=None, context=None, context_detail="", change_id=None):
         self.request = request
         self.user = user
+        self.defer_object_changes = settings.CHANGELOG_DEFERRED
         self.reset_deferred_object_changes()
 
         if self.request is None and self.user is None:
@@ -89,9 +96,10 @@ class ChangeContext:
             create_object_changes = []
             for key in self._object_change_batch(batch_size):
                 for entry in self.deferred_object_changes[key]:
-                    objectchange = entry["instance"].to_objectchange(entry["action"])
+                    # Deleted objects are serialized before they are deleted; all others are serialized now
+                    objectchange = entry.get("objectchange") or entry["instance"].to_objectchange(entry["action"])
                     objectchange.user = entry["user"]
-                    objectchange.user_name = objectchange.user.username
+                    objectchange.user_name = objectchange.user.username if objectchange.user else "Undefined"
                     objectchange.request_id = self.change_id
                     objectchange.change_context = self.context
                     objectchange.change_context_detail = self.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
@@ -145,6 +153,10 @@ def change_logging(change_context):
         # changes during test cleanup.
         change_context_state.reset(prev_state)
 
+        # Create any deferred object changes once the changes they describe have been committed
+        if change_context.defer_object_changes:
+            transaction.on_commit(change_context.flush_deferred_object_changes)
+
 
 @contextmanager
 def web_request_context(
@@ -198,9 +210,23 @@ def web_request_context(
             yield request
     finally:
         # enqueue jobhooks and webhooks, use change_context.change_id in case change_id was not supplied
-        for object_change in ObjectChange.objects.filter(request_id=change_context.change_id).iterator():
-            enqueue_job_hooks(object_change)
-            enqueue_webhooks(object_change)
+        def enqueue_hooks():
+            search_backend = get_search_backend()
+            changed_objects = set()
+            with batch_webhooks():
+                for object_change in ObjectChange.objects.filter(request_id=change_context.change_id).iterator():
+                    enqueue_job_hooks(object_change)
+                    enqueue_webhooks(object_change)
+                    if search_backend.indexed:
+                        changed_objects.add((object_change.changed_object_type_id, object_change.changed_object_id))
+            if changed_objects:
+                search_backend.update_index(changed_objects)
+
+        if change_context.defer_object_changes:
+            # Wait until the deferred object changes have been created
+            transaction.on_commit(enqueue_hooks)
+        else:
+            enqueue_hooks()
 
 
 @contextmanager
@@ -214,6 +240,12 @@ def deferred_change_logging_for_bulk_operation():
     if change_context is None:
         raise ValueError("Change logging must be enabled before using deferred_change_logging_for_bulk_operation")
 
+    if change_context.defer_object_changes:
+        # All object changes are already being deferred until the change context exits
+        with transaction.atomic():
+            yield
+        return
+
     with transaction.atomic():
         try:
             change_context.defer_object_changes = True
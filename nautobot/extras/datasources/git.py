@@ -11,9 +11,11 @@ from urllib.parse import quote
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
 from django.db import transaction
-from git import InvalidGitRepositoryError, Repo
+from django.utils import timezone
+from git import GitCommandError, InvalidGitRepositoryError, Repo
 import yaml
 
 from nautobot.core.utils.git import GitRepo
@@ -21,6 +23,7 @@ from nautobot.core.utils.module_loading import import_modules_privately
 from nautobot.dcim.models import Device, DeviceRedundancyGroup, DeviceType, Location, Platform
 from nautobot.extras.choices import (
     LogLevelChoices,
+    ObjectChangeActionChoices,
     SecretsGroupAccessTypeChoices,
     SecretsGroupSecretTypeChoices,
 )
@@ -36,7 +39,7 @@ from nautobot.extras.models import (
     Tag,
 )
 from nautobot.extras.registry import DatasourceContent, register_datasource_contents, registry
-from nautobot.extras.utils import refresh_job_model_from_job_class
+from nautobot.extras.utils import bulk_create_object_changes, refresh_job_model_from_job_class
 from nautobot.tenancy.models import Tenant, TenantGroup
 from nautobot.virtualization.models import Cluster, ClusterGroup, VirtualMachine
 
@@ -50,6 +53,31 @@ GitJobResult = namedtuple("GitJobResult", ["job_result", "repository_record"])
 # namedtuple takes from_url(remote git repository url), to_path(local path of git repo), from_branch(git branch)
 GitRepoInfo = namedtuple("GitRepoInfo", ["from_url", "to_path", "from_branch"])
 
+# namedtuple takes repo_helper(GitRepo instance), synced_head(commit the content was last synced from),
+# updated(paths of files added or modified since then) and deleted(paths of files deleted since then)
+GitContentChanges = namedtuple("GitContentChanges", ["repo_helper", "synced_head", "updated", "deleted"])
+
+# Subdirectories of `config_contexts/` whose files each define a config context filtered by the named object
+CONFIG_CONTEXT_FILTER_TYPES = (
+    "locations",
+    "device_types",
+    "roles",
+    "platforms",
+    "cluster_groups",
+    "clusters",
+    "tenant_groups",
+    "tenants",
+    "tags",
+    "dynamic_groups",
+    "device_redundancy_groups",
+)
+
+# Subdirectories of `config_contexts/` whose files each define the local config context of the named object
+LOCAL_CONFIG_CONTEXT_MODELS = {
+    "devices": Device,
+    "virtual_machines": VirtualMachine,
+}
+
 
 def enqueue_git_repository_helper(repository, user, job_class, **kwargs):
     """
@@ -208,6 +236,73 @@ def git_repository_dry_run(repository_record, logger):  # pylint: disable=redefi
     logger.info("Repository dry run successful")
 
 
+def get_synced_head(repository_record, content_identifier):
+    """
+    Get the commit that the given content (such as "extras.configcontext") of this repository was last successfully
+    synced from, if it's known.
+    """
+    return cache.get(f"{get_synced_head.cache_key_prefix}.{repository_record.pk}.{content_identifier}")
+
+
+get_synced_head.cache_key_prefix = "nautobot.extras.datasources.git.get_synced_head"
+
+
+def set_synced_head(repository_record, content_identifier, head):
+    """Record (or if `head` is None, forget) the commit that the given content of this repository was synced from."""
+    cache_key = f"{get_synced_head.cache_key_prefix}.{repository_record.pk}.{content_identifier}"
+    if head is None:
+        cache.delete(cache_key)
+    else:
+        cache.set(cache_key, head, timeout=None)
+
+
+def get_changed_paths(repository_record, content_identifier, subdirectory):
+    """
+    Get the changes to the files in the given subdirectory of the repository since its content was last synced.
+
+    Returns None, meaning that all of the files need to be (re)loaded, if the content hasn't been synced before, if the
+    repository is being resynced at the same commit, or if the previously synced commit isn't available locally.
+
+    Returns:
+        (GitContentChanges): The `updated` and `deleted` file paths, relative to the subdirectory.
+    """
+    synced_head = get_synced_head(repository_record, content_identifier)
+    if not synced_head or synced_head == repository_record.current_head:
+        return None
+    if not os.path.isdir(os.path.join(repository_record.filesystem_path, ".git")):
+        return None
+
+    try:
+        repo_helper = GitRepo(repository_record.filesystem_path, None)
+        changed_paths = repo_helper.diff_commits(synced_head, repository_record.current_head, path=subdirectory)
+    except GitCommandError as exc:
+        logger.warning("Unable to diff against previously synced commit %s, reloading all files: %s", synced_head, exc)
+        return None
+
+    prefix = f"{subdirectory}/"
+    return GitContentChanges(
+        repo_helper=repo_helper,
+        synced_head=synced_head,
+        updated={path[len(prefix) :] for path in changed_paths.updated if path.startswith(prefix)},
+        deleted={path[len(prefix) :] for path in changed_paths.deleted if path.startswith(prefix)},
+    )
+
+
+def get_previous_metadata_names(changes, subdirectory, paths):
+    """Get the `_metadata` names of the records defined by the previously synced versions of the given files, if any."""
+    names = set()
+    for path in paths:
+        try:
+            data = yaml.safe_load(changes.repo_helper.read_file(f"{subdirectory}/{path}", changes.synced_head))
+        except (GitCommandError, yaml.YAMLError):
+            # Added since the previous sync, or not valid data then
+            continue
+        for entry in data if isinstance(data, list) else [data]:
+            with suppress(KeyError, TypeError):
+                names.add(entry["_metadata"]["name"])
+    return names
+
+
 #
 # Config context handling
 #
@@ -219,71 +314,96 @@ def refresh_git_config_contexts(repository_record, job_result, delete=False):
         update_git_config_contexts(repository_record, job_result)
     else:
         delete_git_config_contexts(repository_record, job_result)
+        set_synced_head(repository_record, "extras.configcontext", None)
+
+
+def _find_config_context_files(config_context_path):
+    """List the paths, relative to the `config_contexts/` directory, of all files that may define config contexts."""
+    # First, the "flat file" case - data files in the root config_context_path,
+    # whose metadata is expressed purely within the contents of the file
+    paths = [
+        file_name
+        for file_name in os.listdir(config_context_path)
+        if os.path.isfile(os.path.join(config_context_path, file_name))
+    ]
+    # Next, the "filter/name" directory structure case - files in <filter_type>/<name>.(json|yaml),
+    # and finally device- and VM-specific "local" context in (devices|virtual_machines)/<name>.(json|yaml)
+    for dir_name in (*CONFIG_CONTEXT_FILTER_TYPES, *LOCAL_CONFIG_CONTEXT_MODELS):
+        dir_path = os.path.join(config_context_path, dir_name)
+        if os.path.isdir(dir_path):
+            paths += [f"{dir_name}/{file_name}" for file_name in os.listdir(dir_path)]
+    return paths
+
+
+def _config_context_file_order(path):
+    """Sort key to load flat files first, then filter/name files, then local config context files."""
+    dir_name = path.rpartition("/")[0]
+    if not dir_name:
+        return (0, path)
+    if dir_name in CONFIG_CONTEXT_FILTER_TYPES:
+        return (1, path)
+    return (2, path)
 
 
 def update_git_config_contexts(repository_record, job_result):
-    """Refresh any config contexts provided by this Git repository."""
+    """
+    Refresh any config contexts provided by this Git repository.
+
+    If the config contexts were last synced from an earlier commit, only the files that were added, modified or deleted
+    since then are processed; otherwise all files are loaded and any prior contexts not found in them are deleted.
+    """
     config_context_path = os.path.join(repository_record.filesystem_path, "config_contexts")
+    changes = get_changed_paths(repository_record, "extras.configcontext", "config_contexts")
     managed_config_contexts = set()
     managed_local_config_contexts = defaultdict(set)
+    local_config_contexts = defaultdict(dict)
+    failed = False
 
     if os.path.isdir(config_context_path):
-        # First, handle the "flat file" case - data files in the root config_context_path,
-        # whose metadata is expressed purely within the contents of the file:
-        for file_name in os.listdir(config_context_path):
-            if not os.path.isfile(os.path.join(config_context_path, file_name)):
-                continue
-            msg = f"Loading config context from `{file_name}`"
-            logger.info(msg)
-            job_result.log(msg, grouping="config contexts")
-            try:
-                with open(os.path.join(config_context_path, file_name), "r") as fd:
-                    # The data file can be either JSON or YAML; since YAML is a superset of JSON, we load it regardless
-                    context_data = yaml.safe_load(fd)
-
-                # A file can contain one config context dict or a list thereof
-                if isinstance(context_data, dict):
-                    context_name = import_config_context(context_data, repository_record, job_result)
-                    managed_config_contexts.add(context_name)
-                elif isinstance(context_data, list):
-                    for context_data_entry in context_data:
-                        context_name = import_config_context(context_data_entry, repository_record, job_result)
-                        managed_config_contexts.add(context_name)
-                else:
-                    raise RuntimeError("data must be a dict or list of dicts")
-
-            except Exception as exc:
-                msg = f"Error in loading config context data from `{file_name}`: {exc}"
-                logger.error(msg)
-                job_result.log(msg, level_choice=LogLevelChoices.LOG_ERROR, grouping="config contexts")
-
-        # Next, handle the "filter/name" directory structure case - files in <filter_type>/<name>.(json|yaml)
-        for filter_type in (
-            "locations",
-            "device_types",
-            "roles",
-            "platforms",
-            "cluster_groups",
-            "clusters",
-            "tenant_groups",
-            "tenants",
-            "tags",
-            "dynamic_groups",
-            "device_redundancy_groups",
-        ):
-            if os.path.isdir(os.path.join(repository_record.filesystem_path, filter_type)):
+        for dir_name in (*CONFIG_CONTEXT_FILTER_TYPES, *LOCAL_CONFIG_CONTEXT_MODELS):
+            if os.path.isdir(os.path.join(repository_record.filesystem_path, dir_name)):
                 msg = (
-                    f'Found "{filter_type}" directory in the repository root. If this is meant to contain config contexts, '
+                    f'Found "{dir_name}" directory in the repository root. If this is meant to contain config contexts, '
                     "it should be moved into a `config_contexts/` subdirectory."
                 )
                 logger.warning(msg)
                 job_result.log(msg, level_choice=LogLevelChoices.LOG_WARNING, grouping="config contexts")
 
-            dir_path = os.path.join(config_context_path, filter_type)
-            if not os.path.isdir(dir_path):
-                continue
+        if changes is None:
+            paths = _find_config_context_files(config_context_path)
+        else:
+            paths = sorted(changes.updated, key=_config_context_file_order)
+
+        for path in paths:
+            dir_name, _, file_name = path.rpartition("/")
+            if not dir_name:
+                msg = f"Loading config context from `{file_name}`"
+                logger.info(msg)
+                job_result.log(msg, grouping="config contexts")
+                try:
+                    with open(os.path.join(config_context_path, file_name), "r") as fd:
+                        # The data file can be either JSON or YAML; since YAML is a superset of JSON, we load it regardless
+                        context_data = yaml.safe_load(fd)
+
+                    # A file can contain one config context dict or a list thereof
+                    if isinstance(context_data, dict):
+                        context_name = import_config_context(context_data, repository_record, job_result)
+                        managed_config_contexts.add(context_name)
+                    elif isinstance(context_data, list):
+                        for context_data_entry in context_data:
+                            context_name = import_config_context(context_data_entry, repository_record, job_result)
+                            managed_config_contexts.add(context_name)
+                    else:
+                        raise RuntimeError("data must be a dict or list of dicts")
 
-            for file_name in os.listdir(dir_path):
+                except Exception as exc:
+                    failed = True
+                    msg = f"Error in loading config context data from `{file_name}`: {exc}"
+                    logger.error(msg)
+                    job_result.log(msg, level_choice=LogLevelChoices.LOG_ERROR, grouping="config contexts")
+
+            elif dir_name in CONFIG_CONTEXT_FILTER_TYPES:
+                filter_type = dir_name
                 name = os.path.splitext(file_name)[0]
                 msg = (
                     f'Loading config context, filter `{filter_type} = [name: "{name}"]`, '
@@ -292,7 +412,7 @@ def update_git_config_contexts(repository_record, job_result):
                 logger.info(msg)
                 job_result.log(msg, grouping="config contexts")
                 try:
-                    with open(os.path.join(dir_path, file_name), "r") as fd:
+                    with open(os.path.join(config_context_path, filter_type, file_name), "r") as fd:
                         # Data file can be either JSON or YAML; since YAML is a superset of JSON, we load it regardless
                         context_data = yaml.safe_load(fd)
 
@@ -307,52 +427,69 @@ def update_git_config_contexts(repository_record, job_result):
                     context_name = import_config_context(context_data, repository_record, job_result)
                     managed_config_contexts.add(context_name)
                 except Exception as exc:
+                    failed = True
                     msg = f"Error in loading config context data from `{file_name}`: {exc}"
                     logger.error(msg)
                     job_result.log(msg, level_choice=LogLevelChoices.LOG_ERROR, grouping="config contexts")
 
-        # Finally, handle device- and VM-specific "local" context in (devices|virtual_machines)/<name>.(json|yaml)
-        for local_type in ("devices", "virtual_machines"):
-            if os.path.isdir(os.path.join(repository_record.filesystem_path, local_type)):
-                msg = (
-                    f'Found "{local_type}" directory in the repository root. If this is meant to contain '
-                    "config contexts, it should be moved into a `config_contexts/` subdirectory."
-                )
-                logger.warning(msg)
-                job_result.log(msg, level_choice=LogLevelChoices.LOG_WARNING, grouping="config contexts")
-
-            dir_path = os.path.join(config_context_path, local_type)
-            if not os.path.isdir(dir_path):
-                continue
-
-            for file_name in os.listdir(dir_path):
+            elif dir_name in LOCAL_CONFIG_CONTEXT_MODELS:
+                local_type = dir_name
                 device_name = os.path.splitext(file_name)[0]
                 msg = f"Loading local config context for `{device_name}` from `{local_type}/{file_name}`"
                 logger.info(msg)
                 job_result.log(msg, grouping="local config contexts")
                 try:
-                    with open(os.path.join(dir_path, file_name), "r") as fd:
+                    with open(os.path.join(config_context_path, local_type, file_name), "r") as fd:
                         context_data = yaml.safe_load(fd)
-
-                    import_local_config_context(
-                        local_type,
-                        device_name,
-                        context_data,
-                        repository_record,
-                    )
-                    managed_local_config_contexts[local_type].add(device_name)
                 except Exception as exc:
+                    failed = True
                     msg = f"Error in loading local config context from `{local_type}/{file_name}`: {exc}"
                     logger.error(msg)
                     job_result.log(msg, level_choice=LogLevelChoices.LOG_ERROR, grouping="local config contexts")
+                    continue
+                # Local config contexts are applied in bulk below, rather than looking up each record in turn
+                local_config_contexts[local_type][device_name] = (file_name, context_data)
 
-    # Delete any prior contexts that are owned by this repository but were not created/updated above
-    delete_git_config_contexts(
-        repository_record,
-        job_result,
-        preserve=managed_config_contexts,
-        preserve_local=managed_local_config_contexts,
-    )
+        for local_type, contexts in local_config_contexts.items():
+            managed_local_config_contexts[local_type] = import_local_config_contexts(
+                local_type, contexts, repository_record, job_result
+            )
+            if len(managed_local_config_contexts[local_type]) < len(contexts):
+                failed = True
+
+    if changes is None:
+        # Delete any prior contexts that are owned by this repository but were not created/updated above
+        delete_git_config_contexts(
+            repository_record,
+            job_result,
+            preserve=managed_config_contexts,
+            preserve_local=managed_local_config_contexts,
+        )
+    else:
+        # Delete any prior contexts that were defined by the previous versions of the changed files,
+        # or by the deleted files, but were not created/updated above
+        changed_paths = changes.updated | changes.deleted
+        local_names = defaultdict(set)
+        for path in changed_paths:
+            dir_name, _, file_name = path.rpartition("/")
+            if dir_name in LOCAL_CONFIG_CONTEXT_MODELS:
+                local_names[dir_name].add(os.path.splitext(file_name)[0])
+        names = get_previous_metadata_names(
+            changes,
+            "config_contexts",
+            [path for path in changed_paths if path.rpartition("/")[0] in ("", *CONFIG_CONTEXT_FILTER_TYPES)],
+        )
+        delete_git_config_contexts(
+            repository_record,
+            job_result,
+            preserve=managed_config_contexts,
+            preserve_local=managed_local_config_contexts,
+            names=names,
+            local_names=local_names,
+        )
+
+    if not failed:
+        set_synced_head(repository_record, "extras.configcontext", repository_record.current_head)
 
 
 def import_config_context(context_data, repository_record, job_result):
@@ -548,40 +685,161 @@ def import_local_config_context(local_type, device_name, context_data, repositor
     )
 
 
-def delete_git_config_contexts(repository_record, job_result, preserve=(), preserve_local=None):
-    """Delete config contexts owned by this Git repository that are not in the preserve list (if any)."""
+def import_local_config_contexts(local_type, contexts, repository_record, job_result, chunk_size=1000):
+    """
+    Create/update the local config context data associated with many Devices or VirtualMachines at once.
+
+    Args:
+        local_type (str): Either "devices" or "virtual_machines".
+        contexts (dict): `{name: (file_name, context_data)}` for each record to update.
+        repository_record (GitRepository): The repository providing the data.
+        job_result (JobResult): The JobResult to log to.
+        chunk_size (int): The number of records to look up and update in each query.
+
+    Returns:
+        (set): The names of the records that were found, whether or not their data needed to be updated.
+    """
+    model = LOCAL_CONFIG_CONTEXT_MODELS[local_type]
+    git_repository_content_type = ContentType.objects.get_for_model(GitRepository)
+    found_names = set()
+    names = sorted(contexts)
+
+    for offset in range(0, len(names), chunk_size):
+        chunk = names[offset : offset + chunk_size]
+        records_by_name = defaultdict(list)
+        for record in model.objects.filter(name__in=chunk).select_related("local_config_context_schema"):
+            records_by_name[record.name].append(record)
+
+        updated_records = []
+        for name in chunk:
+            file_name, context_data = contexts[name]
+            records = records_by_name[name]
+            try:
+                if not records:
+                    raise RuntimeError("record not found!")
+                if len(records) > 1:
+                    # Possible for Device as name is not guaranteed globally unique
+                    # TODO: come up with a design that accounts for non-unique names, as well as un-named Devices.
+                    raise RuntimeError(
+                        "multiple records with the same name found; unable to determine which one to apply to!"
+                    )
+                record = records[0]
+                found_names.add(name)
+
+                owned = (
+                    record.local_config_context_data_owner_content_type_id == git_repository_content_type.pk
+                    and record.local_config_context_data_owner_object_id == repository_record.pk
+                )
+                if record.local_config_context_data_owner_content_type_id is not None and not owned:
+                    logger.error(
+                        "DATA CONFLICT: Local context data is owned by another owner, %s",
+                        record.local_config_context_data_owner,
+                        extra={"object": record, "grouping": "local config contexts"},
+                    )
+                    continue
+
+                if owned and record.local_config_context_data == context_data:
+                    logger.info(
+                        "No change to local config context",
+                        extra={"object": record, "grouping": "local config contexts"},
+                    )
+                    continue
+
+                record.local_config_context_data = context_data
+                record.local_config_context_data_owner = repository_record
+                record.clean_local_config_context_data()
+            except Exception as exc:
+                found_names.discard(name)
+                msg = f"Error in loading local config context from `{local_type}/{file_name}`: {exc}"
+                logger.error(msg)
+                job_result.log(msg, level_choice=LogLevelChoices.LOG_ERROR, grouping="local config contexts")
+                continue
+            updated_records.append(record)
+
+        save_local_config_contexts(model, updated_records)
+        for record in updated_records:
+            logger.info(
+                "Successfully updated local config context",
+                extra={"object": record, "grouping": "local config contexts"},
+            )
+
+    return found_names
+
+
+def save_local_config_contexts(model, records):
+    """
+    Save the local config context data and owner of the given Devices or VirtualMachines in bulk.
+
+    An ObjectChange is recorded for each record in the current change context, if any, as saving it would.
+    """
+    if not records:
+        return
+    now = timezone.now()
+    for record in records:
+        record.last_updated = now
+
+    with transaction.atomic():
+        model.objects.bulk_update(
+            records,
+            [
+                "local_config_context_data",
+                "local_config_context_data_owner_content_type",
+                "local_config_context_data_owner_object_id",
+                "last_updated",
+            ],
+            batch_size=1000,
+        )
+
+        bulk_create_object_changes(records, action=ObjectChangeActionChoices.ACTION_UPDATE)
+
+
+def delete_git_config_contexts(
+    repository_record, job_result, preserve=(), preserve_local=None, names=None, local_names=None
+):
+    """
+    Delete config contexts owned by this Git repository that are not in the preserve list (if any).
+
+    If `names` and/or `local_names` (a dict of sets of names, keyed by local type) are specified, only the config
+    contexts with those names and/or the local config contexts of the records with those names are considered.
+    """
     if not preserve_local:
         preserve_local = defaultdict(set)
 
     git_repository_content_type = ContentType.objects.get_for_model(GitRepository)
-    for context_record in ConfigContext.objects.filter(
+    context_records = ConfigContext.objects.filter(
         owner_content_type=git_repository_content_type,
         owner_object_id=repository_record.pk,
-    ):
+    )
+    if names is not None:
+        context_records = context_records.filter(name__in=names)
+    for context_record in context_records:
         if context_record.name not in preserve:
             context_record.delete()
             msg = f"Deleted config context {context_record}"
             logger.warning(msg)
             job_result.log(msg, level_choice=LogLevelChoices.LOG_WARNING, grouping="config contexts")
 
-    for grouping, model in (
-        ("devices", Device),
-        ("virtual_machines", VirtualMachine),
-    ):
-        for record in model.objects.filter(
+    for grouping, model in LOCAL_CONFIG_CONTEXT_MODELS.items():
+        records = model.objects.filter(
             local_config_context_data_owner_content_type=git_repository_content_type,
             local_config_context_data_owner_object_id=repository_record.pk,
-        ):
+        ).select_related("local_config_context_schema")
+        if local_names is not None:
+            if not local_names.get(grouping):
+                continue
+            records = records.filter(name__in=local_names[grouping])
+        cleared_records = []
+        for record in records:
             if record.name not in preserve_local[grouping]:
                 record.local_config_context_data = None
                 record.local_config_context_data_owner = None
-                record.clean()
-                record.save()
-                msg = "Deleted local config context"
-                logger.warning(msg)
-                job_result.log(
-                    msg, obj=record, level_choice=LogLevelChoices.LOG_WARNING, grouping="local config contexts"
-                )
+                record.clean_local_config_context_data()
+                cleared_records.append(record)
+        save_local_config_contexts(model, cleared_records)
+        for record in cleared_records:
+            msg = "Deleted local config context"
+            logger.warning(msg)
+            job_result.log(msg, obj=record, level_choice=LogLevelChoices.LOG_WARNING, grouping="local config contexts")
 
 
 #
@@ -595,16 +853,29 @@ def refresh_git_config_context_schemas(repository_record, job_result, delete=Fal
         update_git_config_context_schemas(repository_record, job_result)
     else:
         delete_git_config_context_schemas(repository_record, job_result)
+        set_synced_head(repository_record, "extras.configcontextschema", None)
 
 
 def update_git_config_context_schemas(repository_record, job_result):
-    """Refresh any config context schemas provided by this Git repository."""
+    """
+    Refresh any config context schemas provided by this Git repository.
+
+    If the schemas were last synced from an earlier commit, only the files that were added, modified or deleted since
+    then are processed.
+    """
     config_context_schema_path = os.path.join(repository_record.filesystem_path, "config_context_schemas")
+    changes = get_changed_paths(repository_record, "extras.configcontextschema", "config_context_schemas")
 
     managed_config_context_schemas = set()
+    failed = False
 
     if os.path.isdir(config_context_schema_path):
-        for file_name in os.listdir(config_context_schema_path):
+        if changes is None:
+            file_names = os.listdir(config_context_schema_path)
+        else:
+            file_names = sorted(path for path in changes.updated if "/" not in path)
+
+        for file_name in file_names:
             if not os.path.isfile(os.path.join(config_context_schema_path, file_name)):
                 continue
             msg = (f"Loading config context schema from `{file_name}`",)
@@ -629,17 +900,31 @@ def update_git_config_context_schemas(repository_record, job_result):
                 else:
                     raise RuntimeError("data must be a dict or a list of dicts")
             except Exception as exc:
+                failed = True
                 msg = f"Error in loading config context schema data from `{file_name}`: {exc}"
                 logger.error(msg)
                 job_result.log(msg, level_choice=LogLevelChoices.LOG_ERROR, grouping="config context schemas")
 
-    # Delete any prior contexts that are owned by this repository but were not created/updated above
+    if changes is None:
+        # Delete any prior schemas that are owned by this repository but were not created/updated above
+        names = None
+    else:
+        # Only consider the schemas defined by the previous versions of the changed or deleted files
+        names = get_previous_metadata_names(
+            changes,
+            "config_context_schemas",
+            [path for path in changes.updated | changes.deleted if "/" not in path],
+        )
     delete_git_config_context_schemas(
         repository_record,
         job_result,
         preserve=managed_config_context_schemas,
+        names=names,
     )
 
+    if not failed:
+        set_synced_head(repository_record, "extras.configcontextschema", repository_record.current_head)
+
 
 def import_config_context_schema(context_schema_data, repository_record, job_result):
     """Using data from schema file, create schema record in Nautobot."""
@@ -696,13 +981,20 @@ def import_config_context_schema(context_schema_data, repository_record, job_res
     return schema_record.name if schema_record else None
 
 
-def delete_git_config_context_schemas(repository_record, job_result, preserve=()):
-    """Delete config context schemas owned by this Git repository that are not in the preserve list (if any)."""
+def delete_git_config_context_schemas(repository_record, job_result, preserve=(), names=None):
+    """
+    Delete config context schemas owned by this Git repository that are not in the preserve list (if any).
+
+    If `names` is specified, only the schemas with those names are considered.
+    """
     git_repository_content_type = ContentType.objects.get_for_model(GitRepository)
-    for schema_record in ConfigContextSchema.objects.filter(
+    schema_records = ConfigContextSchema.objects.filter(
         owner_content_type=git_repository_content_type,
         owner_object_id=repository_record.pk,
-    ):
+    )
+    if names is not None:
+        schema_records = schema_records.filter(name__in=names)
+    for schema_record in schema_records:
         if schema_record.name not in preserve:
             schema_record.delete()
             msg = f"Deleted config context schema {schema_record}"
@@ -816,12 +1108,16 @@ def refresh_git_export_templates(repository_record, job_result, delete=False):
         update_git_export_templates(repository_record, job_result)
     else:
         delete_git_export_templates(repository_record, job_result)
+        set_synced_head(repository_record, "extras.exporttemplate", None)
 
 
 def update_git_export_templates(repository_record, job_result):
     """Refresh any export templates provided by this Git repository.
 
     Templates are located in GIT_ROOT/<repo>/export_templates/<app_label>/<model>/<template name>.
+
+    If the templates were last synced from an earlier commit, only the files that were added, modified or deleted
+    since then are processed.
     """
     # Error checking - did the user put directories in the repository root instead of under /export_templates/?
     for app_label in ["circuits", "dcim", "extras", "ipam", "tenancy", "users", "virtualization"]:
@@ -835,12 +1131,17 @@ def update_git_export_templates(repository_record, job_result):
             job_result.log(msg, level_choice=LogLevelChoices.LOG_WARNING, grouping="export templates")
 
     export_template_path = os.path.join(repository_record.filesystem_path, "export_templates")
+    changes = get_changed_paths(repository_record, "extras.exporttemplate", "export_templates")
     managed_export_templates = {}
+    failed = False
 
     git_repository_content_type = ContentType.objects.get_for_model(GitRepository)
 
     for model_content_type, file_path in files_from_contenttype_directories(
-        export_template_path, job_result, "export templates"
+        export_template_path,
+        job_result,
+        "export templates",
+        paths=changes.updated if changes is not None else None,
     ):
         file_name = os.path.basename(file_path)
         app_label = model_content_type.app_label
@@ -917,17 +1218,41 @@ def update_git_export_templates(repository_record, job_result):
                 )
 
         except Exception as exc:
+            failed = True
             logger.error(str(exc))
             job_result.log(
                 str(exc), obj=template_record, level_choice=LogLevelChoices.LOG_ERROR, grouping="export templates"
             )
 
-    # Delete any prior templates that are owned by this repository but were not discovered above
-    delete_git_export_templates(repository_record, job_result, preserve=managed_export_templates)
+    if changes is None:
+        # Delete any prior templates that are owned by this repository but were not discovered above
+        delete_git_export_templates(repository_record, job_result, preserve=managed_export_templates)
+    else:
+        # Delete the templates whose files were deleted
+        deleted_export_templates = {}
+        for path in changes.deleted:
+            parts = path.split("/")
+            if len(parts) == 3:
+                deleted_export_templates.setdefault(f"{parts[0]}.{parts[1]}", set()).add(parts[2])
+        if deleted_export_templates:
+            delete_git_export_templates(
+                repository_record,
+                job_result,
+                preserve=managed_export_templates,
+                names=deleted_export_templates,
+            )
+
+    if not failed:
+        set_synced_head(repository_record, "extras.exporttemplate", repository_record.current_head)
 
 
-def delete_git_export_templates(repository_record, job_result, preserve=None):
-    """Delete ExportTemplates owned by the given Git repository that are not in the preserve dict (if any)."""
+def delete_git_export_templates(repository_record, job_result, preserve=None, names=None):
+    """
+    Delete ExportTemplates owned by the given Git repository that are not in the preserve dict (if any).
+
+    If `names` (a dict of sets of template names, keyed by "<app_label>.<model>") is specified, only the templates with
+    those names are considered.
+    """
     git_repository_content_type = ContentType.objects.get_for_model(GitRepository)
     if not preserve:
         preserve = {}
@@ -935,8 +1260,10 @@ def delete_git_export_templates(repository_record, job_result, preserve=None):
     for template_record in ExportTemplate.objects.filter(
         owner_content_type=git_repository_content_type,
         owner_object_id=repository_record.pk,
-    ):
+    ).select_related("content_type"):
         key = f"{template_record.content_type.app_label}.{template_record.content_type.model}"
+        if names is not None and template_record.name not in names.get(key, ()):
+            continue
         if template_record.name not in preserve.get(key, ()):
             template_record.delete()
             msg = f"Deleted export template {template_record}"
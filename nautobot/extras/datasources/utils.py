@@ -1,3 +1,4 @@
+from collections import defaultdict
 import logging
 import os
 
@@ -8,33 +9,48 @@ from nautobot.extras.choices import LogLevelChoices
 logger = logging.getLogger(__name__)
 
 
-def files_from_contenttype_directories(base_path, job_result, log_grouping):
+def files_from_contenttype_directories(base_path, job_result, log_grouping, paths=None):
     """
     Iterate over a directory structure base_path/<app_label>/<model>/ and yield the ContentType and files encountered.
 
+    Args:
+        paths (iterable): If specified, only the files at these paths (relative to `base_path`) are yielded, rather than
+            all files in the directory structure.
+
     Returns:
         (Tuple[ContentType, file_path]): A tuple of the ContentType and the file path.
     """
     if not os.path.isdir(base_path):
         return
 
-    for app_label in os.listdir(base_path):
-        app_label_path = os.path.join(base_path, app_label)
-        if not os.path.isdir(app_label_path):
-            continue
-
-        for modelname in os.listdir(app_label_path):
-            modelname_path = os.path.join(app_label_path, modelname)
-            if not os.path.isdir(modelname_path):
+    filenames_by_directory = defaultdict(list)
+    if paths is None:
+        for app_label in os.listdir(base_path):
+            app_label_path = os.path.join(base_path, app_label)
+            if not os.path.isdir(app_label_path):
                 continue
 
-            try:
-                model_content_type = ContentType.objects.get(app_label=app_label, model=modelname)
-            except ContentType.DoesNotExist:
-                msg = f"Skipping `{app_label}.{modelname}` as it isn't a known content type"
-                logger.warning(msg)
-                job_result.log(msg, level_choice=LogLevelChoices.LOG_WARNING, grouping=log_grouping)
-                continue
+            for modelname in os.listdir(app_label_path):
+                modelname_path = os.path.join(app_label_path, modelname)
+                if not os.path.isdir(modelname_path):
+                    continue
+
+                filenames_by_directory[(app_label, modelname)] = os.listdir(modelname_path)
+    else:
+        for path in sorted(paths):
+            parts = path.split("/")
+            if len(parts) == 3 and os.path.isfile(os.path.join(base_path, *parts)):
+                filenames_by_directory[(parts[0], parts[1])].append(parts[2])
+
+    for (app_label, modelname), filenames in filenames_by_directory.items():
+        try:
+            model_content_type = ContentType.objects.get(app_label=app_label, model=modelname)
+        except ContentType.DoesNotExist:
+            msg = f"Skipping `{app_label}.{modelname}` as it isn't a known content type"
+            logger.warning(msg)
+            job_result.log(msg, level_choice=LogLevelChoices.LOG_WARNING, grouping=log_grouping)
+            continue
 
-            for filename in os.listdir(modelname_path):
-                yield (model_content_type, os.path.join(modelname_path, filename))
+        modelname_path = os.path.join(base_path, app_label, modelname)
+        for filename in filenames:
+            yield (model_content_type, os.path.join(modelname_path, filename))
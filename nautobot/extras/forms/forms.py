@@ -447,7 +447,7 @@ class CustomFieldModelCSVForm(CSVModelForm, CustomFieldModelFormMixin):
 
     def _append_customfield_fields(self):
         # Append form fields
-        for cf in CustomField.objects.filter(content_types=self.obj_type):
+        for cf in CustomField.objects.get_snapshot_for_model(self._meta.model):
             field_name = cf.add_prefix_to_cf_key()
             self.fields[field_name] = cf.to_form_field(for_csv_import=True)
 
@@ -1657,6 +1657,7 @@ class WebhookForm(BootstrapMixin, forms.ModelForm):
             "secret",
             "ssl_verification",
             "ca_file_path",
+            "batch_size",
         )
 
     def clean(self):
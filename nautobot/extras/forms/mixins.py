@@ -63,7 +63,7 @@ class CustomFieldModelFilterFormMixin(forms.Form):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        custom_fields = CustomField.objects.get_for_model(self.model, exclude_filter_disabled=True)
+        custom_fields = CustomField.objects.get_snapshot_for_model(self.model, exclude_filter_disabled=True)
         self.custom_fields = []
         for cf in custom_fields:
             field_name = cf.add_prefix_to_cf_key()
@@ -96,7 +96,7 @@ class CustomFieldModelFormMixin(forms.ModelForm):
         Append form fields for all CustomFields assigned to this model.
         """
         # Append form fields; assign initial values if modifying and existing object
-        for cf in CustomField.objects.filter(content_types=self.obj_type):
+        for cf in CustomField.objects.get_snapshot_for_model(self._meta.model):
             field_name = cf.add_prefix_to_cf_key()
             if self.instance.present_in_database:
                 self.fields[field_name] = cf.to_form_field(set_initial=False)
@@ -124,7 +124,7 @@ class CustomFieldModelBulkEditFormMixin(BulkEditForm):
         self.obj_type = ContentType.objects.get_for_model(self.model)
 
         # Add all applicable CustomFields to the form
-        custom_fields = CustomField.objects.filter(content_types=self.obj_type)
+        custom_fields = CustomField.objects.get_snapshot_for_model(self.model)
         for cf in custom_fields:
             field_name = cf.add_prefix_to_cf_key()
             # Annotate non-required custom fields as nullable
@@ -182,10 +182,8 @@ class RelationshipModelBulkEditFormMixin(BulkEditForm):
         """
         Append form fields for all Relationships assigned to this model.
         """
-        source_relationships = Relationship.objects.filter(source_type=self.obj_type, source_hidden=False)
+        source_relationships, dest_relationships = Relationship.objects.get_snapshot_for_model(self.model, hidden=False)
         self._append_relationships_side(source_relationships, RelationshipSideChoices.SIDE_SOURCE)
-
-        dest_relationships = Relationship.objects.filter(destination_type=self.obj_type, destination_hidden=False)
         self._append_relationships_side(dest_relationships, RelationshipSideChoices.SIDE_DESTINATION)
 
     def _append_relationships_side(self, relationships, initial_side):
@@ -647,7 +645,7 @@ class RelationshipModelFilterFormMixin(forms.Form):
         """
         Append form fields for all Relationships assigned to this model.
         """
-        src_relationships, dst_relationships = Relationship.objects.get_for_model(model=self.model, hidden=False)
+        src_relationships, dst_relationships = Relationship.objects.get_snapshot_for_model(self.model, hidden=False)
 
         for rel in src_relationships:
             self._append_relationships_side([rel], RelationshipSideChoices.SIDE_SOURCE)
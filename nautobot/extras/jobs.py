@@ -30,6 +30,7 @@ import netaddr
 import yaml
 
 from nautobot.core.celery import import_jobs, nautobot_task
+from nautobot.core.celery.log import flush_database_handlers
 from nautobot.core.forms import (
     DynamicModelChoiceField,
     DynamicModelMultipleChoiceField,
@@ -1142,6 +1143,9 @@ def run_job(self, job_class_path, *args, **kwargs):
         job.on_failure(exc, self.request.id, args, kwargs, einfo)
         job.after_return(JobResultStatusChoices.STATUS_FAILURE, exc, self.request.id, args, kwargs, einfo)
         raise
+    finally:
+        # Make sure that all of the job's log entries are recorded before the job is reported as completed
+        flush_database_handlers()
 
 
 def enqueue_job_hooks(object_change):
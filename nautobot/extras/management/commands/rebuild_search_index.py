@@ -0,0 +1,49 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot.extras.search import get_search_backend, get_search_fields, get_searchable_models
+
+
+class Command(BaseCommand):
+    help = "Rebuild the global search index for the specified models, or for all searchable models"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "args",
+            metavar="app_label.ModelName",
+            nargs="*",
+            help="One or more specific models (each prefixed with its app_label) to reindex",
+        )
+
+    def _get_models(self, names):
+        """Compile the list of models to be reindexed. If no names are specified, all searchable models are included."""
+        searchable_models = get_searchable_models()
+        if not names:
+            return searchable_models
+
+        models = []
+        for name in names:
+            try:
+                model = apps.get_model(name)
+            except (LookupError, ValueError):
+                raise CommandError(f"Unknown model: {name}. Models must be specified in the form app_label.ModelName.")
+            if model not in searchable_models:
+                raise CommandError(f"Invalid model: {name} is not included in the global search")
+            models.append(model)
+        return models
+
+    def handle(self, *args, **options):
+        search_backend = get_search_backend()
+        if not search_backend.indexed:
+            self.stdout.write(self.style.NOTICE("The configured SEARCH_BACKEND has no index; nothing to rebuild"))
+            return
+
+        for model in self._get_models(args):
+            verbose_name_plural = model._meta.verbose_name_plural
+            if get_search_fields(model) is None:
+                self.stdout.write(f"Skipping {verbose_name_plural}, which are always searched with their filterset")
+                continue
+            self.stdout.write(f"Reindexing {verbose_name_plural}...")
+            search_backend.rebuild_index(models=[model])
+
+        self.stdout.write(self.style.SUCCESS("Done."))
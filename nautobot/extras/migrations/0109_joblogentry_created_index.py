@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2024-07-08 14:12
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0108_jobbutton_enabled"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="joblogentry",
+            name="created",
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+    ]
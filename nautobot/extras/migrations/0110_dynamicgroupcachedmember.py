@@ -0,0 +1,38 @@
+# Generated by Django 3.2.25 on 2024-07-09 16:41
+
+import uuid
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0109_joblogentry_created_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DynamicGroupCachedMember",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("associated_object_id", models.UUIDField(db_index=True)),
+                (
+                    "dynamic_group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="cached_members",
+                        to="extras.dynamicgroup",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("dynamic_group", "associated_object_id")},
+            },
+        ),
+    ]
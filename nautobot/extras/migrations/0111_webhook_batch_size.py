@@ -0,0 +1,30 @@
+# Generated by Django 3.2.25 on 2024-07-10 09:12
+
+import django.core.validators
+from django.db import migrations, models
+
+import nautobot.extras.models.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0110_dynamicgroupcachedmember"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="webhook",
+            managers=[
+                ("objects", nautobot.extras.models.models.WebhookManager()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="webhook",
+            name="batch_size",
+            field=models.PositiveIntegerField(
+                default=1,
+                help_text="Maximum number of changes to send in each request. If greater than 1, the changes made in each request or job are sent together, and the request body is a JSON array of the individual change bodies.",
+                validators=[django.core.validators.MinValueValidator(1)],
+            ),
+        ),
+    ]
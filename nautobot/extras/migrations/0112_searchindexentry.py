@@ -0,0 +1,68 @@
+# Generated by Django 3.2.25 on 2026-10-17 05:50
+
+import logging
+import uuid
+
+from django.db import DatabaseError, migrations, models, transaction
+import django.db.models.deletion
+
+logger = logging.getLogger(__name__)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """On PostgreSQL, index the searchable text for case-insensitive substring matches, if `pg_trgm` is available."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except DatabaseError as exc:
+        logger.warning("Unable to enable the pg_trgm extension, search index entries will not be indexed: %s", exc)
+        return
+    for column in ("text", "keywords"):
+        schema_editor.execute(
+            f"CREATE INDEX extras_searchindexentry_{column}_trgm ON extras_searchindexentry "
+            f"USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for column in ("text", "keywords"):
+        schema_editor.execute(f"DROP INDEX IF EXISTS extras_searchindexentry_{column}_trgm")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("extras", "0111_webhook_batch_size"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchIndexEntry",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("object_id", models.UUIDField()),
+                ("text", models.TextField(blank=True)),
+                ("keywords", models.TextField(blank=True)),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="contenttypes.contenttype"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "search index entries",
+                "unique_together": {("content_type", "object_id")},
+            },
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -2,7 +2,7 @@ from .change_logging import ChangeLoggedModel, ObjectChange
 from .contacts import Contact, ContactAssociation, Team
 from .customfields import ComputedField, CustomField, CustomFieldChoice, CustomFieldModel
 from .datasources import GitRepository
-from .groups import DynamicGroup, DynamicGroupMembership
+from .groups import DynamicGroup, DynamicGroupCachedMember, DynamicGroupMembership
 from .jobs import (
     Job,
     JobButton,
@@ -29,6 +29,7 @@ from .models import (
 )
 from .relationships import Relationship, RelationshipAssociation, RelationshipModel
 from .roles import Role, RoleField
+from .search import SearchIndexEntry
 from .secrets import Secret, SecretsGroup, SecretsGroupAssociation
 from .statuses import Status, StatusField, StatusModel
 from .tags import Tag, TaggedItem
@@ -46,6 +47,7 @@ __all__ = (
     "CustomFieldModel",
     "CustomLink",
     "DynamicGroup",
+    "DynamicGroupCachedMember",
     "DynamicGroupMembership",
     "ExportTemplate",
     "ExternalIntegration",
@@ -69,6 +71,7 @@ __all__ = (
     "RoleField",
     "ScheduledJob",
     "ScheduledJobs",
+    "SearchIndexEntry",
     "Secret",
     "SecretsGroup",
     "SecretsGroupAssociation",
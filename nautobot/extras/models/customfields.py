@@ -6,7 +6,6 @@ import re
 
 from django import forms
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import RegexValidator, ValidationError
@@ -40,7 +39,13 @@ from nautobot.extras.choices import CustomFieldFilterLogicChoices, CustomFieldTy
 from nautobot.extras.models import ChangeLoggedModel
 from nautobot.extras.models.mixins import NotesMixin
 from nautobot.extras.tasks import delete_custom_field_data, update_custom_field_choice_data
-from nautobot.extras.utils import check_if_key_is_graphql_safe, extras_features, FeatureQuery
+from nautobot.extras.utils import (
+    check_if_key_is_graphql_safe,
+    extras_features,
+    FeatureQuery,
+    metadata_cache,
+    queryset_from_snapshot,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -51,17 +56,27 @@ class ComputedFieldManager(BaseManager.from_queryset(RestrictedQuerySet)):
     def get_for_model(self, model):
         """
         Return all ComputedFields assigned to the given model.
+
+        The queryset is pre-populated from `get_snapshot_for_model()`, so iterating over it doesn't query the database.
+        """
+        content_type = ContentType.objects.get_for_model(model._meta.concrete_model)
+        return queryset_from_snapshot(
+            self.get_queryset().filter(content_type=content_type), self.get_snapshot_for_model(model)
+        )
+
+    def get_snapshot_for_model(self, model):
+        """
+        Return a tuple of all ComputedFields assigned to the given model, cached in the memory of this process.
+
+        The ComputedFields are shared by all callers, and so must not be modified.
         """
         concrete_model = model._meta.concrete_model
-        cache_key = f"{self.get_for_model.cache_key_prefix}.{concrete_model._meta.label_lower}"
-        queryset = cache.get(cache_key)
-        if queryset is None:
+
+        def get_computed_fields():
             content_type = ContentType.objects.get_for_model(concrete_model)
-            queryset = self.get_queryset().filter(content_type=content_type)
-            cache.set(cache_key, queryset)
-        return queryset
+            return tuple(self.get_queryset().filter(content_type=content_type))
 
-    get_for_model.cache_key_prefix = "nautobot.extras.computedfield.get_for_model"
+        return metadata_cache.get_or_set(("computedfield", concrete_model._meta.label_lower), get_computed_fields)
 
 
 @extras_features("graphql")
@@ -179,9 +194,7 @@ class CustomFieldModel(models.Model):
         """
         Return a dictionary of custom fields for a single object in the form {<field>: value}.
         """
-        fields = CustomField.objects.get_for_model(self)
-        if advanced_ui is not None:
-            fields = fields.filter(advanced_ui=advanced_ui)
+        fields = CustomField.objects.get_snapshot_for_model(self, advanced_ui=advanced_ui)
         return OrderedDict([(field, self.cf.get(field.key)) for field in fields])
 
     def get_custom_field_groupings_basic(self):
@@ -223,9 +236,7 @@ class CustomFieldModel(models.Model):
         }
         """
         record = {}
-        fields = CustomField.objects.get_for_model(self)
-        if advanced_ui is not None:
-            fields = fields.filter(advanced_ui=advanced_ui)
+        fields = CustomField.objects.get_snapshot_for_model(self, advanced_ui=advanced_ui)
 
         for field in fields:
             data = (field, self.cf.get(field.key))
@@ -236,7 +247,7 @@ class CustomFieldModel(models.Model):
     def clean(self):
         super().clean()
 
-        custom_fields = {cf.key: cf for cf in CustomField.objects.get_for_model(self)}
+        custom_fields = {cf.key: cf for cf in CustomField.objects.get_snapshot_for_model(self)}
 
         # Validate all field values
         for field_key, value in self._custom_field_data.items():
@@ -263,10 +274,10 @@ class CustomFieldModel(models.Model):
         Return a boolean indicating whether or not this content type has computed fields associated with it.
         This can also check whether the advanced_ui attribute is True or False for UI display purposes.
         """
-        computed_fields = ComputedField.objects.get_for_model(self)
+        computed_fields = ComputedField.objects.get_snapshot_for_model(self)
         if advanced_ui is not None:
-            computed_fields = computed_fields.filter(advanced_ui=advanced_ui)
-        return computed_fields.exists()
+            computed_fields = [cf for cf in computed_fields if cf.advanced_ui == advanced_ui]
+        return bool(computed_fields)
 
     def has_computed_fields_basic(self):
         return self.has_computed_fields(advanced_ui=False)
@@ -279,9 +290,11 @@ class CustomFieldModel(models.Model):
         Get a computed field for this model, lookup via key.
         Returns the template of this field if render is False, otherwise returns the rendered value.
         """
-        try:
-            computed_field = ComputedField.objects.get_for_model(self).get(key=key)
-        except ComputedField.DoesNotExist:
+        computed_field = next(
+            (cf for cf in ComputedField.objects.get_snapshot_for_model(self) if cf.key == key),
+            None,
+        )
+        if computed_field is None:
             logger.warning("Computed Field with key %s does not exist for model %s", key, self._meta.verbose_name)
             return None
         if render:
@@ -294,9 +307,9 @@ class CustomFieldModel(models.Model):
         Keys are the `key` value of each field. If label_as_key is True, `label` values of each field are used as keys.
         """
         computed_fields_dict = {}
-        computed_fields = ComputedField.objects.get_for_model(self)
+        computed_fields = ComputedField.objects.get_snapshot_for_model(self)
         if advanced_ui is not None:
-            computed_fields = computed_fields.filter(advanced_ui=advanced_ui)
+            computed_fields = [cf for cf in computed_fields if cf.advanced_ui == advanced_ui]
         if not computed_fields:
             return {}
         for cf in computed_fields:
@@ -311,24 +324,48 @@ class CustomFieldManager(BaseManager.from_queryset(RestrictedQuerySet)):
         """
         Return all CustomFields assigned to the given model.
 
+        The queryset is pre-populated from `get_snapshot_for_model()`, so iterating over it doesn't query the database.
+
         Args:
             model: The django model to which custom fields are registered
             exclude_filter_disabled: Exclude any custom fields which have filter logic disabled
         """
-        concrete_model = model._meta.concrete_model
-        cache_key = (
-            f"{self.get_for_model.cache_key_prefix}.{concrete_model._meta.label_lower}.{exclude_filter_disabled}"
+        content_type = ContentType.objects.get_for_model(model._meta.concrete_model)
+        queryset = self.get_queryset().filter(content_types=content_type)
+        if exclude_filter_disabled:
+            queryset = queryset.exclude(filter_logic=CustomFieldFilterLogicChoices.FILTER_DISABLED)
+        return queryset_from_snapshot(
+            queryset, self.get_snapshot_for_model(model, exclude_filter_disabled=exclude_filter_disabled)
         )
-        queryset = cache.get(cache_key)
-        if queryset is None:
+
+    def get_snapshot_for_model(self, model, exclude_filter_disabled=False, advanced_ui=None):
+        """
+        Return a tuple of all CustomFields assigned to the given model, cached in the memory of this process.
+
+        The CustomFields are shared by all callers, and so must not be modified. Their choices are prefetched, so that
+        validating values against them doesn't query the database either.
+
+        Args:
+            model: The django model to which custom fields are registered
+            exclude_filter_disabled: Exclude any custom fields which have filter logic disabled
+            advanced_ui: Only include custom fields whose `advanced_ui` flag has the given value, unless None
+        """
+        concrete_model = model._meta.concrete_model
+
+        def get_custom_fields():
             content_type = ContentType.objects.get_for_model(concrete_model)
-            queryset = self.get_queryset().filter(content_types=content_type)
-            if exclude_filter_disabled:
-                queryset = queryset.exclude(filter_logic=CustomFieldFilterLogicChoices.FILTER_DISABLED)
-            cache.set(cache_key, queryset)
-        return queryset
+            return tuple(
+                self.get_queryset().filter(content_types=content_type).prefetch_related("custom_field_choices")
+            )
 
-    get_for_model.cache_key_prefix = "nautobot.extras.customfield.get_for_model"
+        custom_fields = metadata_cache.get_or_set(("customfield", concrete_model._meta.label_lower), get_custom_fields)
+        if exclude_filter_disabled:
+            custom_fields = tuple(
+                cf for cf in custom_fields if cf.filter_logic != CustomFieldFilterLogicChoices.FILTER_DISABLED
+            )
+        if advanced_ui is not None:
+            custom_fields = tuple(cf for cf in custom_fields if cf.advanced_ui == advanced_ui)
+        return custom_fields
 
 
 @extras_features("webhooks")
@@ -698,18 +735,17 @@ class CustomField(BaseModel, ChangeLoggedModel, NotesMixin):
 
             # Validate selected choice
             elif self.type == CustomFieldTypeChoices.TYPE_SELECT:
-                if value not in self.custom_field_choices.values_list("value", flat=True):
-                    raise ValidationError(
-                        f"Invalid choice ({value}). Available choices are: {', '.join(self.custom_field_choices.values_list('value', flat=True))}"
-                    )
+                # Use .all() rather than .values_list() so that prefetched choices (see get_snapshot_for_model) are used
+                choices = [cfc.value for cfc in self.custom_field_choices.all()]
+                if value not in choices:
+                    raise ValidationError(f"Invalid choice ({value}). Available choices are: {', '.join(choices)}")
 
             elif self.type == CustomFieldTypeChoices.TYPE_MULTISELECT:
                 if isinstance(value, str):
                     value = value.split(",")
-                if not set(value).issubset(self.custom_field_choices.values_list("value", flat=True)):
-                    raise ValidationError(
-                        f"Invalid choice(s) ({value}). Available choices are: {', '.join(self.custom_field_choices.values_list('value', flat=True))}"
-                    )
+                choices = [cfc.value for cfc in self.custom_field_choices.all()]
+                if not set(value).issubset(choices):
+                    raise ValidationError(f"Invalid choice(s) ({value}). Available choices are: {', '.join(choices)}")
 
         elif self.required:
             raise ValidationError("Required field cannot be empty.")
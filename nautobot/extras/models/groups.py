@@ -1,14 +1,13 @@
 """Dynamic Groups Models."""
 
 import logging
-import pickle
 
 from django import forms
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
+from django.db import models, transaction
 from django.utils.functional import cached_property
 import django_filters
 
@@ -325,36 +324,65 @@ class DynamicGroup(OrganizationalModel):
 
     @property
     def members_cache_key(self):
-        """Return the cache key for this group's members."""
+        """Return the cache key recording that this group's cached members are current."""
         return f"nautobot.extras.dynamicgroup.{self.id}.members_cached"
 
     @property
     def members_cached(self):
-        """Return the member objects for this group, cached if available."""
+        """
+        Return the member objects for this group, as recorded in its `cached_members`.
 
-        unpickled_query = None
-        try:
-            cached_query = cache.get(self.members_cache_key)
-            if cached_query is not None:
-                unpickled_query = pickle.loads(cached_query)  # noqa: S301  # suspicious-pickle-usage -- we know, but we control what's in the DB
-        except pickle.UnpicklingError:
-            logger.warning("Failed to unpickle cached members for %s", self)
-        finally:
-            if unpickled_query is None:
-                unpickled_query = self.members.all()
-                cached_query = pickle.dumps(unpickled_query)  # Explicitly pickle the query to evaluate it.
-                cache.set(
-                    self.members_cache_key, cached_query, get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT")
-                )
-
-        return unpickled_query
+        The cached members are a materialized table of this group's members, which is kept up to date as objects are
+        saved and deleted, and is fully refreshed from `members` if it hasn't been within the last
+        `DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT` seconds. If that setting is 0, this is the same as `members`.
+        """
+        if not self._refresh_cached_members_if_stale():
+            return self.members
+        return self.model.objects.filter(pk__in=self.cached_members.values("associated_object_id"))
+
+    def _refresh_cached_members_if_stale(self):
+        """
+        Refresh this group's cached members if they haven't been refreshed within the cache timeout.
+
+        Returns:
+            bool: False if member caching is disabled, otherwise True.
+        """
+        timeout = get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT")
+        if timeout == 0:
+            return False
+        if cache.get(self.members_cache_key) is None:
+            self._refresh_cached_members(timeout)
+        return True
+
+    def _refresh_cached_members(self, timeout):
+        """Synchronize this group's cached members with its `members`, and mark them as current for `timeout`."""
+        with transaction.atomic():
+            # Skip the Collector, which would otherwise load and send delete signals for each removed member
+            stale_members = self.cached_members.exclude(associated_object_id__in=self.members.values("pk"))
+            stale_members._raw_delete(stale_members.db)  # pylint: disable=protected-access
+            cached_member_ids = set(self.cached_members.values_list("associated_object_id", flat=True))
+            DynamicGroupCachedMember.objects.bulk_create(
+                [
+                    DynamicGroupCachedMember(dynamic_group=self, associated_object_id=pk)
+                    for pk in self.members.values_list("pk", flat=True).iterator()
+                    if pk not in cached_member_ids
+                ],
+                batch_size=1000,
+                # Another process may be refreshing the cached members of this group concurrently
+                ignore_conflicts=True,
+            )
+        # Only mark the cached members as current once they've been committed
+        transaction.on_commit(lambda: cache.set(self.members_cache_key, True, timeout))
 
     def update_cached_members(self):
         """
         Update the cached members of the groups. Also returns the updated cached members.
         """
+        timeout = get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT")
+        if timeout == 0:
+            return self.members
 
-        cache.delete(self.members_cache_key)
+        self._refresh_cached_members(timeout)
 
         return self.members_cached
 
@@ -383,10 +411,9 @@ class DynamicGroup(OrganizationalModel):
         if not use_cache and ContentType.objects.get_for_model(obj).id != self.content_type_id:
             return False
 
-        if not use_cache:
-            return self.members.filter(pk=obj.pk).exists()
-        else:
-            return obj in list(self.members_cached)
+        if use_cache and self._refresh_cached_members_if_stale():
+            return self.cached_members.filter(associated_object_id=obj.pk).exists()
+        return self.members.filter(pk=obj.pk).exists()
 
     @property
     def count(self):
@@ -527,6 +554,10 @@ class DynamicGroup(OrganizationalModel):
                 msg="Cannot delete DynamicGroup while child of other DynamicGroups.",
                 protected_objects=set(self.parents.all()),
             )
+        # Delete the cached members directly, rather than having the Collector load each one of them
+        cached_members = self.cached_members.all()
+        cached_members._raw_delete(cached_members.db)  # pylint: disable=protected-access
+        cache.delete(self.members_cache_key)
         return super().delete(*args, **kwargs)
 
     def clean_fields(self, exclude=None):
@@ -953,6 +984,19 @@ class DynamicGroup(OrganizationalModel):
         return self._ordered_filter(self.__class__.objects, ["pk"], pk_list)
 
 
+class DynamicGroupCachedMember(BaseModel):
+    """Materialized membership of a DynamicGroup, used as a cache of its evaluated members."""
+
+    dynamic_group = models.ForeignKey("extras.DynamicGroup", on_delete=models.CASCADE, related_name="cached_members")
+    associated_object_id = models.UUIDField(db_index=True)
+
+    class Meta:
+        unique_together = [["dynamic_group", "associated_object_id"]]
+
+    def __str__(self):
+        return f"{self.associated_object_id} in {self.dynamic_group}"
+
+
 class DynamicGroupMembership(BaseModel):
     """Intermediate model for associating filters to groups."""
 
@@ -11,7 +11,7 @@ from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
-from django.db import models, transaction
+from django.db import DEFAULT_DB_ALIAS, models, transaction
 from django.db.models import signals
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -448,7 +448,7 @@ class JobLogEntry(BaseModel):
     )
     grouping = models.CharField(max_length=JOB_LOG_MAX_GROUPING_LENGTH, default="main")
     message = models.TextField(blank=True)
-    created = models.DateTimeField(default=timezone.now)
+    created = models.DateTimeField(default=timezone.now, db_index=True)
     # Storing both of the below as strings instead of using GenericForeignKey to support
     # compatibility with existing JobResult logs. GFK would pose a problem with dangling foreign-key
     # references, whereas this allows us to retain all records for as long as the entry exists.
@@ -735,7 +735,18 @@ class JobResult(BaseModel, CustomFieldModel):
 
         return job_result
 
-    def log(
+    @property
+    def log_entries_database(self):
+        """The database alias that the JobLogEntry records of this JobResult are stored in."""
+        # If the override is provided, we want to use the default database.
+        # Otherwise we want to use a separate database here so that the logs are created immediately
+        # instead of within transaction.atomic(). This allows us to be able to report logs when the jobs
+        # are running, and allow us to rollback the database without losing the log entries.
+        if not self.use_job_logs_db or not JOB_LOGS:
+            return DEFAULT_DB_ALIAS
+        return JOB_LOGS
+
+    def build_log_entry(
         self,
         message,
         obj=None,
@@ -743,12 +754,7 @@ class JobResult(BaseModel, CustomFieldModel):
         grouping="main",
     ):
         """
-        General-purpose API for storing log messages in a JobResult's 'data' field.
-
-        message (str): Message to log (an attempt will be made to sanitize sensitive information from this message)
-        obj (object): Object associated with this message, if any
-        level_choice (LogLevelChoices): Message severity level
-        grouping (str): Grouping to store the log message under
+        Construct (but don't save) a JobLogEntry for this JobResult; see `log()` for the arguments.
         """
         if level_choice not in LogLevelChoices.as_dict():
             raise ValueError(f"Unknown logging level: {level_choice}")
@@ -777,14 +783,25 @@ class JobResult(BaseModel, CustomFieldModel):
                 log_object=str(obj)[:JOB_LOG_MAX_LOG_OBJECT_LENGTH] if obj else "",
                 absolute_url="",
             )
-        # If the override is provided, we want to use the default database(pass no using argument)
-        # Otherwise we want to use a separate database here so that the logs are created immediately
-        # instead of within transaction.atomic(). This allows us to be able to report logs when the jobs
-        # are running, and allow us to rollback the database without losing the log entries.
-        if not self.use_job_logs_db or not JOB_LOGS:
-            log.save()
-        else:
-            log.save(using=JOB_LOGS)
+        return log
+
+    def log(
+        self,
+        message,
+        obj=None,
+        level_choice=LogLevelChoices.LOG_INFO,
+        grouping="main",
+    ):
+        """
+        General-purpose API for storing log messages in a JobResult's 'data' field.
+
+        message (str): Message to log (an attempt will be made to sanitize sensitive information from this message)
+        obj (object): Object associated with this message, if any
+        level_choice (LogLevelChoices): Message severity level
+        grouping (str): Grouping to store the log message under
+        """
+        log = self.build_log_entry(message, obj=obj, level_choice=level_choice, grouping=grouping)
+        log.save(using=self.log_entries_database)
 
 
 #
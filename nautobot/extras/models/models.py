@@ -6,6 +6,7 @@ from db_file_storage.storage import DatabaseFileStorage
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.storage import get_storage_class
 from django.core.serializers.json import DjangoJSONEncoder
@@ -13,7 +14,6 @@ from django.core.validators import MinValueValidator
 from django.db import models
 from django.http import HttpResponse
 from graphene_django.settings import graphene_settings
-from graphql import get_default_backend
 from graphql.error import GraphQLSyntaxError
 from graphql.language.ast import OperationDefinition
 from jsonschema.exceptions import SchemaError, ValidationError as JSONSchemaValidationError
@@ -24,9 +24,12 @@ from nautobot.core.constants import CHARFIELD_MAX_LENGTH
 from nautobot.core.models import BaseManager, BaseModel
 from nautobot.core.models.fields import ForeignKeyWithAutoRelatedName, LaxURLField
 from nautobot.core.models.generics import OrganizationalModel, PrimaryModel
+from nautobot.core.models.querysets import RestrictedQuerySet
+from nautobot.core.utils.config import get_settings_or_config
 from nautobot.core.utils.data import deepmerge, render_jinja2
 from nautobot.extras.choices import (
     ButtonClassChoices,
+    ObjectChangeActionChoices,
     WebhookHttpMethodChoices,
 )
 from nautobot.extras.constants import HTTP_CONTENT_TYPE_JSON
@@ -189,10 +192,24 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
             ),
         ]
 
-    def get_config_context(self):
+    def get_config_context(self, use_cache=True):
         """
         Return the rendered configuration context for a device or VM.
+
+        If `use_cache` is True and `CONFIG_CONTEXT_CACHE_TIMEOUT` is non-zero, the cached config context is returned if
+        it is still current, and is otherwise rendered and cached.
         """
+        if use_cache and hasattr(self, "_cached_config_context"):
+            return self._cached_config_context
+        if (
+            use_cache
+            and not hasattr(self, "config_context_data")
+            and get_settings_or_config("CONFIG_CONTEXT_CACHE_TIMEOUT") != 0
+        ):
+            from nautobot.extras.config_contexts import get_cached_config_contexts
+
+            return get_cached_config_contexts([self])[self.pk]
+
         if not hasattr(self, "config_context_data"):
             # Annotation not available, so fall back to manually querying for the config context
             config_context_data = ConfigContext.objects.get_for_object(self).values_list("data", flat=True)
@@ -214,7 +231,10 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
 
     def clean(self):
         super().clean()
+        self.clean_local_config_context_data()
 
+    def clean_local_config_context_data(self):
+        """Validate the local config context data, against its schema if any."""
         # Verify that JSON data is provided as an object
         if self.local_config_context_data and not isinstance(self.local_config_context_data, dict):
             raise ValidationError(
@@ -655,11 +675,12 @@ class GraphQLQuery(BaseModel, ChangeLoggedModel, NotesMixin):
         verbose_name_plural = "GraphQL queries"
 
     def save(self, *args, **kwargs):
+        from nautobot.core.graphql.backend import get_graphql_backend
+
         variables = {}
         schema = graphene_settings.SCHEMA
-        backend = get_default_backend()
-        # Load query into GraphQL backend
-        document = backend.document_from_string(schema, self.query)
+        # Load query into GraphQL backend, which also caches it for execution as a persisted query
+        document = get_graphql_backend().document_from_string(schema, self.query)
 
         # Inspect the parsed document tree (document.document_ast) to retrieve the query (operation) definition(s)
         # that define one or more variables. For each operation and variable definition, store the variable's
@@ -678,11 +699,12 @@ class GraphQLQuery(BaseModel, ChangeLoggedModel, NotesMixin):
         return super().save(*args, **kwargs)
 
     def clean(self):
+        from nautobot.core.graphql.backend import get_graphql_backend
+
         super().clean()
         schema = graphene_settings.SCHEMA
-        backend = get_default_backend()
         try:
-            backend.document_from_string(schema, self.query)
+            get_graphql_backend().document_from_string(schema, self.query)
         except GraphQLSyntaxError as error:
             raise ValidationError({"query": error})
 
@@ -806,6 +828,34 @@ class Note(BaseModel, ChangeLoggedModel):
 #
 
 
+class WebhookManager(BaseManager.from_queryset(RestrictedQuerySet)):
+    use_in_migrations = True
+
+    def get_for_model(self, model, action):
+        """
+        Return all enabled Webhooks assigned to the given model that are called on the given action.
+
+        Args:
+            model: The django model whose changes are to be sent
+            action: The ObjectChangeActionChoices value of the change
+        """
+        concrete_model = model._meta.concrete_model
+        cache_key = f"{self.get_for_model.cache_key_prefix}.{concrete_model._meta.label_lower}.{action}"
+        webhooks = cache.get(cache_key)
+        if webhooks is None:
+            content_type = ContentType.objects.get_for_model(concrete_model)
+            action_flag = {
+                ObjectChangeActionChoices.ACTION_CREATE: "type_create",
+                ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
+                ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
+            }[action]
+            webhooks = list(self.get_queryset().filter(content_types=content_type, enabled=True, **{action_flag: True}))
+            cache.set(cache_key, webhooks)
+        return webhooks
+
+    get_for_model.cache_key_prefix = "nautobot.extras.webhook.get_for_model"
+
+
 @extras_features("graphql")
 class Webhook(BaseModel, ChangeLoggedModel, NotesMixin):
     """
@@ -877,6 +927,14 @@ class Webhook(BaseModel, ChangeLoggedModel, NotesMixin):
         "Leave blank to use the system defaults.",
         default="",
     )
+    batch_size = models.PositiveIntegerField(
+        default=1,
+        validators=[MinValueValidator(1)],
+        help_text="Maximum number of changes to send in each request. If greater than 1, the changes made in each "
+        "request or job are sent together, and the request body is a JSON array of the individual change bodies.",
+    )
+
+    objects = WebhookManager()
 
     class Meta:
         ordering = ("name",)
@@ -891,6 +949,12 @@ class Webhook(BaseModel, ChangeLoggedModel, NotesMixin):
         if not self.type_create and not self.type_delete and not self.type_update:
             raise ValidationError("You must select at least one type: create, update, and/or delete.")
 
+        # Batched change bodies are combined into a JSON array
+        if self.batch_size > 1 and self.http_content_type != HTTP_CONTENT_TYPE_JSON:
+            raise ValidationError(
+                {"batch_size": f"Batched delivery requires the HTTP content type {HTTP_CONTENT_TYPE_JSON}."}
+            )
+
         # CA file path requires SSL verification enabled
         if not self.ssl_verification and self.ca_file_path:
             raise ValidationError(
@@ -3,7 +3,6 @@ import logging
 from django import forms
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
@@ -26,7 +25,13 @@ from nautobot.core.utils.lookup import get_filterset_for_model, get_route_for_mo
 from nautobot.extras.choices import RelationshipRequiredSideChoices, RelationshipSideChoices, RelationshipTypeChoices
 from nautobot.extras.models import ChangeLoggedModel
 from nautobot.extras.models.mixins import NotesMixin
-from nautobot.extras.utils import check_if_key_is_graphql_safe, extras_features, FeatureQuery
+from nautobot.extras.utils import (
+    check_if_key_is_graphql_safe,
+    extras_features,
+    FeatureQuery,
+    metadata_cache,
+    queryset_from_snapshot,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -82,10 +87,9 @@ class RelationshipModel(models.Model):
                     },
                 }`
         """
-        src_relationships, dst_relationships = Relationship.objects.get_for_model(self)
-        if advanced_ui is not None:
-            src_relationships = src_relationships.filter(advanced_ui=advanced_ui)
-            dst_relationships = dst_relationships.filter(advanced_ui=advanced_ui)
+        src_relationships, dst_relationships = Relationship.objects.get_snapshot_for_model(
+            self, advanced_ui=advanced_ui
+        )
         content_type = ContentType.objects.get_for_model(self)
 
         sides = {
@@ -361,49 +365,82 @@ class RelationshipManager(BaseManager.from_queryset(RestrictedQuerySet)):
         """
         Return all Relationships assigned to the given model for the source side only.
 
+        The queryset is pre-populated from `get_snapshot_for_model()`, so iterating over it doesn't query the database.
+
         Args:
             model (Model): The django model to which relationships are registered
             hidden (bool): Filter based on the value of the hidden flag, or None to not apply this filter
         """
-        concrete_model = model._meta.concrete_model
-        cache_key = f"{self.get_for_model_source.cache_key_prefix}.{concrete_model._meta.label_lower}.{hidden}"
-        queryset = cache.get(cache_key)
-        if queryset is None:
-            content_type = ContentType.objects.get_for_model(concrete_model)
-            queryset = (
-                self.get_queryset().filter(source_type=content_type).select_related("source_type", "destination_type")
-            )  # You almost always will want access to the source_type/destination_type
-            if hidden is not None:
-                queryset = queryset.filter(source_hidden=hidden)
-            cache.set(cache_key, queryset)
-        return queryset
-
-    get_for_model_source.cache_key_prefix = "nautobot.extras.relationship.get_for_model_source"
+        content_type = ContentType.objects.get_for_model(model._meta.concrete_model)
+        queryset = (
+            self.get_queryset().filter(source_type=content_type).select_related("source_type", "destination_type")
+        )
+        if hidden is not None:
+            queryset = queryset.filter(source_hidden=hidden)
+        return queryset_from_snapshot(queryset, self.get_snapshot_for_model(model, hidden=hidden)[0])
 
     def get_for_model_destination(self, model, hidden=None):
         """
         Return all Relationships assigned to the given model for the destination side only.
 
+        The queryset is pre-populated from `get_snapshot_for_model()`, so iterating over it doesn't query the database.
+
         Args:
             model (Model): The django model to which relationships are registered
             hidden (bool): Filter based on the value of the hidden flag, or None to not apply this filter
         """
+        content_type = ContentType.objects.get_for_model(model._meta.concrete_model)
+        queryset = (
+            self.get_queryset().filter(destination_type=content_type).select_related("source_type", "destination_type")
+        )
+        if hidden is not None:
+            queryset = queryset.filter(destination_hidden=hidden)
+        return queryset_from_snapshot(queryset, self.get_snapshot_for_model(model, hidden=hidden)[1])
+
+    def get_snapshot_for_model(self, model, hidden=None, advanced_ui=None):
+        """
+        Return tuples of all Relationships assigned to the given model, cached in the memory of this process.
+
+        The Relationships are shared by all callers, and so must not be modified. Their `source_type` and
+        `destination_type` are loaded along with them.
+
+        Args:
+            model (Model): The django model to which relationships are registered
+            hidden (bool): Filter based on the value of the hidden flag of each side, or None to not apply this filter
+            advanced_ui (bool): Filter based on the value of the advanced_ui flag, or None to not apply this filter
+
+        Returns a tuple of the tuples of source and destination Relationships.
+        """
         concrete_model = model._meta.concrete_model
-        cache_key = f"{self.get_for_model_destination.cache_key_prefix}.{concrete_model._meta.label_lower}.{hidden}"
-        queryset = cache.get(cache_key)
-        if queryset is None:
+
+        def get_relationships():
             content_type = ContentType.objects.get_for_model(concrete_model)
-            queryset = (
+            relationships = tuple(
                 self.get_queryset()
-                .filter(destination_type=content_type)
+                .filter(Q(source_type=content_type) | Q(destination_type=content_type))
                 .select_related("source_type", "destination_type")
-            )  # You almost always will want access to the source_type/destination_type
-            if hidden is not None:
-                queryset = queryset.filter(destination_hidden=hidden)
-            cache.set(cache_key, queryset)
-        return queryset
+            )
+            return (
+                tuple(relationship for relationship in relationships if relationship.source_type_id == content_type.pk),
+                tuple(
+                    relationship
+                    for relationship in relationships
+                    if relationship.destination_type_id == content_type.pk
+                ),
+            )
 
-    get_for_model_destination.cache_key_prefix = "nautobot.extras.relationship.get_for_model_destination"
+        source, destination = metadata_cache.get_or_set(
+            ("relationship", concrete_model._meta.label_lower), get_relationships
+        )
+        if hidden is not None:
+            source = tuple(relationship for relationship in source if relationship.source_hidden == hidden)
+            destination = tuple(
+                relationship for relationship in destination if relationship.destination_hidden == hidden
+            )
+        if advanced_ui is not None:
+            source = tuple(relationship for relationship in source if relationship.advanced_ui == advanced_ui)
+            destination = tuple(relationship for relationship in destination if relationship.advanced_ui == advanced_ui)
+        return source, destination
 
     def get_required_for_model(self, model):
         """
@@ -0,0 +1,25 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+from nautobot.core.models import BaseModel
+
+
+class SearchIndexEntry(BaseModel):
+    """
+    Denormalized searchable text of an object, as maintained and queried by `nautobot.extras.search.IndexedSearchBackend`.
+    """
+
+    content_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE, related_name="+")
+    object_id = models.UUIDField()
+    # Values of the fields that are searched with a case-insensitive substring match, one per line
+    text = models.TextField(blank=True)
+    # Values of the fields that are searched with a (case-insensitive) exact match, one per line, with leading and
+    # trailing newlines so that each can be matched as a whole line
+    keywords = models.TextField(blank=True)
+
+    class Meta:
+        unique_together = [["content_type", "object_id"]]
+        verbose_name_plural = "search index entries"
+
+    def __str__(self):
+        return f"{self.content_type.model} {self.object_id}"
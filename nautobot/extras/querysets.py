@@ -1,7 +1,7 @@
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
-from django.db.models import F, Model, OuterRef, Q, Subquery
+from django.db.models import Exists, F, Model, OuterRef, Q, Subquery
 from django.db.models.functions import JSONObject
 
 from nautobot.core.models.query_functions import EmptyGroupByJSONBAgg
@@ -182,13 +182,58 @@ class DynamicGroupQuerySet(RestrictedQuerySet):
         # optimize the query.
         eligible_groups = self._get_eligible_dynamic_groups(obj, use_cache=use_cache)
 
+        if use_cache and get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT") != 0:
+            # Look up all of the object's groups at once from their cached members.
+            from nautobot.extras.models.groups import DynamicGroupCachedMember
+
+            eligible_groups = list(eligible_groups)
+            self._refresh_stale_cached_members(eligible_groups)
+            group_ids = set(
+                DynamicGroupCachedMember.objects.filter(associated_object_id=obj.pk).values_list(
+                    "dynamic_group_id", flat=True
+                )
+            )
+            return [dynamic_group for dynamic_group in eligible_groups if dynamic_group.pk in group_ids]
+
         # Filter down to matching groups.
-        my_groups = []
-        for dynamic_group in list(eligible_groups):
-            if dynamic_group.has_member(obj, use_cache=use_cache):
-                my_groups.append(dynamic_group)
+        return self._get_member_groups(obj, eligible_groups)
+
+    @staticmethod
+    def _get_member_groups(obj, dynamic_groups):
+        """
+        Return those of the given `DynamicGroup` objects that the given object is a member of.
+
+        Rather than querying the members of each group in turn, this checks the object's membership of all of the
+        groups in a single query, as one `Exists()` annotation per group on a query for the object itself.
+        """
+        from nautobot.extras.models.groups import DynamicGroupMembership
 
-        return my_groups
+        dynamic_groups = list(dynamic_groups)
+        if not dynamic_groups:
+            return []
+
+        # Equivalent to `dynamic_group.members`, but without a query per group to check whether it has child groups
+        parent_group_ids = set(
+            DynamicGroupMembership.objects.filter(parent_group__in=dynamic_groups).values_list(
+                "parent_group_id", flat=True
+            )
+        )
+        annotations = {}
+        for i, dynamic_group in enumerate(dynamic_groups):
+            if dynamic_group.pk in parent_group_ids:
+                members = dynamic_group.get_group_queryset()
+            else:
+                members = dynamic_group.get_queryset()
+            # An empty queryset (such as for an invalid filter) can't be compiled into a subquery
+            if not members.query.is_empty():
+                annotations[f"member_of_{i}"] = Exists(members.filter(pk=OuterRef("pk")))
+        if not annotations:
+            return []
+
+        membership = type(obj).objects.filter(pk=obj.pk).annotate(**annotations).values(*annotations).first()
+        if membership is None:
+            return []
+        return [dynamic_group for i, dynamic_group in enumerate(dynamic_groups) if membership.get(f"member_of_{i}")]
 
     def get_for_object(self, obj, use_cache=False):
         """
@@ -203,6 +248,97 @@ class DynamicGroupQuerySet(RestrictedQuerySet):
     def get_by_natural_key(self, slug):
         return self.get(slug=slug)
 
+    @staticmethod
+    def _refresh_stale_cached_members(dynamic_groups):
+        """Refresh the cached members of any of the given `DynamicGroup` objects that aren't current."""
+        timeout = get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT")
+        current = cache.get_many([dynamic_group.members_cache_key for dynamic_group in dynamic_groups])
+        for dynamic_group in dynamic_groups:
+            if dynamic_group.members_cache_key not in current:
+                dynamic_group._refresh_cached_members(timeout)
+
+    def update_cached_members_for_object(self, obj, deleted=False):
+        """
+        Update the cached members of the `DynamicGroup` objects eligible to contain the given object after it has been
+        saved or deleted.
+
+        Only groups whose cached members are current are updated; any others will be fully refreshed when next used.
+
+        Args:
+            obj: The object that was saved or deleted.
+            deleted: If True, the object was deleted and is no longer a member of any group.
+        """
+        from nautobot.extras.models.groups import DynamicGroupCachedMember
+
+        if get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT") == 0:
+            return
+
+        cached_members = DynamicGroupCachedMember.objects.filter(associated_object_id=obj.pk)
+        if deleted:
+            cached_members._raw_delete(cached_members.db)  # pylint: disable=protected-access
+            return
+
+        eligible_groups = list(self._get_eligible_dynamic_groups(obj, use_cache=True))
+        current = cache.get_many([dynamic_group.members_cache_key for dynamic_group in eligible_groups])
+        current_groups = [
+            dynamic_group for dynamic_group in eligible_groups if dynamic_group.members_cache_key in current
+        ]
+        if not current_groups:
+            return
+
+        member_group_ids = {dynamic_group.pk for dynamic_group in self._get_member_groups(obj, current_groups)}
+        cached_members = cached_members.filter(dynamic_group__in=current_groups)
+        cached_group_ids = set(cached_members.values_list("dynamic_group_id", flat=True))
+
+        removed_members = cached_members.filter(dynamic_group_id__in=cached_group_ids - member_group_ids)
+        removed_members._raw_delete(removed_members.db)  # pylint: disable=protected-access
+        DynamicGroupCachedMember.objects.bulk_create(
+            [
+                DynamicGroupCachedMember(dynamic_group_id=dynamic_group_id, associated_object_id=obj.pk)
+                for dynamic_group_id in member_group_ids - cached_group_ids
+            ],
+            # Another process may have cached the same membership concurrently
+            ignore_conflicts=True,
+        )
+
+    def update_cached_members_for_objects(self, model, pks):
+        """
+        Update the cached members of the `DynamicGroup` objects eligible to contain objects of the given model, after the
+        objects with the given primary keys have been updated in bulk (for example, by `QuerySet.update()`) without
+        sending their `post_save` signals.
+
+        As with `update_cached_members_for_object()`, only groups whose cached members are current are updated; this
+        takes one query per group for all of the given objects.
+
+        Args:
+            model: The model of the updated objects.
+            pks: The primary keys of the updated objects.
+        """
+        from nautobot.extras.models.groups import DynamicGroupCachedMember
+
+        if get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT") == 0 or not pks:
+            return
+
+        eligible_groups = list(self.filter(content_type=ContentType.objects.get_for_model(model)))
+        current = cache.get_many([dynamic_group.members_cache_key for dynamic_group in eligible_groups])
+        for dynamic_group in eligible_groups:
+            if dynamic_group.members_cache_key not in current:
+                continue
+            member_ids = set(dynamic_group.members.filter(pk__in=pks).values_list("pk", flat=True))
+            cached_members = dynamic_group.cached_members.filter(associated_object_id__in=pks)
+            cached_member_ids = set(cached_members.values_list("associated_object_id", flat=True))
+
+            removed_members = cached_members.filter(associated_object_id__in=cached_member_ids - member_ids)
+            removed_members._raw_delete(removed_members.db)  # pylint: disable=protected-access
+            DynamicGroupCachedMember.objects.bulk_create(
+                [
+                    DynamicGroupCachedMember(dynamic_group=dynamic_group, associated_object_id=pk)
+                    for pk in member_ids - cached_member_ids
+                ],
+                # Another process may have cached the same membership concurrently
+                ignore_conflicts=True,
+            )
+
     @classmethod
     def _get_eligible_dynamic_groups_cache_key(cls, obj):
         """
@@ -0,0 +1,347 @@
+"""Backends for Nautobot's global search, as selected by the `SEARCH_BACKEND` setting."""
+
+from collections import defaultdict
+import functools
+import logging
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connection, transaction
+from django.db.models import Case, Count, FloatField, Q, Value, When
+from django.urls import resolve, reverse
+from django.utils.module_loading import import_string
+
+from nautobot.core.constants import SEARCH_MAX_RESULTS
+from nautobot.core.filters import MappedPredicatesFilterMixin
+from nautobot.core.utils.lookup import get_route_for_model
+from nautobot.extras.models import SearchIndexEntry
+
+logger = logging.getLogger(__name__)
+
+# Search filter lookups that can be answered from a SearchIndexEntry's `text` and `keywords` respectively
+CONTAINS_LOOKUPS = ("icontains",)
+EXACT_LOOKUPS = ("exact", "iexact")
+
+
+def get_searchable_models():
+    """Return the models included in the global search, based on the `searchable_models` list of each app."""
+    searchable_models = []
+    for app_config in apps.get_app_configs():
+        for modelname in getattr(app_config, "searchable_models", []):
+            searchable_models.append(app_config.get_model(modelname))
+    return searchable_models
+
+
+@functools.lru_cache(maxsize=None)
+def get_search_view_attributes(model):
+    """
+    Return the base queryset, filterset class, and table class of the list view of the given model, and its URL name.
+    """
+    # Based on the model, reverse-lookup the list URL, then the view or UIViewSet corresponding to that URL,
+    # and finally the queryset, filterset, and table classes needed to find and display the model search results.
+    url = get_route_for_model(model, "list")
+    view_func = resolve(reverse(url)).func
+    # For a UIViewSet, view_func.cls gets what we need; for an ObjectListView, view_func.view_class is it.
+    view_or_viewset = getattr(view_func, "cls", getattr(view_func, "view_class", None))
+    # For a UIViewSet, .filterset_class, for an ObjectListView, .filterset.
+    filterset = getattr(view_or_viewset, "filterset_class", getattr(view_or_viewset, "filterset", None))
+    # For a UIViewSet, .table_class, for an ObjectListView, .table.
+    table = getattr(view_or_viewset, "table_class", getattr(view_or_viewset, "table", None))
+    return view_or_viewset.queryset, filterset, table, url
+
+
+def _is_multivalued_path(model, path):
+    """
+    Return whether the given field path may have several values for a single instance of the model, or None if it
+    isn't a path of concrete fields and relations to change-logged models.
+    """
+    multivalued = False
+    for field_name in path.split("__"):
+        if model is None:
+            return None
+        try:
+            field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return None
+        if not field.is_relation:
+            model = None
+            continue
+        if field.many_to_many or field.one_to_many:
+            multivalued = True
+        model = field.related_model
+        # Entries are only updated when changes are logged, so they can't depend on models that aren't change-logged
+        if model is not None and not hasattr(model, "to_objectchange"):
+            return None
+    return multivalued
+
+
+@functools.lru_cache(maxsize=None)
+def get_search_fields(model):
+    """
+    Return the field paths searched by the `q` filter of the model's filterset, as a dictionary mapping each path to
+    whether it is searched by an exact (rather than substring) match and whether it is multi-valued.
+
+    Returns None if the filter can't be answered from the search index, for example because it uses a custom method.
+    """
+    _, filterset, _, _ = get_search_view_attributes(model)
+    q_filter = filterset.base_filters.get("q") if filterset is not None else None
+    if not isinstance(q_filter, MappedPredicatesFilterMixin):
+        return None
+
+    search_fields = {}
+    for path, lookup_info in q_filter.filter_predicates.items():
+        lookup_expr = lookup_info if isinstance(lookup_info, str) else lookup_info.get("lookup_expr")
+        if lookup_expr not in CONTAINS_LOOKUPS + EXACT_LOOKUPS:
+            return None
+        multivalued = _is_multivalued_path(model, path)
+        if multivalued is None:
+            return None
+        search_fields[path] = (lookup_expr in EXACT_LOOKUPS, multivalued)
+    return search_fields
+
+
+@functools.lru_cache(maxsize=None)
+def get_search_dependencies():
+    """
+    Return a dictionary mapping each model whose fields are searched through a relation by the `q` filter of an
+    indexed model, such as the Manufacturer of a DeviceType's `manufacturer__name`, to a list of `(model, lookup)`
+    pairs, where the objects of the indexed model whose entries depend on the given related objects are those that
+    match `{lookup: related_pks}`.
+    """
+    dependencies = defaultdict(list)
+    for model in get_searchable_models():
+        search_fields = get_search_fields(model)
+        if search_fields is None:
+            continue
+        for path in search_fields:
+            field_names = path.split("__")
+            related_model = model
+            # The last field of a path holds the searched value itself, so only the relations leading to it matter
+            for i, field_name in enumerate(field_names[:-1]):
+                related_model = related_model._meta.get_field(field_name).related_model
+                dependency = (model, "__".join(field_names[: i + 1]) + "__in")
+                if dependency not in dependencies[related_model]:
+                    dependencies[related_model].append(dependency)
+    return dict(dependencies)
+
+
+def get_search_backend():
+    """Return the global search backend configured by `settings.SEARCH_BACKEND`."""
+    return _load_search_backend(settings.SEARCH_BACKEND)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_search_backend(path):
+    return import_string(path)()
+
+
+class SearchBackend:
+    """
+    Base class for global search backends.
+
+    Subclasses must implement `search()`; those that maintain an index of their own should also implement
+    `update_index()` and `rebuild_index()` and set `indexed = True`.
+    """
+
+    indexed = False
+
+    def search(self, user, query, models):
+        """
+        Search the given models for objects that match the given query and that the user is permitted to view.
+
+        Returns:
+            (list): A dict for each model with matching objects, in the same order as `models`, with keys "model",
+                "queryset" (the matching objects to display) and "count" (the total number of matching objects, or
+                None if it is simply the number of objects in "queryset").
+        """
+        raise NotImplementedError
+
+    def update_index(self, changed_objects):
+        """Update the index for the given `(content_type_id, object_id)` pairs, which may have been deleted."""
+
+    def rebuild_index(self, models=None):
+        """Rebuild the index for the given models, or for all searchable models."""
+
+    def filterset_search(self, user, query, model):
+        """Search the given model with the `q` filter of its list view's filterset, as the global search always has."""
+        queryset, filterset, _, _ = get_search_view_attributes(model)
+        queryset = filterset({"q": query}, queryset=queryset.restrict(user, "view")).qs
+        return {"model": model, "queryset": queryset, "count": None}
+
+
+class FilterSetSearchBackend(SearchBackend):
+    """Search backend that queries each model in turn, with the `q` filter of the filterset of its list view."""
+
+    def search(self, user, query, models):
+        return [self.filterset_search(user, query, model) for model in models]
+
+
+class IndexedSearchBackend(SearchBackend):
+    """
+    Search backend that queries a single table of denormalized searchable text, `SearchIndexEntry`, for all models.
+
+    The text of each object is built from the same fields that are searched by the `q` filter of the filterset of
+    its model's list view, and is updated as changes to objects, and to the related objects whose fields they are
+    searched by, are logged. Models whose `q` filter can't be answered from the index (for example, IP addresses and
+    prefixes, which are searched by network) are searched with their filterset, as by `FilterSetSearchBackend`.
+    """
+
+    indexed = True
+
+    def get_entries(self, user, query, models, ranked=True):
+        """
+        Return the SearchIndexEntries for the objects of the given models that match the query and that the user is
+        permitted to view, in a single query. Unless `ranked` is False, these are annotated with their `rank` and
+        ordered by descending rank.
+        """
+        keyword = f"\n{query.strip()}\n"
+        permitted = Q()
+        for model in models:
+            queryset, _, _, _ = get_search_view_attributes(model)
+            permitted |= Q(
+                content_type=ContentType.objects.get_for_model(model),
+                object_id__in=queryset.restrict(user, "view").values("pk"),
+            )
+        if not permitted:
+            return SearchIndexEntry.objects.none()
+
+        entries = SearchIndexEntry.objects.filter(Q(text__icontains=query) | Q(keywords__icontains=keyword)).filter(
+            permitted
+        )
+        if not ranked:
+            return entries
+
+        rank = Case(
+            When(keywords__icontains=keyword, then=Value(3.0)),
+            When(text__istartswith=query, then=Value(2.0)),
+            When(text__icontains=f"\n{query}", then=Value(1.0)),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+        if connection.vendor == "postgresql":
+            from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+            rank = rank + SearchRank(
+                SearchVector("text", config="simple"), SearchQuery(query, config="simple", search_type="plain")
+            )
+
+        return entries.annotate(rank=rank).order_by("-rank", "object_id")
+
+    def search(self, user, query, models):
+        indexed_models = [model for model in models if get_search_fields(model) is not None]
+        counts = dict(
+            self.get_entries(user, query, indexed_models, ranked=False)
+            .order_by()
+            .values_list("content_type")
+            .annotate(count=Count("pk"))
+        )
+        entries = self.get_entries(user, query, indexed_models)
+
+        results = []
+        for model in models:
+            if model not in indexed_models:
+                results.append(self.filterset_search(user, query, model))
+                continue
+            content_type = ContentType.objects.get_for_model(model)
+            if not counts.get(content_type.pk):
+                continue
+            object_ids = list(
+                entries.filter(content_type=content_type).values_list("object_id", flat=True)[:SEARCH_MAX_RESULTS]
+            )
+            queryset, _, _, _ = get_search_view_attributes(model)
+            # Display the objects in the order of their rank
+            queryset = (
+                queryset.restrict(user, "view")
+                .filter(pk__in=object_ids)
+                .order_by(Case(*[When(pk=pk, then=Value(i)) for i, pk in enumerate(object_ids)]))
+            )
+            results.append({"model": model, "queryset": queryset, "count": counts[content_type.pk]})
+        return results
+
+    def update_index(self, changed_objects):
+        object_ids = defaultdict(set)
+        for content_type_id, object_id in changed_objects:
+            object_ids[content_type_id].add(object_id)
+
+        searchable_models = set(get_searchable_models())
+        dependencies = get_search_dependencies()
+        models_ids = defaultdict(set)
+        for content_type_id, ids in object_ids.items():
+            model = ContentType.objects.get_for_id(content_type_id).model_class()
+            if model in searchable_models and get_search_fields(model) is not None:
+                models_ids[model] |= ids
+            # Objects that are searched by the fields of a changed related object must be reindexed as well
+            for dependent_model, lookup in dependencies.get(model, []):
+                models_ids[dependent_model].update(
+                    dependent_model.objects.filter(**{lookup: ids}).values_list("pk", flat=True).distinct()
+                )
+
+        for model, ids in models_ids.items():
+            self.index_objects(model, ids)
+
+    def rebuild_index(self, models=None, chunk_size=1000):
+        if models is None:
+            models = get_searchable_models()
+        for model in models:
+            if get_search_fields(model) is None:
+                continue
+            content_type = ContentType.objects.get_for_model(model)
+            logger.info("Rebuilding the search index for %s", model._meta.verbose_name_plural)
+            # Remove the entries of any objects that no longer exist
+            SearchIndexEntry.objects.filter(content_type=content_type).exclude(
+                object_id__in=model.objects.values("pk")
+            ).delete()
+            pks = []
+            for pk in model.objects.values_list("pk", flat=True).iterator(chunk_size=chunk_size):
+                pks.append(pk)
+                if len(pks) >= chunk_size:
+                    self.index_objects(model, pks)
+                    pks = []
+            if pks:
+                self.index_objects(model, pks)
+
+    def index_objects(self, model, pks):
+        """Create or replace the entries for the given objects of the model, removing those of any that don't exist."""
+        search_fields = get_search_fields(model)
+        content_type = ContentType.objects.get_for_model(model)
+        queryset = model.objects.filter(pk__in=pks)
+
+        text = defaultdict(list)
+        keywords = defaultdict(list)
+
+        def add_value(pk, path, value):
+            if value is None or value == "":
+                return
+            exact, _ = search_fields[path]
+            (keywords if exact else text)[pk].append(str(value).replace("\n", " ") if exact else str(value))
+
+        # Fields with a single value per object are retrieved together, along with the PKs of all existing objects
+        single_paths = [path for path, (_, multivalued) in search_fields.items() if not multivalued]
+        existing_pks = []
+        for pk, *values in queryset.values_list("pk", *single_paths):
+            existing_pks.append(pk)
+            for path, value in zip(single_paths, values):
+                add_value(pk, path, value)
+
+        # Each multi-valued field is retrieved separately, to avoid multiplying the rows retrieved for each object
+        for path, (_, multivalued) in search_fields.items():
+            if multivalued:
+                for pk, value in queryset.values_list("pk", path):
+                    add_value(pk, path, value)
+
+        with transaction.atomic():
+            SearchIndexEntry.objects.filter(content_type=content_type, object_id__in=pks).delete()
+            SearchIndexEntry.objects.bulk_create(
+                [
+                    SearchIndexEntry(
+                        content_type=content_type,
+                        object_id=pk,
+                        text="\n".join(text[pk]),
+                        keywords="\n" + "".join(f"{value}\n" for value in keywords[pk]),
+                    )
+                    for pk in existing_pks
+                ],
+                batch_size=1000,
+            )
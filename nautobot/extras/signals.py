@@ -1,20 +1,20 @@
 import contextlib
 import contextvars
-from datetime import timedelta
 import logging
 import os
-import secrets
 import shutil
 import traceback
 
 from db_file_storage.model_utils import delete_file
 from db_file_storage.storage import DatabaseFileStorage
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.storage import get_storage_class
 from django.db import transaction
+from django.db.models import Q
 from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
@@ -25,22 +25,33 @@ from nautobot.core.celery import app, import_jobs
 from nautobot.core.models import BaseModel
 from nautobot.core.utils.config import get_settings_or_config
 from nautobot.core.utils.logging import sanitize
-from nautobot.extras.choices import JobResultStatusChoices, ObjectChangeActionChoices
+from nautobot.extras.choices import JobExecutionType, JobResultStatusChoices, ObjectChangeActionChoices
+from nautobot.extras.config_contexts import (
+    bump_generations,
+    ConfigContextRenderer,
+    get_config_context_generation_keys,
+    get_generation_key,
+    invalidate_config_contexts_on_commit,
+)
 from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
 from nautobot.extras.models import (
     ComputedField,
+    ConfigContext,
     ContactAssociation,
     CustomField,
+    CustomFieldChoice,
     DynamicGroup,
     DynamicGroupMembership,
     GitRepository,
     JobResult,
     ObjectChange,
     Relationship,
+    Webhook,
 )
 from nautobot.extras.querysets import NotesQuerySet
+from nautobot.extras.registry import registry
 from nautobot.extras.tasks import delete_custom_field_data, provision_field
-from nautobot.extras.utils import refresh_job_model_from_job_class
+from nautobot.extras.utils import metadata_cache, refresh_job_model_from_job_class
 
 # thread safe change context state variable
 change_context_state = contextvars.ContextVar("change_context_state", default=None)
@@ -70,27 +81,19 @@ def get_user_if_authenticated(user, instance):
 @receiver(m2m_changed)
 @receiver(post_delete)
 def invalidate_models_cache(sender, **kwargs):
-    """Invalidate the related-models cache for ComputedFields, CustomFields and Relationships."""
-    if sender is CustomField.content_types.through:
-        manager = CustomField.objects
-    elif sender in (ComputedField, CustomField, Relationship):
-        manager = sender.objects
-    else:
-        return
-
-    cached_methods = (
-        "get_for_model",
-        "get_for_model_source",
-        "get_for_model_destination",
-    )
-
-    for method_name in cached_methods:
-        if hasattr(manager, method_name):
-            method = getattr(manager, method_name)
-            if hasattr(method, "cache_key_prefix"):
-                with contextlib.suppress(redis.exceptions.ConnectionError):
-                    # TODO: *maybe* target more narrowly, e.g. only clear the cache for specific related content-types?
-                    cache.delete_pattern(f"{method.cache_key_prefix}.*")
+    """Invalidate the related-models cache for ComputedFields, CustomFields, Relationships and Webhooks."""
+    if sender in (
+        ComputedField,
+        CustomField,
+        CustomField.content_types.through,
+        CustomFieldChoice,
+        Relationship,
+    ):
+        # A single counter increment in the shared cache, rather than a scan for and deletion of each cache key
+        metadata_cache.invalidate()
+    elif sender in (Webhook, Webhook.content_types.through):
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            cache.delete_pattern(f"{Webhook.objects.get_for_model.cache_key_prefix}.*")
 
 
 @receiver(post_save)
@@ -143,8 +146,15 @@ def _handle_changed_object(sender, instance, raw=False, **kwargs):
                 request_id=change_context.change_id,
             )
 
-            # Skip the database check when deferring object changes
-            if not change_context.defer_object_changes and related_changes.exists():
+            # Skip the database check when deferring object changes; just serialize the latest instance later on
+            if change_context.defer_object_changes:
+                cached_related_change = change_context.deferred_object_changes[unique_object_change_id][-1]
+                if cached_related_change["action"] == ObjectChangeActionChoices.ACTION_DELETE:
+                    cached_related_change["action"] = ObjectChangeActionChoices.ACTION_UPDATE
+                    cached_related_change.pop("objectchange", None)
+                if "objectchange" not in cached_related_change:
+                    cached_related_change["instance"] = instance
+            elif related_changes.exists():
                 objectchange = instance.to_objectchange(action)
                 most_recent_change = related_changes.order_by("-time").first()
                 if most_recent_change.action == ObjectChangeActionChoices.ACTION_DELETE:
@@ -174,12 +184,6 @@ def _handle_changed_object(sender, instance, raw=False, **kwargs):
     elif action == ObjectChangeActionChoices.ACTION_UPDATE:
         model_updates.labels(instance._meta.model_name).inc()
 
-    # Housekeeping: 0.1% chance of clearing out expired ObjectChanges
-    changelog_retention = get_settings_or_config("CHANGELOG_RETENTION")
-    if changelog_retention and secrets.randbelow(1000) == 0:
-        cutoff = timezone.now() - timedelta(days=changelog_retention)
-        ObjectChange.objects.filter(time__lt=cutoff).delete()
-
 
 @receiver(pre_delete)
 def _handle_deleted_object(sender, instance, **kwargs):
@@ -225,6 +229,10 @@ def _handle_deleted_object(sender, instance, **kwargs):
             if cached_related_change["action"] != ObjectChangeActionChoices.ACTION_CREATE:
                 cached_related_change["action"] = ObjectChangeActionChoices.ACTION_DELETE
                 save_new_objectchange = False
+            if change_context.defer_object_changes:
+                # The object can't be serialized once it has been deleted, so record its final state now
+                cached_related_change["objectchange"] = instance.to_objectchange(cached_related_change["action"])
+                cached_related_change["changed_object_id"] = instance.pk
 
             related_changes = ObjectChange.objects.filter(
                 changed_object_type=changed_object_type,
@@ -253,7 +261,11 @@ def _handle_deleted_object(sender, instance, **kwargs):
                     "changed_object_id": instance.pk,
                 }
             )
-            if not change_context.defer_object_changes:
+            if change_context.defer_object_changes:
+                change_context.deferred_object_changes[unique_object_change_id][-1]["objectchange"] = (
+                    instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
+                )
+            else:
                 objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
                 objectchange.user = user
                 objectchange.request_id = change_context.change_id
@@ -356,6 +368,87 @@ def git_repository_pre_delete(instance, **kwargs):
         job_result.save()
 
 
+#
+# Config contexts
+#
+
+
+def config_context_invalidate_cache(sender, instance, raw=False, **kwargs):
+    """
+    When a ConfigContext or its assignments are about to change, invalidate the cached config contexts of the objects
+    that it applies to at present, and when the change has been made, those of the objects that it now applies to.
+    """
+    if raw or get_settings_or_config("CONFIG_CONTEXT_CACHE_TIMEOUT") == 0:
+        # Caching is disabled, so there's nothing to do
+        return
+
+    signal = kwargs["signal"]
+    action = kwargs.get("action")
+    if (
+        signal is pre_delete
+        or action in ("pre_add", "pre_remove", "pre_clear")
+        or (signal is pre_save and instance.present_in_database)
+    ):
+        # Capture the objects that the config context applies to before the change
+        invalidate_config_contexts_on_commit(get_config_context_generation_keys([instance]))
+    elif signal is post_save or action in ("post_add", "post_remove", "post_clear"):
+        # Capture the objects that the config context applies to once all changes in this transaction are made
+        transaction.on_commit(lambda: bump_generations(get_config_context_generation_keys([instance])))
+
+
+pre_save.connect(config_context_invalidate_cache, sender=ConfigContext)
+post_save.connect(config_context_invalidate_cache, sender=ConfigContext)
+pre_delete.connect(config_context_invalidate_cache, sender=ConfigContext)
+for _dimension in ConfigContextRenderer.DIMENSIONS:
+    m2m_changed.connect(config_context_invalidate_cache, sender=getattr(ConfigContext, _dimension).through)
+
+
+def config_context_tree_node_changed(sender, instance, created=False, raw=False, **kwargs):
+    """
+    When a Location or TenantGroup is updated, possibly moving it in its tree, invalidate the cached config contexts of
+    objects assigned to it or to any of its descendants, whose inherited config contexts may have changed as a result.
+    """
+    if created or raw or get_settings_or_config("CONFIG_CONTEXT_CACHE_TIMEOUT") == 0:
+        return
+
+    name = sender._meta.model_name
+    keys = [get_generation_key(name, pk) for pk in instance.descendants(include_self=True).values_list("pk", flat=True)]
+    invalidate_config_contexts_on_commit(keys)
+
+
+post_save.connect(config_context_tree_node_changed, sender="dcim.Location")
+post_save.connect(config_context_tree_node_changed, sender="tenancy.TenantGroup")
+
+
+def config_context_assigned_object_changed(sender, instance, created=False, raw=False, **kwargs):
+    """
+    When an object that config contexts are assigned to is deleted, or a DynamicGroup is updated, invalidate the cached
+    config contexts of the objects that those config contexts may now apply to.
+    """
+    if created or raw or get_settings_or_config("CONFIG_CONTEXT_CACHE_TIMEOUT") == 0:
+        return
+
+    config_context_pks = set()
+    for dimension in ConfigContextRenderer.DIMENSIONS:
+        if ConfigContext._meta.get_field(dimension).related_model is sender:
+            config_context_pks.update(
+                ConfigContext.objects.filter(**{dimension: instance}).values_list("pk", flat=True)
+            )
+    if config_context_pks:
+        transaction.on_commit(
+            lambda: bump_generations(
+                get_config_context_generation_keys(ConfigContext.objects.filter(pk__in=config_context_pks))
+            )
+        )
+
+
+for _dimension in ConfigContextRenderer.DIMENSIONS:
+    pre_delete.connect(
+        config_context_assigned_object_changed, sender=ConfigContext._meta.get_field(_dimension).related_model
+    )
+post_save.connect(config_context_assigned_object_changed, sender=DynamicGroup)
+
+
 #
 # Dynamic Groups
 #
@@ -447,6 +540,30 @@ post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroup)
 post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroupMembership)
 
 
+def dynamic_group_update_cached_members_for_object(sender, instance, raw=False, **kwargs):
+    """
+    When an object that can belong to DynamicGroups is saved, deleted, or has its tags or other many-to-many fields
+    changed, update its membership in the cached members of those groups.
+    """
+    if raw:
+        return
+
+    if kwargs.get("action") not in (None, "post_add", "post_remove", "post_clear") or kwargs.get("reverse"):
+        # Only handle the completion of m2m changes made from this instance's side of the relation
+        return
+
+    model = type(instance)
+    if model._meta.model_name not in registry["model_features"]["dynamic_groups"].get(model._meta.app_label, []):
+        return
+
+    DynamicGroup.objects.update_cached_members_for_object(instance, deleted=kwargs["signal"] is post_delete)
+
+
+post_save.connect(dynamic_group_update_cached_members_for_object)
+post_delete.connect(dynamic_group_update_cached_members_for_object)
+m2m_changed.connect(dynamic_group_update_cached_members_for_object)
+
+
 #
 # Jobs
 #
@@ -494,3 +611,42 @@ def refresh_job_models(sender, *, apps, **kwargs):
             )
             job_model.installed = False
             job_model.save()
+
+
+def ensure_logs_cleanup_schedule(sender, *, apps, **kwargs):
+    """
+    Callback for the nautobot_database_ready signal; schedules the Logs Cleanup system Job to run daily, unless it's
+    already scheduled, so that `CHANGELOG_RETENTION` is enforced without deleting expired changes in user requests.
+    """
+    from nautobot.core.jobs.cleanup import CleanupTypes, LogsCleanup  # avoid circular import
+    from nautobot.extras.models import Job, ScheduledJob
+
+    # To make reverse migrations safe
+    if not hasattr(apps.get_model("extras", "ScheduledJob"), "celery_kwargs"):
+        logger.info("Skipping ensure_logs_cleanup_schedule() as ScheduledJob has not yet been migrated to latest.")
+        return
+
+    # An existing schedule, even a disabled one, is left as the administrator configured it
+    name = "Logs Cleanup"
+    if ScheduledJob.objects.filter(Q(task=LogsCleanup.class_path) | Q(name=name)).exists():
+        return
+    job_model = Job.objects.filter(module_name=LogsCleanup.__module__, job_class_name=LogsCleanup.__name__).first()
+    if job_model is None:
+        return
+    # Scheduled Jobs run as the user who scheduled them, who must be permitted to delete the expired records
+    user = get_user_model().objects.filter(is_superuser=True, is_active=True).order_by("date_joined").first()
+    if user is None:
+        logger.info("Not scheduling the Logs Cleanup Job until a superuser has been created")
+        return
+
+    ScheduledJob(
+        name=name,
+        task=LogsCleanup.class_path,
+        job_model=job_model,
+        start_time=ScheduledJob.earliest_possible_time(),
+        description="Daily deletion of change log entries older than CHANGELOG_RETENTION",
+        kwargs={"cleanup_types": [CleanupTypes.OBJECT_CHANGE]},
+        interval=JobExecutionType.TYPE_DAILY,
+        user=user,
+    ).validated_save()
+    logger.info("Scheduled the Logs Cleanup Job to run daily as %s", user)
@@ -1135,6 +1135,7 @@ class WebhookTable(BaseTable):
             "type_delete",
             "ssl_verification",
             "ca_file_path",
+            "batch_size",
         )
         default_columns = (
             "pk",
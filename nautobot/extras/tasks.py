@@ -1,18 +1,129 @@
+from contextlib import contextmanager
 from logging import getLogger
+import urllib.parse
 
+from celery import current_task
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
+from django.utils import timezone
 from jinja2.exceptions import TemplateError
 import requests
 
 from nautobot.core.celery import nautobot_task
+from nautobot.core.models.query_functions import JSONArrayReplace, JSONRemove, JSONSet
 from nautobot.extras.choices import CustomFieldTypeChoices, ObjectChangeActionChoices
-from nautobot.extras.utils import generate_signature
+from nautobot.extras.utils import bulk_create_object_changes, generate_signature
 
 logger = getLogger("nautobot.extras.tasks")
 
 
+def _get_job_result():
+    """Return the JobResult of the currently running task, if it has one, to report the task's progress to."""
+    from nautobot.extras.models import JobResult  # avoiding circular import
+
+    task_id = getattr(current_task.request, "id", None) if current_task else None
+    if task_id is None:
+        return None
+    return JobResult.objects.filter(pk=task_id).first()
+
+
+def _report_progress(job_result, message, *args):
+    """Log the given progress message, and record it in the given JobResult, if any."""
+    logger.info(message, *args)
+    if job_result is not None:
+        job_result.log(message % args, grouping="progress")
+
+
+@contextmanager
+def _change_logging(change_context):
+    """
+    Enter the change context described by the given dict, if any, and a transaction, yielding the `ChangeContext`.
+
+    The whole update is made in a single transaction, so that it is either made in full or not at all, as when each
+    object was saved in turn.
+    """
+    # Circular Import
+    from nautobot.extras.context_managers import web_request_context
+    from nautobot.extras.signals import change_context_state
+
+    if change_context is None:
+        with transaction.atomic():
+            yield None
+        return
+
+    with web_request_context(
+        user=change_context.get("user"),
+        change_id=change_context.get("change_id"),
+        context_detail=change_context.get("context_detail"),
+        context=change_context.get("context"),
+    ):
+        context = change_context_state.get()
+        # Create the object changes for each chunk as it's updated, rather than holding every object in memory until
+        # the transaction is committed
+        context.defer_object_changes = False
+        with transaction.atomic():
+            yield context
+
+
+def _update_custom_field_data(queryset, expression, change_context=None, job_result=None, chunk_size=1000):
+    """
+    Set the `_custom_field_data` of every object in `queryset` to `expression`, `chunk_size` objects at a time.
+
+    `queryset` should be based on the model's `_base_manager`, as some default managers (such as those of tree models)
+    annotate their querysets in ways that can't be used in an UPDATE query. Each chunk is selected by primary key and
+    updated by a single query, without loading the objects or sending their `save()` signals. Instead, the cached members
+    of any dynamic groups of the model are updated for each chunk, and if a `change_context` is given, the ObjectChanges
+    recording the update of the objects in each chunk are created in bulk; webhooks and job hooks are enqueued for them
+    as usual when the change context exits.
+
+    Returns the number of objects updated.
+    """
+    # Circular Import
+    from nautobot.extras.models import DynamicGroup
+
+    model = queryset.model
+    verbose_name_plural = model._meta.verbose_name_plural
+    total = queryset.count()
+    if not total:
+        return 0
+
+    _report_progress(job_result, "Updating custom field data of %d %s", total, verbose_name_plural)
+    updates = {"_custom_field_data": expression}
+    if any(field.name == "last_updated" for field in model._meta.concrete_fields):
+        updates["last_updated"] = timezone.now()
+
+    updated = 0
+    reported_percent = 0
+    last_pk = None
+    while True:
+        chunk = queryset.order_by("pk")
+        if last_pk is not None:
+            chunk = chunk.filter(pk__gt=last_pk)
+        pks = list(chunk.values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            break
+        last_pk = pks[-1]
+
+        updated += queryset.filter(pk__in=pks).update(**updates)
+        DynamicGroup.objects.update_cached_members_for_objects(model, pks)
+        if change_context is not None:
+            bulk_create_object_changes(
+                model.objects.filter(pk__in=pks), action=ObjectChangeActionChoices.ACTION_UPDATE, batch_size=chunk_size
+            )
+            # Each object is only updated once, so there's no need to keep every updated object in memory to avoid
+            # recording its change again
+            change_context.reset_deferred_object_changes()
+
+        # Report progress in 10% steps rather than per chunk, to avoid flooding the log
+        percent = min(updated * 100 // total, 100)
+        if percent // 10 > reported_percent // 10:
+            _report_progress(job_result, "Updated %d of %d %s (%d%%)", updated, total, verbose_name_plural, percent)
+            reported_percent = percent
+
+    return updated
+
+
 @nautobot_task
 def update_custom_field_choice_data(field_id, old_value, new_value, change_context=None):
     """
@@ -24,7 +135,6 @@ def update_custom_field_choice_data(field_id, old_value, new_value, change_conte
         new_value (str): The value which will be used as replacement
     """
     # Circular Import
-    from nautobot.extras.context_managers import web_request_context
     from nautobot.extras.models import CustomField
 
     try:
@@ -34,51 +144,23 @@ def update_custom_field_choice_data(field_id, old_value, new_value, change_conte
         return False
 
     if field.type == CustomFieldTypeChoices.TYPE_SELECT:
-        # Loop through all field content types and search for values to update
-        for ct in field.content_types.all():
-            model = ct.model_class()
-            if change_context is not None:
-                with web_request_context(
-                    user=change_context.get("user"),
-                    change_id=change_context.get("change_id"),
-                    context_detail=change_context.get("context_detail"),
-                    context=change_context.get("context"),
-                ):
-                    for obj in model.objects.filter(**{f"_custom_field_data__{field.key}": old_value}):
-                        obj._custom_field_data[field.key] = new_value
-                        obj.save()
-            else:
-                for obj in model.objects.filter(**{f"_custom_field_data__{field.key}": old_value}):
-                    obj._custom_field_data[field.key] = new_value
-                    obj.save()
-
+        lookup = f"_custom_field_data__{field.key}"
+        expression = JSONSet("_custom_field_data", field.key, new_value)
     elif field.type == CustomFieldTypeChoices.TYPE_MULTISELECT:
-        # Loop through all field content types and search for values to update
-        for ct in field.content_types.all():
-            model = ct.model_class()
-            if change_context is not None:
-                with web_request_context(
-                    user=change_context.get("user"),
-                    change_id=change_context.get("change_id"),
-                    context_detail=change_context.get("context_detail"),
-                    context=change_context.get("context"),
-                ):
-                    for obj in model.objects.filter(**{f"_custom_field_data__{field.key}__contains": old_value}):
-                        old_list = obj._custom_field_data[field.key]
-                        new_list = [new_value if e == old_value else e for e in old_list]
-                        obj._custom_field_data[field.key] = new_list
-                        obj.save()
-            else:
-                for obj in model.objects.filter(**{f"_custom_field_data__{field.key}__contains": old_value}):
-                    old_list = obj._custom_field_data[field.key]
-                    new_list = [new_value if e == old_value else e for e in old_list]
-                    obj._custom_field_data[field.key] = new_list
-                    obj.save()
-
+        lookup = f"_custom_field_data__{field.key}__contains"
+        expression = JSONArrayReplace("_custom_field_data", field.key, old_value, new_value)
     else:
         logger.error(f"Unknown field type, failing to act on choice data for this field {field.key}.")
         return False
 
+    job_result = _get_job_result()
+    with _change_logging(change_context) as context:
+        # Loop through all field content types and update the objects using the old value
+        for ct in field.content_types.all():
+            model = ct.model_class()
+            queryset = model._base_manager.filter(**{lookup: old_value})
+            _update_custom_field_data(queryset, expression, context, job_result)
+
     return True
 
 
@@ -91,26 +173,14 @@ def delete_custom_field_data(field_key, content_type_pk_set, change_context=None
         field_key (str): The key of the custom field which is being deleted
         content_type_pk_set (list): List of PKs for content types to act upon
     """
-    # Circular Import
-    from nautobot.extras.context_managers import web_request_context
+    expression = JSONRemove("_custom_field_data", field_key)
 
-    with transaction.atomic():
+    job_result = _get_job_result()
+    with _change_logging(change_context) as context:
         for ct in ContentType.objects.filter(pk__in=content_type_pk_set):
             model = ct.model_class()
-            if change_context is not None:
-                with web_request_context(
-                    user=change_context.get("user"),
-                    change_id=change_context.get("change_id"),
-                    context_detail=change_context.get("context_detail"),
-                    context=change_context.get("context"),
-                ):
-                    for obj in model.objects.filter(**{f"_custom_field_data__{field_key}__isnull": False}):
-                        del obj._custom_field_data[field_key]
-                        obj.save()
-            else:
-                for obj in model.objects.filter(**{f"_custom_field_data__{field_key}__isnull": False}):
-                    del obj._custom_field_data[field_key]
-                    obj.save()
+            queryset = model._base_manager.filter(**{f"_custom_field_data__{field_key}__isnull": False})
+            _update_custom_field_data(queryset, expression, context, job_result)
 
 
 @nautobot_task
@@ -123,7 +193,6 @@ def provision_field(field_id, content_type_pk_set, change_context=None):
         content_type_pk_set (list): List of PKs for content types to act upon
     """
     # Circular Import
-    from nautobot.extras.context_managers import web_request_context
     from nautobot.extras.models import CustomField
 
     try:
@@ -132,37 +201,35 @@ def provision_field(field_id, content_type_pk_set, change_context=None):
         logger.error(f"Custom field with ID {field_id} not found, failing to provision.")
         return False
 
-    with transaction.atomic():
+    expression = JSONSet("_custom_field_data", field.key, field.default)
+
+    job_result = _get_job_result()
+    with _change_logging(change_context) as context:
         for ct in ContentType.objects.filter(pk__in=content_type_pk_set):
             model = ct.model_class()
-            if change_context is not None:
-                with web_request_context(
-                    user=change_context.get("user"),
-                    change_id=change_context.get("change_id"),
-                    context_detail=change_context.get("context_detail"),
-                    context=change_context.get("context"),
-                ):
-                    for obj in model.objects.all():
-                        obj._custom_field_data.setdefault(field.key, field.default)
-                        obj.save()
-            else:
-                for obj in model.objects.all():
-                    obj._custom_field_data.setdefault(field.key, field.default)
-                    obj.save()
+            # Objects which already have a value for the field keep it
+            queryset = model._base_manager.exclude(_custom_field_data__has_key=field.key)
+            _update_custom_field_data(queryset, expression, context, job_result)
 
     return True
 
 
-@nautobot_task
-def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
-    """
-    Make a POST request to the defined Webhook
-    """
-    from nautobot.extras.models import Webhook  # avoiding circular import
+# Pooled HTTP sessions for sending webhooks, by target scheme and host, so that successive requests to the same host in
+# this worker process reuse its keep-alive connections rather than opening a new connection (and TLS session) each time
+_webhook_sessions = {}
 
-    webhook = Webhook.objects.get(pk=webhook_pk)
 
-    context = {
+def get_webhook_session(url):
+    """Return this process's pooled `requests.Session` for sending webhooks to the given URL."""
+    parsed_url = urllib.parse.urlsplit(url)
+    key = (parsed_url.scheme, parsed_url.netloc)
+    if key not in _webhook_sessions:
+        _webhook_sessions[key] = requests.Session()
+    return _webhook_sessions[key]
+
+
+def _get_webhook_context(data, model_name, event, timestamp, username, request_id, snapshots):
+    return {
         "event": dict(ObjectChangeActionChoices)[event].lower(),
         "timestamp": timestamp,
         "model": model_name,
@@ -172,6 +239,11 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "snapshots": snapshots,
     }
 
+
+def _send_webhook(webhook, context, body, description):
+    """
+    Send the given request body for the given Webhook, with headers rendered from the given context.
+    """
     # Build the headers for the HTTP request
     headers = {
         "Content-Type": webhook.http_content_type,
@@ -182,13 +254,6 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         logger.error("Error parsing HTTP headers for webhook %s: %s", webhook, e)
         raise
 
-    # Render the request body
-    try:
-        body = webhook.render_body(context)
-    except TemplateError as e:
-        logger.error("Error rendering request body for webhook %s: %s", webhook, e)
-        raise
-
     # Prepare the HTTP request
     params = {
         "method": webhook.http_method,
@@ -196,7 +261,7 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "headers": headers,
         "data": body.encode("utf8"),
     }
-    logger.info("Sending %s request to %s (%s %s)", params["method"], params["url"], context["model"], context["event"])
+    logger.info("Sending %s request to %s (%s)", params["method"], params["url"], description)
     logger.debug("%s", params)
     try:
         prepared_request = requests.Request(**params).prepare()
@@ -209,11 +274,11 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         prepared_request.headers["X-Hook-Signature"] = generate_signature(prepared_request.body, webhook.secret)
 
     # Send the request
-    with requests.Session() as session:
-        session.verify = webhook.ssl_verification
-        if webhook.ca_file_path:
-            session.verify = webhook.ca_file_path
-        response = session.send(prepared_request, proxies=settings.HTTP_PROXIES)
+    verify = webhook.ssl_verification
+    if webhook.ca_file_path:
+        verify = webhook.ca_file_path
+    session = get_webhook_session(webhook.payload_url)
+    response = session.send(prepared_request, verify=verify, proxies=settings.HTTP_PROXIES)
 
     if response.ok:
         logger.info("Request succeeded; response status %s", response.status_code)
@@ -223,3 +288,48 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         raise requests.exceptions.RequestException(
             f"Status {response.status_code} returned with content '{response.content}', webhook FAILED to process."
         )
+
+
+@nautobot_task
+def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
+    """
+    Make a POST request to the defined Webhook
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+
+    context = _get_webhook_context(data, model_name, event, timestamp, username, request_id, snapshots)
+
+    # Render the request body
+    try:
+        body = webhook.render_body(context)
+    except TemplateError as e:
+        logger.error("Error rendering request body for webhook %s: %s", webhook, e)
+        raise
+
+    return _send_webhook(webhook, context, body, f"{context['model']} {context['event']}")
+
+
+@nautobot_task
+def process_webhook_batch(webhook_pk, events):
+    """
+    Make a single request to the defined Webhook for a batch of events, with a JSON array of their bodies.
+
+    Each event is a list of the `data`, `model_name`, `event`, `timestamp`, `username`, `request_id` and `snapshots`
+    arguments to `process_webhook()`. The request headers are rendered with the context of the first event.
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+
+    contexts = [_get_webhook_context(*event) for event in events]
+
+    # Render the request body
+    try:
+        body = f"[{', '.join(webhook.render_body(context) for context in contexts)}]"
+    except TemplateError as e:
+        logger.error("Error rendering request body for webhook %s: %s", webhook, e)
+        raise
+
+    return _send_webhook(webhook, contexts[0], body, f"{len(contexts)} events")
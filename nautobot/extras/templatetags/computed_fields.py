@@ -1,5 +1,4 @@
 from django import template
-from django.contrib.contenttypes.models import ContentType
 from django.utils.html import format_html_join
 
 from nautobot.extras.models import ComputedField
@@ -12,8 +11,7 @@ def has_computed_fields(context, obj):
     """
     Return a boolean value indicating if an object's content type has associated computed fields.
     """
-    content_type = ContentType.objects.get_for_model(obj)
-    return ComputedField.objects.filter(content_type=content_type).exists()
+    return bool(ComputedField.objects.get_snapshot_for_model(obj))
 
 
 @register.simple_tag(takes_context=True)
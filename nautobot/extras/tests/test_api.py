@@ -268,6 +268,33 @@ class ConfigContextTest(APIViewTestCases.APIViewTestCase):
         self.assertIn("config_context", response.data)
         self.assertEqual(response.data["config_context"]["bar"], 456, response.data["config_context"])
 
+    def test_render_configcontexts_in_bulk(self):
+        """
+        Test rendering config context data for many devices at once.
+        """
+        manufacturer = Manufacturer.objects.first()
+        devicetype = DeviceType.objects.create(manufacturer=manufacturer, model="Device Type 1")
+        devicerole = Role.objects.get_for_model(Device).first()
+        devicestatus = Status.objects.get_for_model(Device).first()
+        location = Location.objects.filter(location_type=LocationType.objects.get(name="Campus")).first()
+        for i in range(3):
+            Device.objects.create(
+                name=f"Device {i}", device_type=devicetype, role=devicerole, status=devicestatus, location=location
+            )
+        configcontext4 = ConfigContext.objects.create(name="Config Context 4", data={"location_data": "ABC"})
+        configcontext4.locations.add(location)
+
+        self.add_permissions("dcim.view_device")
+        url = reverse("dcim-api:device-config-contexts")
+        response = self.client.get(f"{url}?location={location.pk}&limit=1000", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        devices = Device.objects.filter(location=location)
+        self.assertEqual(response.data["count"], devices.count())
+        for device in devices:
+            result = next(result for result in response.data["results"] if result["id"] == device.pk)
+            self.assertEqual(result["config_context"], device.get_config_context())
+            self.assertEqual(result["config_context"]["location_data"], "ABC")
+
     def test_schema_validation_pass(self):
         """
         Given a config context schema
@@ -1,5 +1,7 @@
 from django.contrib.contenttypes.models import ContentType
-from django.test import override_settings
+from django.db import connection
+from django.test import override_settings, tag
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.html import escape
 from rest_framework import status
@@ -504,6 +506,78 @@ class ChangeLogAPITest(APITestCase):
         self.assertEqual(vm_interface.description, "test vm interface m2m change")
         self.assertSequenceEqual(list(vm_interface.tagged_vlans.all()), [tagged_vlan])
 
+    @override_settings(CHANGELOG_DEFERRED=True)
+    def test_deferred_change_logging(self):
+        """Test that deferred object changes are created once the request's transaction commits."""
+        location_type = LocationType.objects.get(name="Campus")
+        data = {
+            "name": "Test Location 1",
+            "status": self.statuses[0].pk,
+            "location_type": f"{location_type.pk}",
+            "tags": [{"name": self.tags[0].name}],
+        }
+        self.add_permissions("dcim.add_location", "dcim.delete_location", "extras.view_status")
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(reverse("dcim-api:location-list"), data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        self.assertEqual(ObjectChange.objects.count(), 0)
+        for callback in callbacks:
+            callback()
+
+        location = Location.objects.get(pk=response.data["id"])
+        oc = get_changes_for_model(location).get()
+        self.assertEqual(oc.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(oc.object_data["tags"], [self.tags[0].name])
+        self.assertEqual(oc.change_context, ObjectChangeEventContextChoices.CONTEXT_WEB)
+        self.assertEqual(oc.user_id, self.user.pk)
+        self.assertEqual(oc.user_name, self.user.username)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            url = reverse("dcim-api:location-detail", kwargs={"pk": location.pk})
+            response = self.client.delete(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_204_NO_CONTENT)
+        oc = get_changes_for_model(Location).get(action=ObjectChangeActionChoices.ACTION_DELETE)
+        self.assertEqual(oc.changed_object_id, location.pk)
+        self.assertEqual(oc.object_data["name"], "Test Location 1")
+
+    def _bulk_create_locations(self, count):
+        """Create `count` Locations in a single REST API request and return the number of queries that it took."""
+        location_type = LocationType.objects.get(name="Campus")
+        data = [
+            {"name": f"Test Location {i}", "status": self.statuses[0].pk, "location_type": f"{location_type.pk}"}
+            for i in range(count)
+        ]
+        self.add_permissions("dcim.add_location", "extras.view_status")
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(reverse("dcim-api:location-list"), data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        self.assertEqual(get_changes_for_model(Location).count(), count)
+        return len(queries)
+
+    def test_deferred_change_logging_saves_queries(self):
+        with override_settings(CHANGELOG_DEFERRED=False):
+            immediate_queries = self._bulk_create_locations(10)
+        Location.objects.filter(name__startswith="Test Location").delete()
+        ObjectChange.objects.all().delete()
+        with override_settings(CHANGELOG_DEFERRED=True):
+            deferred_queries = self._bulk_create_locations(10)
+        self.assertLess(deferred_queries, immediate_queries)
+
+    # Compare the execution times of the following two tests in the performance report (`invoke performance-test`)
+    # to see the REST API write latency saved per object by deferred change logging.
+
+    @tag("performance")
+    @override_settings(CHANGELOG_DEFERRED=False)
+    def test_bulk_create_with_immediate_change_logging(self):
+        self._bulk_create_locations(100)
+
+    @tag("performance")
+    @override_settings(CHANGELOG_DEFERRED=True)
+    def test_bulk_create_with_deferred_change_logging(self):
+        self._bulk_create_locations(100)
+
 
 class ObjectChangeModelTest(TestCase):  # TODO: change to BaseModelTestCase once we have an ObjectChangeFactory
     @classmethod
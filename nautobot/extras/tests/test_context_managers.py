@@ -1,6 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.test import override_settings, TestCase
 
 from nautobot.core.celery import app
 from nautobot.core.testing import TransactionTestCase
@@ -231,15 +231,21 @@ class BulkEditDeleteChangeLogging(TestCase):
         self.assertEqual(oc_list[0].action, ObjectChangeActionChoices.ACTION_CREATE)
 
     def test_delete(self):
-        """Test that deletes raise an exception"""
+        """Test that a create followed by a delete is logged as both a create and a delete"""
         location_type = LocationType.objects.get(name="Campus")
         location_status = Status.objects.get_for_model(Location).first()
-        with self.assertRaises(ValueError):
-            with web_request_context(self.user):
-                with deferred_change_logging_for_bulk_operation():
-                    location = Location(name="Test Location 1", location_type=location_type, status=location_status)
-                    location.save()
-                    location.delete()
+        with web_request_context(self.user):
+            with deferred_change_logging_for_bulk_operation():
+                location = Location(name="Test Location 1", location_type=location_type, status=location_status)
+                location.save()
+                location_pk = location.pk
+                location.delete()
+
+        oc_list = get_changes_for_model(Location).filter(changed_object_id=location_pk).order_by("time")
+        self.assertEqual(len(oc_list), 2)
+        self.assertEqual(oc_list[0].action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(oc_list[1].action, ObjectChangeActionChoices.ACTION_DELETE)
+        self.assertEqual(oc_list[1].object_data["name"], "Test Location 1")
 
     def test_bulk_delete_has_user_in_change_log(self):
         """Test that the bulk delete operation adds the user to the change log"""
@@ -340,3 +346,55 @@ class BulkEditDeleteChangeLogging(TestCase):
             self.assertEqual(oc_list[0].change_context, ObjectChangeEventContextChoices.CONTEXT_ORM)
         with self.subTest():
             self.assertEqual(oc_list[0].change_context_detail, "test_change_log_context")
+
+
+@override_settings(CHANGELOG_DEFERRED=True)
+class DeferredChangeLoggingTestCase(TestCase):
+    """Tests for `web_request_context` when `settings.CHANGELOG_DEFERRED` is enabled."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="jacob",
+            email="jacob@example.com",
+            password="top_secret",  # noqa: S106  # hardcoded-password-func-arg -- ok as this is test code only
+        )
+        self.location_type = LocationType.objects.get(name="Campus")
+        self.location_status = Status.objects.get_for_model(Location).first()
+
+    def test_changes_logged_on_commit(self):
+        """Test that repeated changes to an object are logged once, with its final state, on commit"""
+        with self.captureOnCommitCallbacks() as callbacks:
+            with web_request_context(self.user):
+                location = Location(
+                    name="Test Location 1", location_type=self.location_type, status=self.location_status
+                )
+                location.save()
+                location.description = "changed"
+                location.save()
+        self.assertEqual(get_changes_for_model(location).count(), 0)
+
+        for callback in callbacks:
+            callback()
+        oc_list = get_changes_for_model(location)
+        self.assertEqual(len(oc_list), 1)
+        self.assertEqual(oc_list[0].action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(oc_list[0].object_data["description"], "changed")
+        self.assertEqual(oc_list[0].user, self.user)
+        self.assertEqual(oc_list[0].change_context, ObjectChangeEventContextChoices.CONTEXT_ORM)
+
+    def test_update_then_delete(self):
+        """Test that an update followed by a delete is logged as a single delete"""
+        location = Location.objects.create(
+            name="Test Location 1", location_type=self.location_type, status=self.location_status
+        )
+        location_pk = location.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            with web_request_context(self.user):
+                location.description = "changed"
+                location.save()
+                location.delete()
+
+        oc_list = get_changes_for_model(Location).filter(changed_object_id=location_pk)
+        self.assertEqual(len(oc_list), 1)
+        self.assertEqual(oc_list[0].action, ObjectChangeActionChoices.ACTION_DELETE)
+        self.assertEqual(oc_list[0].object_data["description"], "changed")
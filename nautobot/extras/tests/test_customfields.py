@@ -6,6 +6,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import ProtectedError
 from django.forms import ChoiceField, IntegerField, NumberInput
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 
@@ -23,7 +24,7 @@ from nautobot.dcim.models import Device, Location, LocationType, Rack
 from nautobot.dcim.tables import LocationTable
 from nautobot.extras.choices import CustomFieldFilterLogicChoices, CustomFieldTypeChoices
 from nautobot.extras.context_managers import web_request_context
-from nautobot.extras.models import ComputedField, CustomField, CustomFieldChoice, Status
+from nautobot.extras.models import ComputedField, CustomField, CustomFieldChoice, DynamicGroup, Status
 from nautobot.users.models import ObjectPermission
 from nautobot.virtualization.models import VirtualMachine
 
@@ -408,8 +409,8 @@ class CustomFieldManagerTest(TestCase):
         with self.assertNumQueries(0):
             CustomField.objects.get_for_model(Location)
 
-        # Assert that different values of exclude_filter_disabled are cached separately
-        with self.assertNumQueries(1):
+        # Assert that different values of exclude_filter_disabled are derived from the same cached snapshot
+        with self.assertNumQueries(0):
             CustomField.objects.get_for_model(Location, exclude_filter_disabled=True)
         with self.assertNumQueries(0):
             CustomField.objects.get_for_model(Location, exclude_filter_disabled=True)
@@ -427,28 +428,28 @@ class CustomFieldManagerTest(TestCase):
         # Assert that the cache is invalidated on object save
         custom_field = CustomField(type=CustomFieldTypeChoices.TYPE_TEXT, label="Test CF1", default="foo")
         custom_field.save()
-        with self.assertNumQueries(1):
+        with self.assertNumQueries(2):  # the custom fields and their choices
             CustomField.objects.get_for_model(Location)
         with self.assertNumQueries(0):
             CustomField.objects.get_for_model(Location)
 
         # Assert that the cache is invalidated when adding a CustomField.content_types m2m relationship
         custom_field.content_types.set([self.content_type])
-        with self.assertNumQueries(1):
+        with self.assertNumQueries(2):  # the custom fields and their choices
             CustomField.objects.get_for_model(Location)
         with self.assertNumQueries(0):
             CustomField.objects.get_for_model(Location)
 
         # Assert that the cache is invalidated when removing a CustomField.content_types m2m relationship
         custom_field.content_types.set([])
-        with self.assertNumQueries(1):
+        with self.assertNumQueries(2):  # the custom fields and their choices
             CustomField.objects.get_for_model(Location)
         with self.assertNumQueries(0):
             CustomField.objects.get_for_model(Location)
 
         # Assert that the cache is invalidated on object delete
         custom_field.delete()
-        with self.assertNumQueries(1):
+        with self.assertNumQueries(2):  # the custom fields and their choices
             CustomField.objects.get_for_model(Location)
         with self.assertNumQueries(0):
             CustomField.objects.get_for_model(Location)
@@ -2021,6 +2022,13 @@ class CustomFieldBackgroundTasks(TransactionTestCase):
         location_status = Status.objects.get_for_model(Location).first()
         location = Location(name="Location 1", location_type=location_type, status=location_status)
         location.save()
+        location_2 = Location(
+            name="Location 2",
+            location_type=location_type,
+            status=location_status,
+            _custom_field_data={"cf1": "Existing"},
+        )
+        location_2.save()
 
         obj_type = ContentType.objects.get_for_model(Location)
         cf = CustomField(label="CF1", type=CustomFieldTypeChoices.TYPE_TEXT, default="Foo")
@@ -2028,8 +2036,11 @@ class CustomFieldBackgroundTasks(TransactionTestCase):
         cf.content_types.set([obj_type])
 
         location.refresh_from_db()
+        location_2.refresh_from_db()
 
         self.assertEqual(location.cf["cf1"], "Foo")
+        # Existing values are not overwritten by the default
+        self.assertEqual(location_2.cf["cf1"], "Existing")
 
         with web_request_context(self.user):
             cf = CustomField(label="CF2", type=CustomFieldTypeChoices.TYPE_TEXT, default="Bar")
@@ -2131,6 +2142,79 @@ class CustomFieldBackgroundTasks(TransactionTestCase):
         self.assertEqual(oc_list[0].change_context_detail, "update custom field choice data")
         self.assertEqual(oc_list[0].user, self.user)
 
+    @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=60)
+    def test_update_custom_field_choice_data_task_dynamic_groups(self):
+        obj_type = ContentType.objects.get_for_model(Location)
+        cf = CustomField(
+            label="CF1",
+            type=CustomFieldTypeChoices.TYPE_SELECT,
+        )
+        cf.save()
+        cf.content_types.set([obj_type])
+
+        choice = CustomFieldChoice(custom_field=cf, value="Foo")
+        choice.save()
+        location_type = LocationType.objects.create(name="Root Type 5")
+        location_status = Status.objects.get_for_model(Location).first()
+        location = Location(
+            name="Location 1",
+            location_type=location_type,
+            status=location_status,
+            _custom_field_data={"cf1": "Foo"},
+        )
+        location.save()
+        dynamic_group = DynamicGroup.objects.create(name="CF1 Bar", content_type=obj_type, filter={"cf_cf1": ["Bar"]})
+        dynamic_group.update_cached_members()
+        self.assertFalse(dynamic_group.has_member(location, use_cache=True))
+
+        choice.value = "Bar"
+        choice.save()
+
+        # The cached members are updated even though the location isn't saved
+        self.assertTrue(dynamic_group.has_member(location, use_cache=True))
+
+    def test_update_custom_field_choice_data_task_multiselect(self):
+        obj_type = ContentType.objects.get_for_model(Location)
+        cf = CustomField(
+            label="CF1",
+            type=CustomFieldTypeChoices.TYPE_MULTISELECT,
+        )
+        cf.save()
+        cf.content_types.set([obj_type])
+
+        choice = CustomFieldChoice(custom_field=cf, value="Foo")
+        choice.save()
+        CustomFieldChoice.objects.create(custom_field=cf, value="Bar")
+        location_type = LocationType.objects.create(name="Root Type 4")
+        location_status = Status.objects.get_for_model(Location).first()
+        location_1 = Location(
+            name="Location 1",
+            location_type=location_type,
+            status=location_status,
+            _custom_field_data={"cf1": ["Bar", "Foo"]},
+        )
+        location_1.save()
+        location_2 = Location(
+            name="Location 2",
+            location_type=location_type,
+            status=location_status,
+            _custom_field_data={"cf1": ["Bar"]},
+        )
+        location_2.save()
+
+        with web_request_context(self.user):
+            choice.value = "FizzBuzz"
+            choice.save()
+
+        location_1.refresh_from_db()
+        location_2.refresh_from_db()
+
+        # The order of the other values is preserved
+        self.assertEqual(location_1.cf["cf1"], ["Bar", "FizzBuzz"])
+        self.assertEqual(location_2.cf["cf1"], ["Bar"])
+        self.assertEqual(get_changes_for_model(location_1).count(), 1)
+        self.assertEqual(get_changes_for_model(location_2).count(), 0)
+
 
 class CustomFieldTableTest(TestCase):
     """
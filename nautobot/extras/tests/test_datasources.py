@@ -21,9 +21,12 @@ from nautobot.dcim.models import Device, DeviceType, Location, LocationType, Man
 from nautobot.extras.choices import (
     JobResultStatusChoices,
     LogLevelChoices,
+    ObjectChangeActionChoices,
+    ObjectChangeEventContextChoices,
     SecretsGroupAccessTypeChoices,
     SecretsGroupSecretTypeChoices,
 )
+from nautobot.extras.datasources.git import ensure_git_repository, get_changed_paths, get_synced_head
 from nautobot.extras.datasources.registry import get_datasource_contents
 from nautobot.extras.models import (
     ConfigContext,
@@ -35,6 +38,7 @@ from nautobot.extras.models import (
     JobHook,
     JobLogEntry,
     JobResult,
+    ObjectChange,
     Role,
     Secret,
     SecretsGroup,
@@ -410,6 +414,68 @@ class GitTest(TransactionTestCase):
                 jh = JobHook.objects.get(name="MyJobHook")
                 self.assertFalse(jh.enabled)
 
+    def test_pull_git_repository_and_refresh_data_incrementally(self):
+        """
+        Once a repository has been synced, later syncs should only process the files changed since then.
+        """
+        with tempfile.TemporaryDirectory() as tempdir:
+            with self.settings(GIT_ROOT=tempdir):
+                job_model = GitRepositorySync().job_model
+                # The empty repository has no jobs, so the sync fails, but its other (absent) content is synced
+                run_job_for_testing(job=job_model, repository=self.repo.pk)
+                self.repo.refresh_from_db()
+                empty_head = self.repo.current_head
+                self.assertEqual(get_synced_head(self.repo, "extras.configcontext"), empty_head)
+                self.assertEqual(get_synced_head(self.repo, "extras.exporttemplate"), empty_head)
+
+                self.repo.branch = "valid-files"  # actually a tag
+                self.repo.save()
+                ensure_git_repository(self.repo)
+                changes = get_changed_paths(self.repo, "extras.configcontext", "config_contexts")
+                self.assertEqual(
+                    changes.updated, {"context.yaml", "devices/test-device.json", "locations/Test Location.json"}
+                )
+                self.assertEqual(changes.deleted, set())
+
+                job_result = run_job_for_testing(job=job_model, repository=self.repo.pk)
+                job_result.refresh_from_db()
+                self.assertEqual(
+                    job_result.status,
+                    JobResultStatusChoices.STATUS_SUCCESS,
+                    (job_result.traceback, list(job_result.job_log_entries.values_list("message", flat=True))),
+                )
+                self.repo.refresh_from_db()
+                self.assertEqual(get_synced_head(self.repo, "extras.configcontext"), self.repo.current_head)
+                self.assert_explicit_config_context_exists("Frobozz 1000 NTP servers")
+                self.assert_implicit_config_context_exists("Location context")
+                self.assert_config_context_schema_record_exists("Config Context Schema 1")
+                self.assert_device_exists(self.device.name)
+                self.assert_export_template_device("template.j2")
+                self.assert_export_template_vlan_exists("template.j2")
+                # The local config context was updated in bulk, but its change was still logged
+                self.assertTrue(
+                    ObjectChange.objects.filter(
+                        changed_object_id=self.device.pk,
+                        action=ObjectChangeActionChoices.ACTION_UPDATE,
+                        change_context=ObjectChangeEventContextChoices.CONTEXT_JOB,
+                    ).exists()
+                )
+
+                # Now sync the removal of all of those files
+                self.repo.branch = "empty-repo"  # actually a tag
+                self.repo.save()
+                run_job_for_testing(job=job_model, repository=self.repo.pk)
+                git_repository_content_type = ContentType.objects.get_for_model(GitRepository)
+                for model in (ConfigContext, ConfigContextSchema, ExportTemplate):
+                    self.assertFalse(
+                        model.objects.filter(
+                            owner_content_type=git_repository_content_type, owner_object_id=self.repo.pk
+                        ).exists()
+                    )
+                device = Device.objects.get(name=self.device.name)
+                self.assertIsNone(device.local_config_context_data)
+                self.assertIsNone(device.local_config_context_data_owner)
+
     def test_pull_git_repository_and_refresh_data_with_bad_data(self):
         """
         The test_pull_git_repository_and_refresh_data job should gracefully handle bad data in the Git repository
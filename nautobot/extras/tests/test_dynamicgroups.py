@@ -5,8 +5,10 @@ from unittest.mock import patch
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.db.models import ProtectedError
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from nautobot.core.forms.fields import MultiMatchModelMultipleChoiceField, MultiValueCharField
@@ -35,6 +37,7 @@ from nautobot.extras.filters import DynamicGroupFilterSet, DynamicGroupMembershi
 from nautobot.extras.models import (
     CustomField,
     DynamicGroup,
+    DynamicGroupCachedMember,
     DynamicGroupMembership,
     Relationship,
     RelationshipAssociation,
@@ -42,6 +45,7 @@ from nautobot.extras.models import (
     Status,
     Tag,
 )
+from nautobot.extras.querysets import DynamicGroupQuerySet
 from nautobot.ipam.models import Prefix
 from nautobot.tenancy.models import Tenant
 
@@ -279,6 +283,34 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
         self.assertEqual(list(device4_groups), [])
         self.assertQuerySetEqual(device4_groups, device4.dynamic_groups)
 
+    def test_get_list_for_object(self):
+        """Test that `DynamicGroup.objects.get_list_for_object()` checks all groups at once."""
+        groups = DynamicGroup.objects.filter(content_type=self.device_ct)
+        for device in self.devices:
+            device_groups = DynamicGroup.objects.get_list_for_object(device)
+            for group in groups:
+                with self.subTest(device=device.name, group=group.name):
+                    self.assertEqual(group in device_groups, group.has_member(device))
+
+        device = self.devices[0]
+        with CaptureQueriesContext(connection) as queries:
+            device_groups = DynamicGroup.objects.get_list_for_object(device)
+
+        # The number of queries should not grow with the number of groups
+        new_groups = [
+            DynamicGroup.objects.create(
+                name=f"Device Name Group {i}", filter={"name": [device.name]}, content_type=self.device_ct
+            )
+            for i in range(10)
+        ]
+        with CaptureQueriesContext(connection) as more_queries:
+            more_device_groups = DynamicGroup.objects.get_list_for_object(device)
+        self.assertEqual(len(more_queries), len(queries))
+        self.assertEqual(
+            sorted(group.pk for group in more_device_groups),
+            sorted(group.pk for group in [*device_groups, *new_groups]),
+        )
+
     def test_members(self):
         """Test `DynamicGroup.members`."""
         group = self.first_child
@@ -1002,27 +1034,24 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
     @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=2)
     def test_member_caching_enabled(self):
         """
-        Verify that the members list of the DynamicGroup is cached and expires.
+        Verify that the members of the DynamicGroup are cached and refreshed once the cache expires.
         """
         group = self.first_child
 
-        class FakeQuerySet:
-            def all(self):
-                return []
-
         # Ensure the cache is empty from previous tests
         cache.delete(group.members_cache_key)
 
-        with patch.object(group, "get_queryset", return_value=FakeQuerySet()) as mock_get_queryset:
-            group.members_cached
-            group.members_cached
-            group.members_cached
-            self.assertEqual(mock_get_queryset.call_count, 1)
+        with patch.object(group, "_refresh_cached_members", wraps=group._refresh_cached_members) as mock_refresh:
+            with self.captureOnCommitCallbacks(execute=True):
+                group.members_cached
+            self.assertQuerySetEqual(group.members_cached, group.members)
+            self.assertQuerySetEqual(group.members_cached, group.members)
+            self.assertEqual(mock_refresh.call_count, 1)
 
             time.sleep(5)  # Let the cache expire
 
             group.members_cached
-            self.assertEqual(mock_get_queryset.call_count, 2)
+            self.assertEqual(mock_refresh.call_count, 2)
 
         # Clean-up after ourselves
         cache.delete(group.members_cache_key)
@@ -1030,21 +1059,79 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
     @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=0)
     def test_member_caching_disabled(self):
         """
-        Verify that the members list of the DynamicGroup is not cached.
+        Verify that the members of the DynamicGroup are not cached.
         """
         group = self.first_child
 
-        class FakeQuerySet:
-            def all(self):
-                return []
-
         # Ensure the cache is empty from previous tests
         cache.delete(group.members_cache_key)
 
-        with patch.object(group, "get_queryset", return_value=FakeQuerySet()) as mock_get_queryset:
+        with patch.object(group, "get_queryset", wraps=group.get_queryset) as mock_get_queryset:
             group.members_cached
             group.members_cached
             self.assertEqual(mock_get_queryset.call_count, 2)
+        self.assertFalse(group.cached_members.exists())
+
+
+@override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=60)
+class DynamicGroupCachedMemberTest(DynamicGroupTestBase):
+    """Tests for the materialized membership of DynamicGroups."""
+
+    def setUp(self):
+        super().setUp()
+        self.clear_cache()
+        self.addCleanup(self.clear_cache)
+        # Populate the cached members of all groups
+        with self.captureOnCommitCallbacks(execute=True):
+            DynamicGroup.objects._refresh_stale_cached_members(list(DynamicGroup.objects.all()))
+
+    def clear_cache(self):
+        cache.delete(DynamicGroupQuerySet._get_eligible_dynamic_groups_cache_key(Device))
+        cache.delete_many([group.members_cache_key for group in DynamicGroup.objects.all()])
+
+    def test_cached_members_match_members(self):
+        for group in DynamicGroup.objects.all():
+            with self.subTest(group=group.name):
+                self.assertQuerySetEqual(group.members_cached, group.members)
+
+    def test_cached_members_updated_on_save_and_delete(self):
+        group = self.first_child  # location "Location 1"
+        device = self.devices[1]  # location "Location 2"
+        self.assertFalse(group.has_member(device, use_cache=True))
+
+        device.location = self.locations[0]
+        device.save()
+        self.assertTrue(group.has_member(device, use_cache=True))
+        self.assertIn(group, DynamicGroup.objects.get_list_for_object(device, use_cache=True))
+
+        device.location = self.locations[1]
+        device.save()
+        self.assertFalse(group.has_member(device, use_cache=True))
+        self.assertNotIn(group, DynamicGroup.objects.get_list_for_object(device, use_cache=True))
+
+        device.location = self.locations[0]
+        device.save()
+        device_pk = device.pk
+        device.delete()
+        self.assertFalse(DynamicGroupCachedMember.objects.filter(associated_object_id=device_pk).exists())
+
+    def test_get_list_for_object_single_query(self):
+        """Resolving all of an object's groups from their cached members should take a single query."""
+        for device in self.devices:
+            expected = sorted(group.pk for group in DynamicGroup.objects.get_list_for_object(device))
+            # Warm the cache of eligible groups
+            DynamicGroup.objects.get_list_for_object(device, use_cache=True)
+            with self.assertNumQueries(1):
+                groups = DynamicGroup.objects.get_list_for_object(device, use_cache=True)
+            self.assertEqual(sorted(group.pk for group in groups), expected)
+
+    def test_delete_group(self):
+        group = self.first_child
+        self.assertTrue(group.cached_members.exists())
+        group_pk = group.pk
+        self.parent.children.remove(group)
+        group.delete()
+        self.assertFalse(DynamicGroupCachedMember.objects.filter(dynamic_group_id=group_pk).exists())
 
 
 class DynamicGroupMembershipModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mixin?
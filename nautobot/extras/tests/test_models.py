@@ -14,6 +14,7 @@ from django.test import override_settings
 from django.test.utils import isolate_apps
 from django.utils.timezone import now
 from jinja2.exceptions import TemplateAssertionError, TemplateSyntaxError
+from prometheus_client import REGISTRY
 
 from nautobot.circuits.models import CircuitType
 from nautobot.core.choices import ColorChoices
@@ -35,6 +36,7 @@ from nautobot.extras.choices import (
     SecretsGroupAccessTypeChoices,
     SecretsGroupSecretTypeChoices,
 )
+from nautobot.extras.config_contexts import ConfigContextRenderer
 from nautobot.extras.constants import (
     JOB_LOG_MAX_ABSOLUTE_URL_LENGTH,
     JOB_LOG_MAX_GROUPING_LENGTH,
@@ -302,6 +304,7 @@ class ConfigContextTest(ModelTestCases.BaseModelTestCase):
         annotated_queryset = Device.objects.filter(name=device.name).annotate_config_context_data()
         device_context = device.get_config_context()
         self.assertEqual(device_context, annotated_queryset[0].get_config_context())
+        self.assertEqual(device_context, ConfigContextRenderer(Device).render_many([device])[device.pk])
         for key in ["location", "platform", "tenant_group", "tenant", "tag", "dynamic_group"]:
             self.assertIn(key, device_context)
         # Add a device type constraint that does not match the device in question to the location config context
@@ -329,6 +332,7 @@ class ConfigContextTest(ModelTestCases.BaseModelTestCase):
         device_context = device.get_config_context()
         annotated_queryset = Device.objects.filter(name=device.name).annotate_config_context_data()
         self.assertEqual(device_context, annotated_queryset[0].get_config_context())
+        self.assertEqual(device_context, ConfigContextRenderer(Device).render_many([device])[device.pk])
 
         for key in ["location-1", "location-2", "location-3"]:
             self.assertIn(key, device_context)
@@ -356,6 +360,7 @@ class ConfigContextTest(ModelTestCases.BaseModelTestCase):
         device_context = device.get_config_context()
         annotated_queryset = Device.objects.filter(name=device.name).annotate_config_context_data()
         self.assertEqual(device_context, annotated_queryset[0].get_config_context())
+        self.assertEqual(device_context, ConfigContextRenderer(Device).render_many([device])[device.pk])
 
         for key in ["parent-group-1", "child-group-1", "child-tenant-1"]:
             self.assertIn(key, device_context)
@@ -406,6 +411,9 @@ class ConfigContextTest(ModelTestCases.BaseModelTestCase):
         vm_context = virtual_machine.get_config_context()
 
         self.assertEqual(vm_context, annotated_queryset[0].get_config_context())
+        self.assertEqual(
+            vm_context, ConfigContextRenderer(VirtualMachine).render_many([virtual_machine])[virtual_machine.pk]
+        )
         for key in [
             "location",
             "platform",
@@ -499,6 +507,31 @@ class ConfigContextTest(ModelTestCases.BaseModelTestCase):
         ]:
             self.assertIn(key, vm_context)
 
+    def test_renderer_same_as_get_config_context(self):
+        location_context = ConfigContext.objects.create(name="location", weight=100, data={"location": 1})
+        location_context.locations.add(self.parent_location)
+        tag_context = ConfigContext.objects.create(name="tag", weight=200, data={"a": 1, "tag": 1})
+        tag_context.tags.add(self.tag)
+        ConfigContext.objects.create(name="inactive", weight=300, data={"inactive": 1}, is_active=False)
+        devices = [self.device]
+        for i in range(2, 6):
+            device = Device.objects.create(
+                name=f"Device {i}",
+                location=self.location if i % 2 else self.root_location,
+                role=self.devicerole,
+                status=self.device_status,
+                device_type=self.devicetype,
+                local_config_context_data={"local": i} if i % 3 else None,
+            )
+            if i % 2 == 0:
+                device.tags.add(self.tag)
+            devices.append(device)
+
+        rendered = dict(ConfigContextRenderer(Device).iterator(Device.objects.all(), chunk_size=2))
+        self.assertEqual(len(rendered), Device.objects.count())
+        for device in devices:
+            self.assertEqual(rendered[device], device.get_config_context())
+
     def test_multiple_tags_return_distinct_objects(self):
         """
         Tagged items use a generic relationship, which results in duplicate rows being returned when queried.
@@ -592,6 +625,97 @@ class ConfigContextTest(ModelTestCases.BaseModelTestCase):
         self.assertNotIn("dynamic context 1", device2.get_config_context().values())
 
 
+@override_settings(CONFIG_CONTEXT_CACHE_TIMEOUT=60)
+class ConfigContextCacheTest(TestCase):
+    """Tests for the caching of rendered config contexts."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.location = Location.objects.filter(parent__isnull=False, location_type__content_types__model="device")[0]
+        cls.other_location = Location.objects.filter(location_type=cls.location.location_type).exclude(
+            pk=cls.location.pk
+        )[0]
+        device_type = DeviceType.objects.first()
+        role = Role.objects.get_for_model(Device).first()
+        status = Status.objects.get_for_model(Device).first()
+        cls.device = Device.objects.create(
+            name="Cached Device 1", device_type=device_type, role=role, status=status, location=cls.location
+        )
+        cls.other_device = Device.objects.create(
+            name="Cached Device 2", device_type=device_type, role=role, status=status, location=cls.other_location
+        )
+        cls.tag = Tag.objects.get_for_model(Device).first()
+
+    def get_metric(self, result):
+        return REGISTRY.get_sample_value("nautobot_config_context_cache_requests_total", {"result": result}) or 0
+
+    def assertConfigContext(self, device, expected_data, cached):
+        """Assert that the device's rendered config context is as expected, and was or was not served from the cache."""
+        hits = self.get_metric("hit")
+        self.assertEqual(device.get_config_context(), expected_data)
+        self.assertEqual(device.get_config_context(use_cache=False), expected_data)
+        self.assertEqual(self.get_metric("hit"), hits + (1 if cached else 0))
+
+    def test_cache_hit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            ConfigContext.objects.create(name="global", weight=100, data={"a": 1})
+
+        self.assertConfigContext(self.device, {"a": 1}, cached=False)
+        self.assertConfigContext(self.device, {"a": 1}, cached=True)
+
+    def test_cache_disabled(self):
+        ConfigContext.objects.create(name="global", weight=100, data={"a": 1})
+
+        with override_settings(CONFIG_CONTEXT_CACHE_TIMEOUT=0):
+            self.assertConfigContext(self.device, {"a": 1}, cached=False)
+            self.assertConfigContext(self.device, {"a": 1}, cached=False)
+
+    def test_invalidated_by_updated_config_context(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context = ConfigContext.objects.create(name="location", weight=100, data={"a": 1})
+            config_context.locations.add(self.location)
+        self.assertConfigContext(self.device, {"a": 1}, cached=False)
+        self.assertConfigContext(self.other_device, {}, cached=False)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.data = {"a": 2}
+            config_context.save()
+        self.assertConfigContext(self.device, {"a": 2}, cached=False)
+        # The config context doesn't apply to other_device, whose cached config context is still current
+        self.assertConfigContext(self.other_device, {}, cached=True)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.locations.set([self.other_location])
+        self.assertConfigContext(self.device, {}, cached=False)
+        self.assertConfigContext(self.other_device, {"a": 2}, cached=False)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.delete()
+        self.assertConfigContext(self.device, {}, cached=True)
+        self.assertConfigContext(self.other_device, {}, cached=False)
+
+    def test_invalidated_by_config_context_on_parent_location(self):
+        self.assertConfigContext(self.device, {}, cached=False)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context = ConfigContext.objects.create(name="parent location", weight=100, data={"a": 1})
+            config_context.locations.add(self.location.parent)
+        self.assertConfigContext(self.device, {"a": 1}, cached=False)
+
+    def test_invalidated_by_updated_device(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context = ConfigContext.objects.create(name="tag", weight=100, data={"tag": 1})
+            config_context.tags.add(self.tag)
+        self.assertConfigContext(self.device, {}, cached=False)
+
+        self.device.tags.add(self.tag)
+        self.assertConfigContext(self.device, {"tag": 1}, cached=False)
+
+        self.device.local_config_context_data = {"local": 1}
+        self.device.save()
+        self.assertConfigContext(self.device, {"tag": 1, "local": 1}, cached=False)
+
+
 class ConfigContextSchemaTestCase(ModelTestCases.BaseModelTestCase):
     """
     Tests for the ConfigContextSchema model
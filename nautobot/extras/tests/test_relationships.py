@@ -443,7 +443,7 @@ class RelationshipTest(RelationshipBaseTest, ModelTestCases.BaseModelTestCase):
 
         manager = Relationship.objects
         manager_methods = [
-            (manager.get_for_model, 2),
+            (manager.get_for_model, 1),
             (manager.get_for_model_source, 1),
             (manager.get_for_model_destination, 1),
         ]
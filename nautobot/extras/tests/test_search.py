@@ -0,0 +1,140 @@
+"""Tests for the global search backends."""
+
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+
+from nautobot.core.testing import TestCase
+from nautobot.dcim.models import DeviceType, Manufacturer
+from nautobot.extras.context_managers import web_request_context
+from nautobot.extras.models import SearchIndexEntry
+from nautobot.extras.search import (
+    get_search_backend,
+    get_search_dependencies,
+    get_search_fields,
+    IndexedSearchBackend,
+)
+from nautobot.ipam.models import IPAddress
+from nautobot.tenancy.models import Tenant
+from nautobot.users.models import ObjectPermission
+
+INDEXED_SEARCH_BACKEND = "nautobot.extras.search.IndexedSearchBackend"
+
+
+class IndexedSearchBackendTestCase(TestCase):
+    """Tests for the IndexedSearchBackend."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenants = (
+            Tenant.objects.create(name="Zyxwv Tenant 1", description="First"),
+            Tenant.objects.create(name="Zyxwv Tenant 2", description="Second"),
+            Tenant.objects.create(name="Other Tenant", description="Not a zyxwv tenant"),
+        )
+        cls.backend = IndexedSearchBackend()
+        cls.backend.rebuild_index(models=[Tenant])
+
+    def test_get_search_fields(self):
+        self.assertEqual(
+            get_search_fields(Tenant),
+            {"name": (False, False), "description": (False, False), "comments": (False, False)},
+        )
+        # IP addresses are searched by network, which can't be answered from the index
+        self.assertIsNone(get_search_fields(IPAddress))
+
+    def test_rebuild_index(self):
+        content_type = ContentType.objects.get_for_model(Tenant)
+        self.assertEqual(SearchIndexEntry.objects.filter(content_type=content_type).count(), Tenant.objects.count())
+        entry = SearchIndexEntry.objects.get(content_type=content_type, object_id=self.tenants[0].pk)
+        self.assertEqual(entry.text, "Zyxwv Tenant 1\nFirst")
+
+    def test_search(self):
+        self.add_permissions("tenancy.view_tenant")
+        results = self.backend.search(self.user, "zyxwv", [Tenant])
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["model"], Tenant)
+        self.assertEqual(results[0]["count"], 3)
+        # Matches at the start of the text rank above matches elsewhere
+        self.assertEqual(list(results[0]["queryset"])[-1], self.tenants[2])
+        self.assertEqual(set(results[0]["queryset"]), set(self.tenants))
+
+        self.assertEqual(self.backend.search(self.user, "no such tenant", [Tenant]), [])
+
+    def test_search_permissions(self):
+        obj_perm = ObjectPermission.objects.create(
+            name="View one tenant", actions=["view"], constraints={"pk": str(self.tenants[0].pk)}
+        )
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Tenant))
+
+        results = self.backend.search(self.user, "zyxwv", [Tenant])
+        self.assertEqual(results[0]["count"], 1)
+        self.assertEqual(list(results[0]["queryset"]), [self.tenants[0]])
+
+    def test_search_fallback(self):
+        """Models whose search filter can't be answered from the index are searched with their filterset."""
+        self.add_permissions("ipam.view_ipaddress")
+        ip_address = IPAddress.objects.first()
+        results = self.backend.search(self.user, str(ip_address.host), [IPAddress])
+        self.assertIsNone(results[0]["count"])
+        self.assertIn(ip_address, results[0]["queryset"])
+
+    @override_settings(SEARCH_BACKEND=INDEXED_SEARCH_BACKEND)
+    def test_update_index(self):
+        """The index is updated for objects changed within a change logging context."""
+        self.assertIs(get_search_backend().indexed, True)
+        content_type = ContentType.objects.get_for_model(Tenant)
+        deleted_pk = self.tenants[1].pk
+        with web_request_context(self.user):
+            tenant = Tenant.objects.create(name="Zyxwv Tenant 3")
+            self.tenants[0].description = "Renamed"
+            self.tenants[0].save()
+            self.tenants[1].delete()
+
+        self.assertTrue(SearchIndexEntry.objects.filter(content_type=content_type, object_id=tenant.pk).exists())
+        self.assertEqual(
+            SearchIndexEntry.objects.get(content_type=content_type, object_id=self.tenants[0].pk).text,
+            "Zyxwv Tenant 1\nRenamed",
+        )
+        self.assertFalse(SearchIndexEntry.objects.filter(content_type=content_type, object_id=deleted_pk).exists())
+
+    @override_settings(SEARCH_BACKEND=INDEXED_SEARCH_BACKEND)
+    def test_update_index_related_objects(self):
+        """Objects searched by the fields of a related object are reindexed when the related object changes."""
+        self.assertIn((DeviceType, "manufacturer__in"), get_search_dependencies()[Manufacturer])
+        manufacturer = Manufacturer.objects.create(name="Zyxwv Manufacturer")
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Model 1")
+        self.backend.rebuild_index(models=[DeviceType])
+        content_type = ContentType.objects.get_for_model(DeviceType)
+        self.assertIn(
+            "Zyxwv Manufacturer",
+            SearchIndexEntry.objects.get(content_type=content_type, object_id=device_type.pk).text,
+        )
+
+        with web_request_context(self.user):
+            manufacturer.name = "Renamed Manufacturer"
+            manufacturer.save()
+
+        text = SearchIndexEntry.objects.get(content_type=content_type, object_id=device_type.pk).text
+        self.assertIn("Renamed Manufacturer", text)
+        self.assertNotIn("Zyxwv Manufacturer", text)
+
+    @override_settings(SEARCH_BACKEND=INDEXED_SEARCH_BACKEND)
+    def test_rebuild_search_index_command(self):
+        SearchIndexEntry.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_search_index", "tenancy.Tenant", "ipam.IPAddress", stdout=out)
+        self.assertIn("Reindexing tenants", out.getvalue())
+        self.assertIn("Skipping IP addresses", out.getvalue())
+        self.assertEqual(SearchIndexEntry.objects.count(), Tenant.objects.count())
+
+    @override_settings(SEARCH_BACKEND=INDEXED_SEARCH_BACKEND, EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_search_view(self):
+        response = self.client.get(reverse("search") + "?q=zyxwv&obj_type=tenant")
+        self.assertHttpStatus(response, 200)
+        content = response.content.decode(response.charset)
+        for tenant in self.tenants:
+            self.assertIn(tenant.name, content)
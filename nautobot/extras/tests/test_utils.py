@@ -1,8 +1,20 @@
 from unittest import mock
 
+from django.contrib.contenttypes.models import ContentType
+from django.test import override_settings
+
 from nautobot.core.testing import TestCase
+from nautobot.core.utils.lookup import get_changes_for_model
+from nautobot.dcim.models import Location
+from nautobot.extras.choices import ObjectChangeActionChoices
+from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.registry import registry
-from nautobot.extras.utils import get_celery_queues, get_worker_count, populate_model_features_registry
+from nautobot.extras.utils import (
+    bulk_create_object_changes,
+    get_celery_queues,
+    get_worker_count,
+    populate_model_features_registry,
+)
 
 
 class UtilsTestCase(TestCase):
@@ -77,3 +89,25 @@ class UtilsTestCase(TestCase):
             original_custom_fields_registry,
             "Registry should be restored to original state",
         )
+
+    @override_settings(CHANGELOG_DEFERRED=False)
+    def test_bulk_create_object_changes(self):
+        location_1, location_2 = Location.objects.all()[:2]
+        with web_request_context(self.user):
+            location_1.description = "Saved"
+            location_1.save()
+            Location.objects.filter(pk__in=[location_1.pk, location_2.pk]).update(description="Updated")
+            location_1.refresh_from_db()
+            location_2.refresh_from_db()
+            # Instances that aren't change-logged are skipped without affecting the others
+            bulk_create_object_changes(
+                [ContentType.objects.get_for_model(Location), location_1, location_2],
+                action=ObjectChangeActionChoices.ACTION_UPDATE,
+            )
+
+        for location in (location_1, location_2):
+            with self.subTest(location=location):
+                object_changes = get_changes_for_model(location)
+                self.assertEqual(object_changes.count(), 1)
+                # The change already recorded for location_1 is updated to reflect its latest state
+                self.assertEqual(object_changes.first().object_data["description"], "Updated")
@@ -1,11 +1,14 @@
 from copy import deepcopy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import json
+import threading
 from unittest.mock import patch
 import uuid
 
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.test import tag
 from django.utils import timezone
 from requests import Session
 
@@ -20,12 +23,48 @@ from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.models import Tag, Webhook
 from nautobot.extras.models.statuses import Status
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhook_batch
 from nautobot.extras.utils import generate_signature
 
 User = get_user_model()
 
 
+class WebhookReceiver(ThreadingHTTPServer):
+    """A local HTTP server standing in for a webhook receiver, which records the requests it receives."""
+
+    daemon_threads = True
+
+    class RequestHandler(BaseHTTPRequestHandler):
+        # Support keep-alive connections
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            self.server.requests.append({"client_address": self.client_address, "body": json.loads(body)})
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            pass
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), self.RequestHandler)
+        self.requests = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
 class WebhookTest(APITestCase):
     @classmethod
     def setUpTestData(cls):
@@ -347,6 +386,107 @@ class WebhookTest(APITestCase):
         self.assertEqual(all_changes.count(), 1)
         mock_enqueue_webhooks.assert_called_once_with(all_changes.first())
 
+    def test_get_for_model_cached(self):
+        """Webhook subscriptions are cached until a Webhook is changed."""
+        webhook = Webhook.objects.get(type_create=True)
+        self.assertEqual(Webhook.objects.get_for_model(Location, ObjectChangeActionChoices.ACTION_CREATE), [webhook])
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                Webhook.objects.get_for_model(Location, ObjectChangeActionChoices.ACTION_CREATE), [webhook]
+            )
+        self.assertEqual(Webhook.objects.get_for_model(Location, ObjectChangeActionChoices.ACTION_DELETE), [])
+
+        webhook.enabled = False
+        webhook.save()
+        self.assertEqual(Webhook.objects.get_for_model(Location, ObjectChangeActionChoices.ACTION_CREATE), [])
+
+        webhook.enabled = True
+        webhook.save()
+        webhook.content_types.set([ContentType.objects.get_for_model(Tag)])
+        self.assertEqual(Webhook.objects.get_for_model(Location, ObjectChangeActionChoices.ACTION_CREATE), [])
+        self.assertEqual(Webhook.objects.get_for_model(Tag, ObjectChangeActionChoices.ACTION_CREATE), [webhook])
+
+    @patch("nautobot.extras.tasks.process_webhook_batch.apply_async")
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_enqueue_webhooks_batched(self, mock_async, mock_batch_async):
+        """Changes made in one change context are sent in batches of up to `batch_size` to batched webhooks."""
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.batch_size = 2
+        webhook.save()
+        location_type = LocationType.objects.get(name="Campus")
+
+        with web_request_context(self.user):
+            for i in range(3):
+                Location.objects.create(name=f"Location {i}", location_type=location_type, status=self.statuses[0])
+
+        mock_async.assert_not_called()
+        self.assertEqual(mock_batch_async.call_count, 2)
+        batches = [call[1]["args"] for call in mock_batch_async.call_args_list]
+        self.assertEqual([webhook_pk for webhook_pk, _ in batches], [webhook.pk, webhook.pk])
+        events = [event for _, batch in batches for event in batch]
+        self.assertEqual(len(batches[0][1]), 2)
+        self.assertEqual(sorted(event[0]["name"] for event in events), ["Location 0", "Location 1", "Location 2"])
+        self.assertEqual({event[2] for event in events}, {ObjectChangeActionChoices.ACTION_CREATE})
+
+    def test_process_webhook_batch(self):
+        """A batch of events is sent as a JSON array in a single request."""
+        webhook = Webhook.objects.get(type_create=True)
+        timestamp = str(timezone.now())
+        events = [
+            [
+                {"name": f"Location {i}"},
+                "location",
+                ObjectChangeActionChoices.ACTION_CREATE,
+                timestamp,
+                "user",
+                None,
+                {},
+            ]
+            for i in range(3)
+        ]
+
+        with WebhookReceiver() as receiver:
+            webhook.payload_url = receiver.url
+            webhook.batch_size = 3
+            webhook.save()
+            process_webhook_batch(webhook.pk, events)
+
+        self.assertEqual(len(receiver.requests), 1)
+        body = receiver.requests[0]["body"]
+        self.assertEqual([event["data"]["name"] for event in body], ["Location 0", "Location 1", "Location 2"])
+        self.assertEqual({event["event"] for event in body}, {"created"})
+
+    def _send_webhooks(self, receiver, count):
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.payload_url = receiver.url
+        webhook.save()
+        timestamp = str(timezone.now())
+        for i in range(count):
+            process_webhook(
+                webhook.pk,
+                {"name": f"Location {i}"},
+                "location",
+                ObjectChangeActionChoices.ACTION_CREATE,
+                timestamp,
+                "user",
+                None,
+                {},
+            )
+
+    def test_process_webhook_reuses_connections(self):
+        """Successive requests to the same host reuse a pooled keep-alive connection."""
+        with WebhookReceiver() as receiver:
+            self._send_webhooks(receiver, 5)
+
+        self.assertEqual(len(receiver.requests), 5)
+        self.assertEqual(len({request["client_address"] for request in receiver.requests}), 1)
+
+    @tag("performance")
+    def test_process_webhook_throughput(self):
+        with WebhookReceiver() as receiver:
+            self._send_webhooks(receiver, 500)
+        self.assertEqual(len(receiver.requests), 500)
+
     def test_all_webhook_supported_models(self):
         """
         Assert that all models registered to support webhooks also support change logging
@@ -19,6 +19,7 @@ from nautobot.core.choices import ColorChoices
 from nautobot.core.constants import CHARFIELD_MAX_LENGTH
 from nautobot.core.models.managers import TagsManager
 from nautobot.core.models.utils import find_models_with_matching_fields
+from nautobot.core.utils.cache import GenerationalCache
 from nautobot.extras.choices import ObjectChangeActionChoices
 from nautobot.extras.constants import (
     CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL,
@@ -30,6 +31,10 @@ from nautobot.extras.registry import registry
 
 logger = logging.getLogger(__name__)
 
+# Process-local cache of the CustomFields, ComputedFields and Relationships of each model, see `get_snapshot_for_model()`
+# of their managers
+metadata_cache = GenerationalCache("nautobot.extras.utils.metadata_cache")
+
 
 def get_base_template(base_template, model):
     """
@@ -106,6 +111,17 @@ class ChangeLoggedModelsQuery(FeaturedQueryMixin):
         return [_class for _class in apps.get_models() if hasattr(_class, "to_objectchange")]
 
 
+def queryset_from_snapshot(queryset, snapshot):
+    """
+    Return the given queryset with its results pre-populated from `snapshot`, an iterable of the objects it selects.
+
+    Iterating over, counting or indexing the queryset then doesn't query the database, though filtering it still does.
+    """
+    queryset._result_cache = list(snapshot)
+    queryset._prefetch_done = True
+    return queryset
+
+
 def change_logged_models_queryset():
     """
     Cacheable function for cases where we need this queryset many times, such as when saving multiple objects.
@@ -614,6 +630,75 @@ def migrate_role_data(
         )
 
 
+def bulk_create_object_changes(instances, action=ObjectChangeActionChoices.ACTION_CREATE, batch_size=1000):
+    """
+    Record ObjectChange instances in bulk for objects that were created or updated without calling `save()`,
+    for example via `bulk_create()` or `QuerySet.update()`. Does nothing if change logging is not enabled.
+
+    If the active change context is deferring object changes, the changes are queued to be created when it is flushed.
+    As when saving an object, if a change has already been recorded for an object within the change context, that change
+    is updated to reflect the object's current state rather than recording another one.
+    """
+    from nautobot.extras.models import ObjectChange
+    from nautobot.extras.signals import change_context_state
+
+    change_context = change_context_state.get()
+    if change_context is None:
+        return
+
+    queued_object_changes = []
+    for instance in instances:
+        if not hasattr(instance, "to_objectchange"):
+            continue
+        user = change_context.get_user(instance)
+        content_type = ContentType.objects.get_for_model(instance)
+        unique_object_change_id = f"{content_type.pk}__{instance.pk}__{getattr(user, 'pk', None)}"
+        if unique_object_change_id in change_context.deferred_object_changes:
+            # Already changed within this change context, so update its existing change as `_handle_changed_object` does
+            if change_context.defer_object_changes:
+                cached_related_change = change_context.deferred_object_changes[unique_object_change_id][-1]
+                if cached_related_change["action"] == ObjectChangeActionChoices.ACTION_DELETE:
+                    cached_related_change["action"] = ObjectChangeActionChoices.ACTION_UPDATE
+                    cached_related_change.pop("objectchange", None)
+                if "objectchange" not in cached_related_change:
+                    cached_related_change["instance"] = instance
+            else:
+                most_recent_change = (
+                    ObjectChange.objects.filter(
+                        changed_object_type=content_type,
+                        changed_object_id=instance.pk,
+                        user=user,
+                        request_id=change_context.change_id,
+                    )
+                    .order_by("-time")
+                    .first()
+                )
+                if most_recent_change is not None:
+                    objectchange = instance.to_objectchange(action)
+                    if most_recent_change.action == ObjectChangeActionChoices.ACTION_DELETE:
+                        most_recent_change.action = ObjectChangeActionChoices.ACTION_UPDATE
+                    most_recent_change.object_data = objectchange.object_data
+                    most_recent_change.object_data_v2 = objectchange.object_data_v2
+                    most_recent_change.save()
+            continue
+        change_context.deferred_object_changes[unique_object_change_id] = [
+            {"action": action, "instance": instance, "user": user}
+        ]
+        if change_context.defer_object_changes:
+            continue
+        oc = instance.to_objectchange(action)
+        oc.user = user
+        oc.user_name = user.username if user is not None else "Undefined"
+        oc.request_id = change_context.change_id
+        oc.change_context = change_context.context
+        oc.change_context_detail = change_context.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
+        queued_object_changes.append(oc)
+        if len(queued_object_changes) >= batch_size:
+            ObjectChange.objects.bulk_create(queued_object_changes)
+            queued_object_changes = []
+    ObjectChange.objects.bulk_create(queued_object_changes)
+
+
 def bulk_delete_with_bulk_change_logging(qs, batch_size=1000):
     """
     Deletes objects in the provided queryset and creates ObjectChange instances in bulk to improve performance.
@@ -626,6 +711,10 @@ def bulk_delete_with_bulk_change_logging(qs, batch_size=1000):
     if change_context is None:
         raise ValueError("Change logging must be enabled before using bulk_delete_with_bulk_change_logging")
 
+    defer_object_changes = change_context.defer_object_changes
+    deferred_object_changes = {
+        key: [dict(entry) for entry in entries] for key, entries in change_context.deferred_object_changes.items()
+    }
     with transaction.atomic():
         try:
             queued_object_changes = []
@@ -646,5 +735,10 @@ def bulk_delete_with_bulk_change_logging(qs, batch_size=1000):
             ObjectChange.objects.bulk_create(queued_object_changes)
             return qs.delete()
         finally:
-            change_context.defer_object_changes = False
-            change_context.reset_deferred_object_changes()
+            change_context.defer_object_changes = defer_object_changes
+            if defer_object_changes:
+                # Discard the changes queued by the deletion above, restoring those that were deferred beforehand
+                change_context.deferred_object_changes.clear()
+                change_context.deferred_object_changes.update(deferred_object_changes)
+            else:
+                change_context.reset_deferred_object_changes()
@@ -1,9 +1,14 @@
+from contextlib import contextmanager
+import contextvars
+
 from django.utils import timezone
 
-from nautobot.extras.choices import ObjectChangeActionChoices
 from nautobot.extras.models import Webhook
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhook_batch
+
+# Webhook events collected by the current `batch_webhooks()` context, by Webhook, if any
+webhook_batches_state = contextvars.ContextVar("webhook_batches", default=None)
 
 
 def enqueue_webhooks(object_change):
@@ -18,21 +23,17 @@ def enqueue_webhooks(object_change):
         return
 
     # Retrieve any applicable Webhooks
-    content_type = object_change.changed_object_type
-    action_flag = {
-        ObjectChangeActionChoices.ACTION_CREATE: "type_create",
-        ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
-        ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
-    }[object_change.action]
-    webhooks = Webhook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
-
-    if webhooks.exists():
+    model = object_change.changed_object_type.model_class()
+    webhooks = Webhook.objects.get_for_model(model, object_change.action) if model is not None else []
+
+    if webhooks:
         # fall back to object_data if object_data_v2 is not available
         serialized_data = object_change.object_data_v2
         if serialized_data is None:
             serialized_data = object_change.object_data
 
         # Enqueue the webhooks
+        batches = webhook_batches_state.get()
         for webhook in webhooks:
             args = [
                 webhook.pk,
@@ -44,4 +45,41 @@ def enqueue_webhooks(object_change):
                 object_change.request_id,
                 object_change.get_snapshots(),
             ]
-            process_webhook.apply_async(args=args)
+            if webhook.batch_size > 1:
+                if batches is not None:
+                    batches.setdefault(webhook, []).append(args[1:])
+                else:
+                    process_webhook_batch.apply_async(args=[webhook.pk, [args[1:]]])
+            else:
+                process_webhook.apply_async(args=args)
+
+
+def enqueue_webhook_batches(batches):
+    """
+    Enqueue the webhook events collected by `batch_webhooks()`, in batches of up to each Webhook's `batch_size` events.
+    """
+    for webhook, events in batches.items():
+        for offset in range(0, len(events), webhook.batch_size):
+            process_webhook_batch.apply_async(args=[webhook.pk, events[offset : offset + webhook.batch_size]])
+
+
+@contextmanager
+def batch_webhooks():
+    """
+    Collect the events for Webhooks with a `batch_size` greater than 1 that are enqueued within this context, and
+    enqueue them in batches once it exits, rather than enqueueing a separate task for each event.
+
+    Events for other Webhooks are enqueued immediately, as usual.
+    """
+    if webhook_batches_state.get() is not None:
+        # An outer context is already collecting events
+        yield
+        return
+
+    batches = {}
+    token = webhook_batches_state.set(batches)
+    try:
+        yield
+    finally:
+        webhook_batches_state.reset(token)
+    enqueue_webhook_batches(batches)
@@ -0,0 +1,146 @@
+"""Concurrency-safe allocation of available IP addresses and child prefixes from a parent Prefix."""
+
+from itertools import islice
+
+from django.db import connection, transaction
+import netaddr
+
+from nautobot.ipam.models import IPAddress, Prefix
+
+
+class AllocationError(Exception):
+    """Raised when a Prefix does not have enough available space to satisfy an allocation request."""
+
+
+def lock_prefix(prefix):
+    """
+    Acquire an exclusive allocation lock on `prefix` for the remainder of the current database transaction.
+
+    Allocators working on different prefixes never block one another, and the lock is released automatically when the
+    transaction commits or rolls back, so no separate cleanup is needed. On PostgreSQL this is a transaction-level
+    advisory lock, which doesn't block other writes to the Prefix row itself; on other backends the Prefix row is
+    locked with `SELECT ... FOR UPDATE`.
+
+    Raises:
+        TransactionManagementError: if called outside of a transaction.
+    """
+    if not connection.in_atomic_block:
+        raise transaction.TransactionManagementError("lock_prefix() must be called inside a transaction.")
+    if connection.vendor == "postgresql":
+        lock_id = int.from_bytes(prefix.pk.bytes[:8], "big", signed=True)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [lock_id])
+    else:
+        list(Prefix.objects.select_for_update().filter(pk=prefix.pk).values_list("pk", flat=True))
+
+
+def reserve_ips(prefix, count=1, contiguous=False):
+    """
+    Lock `prefix` and return the first `count` available IP addresses within it.
+
+    The returned addresses remain reserved for the calling transaction until it ends, so they should be created
+    before it commits.
+
+    Args:
+        prefix (Prefix): Prefix to allocate from.
+        count (int, optional): Number of addresses to reserve.
+        contiguous (bool, optional): Only return a single block of `count` consecutive addresses.
+
+    Returns:
+        (list): `netaddr.IPAddress` objects.
+
+    Raises:
+        AllocationError: if fewer than `count` addresses (or no block of that size, if `contiguous`) are available.
+    """
+    lock_prefix(prefix)
+    if contiguous:
+        for first, last in prefix.iter_available_ip_ranges():
+            if int(last) - int(first) + 1 >= count:
+                return [first + offset for offset in range(count)]
+        raise AllocationError(f"No block of {count} consecutive IP addresses is available within the prefix {prefix}")
+
+    available_ips = list(islice(prefix.iter_available_ips(), count))
+    if len(available_ips) < count:
+        raise AllocationError(
+            f"An insufficient number of IP addresses are available within the prefix {prefix} "
+            f"({count} requested, {len(available_ips)} available)"
+        )
+    return available_ips
+
+
+def reserve_prefixes(prefix, prefix_lengths):
+    """
+    Lock `prefix` and return the first available child network of each of the given `prefix_lengths`.
+
+    Args:
+        prefix (Prefix): Prefix to allocate from.
+        prefix_lengths (list): Prefix length of each network to reserve, in the order they should be allocated.
+
+    Returns:
+        (list): `netaddr.IPNetwork` objects, one per entry in `prefix_lengths`.
+
+    Raises:
+        AllocationError: if there is insufficient space to accommodate all of the requested prefixes.
+    """
+    lock_prefix(prefix)
+    available_prefixes = prefix.get_available_prefixes()
+    reserved = []
+    for prefix_length in prefix_lengths:
+        # Find the first available prefix equal to or larger than the requested size
+        for available_prefix in available_prefixes.iter_cidrs():
+            if prefix_length >= available_prefix.prefixlen:
+                allocated_prefix = netaddr.IPNetwork(f"{available_prefix.network}/{prefix_length}")
+                break
+        else:
+            raise AllocationError("Insufficient space is available to accommodate the requested prefix size(s)")
+        available_prefixes.remove(allocated_prefix)
+        reserved.append(allocated_prefix)
+    return reserved
+
+
+def allocate_ips(prefix, count=1, contiguous=False, **kwargs):
+    """
+    Create `count` new IP addresses from the available space within `prefix` in a single transaction.
+
+    Args:
+        prefix (Prefix): Prefix to allocate from.
+        count (int, optional): Number of IP addresses to create.
+        contiguous (bool, optional): Allocate a single block of consecutive addresses.
+        **kwargs: Additional field values (such as `status`) for each created `IPAddress`.
+
+    Returns:
+        (list): The created `IPAddress` objects.
+
+    Examples:
+        >>> allocate_ips(prefix, count=4, contiguous=True, status=active)
+        [<IPAddress: 10.0.0.1/24>, <IPAddress: 10.0.0.2/24>, <IPAddress: 10.0.0.3/24>, <IPAddress: 10.0.0.4/24>]
+    """
+    with transaction.atomic():
+        ip_addresses = []
+        for address in reserve_ips(prefix, count=count, contiguous=contiguous):
+            ip_address = IPAddress(address=f"{address}/{prefix.prefix_length}", namespace=prefix.namespace, **kwargs)
+            ip_address.validated_save()
+            ip_addresses.append(ip_address)
+        return ip_addresses
+
+
+def allocate_prefixes(prefix, prefix_length, count=1, **kwargs):
+    """
+    Create `count` new child prefixes of the given `prefix_length` from the available space within `prefix`.
+
+    Args:
+        prefix (Prefix): Prefix to allocate from.
+        prefix_length (int): Prefix length of each child prefix.
+        count (int, optional): Number of child prefixes to create.
+        **kwargs: Additional field values (such as `status`) for each created `Prefix`.
+
+    Returns:
+        (list): The created `Prefix` objects.
+    """
+    with transaction.atomic():
+        prefixes = []
+        for network in reserve_prefixes(prefix, [prefix_length] * count):
+            child = Prefix(prefix=network, namespace=prefix.namespace, **kwargs)
+            child.validated_save()
+            prefixes.append(child)
+        return prefixes
@@ -1,17 +1,21 @@
-from django.conf import settings
-from django.core.cache import cache
+from itertools import islice
+
+from django.db import transaction
 from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from rest_framework import status
 from rest_framework.decorators import action
-from rest_framework.exceptions import APIException
+from rest_framework.exceptions import APIException, ValidationError
 from rest_framework.response import Response
 
 from nautobot.core.models.querysets import count_related
+from nautobot.core.settings_funcs import is_truthy
 from nautobot.core.utils.config import get_settings_or_config
 from nautobot.dcim.models import Location
 from nautobot.extras.api.views import NautobotModelViewSet
 from nautobot.ipam import filters
+from nautobot.ipam.allocation import AllocationError, reserve_ips, reserve_prefixes
 from nautobot.ipam.models import (
     IPAddress,
     IPAddressToInterface,
@@ -31,6 +35,17 @@ from nautobot.ipam.models import (
 
 from . import serializers
 
+
+class HierarchyIndexBulkCreateMixin:
+    """Resolve the Prefix hierarchy of all objects in a bulk (list) POST request in memory, once per batch."""
+
+    def create(self, request, *args, **kwargs):
+        if isinstance(request.data, list):
+            with self.queryset.hierarchy_index(data=request.data):
+                return super().create(request, *args, **kwargs)
+        return super().create(request, *args, **kwargs)
+
+
 #
 # Namespace
 #
@@ -107,7 +122,7 @@ class RIRViewSet(NautobotModelViewSet):
     retrieve=extend_schema(responses={"200": serializers.PrefixLegacySerializer}, versions=["2.0", "2.1"]),
     update=extend_schema(responses={"200": serializers.PrefixLegacySerializer}, versions=["2.0", "2.1"]),
 )
-class PrefixViewSet(NautobotModelViewSet):
+class PrefixViewSet(HierarchyIndexBulkCreateMixin, NautobotModelViewSet):
     queryset = Prefix.objects.select_related(
         "namespace",
         "parent",
@@ -173,45 +188,34 @@ class PrefixViewSet(NautobotModelViewSet):
         """
         A convenience method for listing and/or allocating available child prefixes within a parent.
 
-        This uses a Redis lock to prevent this API from being invoked in parallel, in order to avoid a race condition
-        if multiple clients tried to simultaneously request allocation from the same parent prefix.
+        Allocation holds a database lock on the parent prefix for the duration of the request's transaction, in order to
+        avoid a race condition if multiple clients tried to simultaneously request allocation from the same parent.
         """
         prefix = get_object_or_404(self.queryset, pk=pk)
         if request.method == "POST":
-            with cache.lock(
-                "nautobot.ipam.api.views.available_prefixes", blocking_timeout=5, timeout=settings.REDIS_LOCK_TIMEOUT
-            ):
-                available_prefixes = prefix.get_available_prefixes()
-
-                # Validate Requested Prefixes' length
-                serializer = serializers.PrefixLengthSerializer(
-                    data=request.data if isinstance(request.data, list) else [request.data],
-                    many=True,
-                    context={
-                        "request": request,
-                        "prefix": prefix,
-                    },
-                )
-                serializer.is_valid(raise_exception=True)
+            # Validate Requested Prefixes' length
+            serializer = serializers.PrefixLengthSerializer(
+                data=request.data if isinstance(request.data, list) else [request.data],
+                many=True,
+                context={
+                    "request": request,
+                    "prefix": prefix,
+                },
+            )
+            serializer.is_valid(raise_exception=True)
 
-                requested_prefixes = serializer.validated_data
+            requested_prefixes = serializer.validated_data
+            with transaction.atomic():
                 # Allocate prefixes to the requested objects based on availability within the parent
-                for requested_prefix in requested_prefixes:
-                    # Find the first available prefix equal to or larger than the requested size
-                    for available_prefix in available_prefixes.iter_cidrs():
-                        if requested_prefix["prefix_length"] >= available_prefix.prefixlen:
-                            allocated_prefix = f"{available_prefix.network}/{requested_prefix['prefix_length']}"
-                            requested_prefix["prefix"] = allocated_prefix
-                            requested_prefix["namespace"] = prefix.namespace.pk
-                            break
-                    else:
-                        return Response(
-                            {"detail": "Insufficient space is available to accommodate the requested prefix size(s)"},
-                            status=status.HTTP_204_NO_CONTENT,
-                        )
-
-                    # Remove the allocated prefix from the list of available prefixes
-                    available_prefixes.remove(allocated_prefix)
+                try:
+                    allocated_prefixes = reserve_prefixes(
+                        prefix, [requested_prefix["prefix_length"] for requested_prefix in requested_prefixes]
+                    )
+                except AllocationError as e:
+                    return Response({"detail": str(e)}, status=status.HTTP_204_NO_CONTENT)
+                for requested_prefix, allocated_prefix in zip(requested_prefixes, allocated_prefixes):
+                    requested_prefix["prefix"] = str(allocated_prefix)
+                    requested_prefix["namespace"] = prefix.namespace.pk
 
                 # Initialize the serializer with a list or a single object depending on what was requested
                 context = {"request": request, "depth": 0}
@@ -226,9 +230,8 @@ class PrefixViewSet(NautobotModelViewSet):
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
 
         else:
-            available_prefixes = prefix.get_available_prefixes()
             serializer = serializers.AvailablePrefixSerializer(
-                available_prefixes.iter_cidrs(),
+                list(prefix.iter_available_prefixes()),
                 many=True,
                 context={
                     "request": request,
@@ -242,6 +245,21 @@ class PrefixViewSet(NautobotModelViewSet):
         methods=["post"],
         responses={201: serializers.IPAddressSerializer(many=True)},
         request=serializers.IPAllocationSerializer(many=True),
+        parameters=[
+            OpenApiParameter(
+                name="count",
+                location="query",
+                type=OpenApiTypes.INT,
+                description="Number of IP addresses to allocate with the attributes of a single POSTed object "
+                "(up to MAX_PAGE_SIZE, if set)",
+            ),
+            OpenApiParameter(
+                name="contiguous",
+                location="query",
+                type=OpenApiTypes.BOOL,
+                description="Only allocate a single block of consecutive IP addresses",
+            ),
+        ],
     )
     @action(
         detail=True,
@@ -258,52 +276,73 @@ class PrefixViewSet(NautobotModelViewSet):
         By default, the number of IPs returned will be equivalent to PAGINATE_COUNT.
         An arbitrary limit (up to MAX_PAGE_SIZE, if set) may be passed, however results will not be paginated.
 
-        This uses a Redis lock to prevent this API from being invoked in parallel, in order to avoid a race condition
-        if multiple clients tried to simultaneously request allocation from the same parent prefix.
+        When allocating, a single object may be POSTed with a `count` query parameter (up to MAX_PAGE_SIZE, if set) to
+        create that many IP addresses with the same attributes, and `contiguous=true` may be specified to require that
+        the allocated addresses form a single consecutive block. All requested addresses are allocated in a single
+        transaction, which holds a database lock on the parent prefix in order to avoid a race condition if multiple
+        clients tried to simultaneously request allocation from the same parent prefix.
         """
         prefix = get_object_or_404(Prefix.objects.restrict(request.user), pk=pk)
 
         # Create the next available IP within the prefix
         if request.method == "POST":
-            with cache.lock(
-                "nautobot.ipam.api.views.available_ips", blocking_timeout=5, timeout=settings.REDIS_LOCK_TIMEOUT
-            ):
-                # Normalize to a list of objects
-                serializer = serializers.IPAllocationSerializer(
-                    data=request.data if isinstance(request.data, list) else [request.data],
-                    many=True,
-                    context={
-                        "request": request,
-                        "prefix": prefix,
-                    },
-                )
-                serializer.is_valid(raise_exception=True)
+            many = isinstance(request.data, list)
+            data = request.data if many else [request.data]
+            if "count" in request.query_params:
+                try:
+                    count = int(request.query_params["count"])
+                except ValueError:
+                    count = 0
+                if many or count < 1:
+                    raise ValidationError({"count": "count must be a positive integer and requires a single object."})
+                # Bound the batch built below by MAX_PAGE_SIZE, as for listing, or if that is unlimited, by the number
+                # of IPs that could possibly be allocated
+                max_page_size = get_settings_or_config("MAX_PAGE_SIZE")
+                if max_page_size:
+                    if count > max_page_size:
+                        raise ValidationError({"count": f"count may not exceed MAX_PAGE_SIZE ({max_page_size})."})
+                else:
+                    available_count = 0
+                    for first, last in prefix.iter_available_ip_ranges():
+                        available_count += int(last) - int(first) + 1
+                        if available_count >= count:
+                            break
+                    if count > available_count:
+                        raise ValidationError(
+                            {"count": f"count exceeds the number of available IP addresses ({available_count})."}
+                        )
+                many = True
+                data = data * count
+            contiguous = is_truthy(request.query_params.get("contiguous", False))
 
-                requested_ips = serializer.validated_data
+            # Normalize to a list of objects
+            serializer = serializers.IPAllocationSerializer(
+                data=data,
+                many=True,
+                context={
+                    "request": request,
+                    "prefix": prefix,
+                },
+            )
+            serializer.is_valid(raise_exception=True)
 
+            requested_ips = serializer.validated_data
+            with transaction.atomic():
                 # Determine if the requested number of IPs is available
-                available_ips = prefix.get_available_ips()
-                if available_ips.size < len(requested_ips):
-                    return Response(
-                        {
-                            "detail": (
-                                f"An insufficient number of IP addresses are available within the prefix {prefix} "
-                                f"({len(requested_ips)} requested, {len(available_ips)} available)"
-                            )
-                        },
-                        status=status.HTTP_204_NO_CONTENT,
-                    )
+                try:
+                    available_ips = reserve_ips(prefix, count=len(requested_ips), contiguous=contiguous)
+                except AllocationError as e:
+                    return Response({"detail": str(e)}, status=status.HTTP_204_NO_CONTENT)
 
                 # Assign addresses from the list of available IPs and copy Namespace assignment from the parent Prefix
-                available_ips = iter(available_ips)
                 prefix_length = prefix.prefix.prefixlen
-                for requested_ip in requested_ips:
-                    requested_ip["address"] = f"{next(available_ips)}/{prefix_length}"
+                for requested_ip, available_ip in zip(requested_ips, available_ips):
+                    requested_ip["address"] = f"{available_ip}/{prefix_length}"
                     requested_ip["namespace"] = prefix.namespace.pk
 
                 # Initialize the serializer with a list or a single object depending on what was requested
                 context = {"request": request, "depth": 0}
-                if isinstance(request.data, list):
+                if many:
                     serializer = serializers.IPAddressSerializer(data=requested_ips, many=True, context=context)
                 else:
                     serializer = serializers.IPAddressSerializer(data=requested_ips[0], context=context)
@@ -323,11 +362,7 @@ class PrefixViewSet(NautobotModelViewSet):
                 limit = min(limit, get_settings_or_config("MAX_PAGE_SIZE"))
 
             # Calculate available IPs within the prefix
-            ip_list = []
-            for index, ip in enumerate(prefix.get_available_ips(), start=1):
-                ip_list.append(ip)
-                if index == limit:
-                    break
+            ip_list = list(islice(prefix.iter_available_ips(), limit if limit > 0 else None))
             serializer = serializers.AvailableIPSerializer(
                 ip_list,
                 many=True,
@@ -351,7 +386,7 @@ class PrefixLocationAssignmentViewSet(NautobotModelViewSet):
 #
 
 
-class IPAddressViewSet(NautobotModelViewSet):
+class IPAddressViewSet(HierarchyIndexBulkCreateMixin, NautobotModelViewSet):
     queryset = IPAddress.objects.select_related(
         "nat_inside",
         "parent",
@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from nautobot.extras.models import Status
+from nautobot.ipam.allocation import allocate_ips, AllocationError
+from nautobot.ipam.models import get_default_namespace, IPAddress, Prefix
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate many parallel clients allocating IP addresses from a single Prefix and report throughput, latency "
+        "and any duplicate allocations. The created IP addresses are deleted afterward unless --keep is specified."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("prefix", help="CIDR of an existing Prefix to allocate from.")
+        parser.add_argument("--namespace", help="Name of the Namespace of the Prefix (default: the Global namespace).")
+        parser.add_argument("--workers", type=int, default=8, help="Number of parallel allocators (default: 8).")
+        parser.add_argument(
+            "--requests", type=int, default=10, help="Number of allocation requests per worker (default: 10)."
+        )
+        parser.add_argument("--count", type=int, default=1, help="IP addresses allocated per request (default: 1).")
+        parser.add_argument("--contiguous", action="store_true", help="Allocate consecutive blocks of addresses.")
+        parser.add_argument(
+            "--status", default="Active", help='Status of the created IP addresses (default: "Active").'
+        )
+        parser.add_argument("--keep", action="store_true", help="Don't delete the created IP addresses afterward.")
+
+    def handle(self, *args, **options):
+        if options["namespace"]:
+            prefix_filter = {"namespace__name": options["namespace"]}
+        else:
+            prefix_filter = {"namespace": get_default_namespace()}
+        try:
+            prefix = Prefix.objects.get(prefix=options["prefix"], **prefix_filter)
+            status = Status.objects.get_for_model(IPAddress).get(name=options["status"])
+        except (Prefix.DoesNotExist, Status.DoesNotExist) as err:
+            raise CommandError(err) from err
+
+        description = f"Allocation load test {time.time()}"
+        self.stdout.write(
+            f"Running {options['workers']} workers x {options['requests']} requests x {options['count']} IP addresses "
+            f"against {prefix} ..."
+        )
+
+        def worker(_):
+            latencies = []
+            failures = errors = 0
+            try:
+                for _ in range(options["requests"]):
+                    start = time.monotonic()
+                    try:
+                        allocate_ips(
+                            prefix,
+                            count=options["count"],
+                            contiguous=options["contiguous"],
+                            status=status,
+                            description=description,
+                        )
+                    except AllocationError:
+                        failures += 1
+                    except Exception as err:  # pylint: disable=broad-except
+                        # e.g. an IntegrityError if two workers were handed the same address
+                        self.stderr.write(f"Allocation failed: {err}")
+                        errors += 1
+                    latencies.append(time.monotonic() - start)
+            finally:
+                # Django uses a separate database connection per thread but doesn't close them automatically
+                connection.close()
+            return latencies, failures, errors
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            results = list(executor.map(worker, range(options["workers"])))
+        elapsed = time.monotonic() - start
+
+        latencies = sorted(latency for worker_latencies, _, _ in results for latency in worker_latencies)
+        failures = sum(worker_failures for _, worker_failures, _ in results)
+        errors = sum(worker_errors for _, _, worker_errors in results)
+        created = IPAddress.objects.filter(parent__namespace=prefix.namespace, description=description)
+        hosts = list(created.values_list("host", flat=True))
+        duplicates = len(hosts) - len(set(hosts))
+
+        self.stdout.write(
+            f"Allocated {len(hosts)} IP addresses in {elapsed:.2f} seconds ({len(hosts) / elapsed:.1f}/s)"
+        )
+        self.stdout.write(
+            f"Requests: {len(latencies)} ({failures} failed for lack of available space, {errors} failed with errors)"
+        )
+        if latencies:
+            self.stdout.write(
+                f"Latency: median {statistics.median(latencies) * 1000:.1f} ms, "
+                f"95th percentile {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f} ms, "
+                f"max {latencies[-1] * 1000:.1f} ms"
+            )
+        if duplicates:
+            self.stderr.write(self.style.ERROR(f"{duplicates} duplicate IP addresses were allocated!"))
+        else:
+            self.stdout.write(self.style.SUCCESS("No duplicate IP addresses were allocated."))
+
+        if not options["keep"]:
+            created.delete()
+        if duplicates or errors:
+            raise CommandError("Concurrent allocation was not handled correctly")
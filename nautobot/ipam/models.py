@@ -22,6 +22,7 @@ from nautobot.ipam import choices, constants
 from nautobot.virtualization.models import VMInterface
 
 from .fields import VarbinaryIPField
+from .prefix_index import get_prefix_index
 from .querysets import IPAddressQuerySet, PrefixQuerySet, RIRQuerySet, VLANQuerySet
 from .validators import DNSValidator
 
@@ -611,11 +612,20 @@ class Prefix(PrimaryModel):
             # which will (re)set the broadcast and ip_version values of this instance to their correct values.
             self.prefix = self.prefix.cidr
 
+        # If a PrefixIndex is active for this namespace, use it to avoid range scans of the Prefix table.
+        index = get_prefix_index(self.namespace_id, cidr=self.prefix) if self.prefix is not None else None
+
         # Determine if a parent exists and set it to the closest ancestor by `prefix_length`.
-        supernets = self.supernets()
-        if supernets:
-            parent = max(supernets, key=operator.attrgetter("prefix_length"))
-            self.parent = parent
+        if index is not None:
+            # This prefix may already be indexed under its previous CIDR, which must not be mistaken for its parent
+            parent_pk = index.get_closest_parent(self.prefix, exclude=self.pk)
+            if parent_pk is not None:
+                self.parent_id = parent_pk
+        else:
+            supernets = self.supernets()
+            if supernets:
+                parent = max(supernets, key=operator.attrgetter("prefix_length"))
+                self.parent = parent
 
         # Validate that creation of this prefix does not create an invalid parent/child relationship
         # 3.0 TODO: uncomment this to enforce this constraint
@@ -652,6 +662,12 @@ class Prefix(PrimaryModel):
             if self._location is not None:
                 self.location = self._location
 
+        if index is not None:
+            index.add_prefix(self.pk, self.prefix)
+            # Nothing is contained within this prefix, so there is nothing to reparent.
+            if not index.has_descendants(self.prefix):
+                return
+
         # Determine the subnets and reparent them to this prefix.
         self.reparent_subnets()
         # Determine the child IPs and reparent them to this prefix.
@@ -844,15 +860,81 @@ class Prefix(PrimaryModel):
 
         return query
 
+    @staticmethod
+    def _iter_unallocated_ranges(first, last, allocated):
+        """
+        Yield the `(start, end)` integer ranges between `first` and `last` (inclusive) not covered by `allocated`.
+
+        Args:
+            first (int): First address of the range to search.
+            last (int): Last address of the range to search.
+            allocated (iterable): `(start, end)` integer ranges of allocated space, sorted by `start`. Ranges may
+                overlap or nest within one another.
+        """
+        cursor = first
+        for start, end in allocated:
+            if start > cursor:
+                yield cursor, min(start - 1, last)
+            cursor = max(cursor, end + 1)
+            if cursor > last:
+                return
+        yield cursor, last
+
+    def iter_available_prefixes(self):
+        """
+        Yield the available child networks within this prefix as `netaddr.IPNetwork` objects, in order.
+
+        Child prefixes are streamed from the database in order of their network address, so that the first few
+        available networks can be found without loading every child prefix or building an `IPSet` of the parent.
+        """
+        children = self.children.order_by("network").values_list("network", "broadcast").iterator()
+        allocated = (
+            (int(netaddr.IPAddress(network)), int(netaddr.IPAddress(broadcast))) for network, broadcast in children
+        )
+        for start, end in self._iter_unallocated_ranges(self.prefix.first, self.prefix.last, allocated):
+            yield from netaddr.iprange_to_cidrs(
+                netaddr.IPAddress(start, self.ip_version), netaddr.IPAddress(end, self.ip_version)
+            )
+
+    def iter_available_ip_ranges(self):
+        """
+        Yield the ranges of available IPs within this prefix as `(first, last)` pairs of `netaddr.IPAddress`, in order.
+
+        As with `get_available_ips()`, the first and last addresses of IPv4 prefixes of type network with a prefix
+        length of /30 or shorter are excluded. Existing IP addresses are streamed from the database in order, so the
+        cost of finding the first few available IPs does not depend on the size of the prefix.
+        """
+        first, last = self.prefix.first, self.prefix.last
+        # IPv6, pool, or IPv4 /31-32 sets are fully usable
+        if not any(
+            [
+                self.ip_version == 6,
+                self.type == choices.PrefixTypeChoices.TYPE_POOL,
+                self.ip_version == 4 and self.prefix_length >= 31,
+            ]
+        ):
+            first, last = first + 1, last - 1
+
+        hosts = self.ip_addresses.order_by("host").values_list("host", flat=True).iterator()
+        allocated = ((int(netaddr.IPAddress(host)),) * 2 for host in hosts)
+        for start, end in self._iter_unallocated_ranges(first, last, allocated):
+            yield netaddr.IPAddress(start, self.ip_version), netaddr.IPAddress(end, self.ip_version)
+
+    def iter_available_ips(self):
+        """
+        Yield the available IPs within this prefix as `netaddr.IPAddress` objects, in order.
+
+        See `iter_available_ip_ranges()`.
+        """
+        for first, last in self.iter_available_ip_ranges():
+            for value in range(int(first), int(last) + 1):
+                yield netaddr.IPAddress(value, self.ip_version)
+
     def get_available_prefixes(self):
         """
         Return all available Prefixes within this prefix as an IPSet.
         """
-        prefix = netaddr.IPSet(self.prefix)
-        child_prefixes = netaddr.IPSet([child.prefix for child in self.descendants()])
-        available_prefixes = prefix - child_prefixes
-
-        return available_prefixes
+        return netaddr.IPSet(self.iter_available_prefixes())
 
     def get_available_ips(self):
         """
@@ -903,19 +985,16 @@ class Prefix(PrimaryModel):
         """
         Return the first available child prefix within the prefix (or None).
         """
-        available_prefixes = self.get_available_prefixes()
-        if not available_prefixes:
-            return None
-        return available_prefixes.iter_cidrs()[0]
+        return next(self.iter_available_prefixes(), None)
 
     def get_first_available_ip(self):
         """
         Return the first available IP within the prefix (or None).
         """
-        available_ips = self.get_available_ips()
-        if not available_ips:
+        first_available_ip = next(self.iter_available_ips(), None)
+        if first_available_ip is None:
             return None
-        return f"{next(available_ips.__iter__())}/{self.prefix_length}"
+        return f"{first_available_ip}/{self.prefix_length}"
 
     def get_utilization(self):
         """Return the utilization of this prefix as a UtilizationData object.
@@ -925,40 +1004,56 @@ class Prefix(PrimaryModel):
         For prefixes containing IP addresses and/or pools, pools are considered fully utilized while
         only IP addresses that are not contained within pools are added to the utilization.
 
+        If this prefix was retrieved with `Prefix.objects.with_utilization()`, no further database queries are made.
+
         Returns:
             UtilizationData (namedtuple): (numerator, denominator)
         """
         denominator = self.prefix.size
-        child_ips = netaddr.IPSet()
-        child_prefixes = netaddr.IPSet()
+        max_bits = 32 if self.ip_version == 4 else 128
+        is_network = self.type == choices.PrefixTypeChoices.TYPE_NETWORK
+        exclude_edges = all([denominator > 2, is_network, self.ip_version == 4])
+        prefetched = hasattr(self, "_utilization_children")
 
         # 3.0 TODO: In the long term, TYPE_POOL prefixes will be disallowed from directly containing IPAddresses,
         # and the addresses will instead be parented to the containing TYPE_NETWORK prefix. It should be possible to
         # change this when that is the case, see #3873 for historical context.
+        ip_count = edge_ip_count = 0
         if self.type != choices.PrefixTypeChoices.TYPE_CONTAINER:
-            pool_ips = IPAddress.objects.filter(
-                parent__namespace=self.namespace, host__gte=self.network, host__lte=self.broadcast
-            ).values_list("host", flat=True)
-            child_ips = netaddr.IPSet(pool_ips)
-
+            if prefetched:
+                ip_count = self._utilization_ip_count
+                edge_ip_count = self._utilization_edge_ip_count
+            else:
+                ip_addresses = IPAddress.objects.filter(parent__namespace=self.namespace, ip_version=self.ip_version)
+                ip_count = ip_addresses.filter(host__gte=self.network, host__lte=self.broadcast).count()
+                if exclude_edges and ip_count:
+                    edge_ip_count = ip_addresses.filter(host__in=[self.network, self.broadcast]).count()
+
+        children = []
         if self.type != choices.PrefixTypeChoices.TYPE_POOL:
-            child_prefixes = netaddr.IPSet(p.prefix for p in self.children.only("network", "prefix_length").iterator())
-
-        numerator_set = child_ips | child_prefixes
+            if prefetched:
+                children = self._utilization_children
+            else:
+                children = self.children.only("network", "broadcast", "prefix_length")
+                if is_network:
+                    children = children.with_ip_address_count()
+
+        # Direct child prefixes never overlap one another, so the utilized space is the sum of their sizes plus
+        # the IP addresses that don't fall within any of them.
+        numerator = ip_count
+        edge_used = bool(edge_ip_count)
+        for child in children:
+            numerator += 2 ** (max_bits - child.prefix_length)
+            if is_network:
+                numerator -= child._utilization_ip_count
+            edge_used = edge_used or child.network == self.network or child.broadcast == self.broadcast
 
         # Exclude network and broadcast address from the denominator unless they've been assigned to an IPAddress or child pool.
         # Only applies to IPv4 network prefixes with a prefix length of /30 or shorter
-        if all(
-            [
-                denominator > 2,
-                self.type == choices.PrefixTypeChoices.TYPE_NETWORK,
-                self.ip_version == 4,
-            ]
-        ):
-            if not any([self.network in numerator_set, self.broadcast in numerator_set]):
-                denominator -= 2
+        if exclude_edges and not edge_used:
+            denominator -= 2
 
-        return UtilizationData(numerator=numerator_set.size, denominator=denominator)
+        return UtilizationData(numerator=numerator, denominator=denominator)
 
 
 @extras_features("graphql")
@@ -1098,10 +1193,10 @@ class IPAddress(PrimaryModel):
             return None
         try:
             closest_parent = (
-                Prefix.objects.filter(namespace=self._namespace)
+                Prefix.objects
                 # 3.0 TODO: disallow IPAddress from parenting to a TYPE_POOL prefix, instead pick closest TYPE_NETWORK
                 # .exclude(type=choices.PrefixTypeChoices.TYPE_POOL)
-                .get_closest_parent(self.host, include_self=True)
+                .get_closest_parent(self.host, include_self=True, namespace=self._namespace)
             )
             return closest_parent
         except Prefix.DoesNotExist as e:
@@ -1152,8 +1247,15 @@ class IPAddress(PrimaryModel):
         if closest_parent is not None:
             self.parent = closest_parent
             self._namespace = None
+        is_new = not self.present_in_database
         super().save(*args, **kwargs)
 
+        # Keep any active PrefixIndex aware of this host so that later Prefixes can be reparented correctly.
+        if is_new and self.parent is not None:
+            index = get_prefix_index(self.parent.namespace_id)
+            if index is not None:
+                index.add_host(self.host)
+
     @property
     def address(self):
         if self.host is not None and self.mask_length is not None:
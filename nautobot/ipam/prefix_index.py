@@ -0,0 +1,305 @@
+"""In-memory longest-prefix-match index of the Prefix (and IPAddress) hierarchy of a single Namespace."""
+
+import contextlib
+import threading
+
+from django.db.models import Q
+import netaddr
+
+_MAX_BITS = {4: 32, 6: 128}
+
+_active = threading.local()
+
+
+class _Node:
+    """A node of a path-compressed binary (PATRICIA) trie."""
+
+    __slots__ = ("children", "host_count", "length", "prefix_pk", "value")
+
+    def __init__(self, value, length, prefix_pk=None):
+        self.value = value
+        self.length = length
+        self.children = [None, None]
+        self.prefix_pk = prefix_pk
+        self.host_count = 0
+
+    @property
+    def is_empty(self):
+        return self.prefix_pk is None and not self.host_count
+
+
+class PrefixIndex:
+    """
+    Per-namespace radix tree of Prefix networks and IPAddress hosts.
+
+    The index answers "what is the closest parent Prefix of this CIDR" and "does anything exist beneath this CIDR"
+    in time proportional to the address length, independent of the number of rows in the namespace. It is used by
+    `Prefix.save()`, `IPAddress.save()` and `PrefixQuerySet.get_closest_parent()` while it is active (see
+    `prefix_index()`), and is kept up to date incrementally as those objects are saved and deleted.
+
+    Changes made by other processes, or through queryset `update()`/`delete()` calls, are *not* reflected in the index.
+    """
+
+    def __init__(self, namespace_id, scope=None):
+        self.namespace_id = namespace_id
+        self.scope = scope
+        self._roots = {version: _Node(0, 0) for version in _MAX_BITS}
+        self._prefixes = {}  # pk -> (ip_version, value, length)
+
+    def __len__(self):
+        return len(self._prefixes)
+
+    @classmethod
+    def build(cls, namespace, cidrs=None, chunk_size=500):
+        """
+        Construct a `PrefixIndex` from the current contents of the database for the given `namespace`.
+
+        Args:
+            namespace (Namespace): Namespace (or its primary key) to index.
+            cidrs (list, optional): If specified, only load the Prefixes and IPAddresses that overlap these CIDRs.
+                The resulting index can only answer questions about networks within its `scope`.
+            chunk_size (int, optional): Maximum number of address ranges to look up per query when `cidrs` is given.
+        """
+        from nautobot.ipam.models import IPAddress, Prefix
+
+        namespace_id = getattr(namespace, "pk", namespace)
+        prefixes = Prefix.objects.filter(namespace_id=namespace_id)
+        hosts = IPAddress.objects.filter(parent__namespace_id=namespace_id)
+        if cidrs is None:
+            index = cls(namespace_id)
+            prefix_filters = host_filters = [Q()]
+        else:
+            index = cls(namespace_id, scope=netaddr.IPSet(cidrs))
+            ranges = list(index.scope.iter_ipranges())
+            prefix_filters = []
+            host_filters = []
+            for offset in range(0, len(ranges), chunk_size):
+                prefix_query = Q()
+                host_query = Q()
+                for ip_range in ranges[offset : offset + chunk_size]:
+                    first, last = str(ip_range[0]), str(ip_range[-1])
+                    prefix_query |= Q(ip_version=ip_range.version, network__lte=last, broadcast__gte=first)
+                    host_query |= Q(ip_version=ip_range.version, host__gte=first, host__lte=last)
+                prefix_filters.append(prefix_query)
+                host_filters.append(host_query)
+
+        for prefix_query in prefix_filters:
+            for pk, network, prefix_length in (
+                prefixes.filter(prefix_query).values_list("pk", "network", "prefix_length").iterator()
+            ):
+                index.add_prefix(pk, f"{network}/{prefix_length}")
+        for host_query in host_filters:
+            for host in hosts.filter(host_query).values_list("host", flat=True).iterator():
+                index.add_host(host)
+        return index
+
+    def covers(self, cidr):
+        """Return whether this index has complete information about the network `cidr`."""
+        return self.scope is None or netaddr.IPNetwork(str(cidr)) in self.scope
+
+    @staticmethod
+    def _key(cidr):
+        """Convert `cidr` (a string, `netaddr.IPNetwork` or `netaddr.IPAddress`) to a (version, value, length) key."""
+        if not isinstance(cidr, netaddr.IPNetwork):
+            cidr = netaddr.IPNetwork(str(cidr))
+        return cidr.version, cidr.value & int(cidr.netmask), cidr.prefixlen
+
+    @staticmethod
+    def _bit(value, position, max_bits):
+        """Return the bit of `value` at `position`, counting from the most significant bit."""
+        return (value >> (max_bits - position - 1)) & 1
+
+    @staticmethod
+    def _covers(node, value, length, max_bits):
+        """Return whether `node` is equal to or a supernet of the network `value`/`length`."""
+        if node.length > length:
+            return False
+        shift = max_bits - node.length
+        return (node.value >> shift) == (value >> shift)
+
+    def _insert(self, version, value, length):
+        """Find or create the node for `value`/`length`, returning it."""
+        max_bits = _MAX_BITS[version]
+        node = self._roots[version]
+        while True:
+            if node.length == length:
+                return node
+            bit = self._bit(value, node.length, max_bits)
+            child = node.children[bit]
+            if child is None:
+                child = _Node(value, length)
+                node.children[bit] = child
+                return child
+            diff = value ^ child.value
+            common = min(length, child.length, max_bits - diff.bit_length())
+            if common == child.length:
+                node = child
+                continue
+            mask = ((1 << common) - 1) << (max_bits - common)
+            branch = _Node(value & mask, common)
+            branch.children[self._bit(child.value, common, max_bits)] = child
+            node.children[bit] = branch
+            if common == length:
+                return branch
+            leaf = _Node(value, length)
+            branch.children[self._bit(value, common, max_bits)] = leaf
+            return leaf
+
+    def _find(self, version, value, length):
+        """Return the path of nodes from the root to the exact node for `value`/`length`, or None if not present."""
+        max_bits = _MAX_BITS[version]
+        node = self._roots[version]
+        path = [node]
+        while node.length < length:
+            node = node.children[self._bit(value, node.length, max_bits)]
+            if node is None or not self._covers(node, value, length, max_bits):
+                return None
+            path.append(node)
+        if node.length != length:
+            return None
+        return path
+
+    def _prune(self, path):
+        """Remove empty nodes with fewer than two children from the end of `path`."""
+        while len(path) > 1:
+            node = path.pop()
+            if not node.is_empty:
+                return
+            children = [child for child in node.children if child is not None]
+            if len(children) > 1:
+                return
+            parent = path[-1]
+            slot = parent.children.index(node)
+            parent.children[slot] = children[0] if children else None
+
+    def add_prefix(self, pk, cidr):
+        """Add (or move) the Prefix with primary key `pk` to the position given by `cidr`."""
+        key = self._key(cidr)
+        if self._prefixes.get(pk) == key:
+            return
+        self.remove_prefix(pk)
+        self._insert(*key).prefix_pk = pk
+        self._prefixes[pk] = key
+
+    def remove_prefix(self, pk):
+        """Remove the Prefix with primary key `pk` from the index, if present."""
+        key = self._prefixes.pop(pk, None)
+        if key is None:
+            return
+        path = self._find(*key)
+        if path is not None:
+            path[-1].prefix_pk = None
+            self._prune(path)
+
+    def add_host(self, host):
+        """Record an IPAddress with the given `host` address."""
+        version, value, _ = self._key(host)
+        self._insert(version, value, _MAX_BITS[version]).host_count += 1
+
+    def remove_host(self, host):
+        """Forget an IPAddress with the given `host` address, if present."""
+        version, value, _ = self._key(host)
+        path = self._find(version, value, _MAX_BITS[version])
+        if path is not None and path[-1].host_count:
+            path[-1].host_count -= 1
+            self._prune(path)
+
+    def get_closest_parent(self, cidr, shortest_prefix_length=0, include_self=False, exclude=None):
+        """
+        Return the primary key of the closest Prefix containing `cidr`, or None if there is no such Prefix.
+
+        Args:
+            cidr (str): IPv4/IPv6 CIDR string
+            shortest_prefix_length (int, optional): Shortest prefix length for closest parent lookup. Defaults to 0.
+            include_self (bool, optional): Include the provided `cidr` in the search. Defaults to False.
+            exclude (uuid, optional): Primary key of a Prefix to ignore, such as one whose CIDR is being changed.
+        """
+        version, value, length = self._key(cidr)
+        max_bits = _MAX_BITS[version]
+        node = self._roots[version]
+        closest = None
+        while node is not None and self._covers(node, value, length, max_bits):
+            if node.prefix_pk is not None and node.prefix_pk != exclude and node.length >= shortest_prefix_length:
+                if node.length < length or include_self:
+                    closest = node.prefix_pk
+            if node.length >= length:
+                break
+            node = node.children[self._bit(value, node.length, max_bits)]
+        return closest
+
+    def has_descendants(self, cidr):
+        """Return whether any Prefix or IPAddress other than `cidr` itself lies within `cidr`."""
+        version, value, length = self._key(cidr)
+        max_bits = _MAX_BITS[version]
+        node = self._roots[version]
+        while node.length < length:
+            child = node.children[self._bit(value, node.length, max_bits)]
+            if child is None:
+                return False
+            if child.length > length:
+                # Path compression may skip past `length`; every non-root node has something stored beneath it.
+                return self._covers(_Node(value, length), child.value, child.length, max_bits)
+            if not self._covers(child, value, length, max_bits):
+                return False
+            node = child
+        return bool(node.host_count) or any(node.children)
+
+
+def has_active_prefix_index():
+    """Return whether any `PrefixIndex` is (or may be lazily) active in the current thread."""
+    return bool(getattr(_active, "frames", None))
+
+
+def get_prefix_index(namespace_id, cidr=None):
+    """
+    Return the `PrefixIndex` active in the current thread for the given namespace, if any.
+
+    If `cidr` is specified, an index is only returned if it has complete information about that network.
+    """
+    for frame in reversed(getattr(_active, "frames", [])):
+        index = frame["indexes"].get(namespace_id)
+        if index is None and frame["lazy"] and namespace_id is not None:
+            index = frame["indexes"][namespace_id] = PrefixIndex.build(namespace_id, cidrs=frame["cidrs"])
+        if index is not None:
+            if cidr is not None and not index.covers(cidr):
+                return None
+            return index
+    return None
+
+
+@contextlib.contextmanager
+def prefix_index(namespace=None, index=None, cidrs=None):
+    """
+    Context manager to activate a `PrefixIndex` in the current thread.
+
+    While active, parent resolution and reparenting in `Prefix.save()` and `IPAddress.save()` consult the in-memory
+    index instead of scanning the database, so that bulk-loading many objects into a single namespace takes a
+    constant number of queries per object regardless of how many objects already exist.
+
+    Args:
+        namespace (Namespace, optional): Namespace to index. If not specified, an index is built for each namespace
+            on first use within the context.
+        index (PrefixIndex, optional): Pre-built index to activate instead of building one from the database.
+        cidrs (list, optional): Only load the Prefixes and IPAddresses overlapping these CIDRs into the index(es).
+            Objects outside of these CIDRs fall back to searching the database.
+
+    Examples:
+        >>> with prefix_index(namespace):
+        ...     for cidr in cidrs:
+        ...         Prefix.objects.create(prefix=cidr, namespace=namespace, status=status)
+    """
+    frame = {"lazy": False, "cidrs": cidrs, "indexes": {}}
+    if index is not None:
+        frame["indexes"][index.namespace_id] = index
+    elif namespace is not None:
+        index = PrefixIndex.build(namespace, cidrs=cidrs)
+        frame["indexes"][index.namespace_id] = index
+    else:
+        frame["lazy"] = True
+    if not hasattr(_active, "frames"):
+        _active.frames = []
+    _active.frames.append(frame)
+    try:
+        yield index
+    finally:
+        _active.frames.remove(frame)
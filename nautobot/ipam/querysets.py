@@ -1,12 +1,17 @@
+import operator
 import re
 
 from django.core.exceptions import ValidationError
-from django.db.models import ProtectedError, Q
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, ProtectedError, Q, Subquery
+from django.db.models.functions import Coalesce
 import netaddr
 
 from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.utils.data import merge_dicts_without_collision
+from nautobot.extras.utils import bulk_create_object_changes
 from nautobot.ipam.mixins import LocationToLocationsQuerySetMixin
+from nautobot.ipam.prefix_index import get_prefix_index, prefix_index, PrefixIndex
 
 
 class RIRQuerySet(RestrictedQuerySet):
@@ -194,10 +199,152 @@ class BaseNetworkQuerySet(RestrictedQuerySet):
         last_ip = self._get_last_ip(ip)
         return ip, last_ip
 
+    # Key under which the network of an object is found in incoming data, e.g. REST API requests or CSV rows
+    cidr_data_key = None
+
+    def _get_cidr_from_data(self, value):
+        return netaddr.IPNetwork(str(value)).cidr
+
+    def hierarchy_index(self, data=None):
+        """
+        Return a context manager that resolves the Prefix hierarchy for a batch of incoming objects in memory.
+
+        Within the context, a `PrefixIndex` is built for each namespace on first use, so that saving each object
+        costs a constant number of queries. See `nautobot.ipam.prefix_index.prefix_index()`.
+
+        Args:
+            data (list, optional): Incoming object data (dicts such as REST API request data or parsed CSV rows).
+                If specified, only existing objects overlapping the networks in `data` are loaded into the index;
+                otherwise, entire namespaces are loaded.
+        """
+        cidrs = None
+        if data is not None:
+            cidrs = []
+            for entry in data:
+                try:
+                    cidrs.append(self._get_cidr_from_data(entry[self.cidr_data_key]))
+                except (KeyError, TypeError, ValueError, netaddr.AddrFormatError):
+                    # Invalid data will be rejected by validation; objects outside of the index use the database.
+                    continue
+        return prefix_index(cidrs=cidrs)
+
+    def discard_from_hierarchy_index(self, obj):
+        """
+        Remove an object whose creation was rolled back from any active `PrefixIndex`.
+
+        The index is updated as each object is saved, but not when the transaction that saved it is rolled back, so
+        without this a rolled back Prefix could be chosen as the parent of objects saved later in the same batch.
+        """
+        raise NotImplementedError
+
 
 class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
     """Queryset for `Prefix` objects."""
 
+    cidr_data_key = "prefix"
+
+    def bulk_create_with_hierarchy(self, objs, batch_size=None):
+        """
+        Create the given unsaved Prefix instances in bulk, resolving the Prefix hierarchy once for the whole batch.
+
+        The incoming prefixes are sorted and their parents resolved in memory against the existing Prefixes that
+        overlap them, after which they are inserted with `bulk_create()`. Existing Prefixes and IPAddresses that
+        belong beneath a new Prefix are then reparented with set-based `UPDATE` queries, which are only issued for
+        new Prefixes that actually contain existing objects.
+
+        As with `bulk_create()`, `save()` is not called and `pre_save`/`post_save` signals are not sent. If change
+        logging is enabled, `ObjectChange` records are created in bulk.
+
+        Args:
+            objs (list): Unsaved `Prefix` instances.
+            batch_size (int, optional): How many objects are created in a single query.
+
+        Returns:
+            (list): The created `Prefix` instances, sorted by namespace, IP version and network.
+        """
+        objs = list(objs)
+        for obj in objs:
+            # Clear host bits from prefix, as `Prefix.save()` does
+            obj.prefix = obj.prefix.cidr
+        objs.sort(key=lambda obj: (str(obj.namespace_id), obj.ip_version, obj.prefix.value, obj.prefix_length))
+
+        namespaces = {}
+        for obj in objs:
+            namespaces.setdefault(obj.namespace_id, []).append(obj)
+
+        to_reparent = []
+        for namespace_id, namespace_objs in namespaces.items():
+            index = PrefixIndex.build(namespace_id, cidrs=[obj.prefix for obj in namespace_objs])
+            to_reparent.extend(obj for obj in namespace_objs if index.has_descendants(obj.prefix))
+            for obj in namespace_objs:
+                index.add_prefix(obj.pk, obj.prefix)
+            for obj in namespace_objs:
+                parent_pk = index.get_closest_parent(obj.prefix)
+                if parent_pk is not None:
+                    obj.parent_id = parent_pk
+
+        location_assignment_model = self.model.locations.through
+        with transaction.atomic():
+            self.bulk_create(objs, batch_size=batch_size)
+            location_assignment_model.objects.bulk_create(
+                [location_assignment_model(prefix=obj, location=obj._location) for obj in objs if obj._location],
+                batch_size=batch_size,
+            )
+            # Shortest prefixes first, so that each reparenting only needs to consider the existing children of the
+            # new prefix's own parent, exactly as in `Prefix.save()`.
+            for obj in sorted(to_reparent, key=operator.attrgetter("prefix_length")):
+                obj.reparent_subnets()
+                obj.reparent_ips()
+            bulk_create_object_changes(objs)
+
+        return objs
+
+    def discard_from_hierarchy_index(self, obj):
+        index = get_prefix_index(obj.namespace_id)
+        if index is not None:
+            index.remove_prefix(obj.pk)
+
+    def _ip_address_count(self, edges_only=False):
+        """
+        Build a subquery expression counting the IPAddresses in the same namespace as each Prefix that lie within it.
+
+        Args:
+            edges_only (bool, optional): Only count IPAddresses on the first or last address of the Prefix.
+        """
+        ip_addresses = (
+            self.model._meta.get_field("ip_addresses")
+            .related_model.objects.order_by()
+            .filter(parent__namespace=OuterRef("namespace"), ip_version=OuterRef("ip_version"))
+        )
+        if edges_only:
+            ip_addresses = ip_addresses.filter(Q(host=OuterRef("network")) | Q(host=OuterRef("broadcast")))
+        else:
+            ip_addresses = ip_addresses.filter(host__gte=OuterRef("network"), host__lte=OuterRef("broadcast"))
+        return Coalesce(
+            Subquery(ip_addresses.values("ip_version").annotate(count=Count("pk")).values("count")),
+            0,
+            output_field=IntegerField(),
+        )
+
+    def with_ip_address_count(self):
+        """Annotate each Prefix with `_utilization_ip_count`, the number of IPAddresses within its range."""
+        return self.annotate(_utilization_ip_count=self._ip_address_count())
+
+    def with_utilization(self):
+        """
+        Annotate and prefetch the data needed by `Prefix.get_utilization()` for every Prefix in this queryset.
+
+        Utilization is calculated from per-Prefix `COUNT` subqueries and the sizes of each Prefix's direct children,
+        so rendering the utilization of a whole page of Prefixes takes two queries in total, regardless of the number
+        of IPAddresses and child Prefixes involved.
+        """
+        children = self.model.objects.only("parent", "network", "broadcast", "prefix_length").with_ip_address_count()
+        return (
+            self.with_ip_address_count()
+            .annotate(_utilization_edge_ip_count=self._ip_address_count(edges_only=True))
+            .prefetch_related(Prefetch("children", queryset=children, to_attr="_utilization_children"))
+        )
+
     def net_equals(self, *prefixes):
         query = Q()
         for prefix in prefixes:
@@ -344,7 +491,7 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
         except netaddr.AddrFormatError as err:
             raise ValidationError({"cidr": f"{value} does not appear to be an IPv4 or IPv6 network."}) from err
 
-    def get_closest_parent(self, cidr, shortest_prefix_length=0, include_self=False):
+    def get_closest_parent(self, cidr, shortest_prefix_length=0, include_self=False, namespace=None):
         """
         Return the closest matching parent Prefix for a `cidr` even if it doesn't exist in the database.
 
@@ -352,6 +499,8 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
             cidr (str): IPv4/IPv6 CIDR string
             shortest_prefix_length (int, optional): Shortest prefix length for closest parent lookup. Defaults to 0.
             include_self (bool, optional): Include the provided `cidr` in the search. Defaults to False.
+            namespace (Namespace, optional): Limit the search to this Namespace. If a `PrefixIndex` is active for it,
+                the closest parent is found from the in-memory index rather than by scanning the database.
         """
         # Validate that it's a real CIDR
         cidr = self._validate_cidr(cidr)
@@ -363,6 +512,22 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
         except ValueError:
             raise ValidationError({"shortest_prefix_length": f"Invalid prefix_length: {shortest_prefix_length}."})
 
+        queryset = self
+        if namespace is not None:
+            queryset = queryset.filter(namespace=namespace)
+            index = get_prefix_index(getattr(namespace, "pk", namespace), cidr=cidr)
+            if index is not None:
+                closest_pk = index.get_closest_parent(
+                    cidr, shortest_prefix_length=shortest_prefix_length, include_self=include_self
+                )
+                if closest_pk is None:
+                    raise self.model.DoesNotExist(f"Could not determine parent Prefix for {cidr}")
+                try:
+                    return queryset.get(pk=closest_pk)
+                except self.model.DoesNotExist:
+                    # Excluded by other filters on this queryset; fall back to searching the database.
+                    pass
+
         # Prepare the queryset filter
         lookup_kwargs = {
             "network__lte": cidr.value,
@@ -373,7 +538,7 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
 
         # Search for possible ancestors by network/prefix, returning them in reverse order, so that
         # we can choose the first one.
-        possible_ancestors = self.filter(**lookup_kwargs).order_by("-prefix_length")
+        possible_ancestors = queryset.filter(**lookup_kwargs).order_by("-prefix_length")
         if not include_self:
             possible_ancestors = possible_ancestors.exclude(network=cidr.value, prefix_length=cidr.prefixlen)
 
@@ -387,6 +552,72 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
 class IPAddressQuerySet(BaseNetworkQuerySet):
     """Queryset for `IPAddress` objects."""
 
+    cidr_data_key = "address"
+
+    def _get_cidr_from_data(self, value):
+        return netaddr.IPNetwork(netaddr.IPNetwork(str(value)).ip)
+
+    def discard_from_hierarchy_index(self, obj):
+        if obj.parent is None:
+            return
+        index = get_prefix_index(obj.parent.namespace_id)
+        if index is not None:
+            index.remove_host(obj.host)
+
+    def bulk_create_with_hierarchy(self, objs, batch_size=None):
+        """
+        Create the given unsaved IPAddress instances in bulk, resolving their `parent` Prefixes once for the whole batch.
+
+        The parent of each address is resolved in memory against the existing Prefixes of its namespace that
+        contain it, after which the addresses are inserted with `bulk_create()`.
+
+        As with `bulk_create()`, `save()` is not called and `pre_save`/`post_save` signals are not sent. If change
+        logging is enabled, `ObjectChange` records are created in bulk.
+
+        Args:
+            objs (list): Unsaved `IPAddress` instances.
+            batch_size (int, optional): How many objects are created in a single query.
+
+        Returns:
+            (list): The created `IPAddress` instances, sorted by IP version and host address.
+
+        Raises:
+            ValidationError: if no suitable parent Prefix exists for any of the addresses.
+        """
+        objs = list(objs)
+        objs.sort(key=lambda obj: (obj.ip_version, netaddr.IPAddress(obj.host).value))
+
+        namespaces = {}
+        default_namespace = None
+        for obj in objs:
+            if getattr(obj, "_provided_namespace", None) or obj.parent_id:
+                namespace = obj._namespace
+            else:
+                # Avoid looking up the default namespace once per object
+                if default_namespace is None:
+                    default_namespace = obj._namespace
+                namespace = default_namespace
+            namespaces.setdefault(getattr(namespace, "pk", namespace), []).append(obj)
+            if obj.dns_name:
+                obj.dns_name = obj.dns_name.lower()
+
+        for namespace_id, namespace_objs in namespaces.items():
+            index = PrefixIndex.build(namespace_id, cidrs=[obj.host for obj in namespace_objs])
+            for obj in namespace_objs:
+                parent_pk = index.get_closest_parent(obj.host, include_self=True)
+                if parent_pk is None:
+                    raise ValidationError(
+                        {"namespace": f"No suitable parent Prefix for {obj} exists in this Namespace"}
+                    )
+                obj.parent_id = parent_pk
+                obj._provided_namespace = None
+
+        with transaction.atomic():
+            self.bulk_create(objs, batch_size=batch_size)
+            bulk_create_object_changes(objs)
+
+        return objs
+
     def get_queryset(self):
         """
         By default, PostgreSQL will order INETs with shorter (larger) prefix lengths ahead of those with longer
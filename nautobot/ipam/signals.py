@@ -1,10 +1,11 @@
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import Q
-from django.db.models.signals import m2m_changed, pre_delete, pre_save
+from django.db.models.signals import m2m_changed, post_delete, pre_delete, pre_save
 from django.dispatch import receiver
 
 from nautobot.ipam.models import (
+    IPAddress,
     IPAddressToInterface,
     Prefix,
     PrefixLocationAssignment,
@@ -13,6 +14,7 @@ from nautobot.ipam.models import (
     VRFDeviceAssignment,
     VRFPrefixAssignment,
 )
+from nautobot.ipam.prefix_index import get_prefix_index, has_active_prefix_index
 
 
 @receiver(pre_save, sender=VRFDeviceAssignment)
@@ -129,3 +131,24 @@ def assert_locations_content_types(sender, instance, action, reverse, model, pk_
             raise ValidationError(
                 {key: f"{instance} is a {instance.location_type} and may not have {label} associated to it."}
             )
+
+
+@receiver(post_delete, sender=Prefix)
+def prefix_deleted_update_prefix_index(sender, instance, **kwargs):
+    """Remove a deleted Prefix from any active `PrefixIndex` for its namespace."""
+    if not has_active_prefix_index():
+        return
+    index = get_prefix_index(instance.namespace_id)
+    if index is not None:
+        index.remove_prefix(instance.pk)
+
+
+@receiver(post_delete, sender=IPAddress)
+def ip_address_deleted_update_prefix_index(sender, instance, **kwargs):
+    """Remove a deleted IPAddress from any active `PrefixIndex` for its namespace."""
+    if not has_active_prefix_index() or instance.parent_id is None:
+        return
+    namespace_id = Prefix.objects.filter(pk=instance.parent_id).values_list("namespace_id", flat=True).first()
+    index = get_prefix_index(namespace_id)
+    if index is not None:
+        index.remove_host(instance.host)
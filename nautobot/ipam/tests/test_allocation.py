@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+import netaddr
+
+from nautobot.core.testing import TestCase, TransactionTestCase
+from nautobot.extras.models import Status
+from nautobot.ipam.allocation import allocate_ips, allocate_prefixes, AllocationError, reserve_ips
+from nautobot.ipam.choices import PrefixTypeChoices
+from nautobot.ipam.models import IPAddress, Namespace, Prefix
+
+
+class AllocationTest(TestCase):
+    """Tests for the `nautobot.ipam.allocation` engine."""
+
+    def setUp(self):
+        super().setUp()
+        self.namespace = Namespace.objects.create(name="Allocation Test")
+        self.status = Status.objects.get_for_model(Prefix).first()
+        self.status.content_types.add(ContentType.objects.get_for_model(IPAddress))
+        self.prefix = Prefix.objects.create(prefix="192.0.2.0/28", status=self.status, namespace=self.namespace)
+
+    def test_allocate_ips(self):
+        ips = allocate_ips(self.prefix, count=3, status=self.status, description="allocated")
+        self.assertEqual([str(ip) for ip in ips], ["192.0.2.1/28", "192.0.2.2/28", "192.0.2.3/28"])
+        for ip in ips:
+            self.assertEqual(ip.parent, self.prefix)
+            self.assertEqual(ip.description, "allocated")
+        self.assertEqual(str(allocate_ips(self.prefix, status=self.status)[0]), "192.0.2.4/28")
+
+    def test_allocate_contiguous_ips(self):
+        for address in ["192.0.2.2/28", "192.0.2.6/28"]:
+            IPAddress.objects.create(address=address, status=self.status, namespace=self.namespace)
+        ips = allocate_ips(self.prefix, count=4, contiguous=True, status=self.status)
+        self.assertEqual([str(ip.host) for ip in ips], ["192.0.2.7", "192.0.2.8", "192.0.2.9", "192.0.2.10"])
+        with self.assertRaises(AllocationError):
+            allocate_ips(self.prefix, count=5, contiguous=True, status=self.status)
+
+    def test_insufficient_space(self):
+        with self.assertRaises(AllocationError):
+            allocate_ips(self.prefix, count=15, status=self.status)
+        self.assertFalse(self.prefix.ip_addresses.exists())
+        self.assertEqual(len(reserve_ips(self.prefix, count=14)), 14)
+
+    def test_allocate_prefixes(self):
+        self.prefix.type = PrefixTypeChoices.TYPE_CONTAINER
+        self.prefix.save()
+        Prefix.objects.create(prefix="192.0.2.0/30", status=self.status, namespace=self.namespace)
+        prefixes = allocate_prefixes(self.prefix, 29, count=1, status=self.status)
+        self.assertEqual(prefixes[0].prefix, netaddr.IPNetwork("192.0.2.8/29"))
+        with self.assertRaises(AllocationError):
+            allocate_prefixes(self.prefix, 30, count=2, status=self.status)
+        prefixes = allocate_prefixes(self.prefix, 30, status=self.status)
+        self.assertEqual(prefixes[0].prefix, netaddr.IPNetwork("192.0.2.4/30"))
+
+
+class ParallelAllocationTest(TransactionTestCase):
+    """Tests for concurrent allocation from the same Prefix."""
+
+    def setUp(self):
+        super().setUp()
+        self.namespace = Namespace.objects.create(name="Parallel Allocation Test")
+        self.status = Status.objects.get(name="Active")
+        self.prefix = Prefix.objects.create(prefix="198.51.100.0/24", status=self.status, namespace=self.namespace)
+
+    def _allocate(self, count):
+        try:
+            return [str(ip) for ip in allocate_ips(self.prefix, count=count, contiguous=True, status=self.status)]
+        finally:
+            connection.close()
+
+    def test_parallel_allocate_ips(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self._allocate, [4] * 16))
+        allocated = [ip for result in results for ip in result]
+        self.assertEqual(len(allocated), 64)
+        self.assertEqual(len(allocated), len(set(allocated)))
+        for result in results:
+            hosts = [int(netaddr.IPNetwork(ip).ip) for ip in result]
+            self.assertEqual(hosts, list(range(hosts[0], hosts[0] + 4)))
+
+    def test_allocation_load_test_command(self):
+        out = StringIO()
+        call_command(
+            "allocation_load_test",
+            "198.51.100.0/24",
+            namespace=self.namespace.name,
+            workers=4,
+            requests=5,
+            count=2,
+            stdout=out,
+        )
+        self.assertIn("Allocated 40 IP addresses", out.getvalue())
+        self.assertIn("No duplicate IP addresses were allocated.", out.getvalue())
+        self.assertFalse(self.prefix.ip_addresses.exists())
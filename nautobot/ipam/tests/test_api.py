@@ -6,6 +6,7 @@ from unittest import skip
 from django.contrib.contenttypes.models import ContentType
 from django.db import connection
 from django.db.models import Count
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 
@@ -616,6 +617,45 @@ class PrefixTest(APIViewTestCases.APIViewTestCase):
         self.assertHttpStatus(response, status.HTTP_201_CREATED)
         self.assertEqual(len(response.data), 6)
 
+    def test_create_available_ips_with_count(self):
+        """
+        Test the batch creation of a contiguous block of available IP addresses from a single object.
+        """
+        prefix = Prefix.objects.create(
+            prefix="192.0.2.0/28",
+            type=choices.PrefixTypeChoices.TYPE_NETWORK,
+            namespace=self.namespace,
+            status=self.status,
+        )
+        IPAddress.objects.create(address="192.0.2.3/28", status=self.status, namespace=self.namespace)
+        url = reverse("ipam-api:prefix-available-ips", kwargs={"pk": prefix.pk})
+        self.add_permissions("ipam.view_prefix", "ipam.add_ipaddress", "extras.view_status")
+        data = {"description": "Batch", "status": self.status.pk}
+
+        response = self.client.post(f"{url}?count=0", data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(f"{url}?count=4&contiguous=true", data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [ip["address"] for ip in response.data], ["192.0.2.4/28", "192.0.2.5/28", "192.0.2.6/28", "192.0.2.7/28"]
+        )
+
+        response = self.client.post(f"{url}?count=8&contiguous=true", data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_204_NO_CONTENT)
+        self.assertIn("detail", response.data)
+
+        with override_settings(MAX_PAGE_SIZE=5):
+            response = self.client.post(f"{url}?count=6", data, format="json", **self.header)
+            self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("count", response.data)
+
+        with override_settings(MAX_PAGE_SIZE=0):
+            # Only 9 IP addresses remain available in the prefix
+            response = self.client.post(f"{url}?count=10", data, format="json", **self.header)
+            self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("count", response.data)
+
 
 class PrefixLocationAssignmentTest(APIViewTestCases.APIViewTestCase):
     model = PrefixLocationAssignment
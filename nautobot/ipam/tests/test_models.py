@@ -1,3 +1,4 @@
+import itertools
 from unittest import skipIf
 
 from django.contrib.contenttypes.models import ContentType
@@ -613,6 +614,34 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
         )
         available_ips = parent_prefix.get_available_ips()
         self.assertEqual(available_ips, missing_ips)
+        self.assertEqual(list(parent_prefix.iter_available_ips()), list(missing_ips))
+
+    def test_iter_unallocated_ranges(self):
+        self.assertEqual(list(Prefix._iter_unallocated_ranges(0, 15, [])), [(0, 15)])
+        self.assertEqual(
+            list(Prefix._iter_unallocated_ranges(1, 14, [(0, 0), (2, 3), (2, 2), (6, 7), (15, 15)])),
+            [(1, 1), (4, 5), (8, 14)],
+        )
+        self.assertEqual(list(Prefix._iter_unallocated_ranges(0, 15, [(0, 7), (4, 5), (8, 15)])), [])
+
+    def test_iter_available_large_prefix(self):
+        """The first available networks and IPs of a huge prefix are found without enumerating the whole prefix."""
+        prefix = Prefix.objects.create(prefix="2001:db8::/32", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="2001:db8::/48", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="2001:db8:2::/48", status=self.status, namespace=self.namespace)
+        available_prefixes = prefix.iter_available_prefixes()
+        self.assertEqual(next(available_prefixes), netaddr.IPNetwork("2001:db8:1::/48"))
+        self.assertEqual(next(available_prefixes), netaddr.IPNetwork("2001:db8:3::/48"))
+        self.assertEqual(prefix.get_first_available_prefix(), netaddr.IPNetwork("2001:db8:1::/48"))
+
+        prefix = Prefix.objects.create(prefix="2001:db9::/32", status=self.status, namespace=self.namespace)
+        for address in ["2001:db9::/32", "2001:db9::1/32", "2001:db9::3/32"]:
+            IPAddress.objects.create(address=address, status=self.status, namespace=self.namespace)
+        self.assertEqual(
+            list(itertools.islice(prefix.iter_available_ips(), 3)),
+            [netaddr.IPAddress("2001:db9::2"), netaddr.IPAddress("2001:db9::4"), netaddr.IPAddress("2001:db9::5")],
+        )
+        self.assertEqual(prefix.get_first_available_ip(), "2001:db9::2/32")
 
     def test_get_first_available_prefix(self):
         prefixes = [
@@ -747,6 +776,27 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
         Prefix.objects.create(prefix="ab80::/9", status=self.status, namespace=self.namespace)
         self.assertEqual(large_prefix_v6.get_utilization(), (2**120, 2**120))
 
+    def test_with_utilization(self):
+        Prefix.objects.create(
+            prefix="10.0.0.0/16", type=PrefixTypeChoices.TYPE_CONTAINER, status=self.status, namespace=self.namespace
+        )
+        Prefix.objects.create(prefix="10.0.0.0/24", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="10.0.1.0/24", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(
+            prefix="10.0.0.0/28", type=PrefixTypeChoices.TYPE_POOL, status=self.status, namespace=self.namespace
+        )
+        Prefix.objects.create(prefix="10.0.1.252/30", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="2001:db8::/64", status=self.status, namespace=self.namespace)
+        for address in ["10.0.0.1/24", "10.0.0.20/24", "10.0.0.255/24", "10.0.1.1/24", "2001:db8::1/64"]:
+            IPAddress.objects.create(address=address, status=self.status, namespace=self.namespace)
+
+        prefixes = Prefix.objects.filter(namespace=self.namespace)
+        expected = {prefix.pk: prefix.get_utilization() for prefix in prefixes}
+        with self.assertNumQueries(2):
+            actual = {prefix.pk: prefix.get_utilization() for prefix in prefixes.with_utilization()}
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual[Prefix.objects.get(prefix="10.0.0.0/24", namespace=self.namespace).pk], (18, 256))
+
     #
     # Uniqueness enforcement tests
     #
@@ -0,0 +1,144 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import tag
+from django.test.utils import CaptureQueriesContext
+import netaddr
+
+from nautobot.core.testing import TestCase
+from nautobot.extras.models import Status
+from nautobot.ipam.models import IPAddress, Namespace, Prefix
+from nautobot.ipam.prefix_index import get_prefix_index, prefix_index, PrefixIndex
+
+
+class PrefixIndexTest(TestCase):
+    """Tests for the in-memory `PrefixIndex` data structure."""
+
+    def test_get_closest_parent(self):
+        index = PrefixIndex(namespace_id=None)
+        index.add_prefix("a", "10.0.0.0/8")
+        index.add_prefix("b", "10.1.0.0/16")
+        index.add_prefix("c", "10.1.1.0/24")
+        index.add_prefix("d", "2001:db8::/32")
+
+        self.assertEqual(index.get_closest_parent("10.1.1.128/25"), "c")
+        self.assertEqual(index.get_closest_parent("10.1.1.0/24"), "b")
+        self.assertEqual(index.get_closest_parent("10.1.1.0/24", include_self=True), "c")
+        self.assertEqual(index.get_closest_parent("10.1.2.1/32"), "b")
+        self.assertEqual(index.get_closest_parent("10.2.0.0/16"), "a")
+        self.assertEqual(index.get_closest_parent("10.1.1.1", shortest_prefix_length=25), None)
+        self.assertEqual(index.get_closest_parent("11.0.0.0/8"), None)
+        self.assertEqual(index.get_closest_parent("2001:db8::1/128"), "d")
+        self.assertEqual(index.get_closest_parent("2001:db9::/32"), None)
+        self.assertEqual(index.get_closest_parent("10.1.1.128/25", exclude="c"), "b")
+
+        index.remove_prefix("b")
+        self.assertEqual(index.get_closest_parent("10.1.2.1/32"), "a")
+        self.assertEqual(index.get_closest_parent("10.1.1.128/25"), "c")
+        self.assertEqual(len(index), 3)
+
+    def test_has_descendants(self):
+        index = PrefixIndex(namespace_id=None)
+        index.add_prefix("a", "10.0.0.0/8")
+        index.add_prefix("b", "10.1.1.0/24")
+        self.assertTrue(index.has_descendants("10.0.0.0/8"))
+        self.assertTrue(index.has_descendants("10.1.0.0/16"))
+        self.assertFalse(index.has_descendants("10.1.1.0/24"))
+        self.assertFalse(index.has_descendants("10.2.0.0/16"))
+
+        index.add_host("10.1.1.1")
+        self.assertTrue(index.has_descendants("10.1.1.0/24"))
+        self.assertTrue(index.has_descendants("10.1.1.1/32"))
+        index.remove_host("10.1.1.1")
+        self.assertFalse(index.has_descendants("10.1.1.0/24"))
+
+    def test_matches_brute_force(self):
+        """Compare the index against a naive containment search over a set of overlapping prefixes."""
+        networks = [netaddr.IPNetwork(f"10.{i % 4}.{i}.0/{16 + i % 16}").cidr for i in range(64)]
+        networks = list(dict.fromkeys(networks))
+        index = PrefixIndex(namespace_id=None)
+        for network in networks:
+            index.add_prefix(str(network), network)
+
+        for candidate in [netaddr.IPNetwork(f"10.{i % 4}.{i}.{i}/{20 + i % 13}") for i in range(128)]:
+            supernets = [network for network in networks if candidate in network and network != candidate.cidr]
+            expected = str(max(supernets, key=lambda network: network.prefixlen)) if supernets else None
+            self.assertEqual(index.get_closest_parent(candidate), expected)
+
+
+class PrefixIndexModelTest(TestCase):
+    """Tests for `Prefix` and `IPAddress` hierarchy maintenance while a `PrefixIndex` is active."""
+
+    def setUp(self):
+        super().setUp()
+        self.namespace = Namespace.objects.create(name="Prefix Index Test")
+        self.status = Status.objects.get_for_model(Prefix).first()
+        self.status.content_types.add(ContentType.objects.get_for_model(IPAddress))
+
+    def test_hierarchy_matches_unindexed_save(self):
+        cidrs = ["10.0.0.0/24", "10.0.0.0/8", "10.0.0.128/25", "10.0.0.0/16", "10.1.0.0/16", "10.0.0.0/25"]
+        with prefix_index(self.namespace) as index:
+            self.assertIs(get_prefix_index(self.namespace.pk), index)
+            prefixes = {
+                cidr: Prefix.objects.create(prefix=cidr, status=self.status, namespace=self.namespace)
+                for cidr in cidrs
+            }
+            ip = IPAddress.objects.create(address="10.0.0.1/24", status=self.status, namespace=self.namespace)
+            self.assertEqual(ip.parent, prefixes["10.0.0.0/25"])
+            # Inserting a prefix between an existing prefix and an existing IP must reparent the IP.
+            pfx = Prefix.objects.create(prefix="10.0.0.0/26", status=self.status, namespace=self.namespace)
+            self.assertEqual(len(index), len(cidrs) + 1)
+        self.assertIsNone(get_prefix_index(self.namespace.pk))
+
+        for prefix in prefixes.values():
+            prefix.refresh_from_db()
+        ip.refresh_from_db()
+        self.assertEqual(ip.parent, pfx)
+        self.assertIsNone(prefixes["10.0.0.0/8"].parent)
+        self.assertEqual(prefixes["10.0.0.0/16"].parent, prefixes["10.0.0.0/8"])
+        self.assertEqual(prefixes["10.1.0.0/16"].parent, prefixes["10.0.0.0/8"])
+        self.assertEqual(prefixes["10.0.0.0/24"].parent, prefixes["10.0.0.0/16"])
+        self.assertEqual(prefixes["10.0.0.0/25"].parent, prefixes["10.0.0.0/24"])
+        self.assertEqual(prefixes["10.0.0.128/25"].parent, prefixes["10.0.0.0/24"])
+        for prefix in Prefix.objects.filter(namespace=self.namespace):
+            expected = prefix.supernets().order_by("-prefix_length").first()
+            self.assertEqual(prefix.parent, expected)
+
+    def test_index_tracks_deletes(self):
+        with prefix_index(self.namespace) as index:
+            parent = Prefix.objects.create(prefix="192.0.2.0/24", status=self.status, namespace=self.namespace)
+            child = Prefix.objects.create(prefix="192.0.2.0/25", status=self.status, namespace=self.namespace)
+            ip = IPAddress.objects.create(address="192.0.2.1/24", status=self.status, namespace=self.namespace)
+            self.assertTrue(index.has_descendants("192.0.2.0/25"))
+            ip.delete()
+            self.assertFalse(index.has_descendants("192.0.2.0/25"))
+            child.delete()
+            self.assertEqual(index.get_closest_parent("192.0.2.1/32"), parent.pk)
+            self.assertEqual(
+                Prefix.objects.get_closest_parent("192.0.2.1/32", namespace=self.namespace),
+                parent,
+            )
+
+    def test_change_prefix_within_itself(self):
+        """Changing the CIDR of an indexed prefix to one within its previous CIDR doesn't make it its own parent."""
+        with prefix_index(self.namespace) as index:
+            parent = Prefix.objects.create(prefix="10.0.0.0/8", status=self.status, namespace=self.namespace)
+            prefix = Prefix.objects.create(prefix="10.0.0.0/16", status=self.status, namespace=self.namespace)
+            prefix.prefix = "10.0.1.0/24"
+            prefix.save()
+            self.assertEqual(prefix.parent_id, parent.pk)
+            self.assertEqual(index.get_closest_parent("10.0.1.0/25"), prefix.pk)
+            self.assertEqual(index.get_closest_parent("10.0.2.0/24"), parent.pk)
+        prefix.refresh_from_db()
+        self.assertEqual(prefix.parent, parent)
+
+    @tag("performance")
+    def test_save_query_count_is_constant(self):
+        """Saving a leaf Prefix with an active index costs the same number of queries regardless of table size."""
+        Prefix.objects.create(prefix="10.0.0.0/8", status=self.status, namespace=self.namespace)
+        with prefix_index(self.namespace):
+            with CaptureQueriesContext(connection) as queries:
+                Prefix(prefix="10.0.0.0/24", status=self.status, namespace=self.namespace).save()
+            for i in range(1, 50):
+                Prefix.objects.create(prefix=f"10.0.{i}.0/24", status=self.status, namespace=self.namespace)
+            with self.assertNumQueries(len(queries)):
+                Prefix(prefix="10.0.255.0/24", status=self.status, namespace=self.namespace).save()
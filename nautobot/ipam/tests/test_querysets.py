@@ -1,6 +1,8 @@
 import re
 from unittest import skipIf
 
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
 from django.db import connection
 import netaddr
 
@@ -757,3 +759,50 @@ class PrefixQuerysetTestCase(TestCase):
                     .order_by("-prefix_length")
                     .first(),
                 )
+
+
+class BulkCreateWithHierarchyTestCase(TestCase):
+    """Tests for `PrefixQuerySet.bulk_create_with_hierarchy()` and `IPAddressQuerySet.bulk_create_with_hierarchy()`."""
+
+    def setUp(self):
+        self.namespace = Namespace.objects.create(name="Bulk Create With Hierarchy Test")
+        self.status = Status.objects.get_for_model(Prefix).first()
+        self.status.content_types.add(ContentType.objects.get_for_model(IPAddress))
+        self.existing_container = Prefix.objects.create(
+            prefix="10.0.0.0/8", namespace=self.namespace, status=self.status
+        )
+        self.existing_leaf = Prefix.objects.create(prefix="10.1.1.0/24", namespace=self.namespace, status=self.status)
+        self.existing_ip = IPAddress.objects.create(address="10.1.2.1/24", namespace=self.namespace, status=self.status)
+
+    def test_prefix_bulk_create_with_hierarchy(self):
+        cidrs = ["10.1.0.0/16", "10.1.1.128/25", "10.2.0.0/16", "10.1.2.0/24", "10.1.1.0/26", "2001:db8::/32"]
+        objs = Prefix.objects.bulk_create_with_hierarchy(
+            [Prefix(prefix=cidr, namespace=self.namespace, status=self.status) for cidr in cidrs]
+        )
+        self.assertEqual(len(objs), len(cidrs))
+
+        prefixes = {str(prefix.prefix): prefix for prefix in Prefix.objects.filter(namespace=self.namespace)}
+        self.assertEqual(len(prefixes), len(cidrs) + 2)
+        for prefix in prefixes.values():
+            with self.subTest(prefix=prefix):
+                self.assertEqual(prefix.parent, prefix.supernets().order_by("-prefix_length").first())
+        self.assertEqual(prefixes["10.1.1.0/24"].parent, prefixes["10.1.0.0/16"])
+        self.assertEqual(prefixes["10.1.1.0/26"].parent, prefixes["10.1.1.0/24"])
+        self.existing_ip.refresh_from_db()
+        self.assertEqual(self.existing_ip.parent, prefixes["10.1.2.0/24"])
+
+    def test_ip_address_bulk_create_with_hierarchy(self):
+        addresses = ["10.1.1.5/24", "10.3.0.1/16", "10.1.1.1/24"]
+        objs = IPAddress.objects.bulk_create_with_hierarchy(
+            [IPAddress(address=address, namespace=self.namespace, status=self.status) for address in addresses]
+        )
+        self.assertEqual([str(obj.address) for obj in objs], ["10.1.1.1/24", "10.1.1.5/24", "10.3.0.1/16"])
+        self.assertEqual(IPAddress.objects.get(address="10.1.1.1/24").parent, self.existing_leaf)
+        self.assertEqual(IPAddress.objects.get(address="10.3.0.1/16").parent, self.existing_container)
+
+    def test_ip_address_bulk_create_with_hierarchy_no_parent(self):
+        with self.assertRaises(ValidationError):
+            IPAddress.objects.bulk_create_with_hierarchy(
+                [IPAddress(address="192.0.2.1/24", namespace=self.namespace, status=self.status)]
+            )
+        self.assertFalse(IPAddress.objects.filter(address="192.0.2.1/24").exists())
@@ -433,6 +433,10 @@ class PrefixListView(generic.ObjectListView):
     queryset = Prefix.objects.annotate(location_count=count_related(Location, "prefixes"))
     use_new_ui = True
 
+    def alter_queryset(self, request):
+        # Calculate the utilization of every Prefix in the table up front, rather than with several queries per row
+        return self.queryset.with_utilization()
+
 
 class PrefixView(generic.ObjectView):
     queryset = Prefix.objects.select_related(